@@ -0,0 +1,197 @@
+"""
+	Envío de correos reutilizando la conexión SMTP.
+
+	'EmailMessage.send()' abre (y cierra) una conexión SMTP/TLS por cada
+	correo. 'MailDispatcher' mantiene abierta una conexión por hilo
+	('get_connection') y la reutiliza entre envíos; los correos de un lote se
+	envían uno a uno en la misma conexión, así si el servidor la cierra a
+	mitad del lote solo se reenvían los que faltan.
+
+	Configuración en 'EMAIL_DISPATCHER' (settings.py):
+
+		- 'BATCH_SIZE': correos por cada 'send_messages'.
+		- 'MAX_IDLE': segundos sin uso antes de cerrar la conexión (los
+		  servidores SMTP cierran las conexiones inactivas).
+		- 'RATE_LIMITS': correos por segundo de cada proveedor ('EMAIL_HOST'),
+		  'DEFAULT_RATE' para el resto ('0' sin límite).
+"""
+import time, smtplib, threading
+from collections.abc import Iterable
+from itertools import islice
+
+from django.conf import settings
+from django.core.mail import get_connection, EmailMessage
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_MAX_IDLE = 60
+DEFAULT_RATE = 0
+
+# Errores de una conexión que el servidor ya cerró
+CONNECTION_ERRORS = (smtplib.SMTPServerDisconnected, ConnectionError)
+
+
+def get_config() -> dict:
+	return getattr(settings, "EMAIL_DISPATCHER", {})
+
+
+class RateLimiter:
+	"""
+		Espacia los envíos para no superar 'rate' correos por segundo.
+	"""
+	def __init__(self, rate: float = DEFAULT_RATE):
+		self.interval = 1 / rate if rate else 0
+		self.next_time = 0.0
+		self.lock = threading.Lock()
+
+	def wait(self, size: int = 1) -> None:
+		if not self.interval:
+			return
+
+		with self.lock:
+			now = time.monotonic()
+			start = max(now, self.next_time)
+			self.next_time = start + self.interval * size
+
+		if start > now:
+			time.sleep(start - now)
+
+
+_limiters: dict[str | None, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(provider: str | None) -> RateLimiter:
+	"""
+		El límite es de cada proveedor, compartido por todos los hilos.
+	"""
+	config = get_config()
+
+	with _limiters_lock:
+		if provider not in _limiters:
+			_limiters[provider] = RateLimiter(
+				rate = config.get("RATE_LIMITS", {}).get(
+					provider, 
+					config.get("DEFAULT_RATE", DEFAULT_RATE)
+				)
+			)
+
+		return _limiters[provider]
+
+
+class MailDispatcher:
+	def __init__(self, backend: str | None = None, **options):
+		config = get_config()
+
+		self.backend = backend
+		self.options = options
+		self.batch_size = config.get("BATCH_SIZE", DEFAULT_BATCH_SIZE)
+		self.max_idle = config.get("MAX_IDLE", DEFAULT_MAX_IDLE)
+
+		self.limiter = get_limiter(
+			provider = options.get("host") or getattr(settings, "EMAIL_HOST", None)
+		)
+
+		self.connection = None
+		self.last_used = 0.0
+		# Una conexión SMTP no se puede usar desde varios hilos a la vez
+		self.lock = threading.RLock()
+
+	def open(self):
+		if self.connection is not None and time.monotonic() - self.last_used > self.max_idle:
+			self.close()
+
+		if self.connection is None:
+			self.connection = get_connection(self.backend, **self.options)
+			# Abierta aquí, 'send_messages' no la cierra al terminar
+			self.connection.open()
+
+		return self.connection
+
+	def close(self) -> None:
+		with self.lock:
+			if self.connection is None:
+				return
+
+			try:
+				self.connection.close()
+			except CONNECTION_ERRORS:
+				pass
+			finally:
+				self.connection = None
+
+	def send_batch(self, messages: list[EmailMessage]) -> int:
+		with self.lock:
+			self.limiter.wait(size = len(messages))
+
+			sent = 0
+			retried = False
+			index = 0
+
+			while index < len(messages):
+				try:
+					sent += self.open().send_messages(messages[index:index + 1]) or 0
+				except CONNECTION_ERRORS:
+					if retried:
+						raise
+
+					# El servidor cerró la conexión, se intenta una vez con una
+					# nueva desde el correo que falló (los anteriores ya se enviaron)
+					retried = True
+					self.close()
+					continue
+
+				index += 1
+				self.last_used = time.monotonic()
+
+			return sent
+
+	def send(self, message: EmailMessage) -> int:
+		return self.send_batch([message])
+
+	def send_many(self, messages: Iterable[EmailMessage]) -> int:
+		"""
+			Envía los correos por lotes de 'BATCH_SIZE' en la misma conexión.
+			Devuelve la cantidad de correos enviados.
+		"""
+		messages = iter(messages)
+		sent = 0
+
+		while batch := list(islice(messages, self.batch_size)):
+			sent += self.send_batch(batch)
+
+		return sent
+
+
+_local = threading.local()
+
+
+def get_dispatcher() -> MailDispatcher:
+	"""
+		Un 'MailDispatcher' (y una conexión) por hilo.
+	"""
+	dispatcher = getattr(_local, "dispatcher", None)
+
+	if dispatcher is None:
+		dispatcher = _local.dispatcher = MailDispatcher()
+
+	return dispatcher
+
+
+def close_dispatcher() -> None:
+	dispatcher = getattr(_local, "dispatcher", None)
+
+	if dispatcher is not None:
+		dispatcher.close()
+		_local.dispatcher = None
+
+
+@receiver(setting_changed)
+def reset_dispatcher(setting: str, **kwargs) -> None:
+	# 'EMAIL_DISPATCHER', 'EMAIL_BACKEND', 'EMAIL_HOST', ...
+	if setting.startswith("EMAIL_"):
+		close_dispatcher()
+
+		with _limiters_lock:
+			_limiters.clear()
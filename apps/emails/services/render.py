@@ -0,0 +1,130 @@
+"""
+	Renderizado de los templates de correo ('templates/emails/').
+
+	Cada template se busca y se compila una sola vez por proceso
+	('get_email_template'); antes se cargaba hasta tres veces por correo
+	('get_template' para validar que existe, 'render_to_string' y la
+	validación de 'EmailResetPassword').
+
+	Del mismo renderizado se obtiene el HTML y su versión en texto plano
+	('RenderedEmail'), que se adjunta como alternativa para los clientes
+	de correo que no muestran HTML. 'render_many' renderiza un lote de
+	contextos con el mismo template.
+
+	Los valores comunes a todos los correos ('issued': fecha de emisión,
+	antes '{% now %}' en cada correo) se calculan una vez por lote.
+"""
+import re, html, datetime
+from dataclasses import dataclass
+from functools import cache
+from typing import Iterable
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.template import Context
+from django.template.exceptions import TemplateDoesNotExist
+from django.template.loader import get_template
+from django.utils import dateformat, timezone
+from django.utils.autoreload import file_changed
+
+PATH_TEMPLATES = "emails/"
+ISSUED_FORMAT = "d N Y P"
+
+TEMPLATE_DOES_NOT_EXIST = "No existe este template: {path}"
+
+# Contenido que no se muestra en el texto plano
+RE_HIDDEN = re.compile(r"<(head|style|script)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+# Etiquetas que terminan una línea
+RE_BREAK = re.compile(r"<br\s*/?>|</(p|div|h[1-6]|li|tr|header|footer|table)\s*>", re.IGNORECASE)
+# Los templates son HTML propio y los valores del contexto se escapan,
+# una expresión regular basta ('strip_tags' usa un 'HTMLParser', más lento)
+RE_TAGS = re.compile(r"<[^>]*>")
+RE_BLANK_LINES = re.compile(r"\n{3,}")
+
+
+@dataclass(frozen = True)
+class RenderedEmail:
+	html: str
+	text: str
+
+
+@cache
+def get_email_template(template_name: str):
+	"""
+		Template compilado de 'templates/emails/<template_name>'.
+	"""
+	path = f"{PATH_TEMPLATES}{template_name}"
+
+	try:
+		return get_template(path)
+	except TemplateDoesNotExist:
+		raise ValueError(TEMPLATE_DOES_NOT_EXIST.format(path = path))
+
+
+@receiver(setting_changed)
+def reset_templates(setting: str, **kwargs) -> None:
+	if setting == "TEMPLATES":
+		get_email_template.cache_clear()
+
+
+@receiver(file_changed)
+def reset_templates_on_change(file_path, **kwargs) -> None:
+	# 'runserver' no se reinicia por cambios en los templates,
+	# se vuelven a compilar en el siguiente correo
+	if file_path.suffix == ".html":
+		get_email_template.cache_clear()
+
+
+def html_to_text(content: str) -> str:
+	content = RE_HIDDEN.sub("", content)
+	content = RE_BREAK.sub("\n", content)
+	content = html.unescape(RE_TAGS.sub("", content))
+
+	# Un solo espacio entre palabras ('split' es más rápido que una expresión regular)
+	lines = [" ".join(line.split()) for line in content.splitlines()]
+
+	return RE_BLANK_LINES.sub("\n\n", "\n".join(lines)).strip()
+
+
+def get_shared_context() -> dict:
+	"""
+		Valores comunes a todos los correos de un lote.
+	"""
+	# Igual que '{% now %}'
+	now = datetime.datetime.now(
+		tz = timezone.get_current_timezone() if settings.USE_TZ else None
+	)
+
+	return {"issued": dateformat.format(now, ISSUED_FORMAT)}
+
+
+def render_email(template_name: str, context: dict | None = None) -> RenderedEmail:
+	content = get_email_template(template_name).render({
+		**get_shared_context(),
+		**(context or {})
+	})
+
+	return RenderedEmail(html = content, text = html_to_text(content))
+
+
+def render_many(template_name: str, contexts: Iterable[dict]) -> list[RenderedEmail]:
+	"""
+		Renderiza el mismo template con cada uno de los 'contexts',
+		reutilizando un único 'Context'.
+	"""
+	template = get_email_template(template_name)
+	context = Context(
+		get_shared_context(),
+		autoescape = template.backend.engine.autoescape
+	)
+
+	result = []
+
+	for values in contexts:
+		with context.push(values):
+			content = template.template.render(context)
+
+		result.append(RenderedEmail(html = content, text = html_to_text(content)))
+
+	return result
@@ -1,11 +1,9 @@
-import os
 from django.conf import settings
-from django.template.exceptions import TemplateDoesNotExist
-from django.template.loader import render_to_string, get_template
 
 from .send_email import SendEmail
 from .send_email import ConfigEmail
 from .send_email import ContentHTMLMessage
+from .render import get_email_template
 
 
 class EmailResetPassword:
@@ -15,8 +13,8 @@ class EmailResetPassword:
 	
 	def __init__(self, data_message:dict = {},  emails_to: list[str] | tuple[str] = []) -> None:
 		try:
-			template = get_template(f"emails/{self.template_name}")
-		except TemplateDoesNotExist as e:
+			get_email_template(self.template_name)
+		except ValueError:
 			raise ValueError(f"El template definido para esta servicio no existe {self.template_name}")
 
 		if not isinstance(data_message, dict):
@@ -36,18 +34,25 @@ class EmailResetPassword:
 
 		self.emails_to = emails_to
 
-		self.content_message = ContentHTMLMessage.set_message(
+		rendered = ContentHTMLMessage.render(
 			template_name = self.template_name, 
 			context = {"name": data_message['name_user'], "password": data_message['password']}
 		)
 
+		self.content_message = rendered.html
+		self.content_text = rendered.text
+
+		# Texto plano como cuerpo y el HTML como alternativa
 		self.email = ConfigEmail.set_config(
 			subject = self.subject,
 			from_email = self.from_email,
 			to = self.emails_to,
-			content = self.content_message,
-			subtype = "html"
+			content = self.content_text,
+			subtype = "text"
 		)
+		# 'text/plain' (ConfigEmail usa el subtipo 'text')
+		self.email.content_subtype = "plain"
+		self.email.attach_alternative(self.content_message, "text/html")
 
 	def send(self) -> int:
 		result = SendEmail.send(email = self.email)
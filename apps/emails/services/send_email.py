@@ -1,6 +1,7 @@
-from django.template.loader import render_to_string, get_template
 from django.core.mail import EmailMultiAlternatives
-from django.template.exceptions import TemplateDoesNotExist
+
+from .dispatcher import get_dispatcher
+from .render import get_email_template, render_email, RenderedEmail
 
 class ContentHTMLMessage:
 	BASIC_TEMPLATE = "template_email_basic.html"
@@ -8,11 +9,15 @@ class ContentHTMLMessage:
 	
 	@classmethod
 	def set_message(cls, template_name:str = BASIC_TEMPLATE, context:dict = {}) -> str:
-		try:
-			path_template = f"{cls.PATH_TEMPLATES}{template_name}"
-			template = get_template(path_template)
-		except TemplateDoesNotExist as e:
-			raise ValueError(f"No existe este template: {cls.PATH_TEMPLATES}{template_name}")
+		return cls.render(template_name = template_name, context = context).html
+
+	@classmethod
+	def render(cls, template_name:str = BASIC_TEMPLATE, context:dict = {}) -> RenderedEmail:
+		"""
+			HTML y texto plano del mensaje, el template se compila una sola vez
+		"""
+		# Error si el template no existe
+		get_email_template(template_name)
 
 		if not template_name:
 			raise ValueError("Debe indicar el nombre del template")
@@ -23,13 +28,7 @@ class ContentHTMLMessage:
 		if not isinstance(context, dict):
 			raise ValueError("Debe pasar un diccionario con los valores para el template")
 
-		
-		template = f"{cls.PATH_TEMPLATES}{template_name}"
-		
-		return render_to_string(
-			template,
-			context=context
-		)
+		return render_email(template_name, context = context)
 
 class ConfigEmail:
 	SUBTYPE_TEXT = "text"
@@ -72,7 +71,13 @@ class SendEmail:
 		if not isinstance(email, EmailMultiAlternatives):
 			raise ValueError("Debe ser una instancia de: [ EmailMultiAlternatives ]")
 
-		try:
-			return email.send()
-		except Exception as e:
-			raise e
\ No newline at end of file
+		# Reutiliza la conexión SMTP del proceso
+		return get_dispatcher().send(email)
+
+	@classmethod
+	def send_many(cls, emails: list[EmailMultiAlternatives]) -> int:
+		if not all(isinstance(email, EmailMultiAlternatives) for email in emails):
+			raise ValueError("Deben ser instancias de: [ EmailMultiAlternatives ]")
+
+		# Los correos se envían por lotes en una misma conexión
+		return get_dispatcher().send_many(emails)
\ No newline at end of file
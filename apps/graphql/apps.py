@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class GraphqlConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.graphql'
+
+    def ready(self):
+        import apps.graphql.receivers
@@ -0,0 +1,324 @@
+"""
+	Caché de las respuestas de las queries públicas de '/graphql'.
+
+	Los tipos públicos declaran su tiempo de vida y el recurso al que
+	pertenecen con la directiva '@cacheControl'. Una query se guarda solo
+	si todos los tipos que consulta la declaran y cada campo raíz filtra
+	por el subdominio de una escuela; la llave incluye la versión de los
+	recursos de esas escuelas ('apps.school.services.cache'), por lo que
+	las escrituras en 'apps.school.models' invalidan las respuestas.
+
+	Las peticiones autenticadas nunca se guardan, tampoco las que leyeron
+	de una réplica que puede no tener el último cambio de sus recursos.
+"""
+import json, hashlib
+
+from django.conf import settings
+
+from graphql import (
+	ArgumentNode,
+	DocumentNode,
+	ExecutionResult,
+	FieldNode,
+	FragmentSpreadNode,
+	GraphQLNamedType,
+	GraphQLObjectType,
+	GraphQLSchema,
+	InlineFragmentNode,
+	ObjectValueNode,
+	OperationDefinitionNode,
+	SelectionSetNode,
+	StringValueNode,
+	VariableNode,
+	get_named_type,
+	is_leaf_type,
+	print_ast,
+)
+import strawberry
+from strawberry.extensions import SchemaExtension
+from strawberry.schema_directive import Location
+
+from apps.school.services.cache import school_cache, school_scope, SCOPE_SCHOOLS
+from apps.school.services.subdomains import aget_request_school_id
+from school import routers
+
+KEY_PREFIX = "graphql-cache"
+CACHE_HEADER = "X-Cache"
+SUBDOMAIN_ARGUMENT = "subdomain"
+# Operadores de los filtros que pueden incluir a otras escuelas
+LOGICAL_ARGUMENTS = ("AND", "OR", "NOT")
+
+
+@strawberry.schema_directive(locations = [Location.OBJECT], name = "cacheControl")
+class CacheControl:
+	max_age: int
+	resource: str
+
+
+def get_config() -> dict:
+	return getattr(settings, "GRAPHQL_RESPONSE_CACHE", {})
+
+
+def get_cache_control(named_type: GraphQLNamedType) -> CacheControl | None:
+	definition = named_type.extensions.get("strawberry-definition")
+
+	for directive in getattr(definition, "directives", None) or []:
+		if isinstance(directive, CacheControl):
+			return directive
+
+	return None
+
+
+def is_wrapper(named_type: GraphQLNamedType) -> bool:
+	"""
+		Tipos de strawberry que solo envuelven a los tipos del esquema
+		(conexiones, 'edges', 'pageInfo', paginación).
+	"""
+	definition = named_type.extensions.get("strawberry-definition")
+	origin = getattr(definition, "origin", None)
+
+	return getattr(origin, "__module__", "").startswith("strawberry")
+
+
+class CachePolicy:
+	"""
+		Tiempo de vida, recursos y escuelas que consulta una query.
+	"""
+	def __init__(self, schema: GraphQLSchema, document: DocumentNode, variables: dict | None) -> None:
+		self.schema = schema
+		self.variables = variables or {}
+		self.fragments = {
+			definition.name.value: definition
+			for definition in document.definitions
+			if definition.kind == "fragment_definition"
+		}
+		self.max_age: int | None = None
+		self.resources: set[str] = set()
+		self.subdomains: set[str] = set()
+
+	def get_subdomains(self, node: ArgumentNode | ObjectValueNode) -> list[str | None]:
+		subdomains = []
+		fields = node.fields if isinstance(node, ObjectValueNode) else [node]
+
+		for field in fields:
+			value = field.value
+
+			if field.name.value in LOGICAL_ARGUMENTS:
+				subdomains.append(None)
+
+			elif field.name.value == SUBDOMAIN_ARGUMENT:
+				if isinstance(value, StringValueNode):
+					subdomains.append(value.value)
+				elif isinstance(value, VariableNode):
+					subdomains.append(self.variables.get(value.name.value))
+				else:
+					subdomains.append(None)
+
+			elif isinstance(value, ObjectValueNode):
+				subdomains.extend(self.get_subdomains(value))
+
+		return subdomains
+
+	def add_root(self, root_type: GraphQLObjectType, node: FieldNode) -> bool:
+		if node.name.value == "__typename":
+			return True
+
+		subdomains = []
+
+		for argument in node.arguments:
+			subdomains.extend(self.get_subdomains(argument))
+
+		# Sin escuela no hay una versión que invalide la respuesta
+		if not subdomains or not all(isinstance(value, str) for value in subdomains):
+			return False
+
+		self.subdomains.update(subdomains)
+
+		return self.add_field(root_type, node)
+
+	def add_field(self, parent_type: GraphQLObjectType, node: FieldNode) -> bool:
+		field = parent_type.fields.get(node.name.value)
+
+		if field is None:
+			return node.name.value == "__typename"
+
+		named_type = get_named_type(field.type)
+
+		if is_leaf_type(named_type):
+			return True
+
+		if not is_wrapper(named_type):
+			cache_control = get_cache_control(named_type)
+
+			if cache_control is None:
+				return False
+
+			self.resources.add(cache_control.resource)
+			self.max_age = (
+				cache_control.max_age if self.max_age is None
+				else min(self.max_age, cache_control.max_age)
+			)
+
+		return self.add_selections(named_type, node.selection_set)
+
+	def add_selections(self, parent_type: GraphQLNamedType, selection_set: SelectionSetNode | None) -> bool:
+		if selection_set is None:
+			return True
+
+		if not isinstance(parent_type, GraphQLObjectType):
+			return False
+
+		for selection in selection_set.selections:
+			if isinstance(selection, FieldNode):
+				cacheable = self.add_field(parent_type, selection)
+
+			elif isinstance(selection, InlineFragmentNode):
+				fragment_type = (
+					self.schema.get_type(selection.type_condition.name.value)
+					if selection.type_condition else parent_type
+				)
+				cacheable = self.add_selections(fragment_type, selection.selection_set)
+
+			else:
+				fragment = self.fragments[selection.name.value]
+				fragment_type = self.schema.get_type(fragment.type_condition.name.value)
+				cacheable = self.add_selections(fragment_type, fragment.selection_set)
+
+			if not cacheable:
+				return False
+
+		return True
+
+	def add_operation(self, operation: OperationDefinitionNode) -> bool:
+		root_type = self.schema.query_type
+
+		for selection in operation.selection_set.selections:
+			if not isinstance(selection, FieldNode) or not self.add_root(root_type, selection):
+				return False
+
+		return self.max_age is not None and self.max_age > 0
+
+	async def get_scopes(self, request = None) -> list[str]:
+		scopes = []
+
+		for subdomain in sorted(self.subdomains):
+			school_id = await aget_request_school_id(request, subdomain)
+			# Una escuela creada con este subdominio cambia 'SCOPE_SCHOOLS'
+			scopes.append(school_scope(school_id) if school_id else SCOPE_SCHOOLS)
+
+		return scopes
+
+
+class ResponseCache(SchemaExtension):
+	"""
+		Guarda el resultado de las queries anónimas que solo consultan
+		tipos públicos (con '@cacheControl').
+	"""
+	key: str | None = None
+	max_age: int | None = None
+	# Momento del último cambio de los recursos (la mayor versión)
+	changed_at: int = 0
+
+	def is_anonymous(self) -> bool:
+		request = getattr(self.execution_context.context, "request", None)
+
+		if request is None:
+			return False
+
+		return not request.headers.get("Authorization")
+
+	def get_operation(self) -> OperationDefinitionNode | None:
+		context = self.execution_context
+		operations = [
+			definition
+			for definition in context.graphql_document.definitions
+			if definition.kind == "operation_definition"
+			and (
+				context.operation_name is None
+				or (definition.name and definition.name.value == context.operation_name)
+			)
+		]
+
+		if len(operations) != 1 or operations[0].operation.value != "query":
+			return None
+
+		return operations[0]
+
+	async def get_key(self, policy: CachePolicy) -> str:
+		context = self.execution_context
+		scopes = await policy.get_scopes(
+			getattr(context.context, "request", None)
+		)
+
+		resources = {
+			resource: await school_cache.aget_versions(resource, scopes)
+			for resource in sorted(policy.resources)
+		}
+		versions = [
+			f"{resource}:{'.'.join(str(v) for v in values)}"
+			for resource, values in resources.items()
+		]
+
+		self.changed_at = max((max(values) for values in resources.values() if values), default = 0)
+
+		digest = hashlib.sha256(
+			json.dumps(
+				[
+					print_ast(context.graphql_document),
+					context.operation_name,
+					context.variables or {},
+					scopes,
+					versions
+				],
+				sort_keys = True,
+				default = str
+			).encode()
+		).hexdigest()
+
+		return f"{KEY_PREFIX}:{digest}"
+
+	def set_header(self, value: str) -> None:
+		response = getattr(self.execution_context.context, "response", None)
+
+		if response is not None:
+			response[CACHE_HEADER] = value
+
+	async def on_execute(self):
+		context = self.execution_context
+
+		if (
+			not get_config().get("ENABLED", True)
+			or context.result is not None
+			or not self.is_anonymous()
+		):
+			yield
+			return
+
+		operation = self.get_operation()
+		policy = CachePolicy(context.schema._schema, context.graphql_document, context.variables)
+
+		if operation is None or not policy.add_operation(operation):
+			yield
+			return
+
+		self.key = await self.get_key(policy)
+		self.max_age = policy.max_age
+
+		data = await school_cache.cache.aget(self.key)
+
+		if data is not None:
+			context.result = ExecutionResult(data = data)
+			self.set_header("HIT")
+			self.key = None
+
+		yield
+
+		result = context.result
+
+		if self.key is None or result is None:
+			return
+
+		if not result.errors and result.data is not None and not routers.may_be_stale(self.changed_at):
+			await school_cache.cache.aset(self.key, result.data, timeout = self.max_age)
+
+		self.set_header("MISS")
@@ -0,0 +1,291 @@
+"""
+	Límites de costo y profundidad de las queries de '/graphql'.
+
+	El costo se calcula antes de ejecutar la query, a partir del documento
+	y sus variables: cada campo suma su peso ('FIELD_WEIGHTS') por cada
+	elemento que puede devolver (argumentos 'first', 'last' o
+	'pagination: {limit}'). Las queries que superan 'MAX_COST' no se
+	ejecutan; el costo calculado se informa en 'extensions.cost'.
+"""
+from typing import Any
+
+from django.conf import settings
+
+from graphql import (
+	ExecutionResult,
+	FieldNode,
+	FragmentSpreadNode,
+	GraphQLError,
+	GraphQLField,
+	GraphQLNamedType,
+	GraphQLObjectType,
+	GraphQLSchema,
+	InlineFragmentNode,
+	SelectionSetNode,
+	get_named_type,
+	get_nullable_type,
+	is_leaf_type,
+	is_list_type,
+)
+from graphql.execution.values import get_argument_values
+from strawberry.extensions import SchemaExtension
+from strawberry.types.graphql import OperationType
+
+from apps.monitoring.services import requests
+from school import routers
+
+DEFAULT_MAX_COST = 2000
+DEFAULT_MAX_DEPTH = 10
+DEFAULT_LIST_SIZE = 10
+DEFAULT_CONNECTION_SIZE = 100
+
+COST_EXCEEDED_MESSAGE = "La consulta excede el costo máximo permitido ({cost} > {max_cost})"
+NEGATIVE_SIZE_MESSAGE = "'{name}' no puede ser negativo ({value})"
+
+# Peso por elemento de los campos ('Tipo.campo'), el resto usa:
+# 0 para los escalares y 1 para los objetos
+FIELD_WEIGHTS: dict[str, int] = {}
+
+
+def get_config() -> dict:
+	return getattr(settings, "GRAPHQL_QUERY_COST", {})
+
+
+def get_max_depth() -> int:
+	return get_config().get("MAX_DEPTH", DEFAULT_MAX_DEPTH)
+
+
+def is_connection(named_type: GraphQLNamedType) -> bool:
+	return named_type.name.endswith("Connection")
+
+
+def get_list_size(field: GraphQLField, arguments: dict[str, Any]) -> int:
+	"""
+		Cantidad máxima de elementos que puede devolver el campo.
+	"""
+	config = get_config()
+	field_type = get_nullable_type(field.type)
+	named_type = get_named_type(field_type)
+
+	pagination = arguments.get("pagination")
+	limit = None
+
+	if pagination is not None:
+		limit = (
+			pagination.get("limit") if isinstance(pagination, dict)
+			else getattr(pagination, "limit", None)
+		)
+
+	sizes = (
+		("first", arguments.get("first")),
+		("last", arguments.get("last")),
+		("pagination.limit", limit)
+	)
+
+	for name, size in sizes:
+		if size is None:
+			continue
+
+		# Un tamaño negativo restaría costo a los otros campos de la query
+		# y 'pagination: {limit: -1}' devuelve todos los elementos
+		if size < 0:
+			raise GraphQLError(
+				NEGATIVE_SIZE_MESSAGE.format(name = name, value = size),
+				extensions = {"code": "BAD_USER_INPUT"}
+			)
+
+		return size
+
+	if is_connection(named_type):
+		return config.get("DEFAULT_CONNECTION_SIZE", DEFAULT_CONNECTION_SIZE)
+
+	if is_list_type(field_type):
+		return config.get("DEFAULT_LIST_SIZE", DEFAULT_LIST_SIZE)
+
+	return 1
+
+
+def get_weight(parent_type: GraphQLNamedType, name: str, field: GraphQLField) -> int:
+	weights = {**FIELD_WEIGHTS, **get_config().get("FIELD_WEIGHTS", {})}
+
+	default = 0 if is_leaf_type(get_named_type(field.type)) else 1
+
+	return weights.get(f"{parent_type.name}.{name}", default)
+
+
+class QueryCost:
+	def __init__(self, schema: GraphQLSchema, fragments: dict, variables: dict | None) -> None:
+		self.schema = schema
+		self.fragments = fragments
+		self.variables = variables or {}
+
+	def selection_cost(
+		self, 
+		parent_type: GraphQLNamedType, 
+		selection_set: SelectionSetNode | None, 
+		page_size: int | None = None
+	) -> int:
+		if selection_set is None or not isinstance(parent_type, GraphQLObjectType):
+			return 0
+
+		cost = 0
+
+		for selection in selection_set.selections:
+			if isinstance(selection, FieldNode):
+				cost += self.field_cost(parent_type, selection, page_size)
+
+			elif isinstance(selection, InlineFragmentNode):
+				fragment_type = (
+					self.schema.get_type(selection.type_condition.name.value)
+					if selection.type_condition else parent_type
+				)
+				cost += self.selection_cost(fragment_type, selection.selection_set, page_size)
+
+			elif isinstance(selection, FragmentSpreadNode):
+				fragment = self.fragments[selection.name.value]
+				fragment_type = self.schema.get_type(fragment.type_condition.name.value)
+				cost += self.selection_cost(fragment_type, fragment.selection_set, page_size)
+
+		return cost
+
+	def field_cost(self, parent_type: GraphQLObjectType, node: FieldNode, page_size: int | None = None) -> int:
+		name = node.name.value
+		field = parent_type.fields.get(name)
+
+		# '__typename' y los campos de introspección
+		if field is None:
+			return 0
+
+		arguments = get_argument_values(field, node, self.variables)
+
+		weight = get_weight(parent_type, name, field)
+		field_type = get_named_type(field.type)
+
+		if is_connection(field_type):
+			# La cantidad de elementos se aplica a 'edges', no a la conexión
+			return weight + self.selection_cost(
+				field_type, 
+				node.selection_set, 
+				get_list_size(field, arguments)
+			)
+
+		if is_connection(parent_type) and name == "edges":
+			size = page_size
+		else:
+			size = get_list_size(field, arguments)
+
+		return size * (weight + self.selection_cost(field_type, node.selection_set))
+
+
+class QueryCostLimiter(SchemaExtension):
+	"""
+		Rechaza, antes de ejecutarlas, las queries cuyo costo supera
+		'GRAPHQL_QUERY_COST["MAX_COST"]'.
+	"""
+	cost: int | None = None
+
+	def get_max_cost(self) -> int:
+		return get_config().get("MAX_COST", DEFAULT_MAX_COST)
+
+	def calculate_cost(self) -> int:
+		context = self.execution_context
+		schema = context.schema._schema
+		document = context.graphql_document
+
+		fragments = {
+			definition.name.value: definition
+			for definition in document.definitions
+			if definition.kind == "fragment_definition"
+		}
+
+		operation = context.operation_type.value
+		root_type = {
+			"query": schema.query_type,
+			"mutation": schema.mutation_type,
+			"subscription": schema.subscription_type
+		}[operation]
+
+		query_cost = QueryCost(schema, fragments, context.variables)
+
+		return sum(
+			query_cost.selection_cost(root_type, definition.selection_set)
+			for definition in document.definitions
+			if definition.kind == "operation_definition"
+			and definition.operation.value == operation
+			and (
+				context.operation_name is None
+				or (definition.name and definition.name.value == context.operation_name)
+			)
+		)
+
+	def on_execute(self):
+		try:
+			self.cost = self.calculate_cost()
+		except GraphQLError as error:
+			self.execution_context.result = ExecutionResult(data = None, errors = [error])
+			yield
+			return
+
+		max_cost = self.get_max_cost()
+
+		if self.cost > max_cost:
+			self.execution_context.result = ExecutionResult(
+				data = None,
+				errors = [
+					GraphQLError(
+						COST_EXCEEDED_MESSAGE.format(cost = self.cost, max_cost = max_cost),
+						extensions = {"code": "QUERY_TOO_COMPLEX"}
+					)
+				]
+			)
+
+		yield
+
+	def get_results(self) -> dict[str, Any]:
+		if self.cost is None:
+			return {}
+
+		return {
+			"cost": {
+				"requested": self.cost,
+				"maximum": self.get_max_cost()
+			}
+		}
+
+
+class ReplicaReads(SchemaExtension):
+	"""
+		Las queries anónimas (sin 'Authorization') leen de las réplicas
+		de la base de datos ('school.routers'), las mutaciones y las
+		peticiones autenticadas leen de 'default'.
+	"""
+	def is_public_query(self) -> bool:
+		request = getattr(self.execution_context.context, "request", None)
+
+		return (
+			request is not None
+			and self.execution_context.operation_type == OperationType.QUERY
+			and not request.headers.get("Authorization")
+		)
+
+	def on_execute(self):
+		if not routers.replicas_enabled() or not self.is_public_query():
+			yield
+			return
+
+		with routers.replica_reads():
+			yield
+
+
+class OperationMetrics(SchemaExtension):
+	"""
+		Agrupa las métricas de la petición ('apps.monitoring') por el
+		nombre de la operación: 'graphql:<operationName>'.
+	"""
+	def on_execute(self):
+		metrics = requests.get_current()
+
+		if metrics is not None:
+			metrics.operation = self.execution_context.operation_name or ""
+
+		yield
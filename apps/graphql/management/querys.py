@@ -5,7 +5,7 @@ import strawberry, strawberry_django
 
 
 from apps.management import models
-from apps.graphql.utils import get_user_from_token
+from apps.graphql.utils import aget_user_from_token
 
 from .types import Response, AdminResponse, AdminErrorResponse, ErrorCode
 
@@ -24,9 +24,9 @@ CODE_PERMISSION_DETAIL = "WITHOUT_SCHOOL_PERMISSION"
 class AdministratorDetailQuery:
 	
 	@strawberry_django.field
-	def administrator(self, pk: strawberry.ID, info: strawberry.Info) -> Response:
+	async def administrator(self, pk: strawberry.ID, info: strawberry.Info) -> Response:
 		messages = []
-		user = get_user_from_token(info.context.request)
+		user = await aget_user_from_token(info.context.request)
 		
 		if not user.is_authenticated:
 			messages.append(
@@ -36,7 +36,7 @@ class AdministratorDetailQuery:
 					code= ErrorCode(code=CODE_UNAUTHENTICATED, status = STATUS_CODE_UNAUTHENTICATED)
 				)
 			)
-		elif not models.Administrator.objects.filter(pk = pk, users__id = user.id).exists():
+		elif not await models.Administrator.objects.filter(pk = pk, users__id = user.id).aexists():
 			messages.append( 
 				AdminErrorResponse(
 					kind=ERROR_PERMISSION,
@@ -49,11 +49,11 @@ class AdministratorDetailQuery:
 		if messages:
 			return AdminResponse(messages = messages)
 
-		return models.Administrator.objects.select_related(
+		return await models.Administrator.objects.select_related(
 			"school"
 		).prefetch_related(
 			Prefetch(
 				"users",
 				queryset = get_user_model().objects.all()
 			)
-		).filter(pk = pk, users__id = user.id).first()
+		).filter(pk = pk, users__id = user.id).afirst()
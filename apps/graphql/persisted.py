@@ -0,0 +1,187 @@
+"""
+	Queries persistidas (protocolo 'Automatic Persisted Queries').
+
+	El cliente envía el hash SHA-256 de la query en
+	'extensions.persistedQuery.sha256Hash'; si el servidor ya la conoce no
+	hace falta enviarla de nuevo. Los documentos se guardan ya analizados y
+	validados, por lo que las queries conocidas no vuelven a pasar por
+	'parse' ni por la validación.
+
+	- Caché LRU en memoria del proceso ('MAXSIZE').
+	- Lista opcional de queries permitidas ('ALLOWLIST'): un JSON
+	  '{hash: query}' que se carga al iniciar y no se desaloja.
+"""
+import json, hashlib
+from threading import Lock
+from collections import OrderedDict
+from pathlib import Path
+
+from django.conf import settings
+
+from graphql import DocumentNode, GraphQLError
+from strawberry.extensions import SchemaExtension
+
+PERSISTED_QUERY_VERSION = 1
+
+PERSISTED_QUERY_NOT_FOUND = "PersistedQueryNotFound"
+PERSISTED_QUERY_NOT_SUPPORTED = "PersistedQueryNotSupported"
+PERSISTED_QUERY_HASH_MISMATCH = "El hash no corresponde a la query enviada"
+
+
+def get_hash(query: str) -> str:
+	return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+class PersistedQueryStore:
+	def __init__(self, maxsize: int = 1000, allowlist: dict[str, str] | None = None) -> None:
+		self.maxsize = maxsize
+		self.allowlist = allowlist or {}
+		self._data: OrderedDict[str, tuple[str, DocumentNode]] = OrderedDict()
+		self._pinned: dict[str, tuple[str, DocumentNode]] = {}
+		self._lock = Lock()
+
+	def __len__(self) -> int:
+		return len(self._data) + len(self._pinned)
+
+	def get_query(self, query_hash: str) -> str | None:
+		item = self.get(query_hash)
+
+		if item is not None:
+			return item[0]
+
+		return self.allowlist.get(query_hash)
+
+	def get(self, query_hash: str) -> tuple[str, DocumentNode] | None:
+		with self._lock:
+			item = self._pinned.get(query_hash)
+
+			if item is not None:
+				return item
+
+			item = self._data.get(query_hash)
+
+			if item is not None:
+				self._data.move_to_end(query_hash)
+
+			return item
+
+	def set(self, query_hash: str, query: str, document: DocumentNode) -> None:
+		with self._lock:
+			if query_hash in self.allowlist:
+				self._pinned[query_hash] = (query, document)
+				return
+
+			self._data[query_hash] = (query, document)
+			self._data.move_to_end(query_hash)
+
+			while len(self._data) > self.maxsize:
+				self._data.popitem(last = False)
+
+	def clear(self) -> None:
+		with self._lock:
+			self._data.clear()
+			self._pinned.clear()
+
+
+def get_config() -> dict:
+	return getattr(settings, "GRAPHQL_PERSISTED_QUERIES", {})
+
+
+def load_allowlist(path: str | Path | None) -> dict[str, str]:
+	if not path:
+		return {}
+
+	queries = json.loads(Path(path).read_text(encoding = "utf-8"))
+
+	for query_hash, query in queries.items():
+		if get_hash(query) != query_hash:
+			raise ValueError(f"{PERSISTED_QUERY_HASH_MISMATCH}: {query_hash}")
+
+	return queries
+
+
+def _create_store() -> PersistedQueryStore:
+	config = get_config()
+
+	return PersistedQueryStore(
+		maxsize = config.get("MAXSIZE", 1000),
+		allowlist = load_allowlist(config.get("ALLOWLIST"))
+	)
+
+
+persisted_queries = _create_store()
+
+
+class PersistedQueries(SchemaExtension):
+	"""
+		Resuelve las queries enviadas por su hash y guarda los documentos
+		validados de todas las queries (con o sin hash).
+	"""
+	query_hash: str | None = None
+	cached: bool = False
+
+	def get_persisted_hash(self) -> str | None:
+		extensions = self.execution_context.operation_extensions or {}
+		persisted = extensions.get("persistedQuery")
+
+		if not isinstance(persisted, dict):
+			return None
+
+		if persisted.get("version") != PERSISTED_QUERY_VERSION:
+			raise GraphQLError(
+				PERSISTED_QUERY_NOT_SUPPORTED,
+				extensions = {"code": "PERSISTED_QUERY_NOT_SUPPORTED"}
+			)
+
+		return persisted.get("sha256Hash")
+
+	def on_operation(self):
+		context = self.execution_context
+		enabled = get_config().get("ENABLED", True)
+
+		query_hash = self.get_persisted_hash() if enabled else None
+
+		if query_hash is not None:
+			if context.query is None:
+				context.query = persisted_queries.get_query(query_hash)
+
+				if context.query is None:
+					raise GraphQLError(
+						PERSISTED_QUERY_NOT_FOUND,
+						extensions = {"code": "PERSISTED_QUERY_NOT_FOUND"}
+					)
+
+			elif get_hash(context.query) != query_hash:
+				raise GraphQLError(
+					PERSISTED_QUERY_HASH_MISMATCH,
+					extensions = {"code": "PERSISTED_QUERY_HASH_MISMATCH"}
+				)
+
+		elif enabled and context.query:
+			query_hash = get_hash(context.query)
+
+		self.query_hash = query_hash
+
+		yield
+
+	def on_parse(self):
+		if self.query_hash is not None:
+			item = persisted_queries.get(self.query_hash)
+
+			if item is not None:
+				self.execution_context.graphql_document = item[1]
+				self.cached = True
+
+		yield
+
+	def on_validate(self):
+		if self.cached:
+			# El documento se validó antes de guardarlo
+			self.execution_context.pre_execution_errors = []
+
+		yield
+
+		context = self.execution_context
+
+		if not self.cached and self.query_hash is not None and not context.pre_execution_errors:
+			persisted_queries.set(self.query_hash, context.query, context.graphql_document)
@@ -0,0 +1,13 @@
+from django.dispatch import receiver
+from django.db.models import signals
+from django.contrib.auth import get_user_model
+
+from apps.graphql.tokens import tokens
+
+
+@receiver(signals.post_save, sender=get_user_model())
+@receiver(signals.post_delete, sender=get_user_model())
+def invalidate_user_tokens(sender, instance=None, **kwargs):
+	# Un 'id' puede volver a usarse, se invalida también al crear
+	tokens.delete_user(instance.pk)
+
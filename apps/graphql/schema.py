@@ -1,6 +1,11 @@
 import strawberry
+from strawberry.extensions import QueryDepthLimiter
 from strawberry_django.optimizer import DjangoOptimizerExtension
 
+from .cache import ResponseCache
+from .extensions import QueryCostLimiter, ReplicaReads, OperationMetrics, get_max_depth
+from .persisted import PersistedQueries
+
 from .school.querys import SchoolQuery
 from .management.querys import AdministratorDetailQuery
 
@@ -10,5 +15,13 @@ class Query(AdministratorDetailQuery, SchoolQuery):
 
 schema = strawberry.Schema(
 	query=Query,
-	extensions = [DjangoOptimizerExtension]
+	extensions = [
+		PersistedQueries,
+		DjangoOptimizerExtension,
+		QueryDepthLimiter(max_depth = get_max_depth()),
+		QueryCostLimiter,
+		ResponseCache,
+		ReplicaReads,
+		OperationMetrics
+	]
 )
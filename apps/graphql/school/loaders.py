@@ -0,0 +1,62 @@
+"""
+	DataLoaders de las relaciones del esquema de las escuelas.
+
+	Se crean por petición (ver 'apps.graphql.views'), así cada relación
+	se resuelve con una sola consulta sin importar la forma de la query
+	(alias, anidación o la cantidad de elementos de las listas).
+"""
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from django.db.models.base import ModelBase
+
+from asgiref.sync import sync_to_async
+from strawberry.dataloader import DataLoader
+
+from apps.school import models
+
+
+def load_many_to_many(model: ModelBase, field_name: str):
+	"""
+		Función de carga para 'DataLoader' de una relación 'ManyToManyField'
+		de 'model': por cada 'pk' devuelve la lista de los objetos relacionados.
+	"""
+	relation = model._meta.get_field(field_name)
+	through = relation.remote_field.through
+
+	source = relation.m2m_field_name()
+	target = relation.m2m_reverse_field_name()
+
+	def load(keys: list[int]) -> list[list]:
+		rows = through.objects.filter(
+			**{f"{source}_id__in": keys}
+		).select_related(target).order_by(f"{target}_id")
+
+		related = defaultdict(list)
+
+		for row in rows:
+			related[getattr(row, f"{source}_id")].append(getattr(row, target))
+
+		return [related.get(key, []) for key in keys]
+
+	return sync_to_async(load)
+
+
+def create_loader(model: ModelBase, field_name: str) -> DataLoader:
+	return DataLoader(load_fn = load_many_to_many(model, field_name))
+
+
+@dataclass
+class SchoolLoaders:
+	news_media: DataLoader = field(
+		default_factory = lambda: create_loader(models.News, "media")
+	)
+	infraestructure_media: DataLoader = field(
+		default_factory = lambda: create_loader(models.Infraestructure, "media")
+	)
+	repository_media: DataLoader = field(
+		default_factory = lambda: create_loader(models.Repository, "media")
+	)
+	setting_colors: DataLoader = field(
+		default_factory = lambda: create_loader(models.SettingFormat, "colors")
+	)
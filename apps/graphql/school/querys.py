@@ -5,6 +5,7 @@ from strawberry_django.relay import DjangoListConnection
 from strawberry_django.pagination import OffsetPaginated
 
 from apps.school import models
+from apps.school.services.subdomains import get_request_school_id, aget_request_school_id
 
 from .types import (
 	MonthsEnum,
@@ -32,18 +33,22 @@ class SchoolQuery:
 	infraestructure: DjangoListConnection[Infraestructure] = strawberry_django.connection()
 
 	@strawberry_django.field
-	def school(self, subdomain: str) -> School | None:
-		return models.School.objects.filter(subdomain = subdomain).first()
+	async def school(self, info: strawberry.Info, subdomain: str) -> School | None:
+		return await models.School.objects.filter(
+			pk = await aget_request_school_id(info.context.request, subdomain)
+		).afirst()
 
+	# 'offset_paginated' solo admite resolvers síncronos, este solo arma
+	# la consulta y se ejecuta al paginar
 	@strawberry_django.offset_paginated(OffsetPaginated[Calendar], order = CalendarOrder)
-	def calendar(self, subdomain: str, month: MonthsEnum = None) -> list[Calendar] | None:
+	def calendar(self, info: strawberry.Info, subdomain: str, month: MonthsEnum = None) -> list[Calendar] | None:
 		
 		current_time = timezone.localtime()
 
 		search_month = month if month else current_time.month
 
 		calendar = models.Calendar.objects.filter(
-			school__subdomain = subdomain,
+			school_id = get_request_school_id(info.context.request, subdomain),
 			date__month = search_month,
 			date__year = current_time.year
 		)
@@ -6,6 +6,16 @@ import strawberry, strawberry_django
 from strawberry import auto, relay
 
 from apps.school import models
+from apps.school.services.cache import (
+	RESOURCE_BOOTSTRAP,
+	RESOURCE_NEWS,
+	RESOURCE_CALENDAR,
+	RESOURCE_REPOSITORY,
+	RESOURCE_INFRAESTRUCTURE,
+	RESOURCE_DOWNLOAD
+)
+
+from apps.graphql.cache import CacheControl
 
 
 @strawberry.enum
@@ -28,12 +38,17 @@ class SchoolFilter:
 	id: auto
 	subdomain: auto
 
-@strawberry_django.type(models.School, filters=SchoolFilter)
+@strawberry_django.type(
+	models.School, 
+	filters = SchoolFilter,
+	directives = [CacheControl(max_age = 60 * 10, resource = RESOURCE_BOOTSTRAP)]
+)
 class School:
 	id: auto
 	name: auto
 	subdomain: auto
 	logo: auto
+	logo_renditions: auto
 	address: auto
 	mission: auto
 	vision: auto
@@ -50,20 +65,30 @@ class NewsOrder:
 	created: auto
 	updated: auto
 
-@strawberry_django.type(models.NewsMedia)
+@strawberry_django.type(
+	models.NewsMedia,
+	directives = [CacheControl(max_age = 60, resource = RESOURCE_NEWS)]
+)
 class NewsMedia:
 	photo: auto
+	renditions: auto
 
 
-@strawberry_django.type(models.News, filters = NewsFilter, ordering = NewsOrder)
+@strawberry_django.type(
+	models.News, 
+	filters = NewsFilter, 
+	ordering = NewsOrder,
+	directives = [CacheControl(max_age = 60, resource = RESOURCE_NEWS)]
+)
 class News(relay.Node):
 	id: auto
 	title: auto
 	created: auto
 	updated: auto
-	media: list[NewsMedia] = strawberry_django.field(
-		prefetch_related = "media"
-	) 
+
+	@strawberry_django.field
+	async def media(self, info: strawberry.Info) -> list[NewsMedia]:
+		return await info.context.loaders.news_media.load(self.pk)
 
 
 
@@ -75,14 +100,20 @@ class CalendarOrder:
 class CalendarFilter:
 	school: SchoolFilter | None
 
-@strawberry_django.type(models.Calendar)
+@strawberry_django.type(
+	models.Calendar,
+	directives = [CacheControl(max_age = 60 * 5, resource = RESOURCE_CALENDAR)]
+)
 class Calendar:
 	id: auto
 	title: auto
 	date: auto
 
 
-@strawberry_django.type(models.ColorHexFormat)
+@strawberry_django.type(
+	models.ColorHexFormat,
+	directives = [CacheControl(max_age = 60 * 10, resource = RESOURCE_BOOTSTRAP)]
+)
 class ColorHexFormat:
 	color: auto
 
@@ -91,9 +122,16 @@ class SettingFormatFilter:
 	school: SchoolFilter | None
 
 
-@strawberry_django.type(models.SettingFormat, filters = SettingFormatFilter)
+@strawberry_django.type(
+	models.SettingFormat, 
+	filters = SettingFormatFilter,
+	directives = [CacheControl(max_age = 60 * 10, resource = RESOURCE_BOOTSTRAP)]
+)
 class SettingFormat:
-	colors: list[ColorHexFormat]
+
+	@strawberry_django.field
+	async def colors(self, info: strawberry.Info) -> list[ColorHexFormat]:
+		return await info.context.loaders.setting_colors.load(self.pk)
 
 
 
@@ -102,7 +140,11 @@ class SocialMediaFilter:
 	school: SchoolFilter | None
 
 
-@strawberry_django.type(models.SocialMedia, filters = SocialMediaFilter)
+@strawberry_django.type(
+	models.SocialMedia, 
+	filters = SocialMediaFilter,
+	directives = [CacheControl(max_age = 60 * 10, resource = RESOURCE_BOOTSTRAP)]
+)
 class SocialMedia:
 	profile: auto
 
@@ -116,7 +158,12 @@ class CoordinateFilter:
 	school: SchoolFilter | None
 
 
-@strawberry_django.type(models.Coordinate, filters = CoordinateFilter, ordering = CoordinateOrder)
+@strawberry_django.type(
+	models.Coordinate, 
+	filters = CoordinateFilter, 
+	ordering = CoordinateOrder,
+	directives = [CacheControl(max_age = 60 * 10, resource = RESOURCE_BOOTSTRAP)]
+)
 class Coordinate(relay.Node):
 	id: auto
 	title: auto
@@ -134,18 +181,28 @@ class InfraestructureFilter:
 	school: SchoolFilter | None
 
 
-@strawberry_django.type(models.InfraestructureMedia)
+@strawberry_django.type(
+	models.InfraestructureMedia,
+	directives = [CacheControl(max_age = 60 * 5, resource = RESOURCE_INFRAESTRUCTURE)]
+)
 class InfraestructureMedia:
 	photo: auto
+	renditions: auto
 
 
-@strawberry_django.type(models.Infraestructure, filters = InfraestructureFilter, ordering = InfraestructureOrder)
+@strawberry_django.type(
+	models.Infraestructure, 
+	filters = InfraestructureFilter, 
+	ordering = InfraestructureOrder,
+	directives = [CacheControl(max_age = 60 * 5, resource = RESOURCE_INFRAESTRUCTURE)]
+)
 class Infraestructure(relay.Node):
 	id: strawberry.relay.GlobalID
 	name: auto
-	media: list[InfraestructureMedia] = strawberry_django.field(
-		prefetch_related = ["media"]
-	)
+
+	@strawberry_django.field
+	async def media(self, info: strawberry.Info) -> list[InfraestructureMedia]:
+		return await info.context.loaders.infraestructure_media.load(self.pk)
 
 
 @strawberry_django.order_type(models.Download)
@@ -156,7 +213,12 @@ class DownloadOrder:
 class DownloadFilter:
 	school: SchoolFilter | None
 
-@strawberry_django.type(models.Download, filters = DownloadFilter, ordering = DownloadOrder)
+@strawberry_django.type(
+	models.Download, 
+	filters = DownloadFilter, 
+	ordering = DownloadOrder,
+	directives = [CacheControl(max_age = 60 * 5, resource = RESOURCE_DOWNLOAD)]
+)
 class Download(relay.Node):
 	id: auto
 	title: auto
@@ -174,21 +236,30 @@ class RepositoryFilter:
 	school: SchoolFilter | None
 
 
-@strawberry_django.type(models.RepositoryMediaFile)
+@strawberry_django.type(
+	models.RepositoryMediaFile,
+	directives = [CacheControl(max_age = 60 * 5, resource = RESOURCE_REPOSITORY)]
+)
 class RepositoryMediaFile:
 	title: auto
 	file: auto
 
 
-@strawberry_django.type(models.Repository, filters = RepositoryFilter, ordering = RepositoryOrder)
+@strawberry_django.type(
+	models.Repository, 
+	filters = RepositoryFilter, 
+	ordering = RepositoryOrder,
+	directives = [CacheControl(max_age = 60 * 5, resource = RESOURCE_REPOSITORY)]
+)
 class Repository(relay.Node):
 	id: auto
 	name_project: auto
 	created: auto
 	updated: auto
-	media: list[RepositoryMediaFile] = strawberry_django.field(
-		prefetch_related = ["media"]
-	)
+
+	@strawberry_django.field
+	async def media(self, info: strawberry.Info) -> list[RepositoryMediaFile]:
+		return await info.context.loaders.repository_media.load(self.pk)
 
 
 __all__ = [
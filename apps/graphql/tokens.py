@@ -0,0 +1,113 @@
+"""
+	Caché 'token -> (payload, usuario)' de la autenticación de '/graphql'.
+
+	Se guarda en memoria del proceso (LRU con tiempo de expiración) y una
+	entrada nunca dura más que el propio token ('exp'). Los cambios sobre
+	el usuario se reflejan al instante en el proceso que los realiza (ver
+	'apps.graphql.receivers'); en el resto, al expirar la entrada.
+
+	La lista negra de 'simplejwt' solo guarda tokens de actualización
+	('refresh'), cerrar la sesión no revoca los tokens de acceso: siguen
+	siendo válidos hasta que expiran ('ACCESS_TOKEN_LIFETIME').
+"""
+import copy, time
+from threading import Lock
+from collections import OrderedDict
+from typing import Any, Callable
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+
+UserModel = get_user_model()
+
+KEY_EXP = "exp"
+
+
+class TokenCache:
+	def __init__(
+		self,
+		maxsize: int = 1024,
+		ttl: float = 60,
+		timer: Callable[[], float] = time.time
+	) -> None:
+		self.maxsize = maxsize
+		self.ttl = ttl
+		self.timer = timer
+		self._data: OrderedDict[str, tuple[dict, Any, float]] = OrderedDict()
+		self._lock = Lock()
+
+	def __len__(self) -> int:
+		return len(self._data)
+
+	def get(self, token: str) -> tuple[dict, Any] | None:
+		with self._lock:
+			item = self._data.get(token)
+
+			if item is None:
+				return None
+
+			payload, user, expires = item
+
+			if expires <= self.timer():
+				del self._data[token]
+				return None
+
+			self._data.move_to_end(token)
+
+			return payload, user
+
+	def set(self, token: str, payload: dict, user) -> None:
+		expires = self.timer() + self.ttl
+
+		if payload.get(KEY_EXP) is not None:
+			expires = min(expires, payload[KEY_EXP])
+
+		with self._lock:
+			self._data[token] = (payload, user, expires)
+			self._data.move_to_end(token)
+
+			while len(self._data) > self.maxsize:
+				self._data.popitem(last = False)
+
+	def _delete_by(self, condition: Callable[[dict, Any], bool]) -> None:
+		with self._lock:
+			for token, (payload, user, _) in list(self._data.items()):
+				if condition(payload, user):
+					del self._data[token]
+
+	def delete_user(self, user_id: int) -> None:
+		self._delete_by(lambda payload, user: user.pk == user_id)
+
+	def clear(self) -> None:
+		with self._lock:
+			self._data.clear()
+
+
+def _create_cache() -> TokenCache:
+	config = getattr(settings, "GRAPHQL_TOKEN_CACHE", {})
+
+	return TokenCache(
+		maxsize = config.get("MAXSIZE", 1024),
+		ttl = config.get("TTL", 60)
+	)
+
+
+tokens = _create_cache()
+
+
+def get_user(token: str) -> UserModel | None:
+	"""
+		Usuario del token guardado en caché o 'None'. Cada llamada recibe
+		una copia, los cambios sobre ella no afectan a la caché.
+	"""
+	item = tokens.get(token)
+
+	if item is None:
+		return None
+
+	return copy.copy(item[1])
+
+
+def set_user(token: str, payload: dict, user: UserModel) -> None:
+	tokens.set(token, payload, copy.copy(user))
+
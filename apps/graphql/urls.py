@@ -1,9 +1,8 @@
 from django.urls import path
 
-from strawberry.django.views import AsyncGraphQLView
-
 from .schema import schema
+from .views import GraphQLView
 
 urlpatterns = [
-    path('', AsyncGraphQLView.as_view(schema=schema)),
+    path('', GraphQLView.as_view(schema=schema), name='graphql'),
 ]
@@ -11,7 +11,7 @@ import jwt
 
 from pydantic import validate_call, ConfigDict
 
-from . import exceptions
+from . import exceptions, tokens
 
 
 WRequest = TypeVar("WRequest", bound=WSGIRequest)
@@ -58,10 +58,10 @@ def decode_token(token: str) -> dict:
 def get_user_by_id(id: int) -> UserModel | None:
     return UserModel.objects.filter(pk = id).first()
 
+KEY_USER_ID = "user_id"
+
 @validate_call(config = ConfigDict(hide_input_in_errors=True))
 def get_user_by_payload(payload: dict) -> UserModel | AnonymousUser:
-    KEY_USER_ID= "user_id"
-
     if not KEY_USER_ID in payload:
         return AnonymousUser()
         
@@ -72,15 +72,70 @@ def get_user_by_payload(payload: dict) -> UserModel | AnonymousUser:
 
     return user
 
-def get_user_from_token(request: WRequest | ARequest) -> UserModel | AnonymousUser:
-    token = get_http_authorization(request = request)
+async def aget_user_by_payload(payload: dict) -> UserModel | AnonymousUser:
+    if not KEY_USER_ID in payload:
+        return AnonymousUser()
 
-    if not token:
+    user = await UserModel.objects.filter(pk = payload.get(KEY_USER_ID)).afirst()
+
+    if not user or not user.is_active:
         return AnonymousUser()
 
+    return user
+
+def get_token(request: WRequest | ARequest) -> str | None:
+    # Se omite la validación de 'pydantic', se llama en cada petición
+    return get_http_authorization.raw_function(request = request)
+
+def get_cached_user(token: str) -> tuple[UserModel | AnonymousUser | None, dict | None]:
+    """
+        Usuario del token guardado en caché o el 'payload' del token
+        para buscarlo.
+    """
+    user = tokens.get_user(token)
+
+    if user is not None:
+        return user, None
+
     try:
         payload = decode_token(token)
     except exceptions.JWTDecodeError as error:
+        return AnonymousUser(), None
+
+    return None, payload
+
+def get_user_from_token(request: WRequest | ARequest) -> UserModel | AnonymousUser:
+    token = get_token(request = request)
+
+    if not token:
+        return AnonymousUser()
+
+    user, payload = get_cached_user(token)
+
+    if user is not None:
+        return user
+
+    user = get_user_by_payload(payload = payload)
+
+    if user.is_authenticated:
+        tokens.set_user(token, payload, user)
+
+    return user
+
+async def aget_user_from_token(request: WRequest | ARequest) -> UserModel | AnonymousUser:
+    token = get_token(request = request)
+
+    if not token:
         return AnonymousUser()
 
-    return get_user_by_payload(payload = payload)
+    user, payload = get_cached_user(token)
+
+    if user is not None:
+        return user
+
+    user = await aget_user_by_payload(payload = payload)
+
+    if user.is_authenticated:
+        tokens.set_user(token, payload, user)
+
+    return user
@@ -0,0 +1,20 @@
+from dataclasses import dataclass, field
+
+from strawberry.django.context import StrawberryDjangoContext
+from strawberry.django.views import AsyncGraphQLView
+
+from .school.loaders import SchoolLoaders
+
+
+@dataclass
+class GraphQLContext(StrawberryDjangoContext):
+	loaders: SchoolLoaders = field(default_factory = SchoolLoaders)
+
+
+class GraphQLView(AsyncGraphQLView):
+	"""
+		Cada petición recibe sus propios DataLoaders ('info.context.loaders'),
+		los resultados no se comparten entre peticiones.
+	"""
+	async def get_context(self, request, response) -> GraphQLContext:
+		return GraphQLContext(request = request, response = response)
@@ -0,0 +1,19 @@
+from django.contrib import admin
+
+from . import models
+
+
+class JobAdmin(admin.ModelAdmin):
+	list_display = [
+		"id",
+		"name",
+		"status",
+		"attempts",
+		"run_at"
+	]
+
+	list_filter = ["status", "name"]
+	exclude = ["payload"]
+
+
+admin.site.register(models.Job, JobAdmin)
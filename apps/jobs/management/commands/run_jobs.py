@@ -0,0 +1,50 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.jobs.services import queue
+
+
+class Command(BaseCommand):
+	help = "Ejecuta las tareas pendientes de la cola ('apps.jobs')"
+
+	def add_arguments(self, parser):
+		parser.add_argument(
+			"--once",
+			action = "store_true",
+			help = "Ejecuta las tareas pendientes y termina"
+		)
+		parser.add_argument(
+			"--batch-size",
+			type = int,
+			default = None,
+			help = "Cantidad de tareas que se toman en cada consulta"
+		)
+		parser.add_argument(
+			"--sleep",
+			type = float,
+			default = None,
+			help = "Segundos de espera cuando no hay tareas pendientes"
+		)
+
+	def handle(self, *args, **options):
+		config = queue.get_config()
+		sleep = options["sleep"] or config.get("POLL_INTERVAL", 2)
+		total = 0
+
+		try:
+			while True:
+				executed = queue.run_pending(batch_size = options["batch_size"])
+				total += executed
+
+				if executed:
+					continue
+
+				if options["once"]:
+					break
+
+				time.sleep(sleep)
+		except KeyboardInterrupt:
+			pass
+
+		self.stdout.write(f"Tareas ejecutadas: {total}")
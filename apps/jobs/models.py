@@ -0,0 +1,41 @@
+from django.db import models
+from django.utils import timezone
+
+MAX_LENGTH_JOB_NAME = 100
+
+class Job(models.Model):
+	class TypeStatus(models.TextChoices):
+		pending = "pendiente"
+		running = "ejecutando"
+		done = "terminado"
+		failed = "fallido"
+
+	name = models.CharField(max_length = MAX_LENGTH_JOB_NAME)
+	payload = models.JSONField(default = dict, blank = True)
+	status = models.CharField(
+		choices = TypeStatus,
+		default = TypeStatus.pending,
+		max_length = 20
+	)
+	attempts = models.PositiveSmallIntegerField(default = 0)
+	max_attempts = models.PositiveSmallIntegerField(default = 5)
+	run_at = models.DateTimeField(default = timezone.now)
+	locked_at = models.DateTimeField(blank = True, null = True)
+	last_error = models.TextField(blank = True, null = True)
+	created = models.DateTimeField(auto_now_add = True)
+	updated = models.DateTimeField(auto_now = True)
+
+	class Meta:
+		verbose_name = "Tarea"
+		verbose_name_plural = "Tareas"
+		db_table = "job"
+		ordering = ["run_at", "id"]
+		indexes = [
+			models.Index(fields = ["status", "run_at"], name = "job_status_run_at_idx"),
+		]
+
+	def __str__(self):
+		return f"Tarea [{self.name}] - {self.status}"
+
+	def __repr__(self):
+		return f"Job(id = {self.id}, name = {self.name}, status = {self.status}, attempts = {self.attempts})"
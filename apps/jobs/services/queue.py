@@ -0,0 +1,189 @@
+"""
+	Cola de tareas en segundo plano guardada en la base de datos.
+
+	Las tareas se registran con '@job(<nombre>)' en los módulos 'jobs.py'
+	de cada app y se encolan con 'enqueue(<nombre>, **payload)'; el
+	'payload' debe ser serializable a JSON y no debe tener datos sensibles
+	(contraseñas, tokens): se encolan los 'id' y la tarea obtiene el resto.
+	El comando 'run_jobs' ejecuta las tareas pendientes.
+
+	Si una tarea falla se vuelve a intentar con espera exponencial
+	('BACKOFF' * 2 ^ (intento - 1), hasta 'MAX_BACKOFF' segundos) hasta
+	completar sus 'max_attempts' intentos.
+
+	Con 'ALWAYS_EAGER' las tareas se ejecutan al encolarlas, en el mismo
+	proceso y sin guardarse en la base de datos (pruebas y desarrollo).
+"""
+import logging, datetime, traceback
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from apps.jobs.models import Job
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_BACKOFF = 30
+DEFAULT_MAX_BACKOFF = 60 * 60
+DEFAULT_BATCH_SIZE = 10
+DEFAULT_TIMEOUT = 60 * 10
+
+JOB_DOES_NOT_EXIST = "No existe una tarea registrada con el nombre: '{name}'"
+JOB_ALREADY_EXISTS = "Ya existe una tarea registrada con el nombre: '{name}'"
+
+
+def get_config() -> dict:
+	return getattr(settings, "SCHOOL_JOBS", {})
+
+
+@dataclass(frozen = True)
+class RegisteredJob:
+	name: str
+	func: Callable[..., Any]
+	max_attempts: int
+
+
+registry: dict[str, RegisteredJob] = {}
+
+
+def job(name: str, max_attempts: int | None = None):
+	"""
+		Registra la función como la tarea 'name'.
+	"""
+	def decorator(func):
+		if name in registry and registry[name].func is not func:
+			raise ValueError(JOB_ALREADY_EXISTS.format(name = name))
+
+		registry[name] = RegisteredJob(
+			name = name,
+			func = func,
+			max_attempts = max_attempts or get_config().get("MAX_ATTEMPTS", DEFAULT_MAX_ATTEMPTS)
+		)
+
+		return func
+
+	return decorator
+
+
+def get_job(name: str) -> RegisteredJob:
+	registered = registry.get(name)
+
+	if registered is None:
+		raise LookupError(JOB_DOES_NOT_EXIST.format(name = name))
+
+	return registered
+
+
+def enqueue(name: str, /, run_at: datetime.datetime | None = None, **payload) -> Job | None:
+	registered = get_job(name)
+
+	if get_config().get("ALWAYS_EAGER", False):
+		registered.func(**payload)
+
+		return None
+
+	return Job.objects.create(
+		name = name,
+		payload = payload,
+		max_attempts = registered.max_attempts,
+		run_at = run_at or timezone.now()
+	)
+
+
+def get_backoff(attempts: int) -> datetime.timedelta:
+	config = get_config()
+
+	seconds = config.get("BACKOFF", DEFAULT_BACKOFF) * 2 ** max(attempts - 1, 0)
+
+	return datetime.timedelta(
+		seconds = min(seconds, config.get("MAX_BACKOFF", DEFAULT_MAX_BACKOFF))
+	)
+
+
+def claim_jobs(batch_size: int | None = None) -> list[Job]:
+	"""
+		Marca como 'ejecutando' las siguientes tareas pendientes. Las tareas
+		'ejecutando' por más de 'TIMEOUT' segundos (el 'worker' se detuvo)
+		también se toman. En PostgreSQL 'skip_locked' permite varios 'workers'.
+	"""
+	config = get_config()
+	now = timezone.now()
+
+	batch_size = batch_size or config.get("BATCH_SIZE", DEFAULT_BATCH_SIZE)
+	expired = now - datetime.timedelta(seconds = config.get("TIMEOUT", DEFAULT_TIMEOUT))
+
+	with transaction.atomic():
+		ids = list(
+			Job.objects.select_for_update(
+				skip_locked = True
+			).filter(
+				Q(status = Job.TypeStatus.pending, run_at__lte = now) |
+				Q(status = Job.TypeStatus.running, locked_at__lt = expired)
+			).order_by(
+				"run_at", "id"
+			).values_list("id", flat = True)[:batch_size]
+		)
+
+		Job.objects.filter(id__in = ids).update(
+			status = Job.TypeStatus.running,
+			locked_at = now,
+			attempts = F("attempts") + 1
+		)
+
+	return list(Job.objects.filter(id__in = ids).order_by("run_at", "id"))
+
+
+def run_job(job: Job) -> bool:
+	try:
+		get_job(job.name).func(**job.payload)
+	except Exception:
+		error = traceback.format_exc()
+
+		logger.exception("Falló la tarea %s (intento %s)", job.name, job.attempts)
+
+		if job.attempts < job.max_attempts:
+			Job.objects.filter(id = job.id).update(
+				status = Job.TypeStatus.pending,
+				run_at = timezone.now() + get_backoff(job.attempts),
+				locked_at = None,
+				last_error = error
+			)
+		else:
+			# La tarea no se vuelve a ejecutar, no se conserva su 'payload'
+			Job.objects.filter(id = job.id).update(
+				status = Job.TypeStatus.failed,
+				payload = {},
+				locked_at = None,
+				last_error = error
+			)
+
+		return False
+
+	if get_config().get("DELETE_COMPLETED", True):
+		Job.objects.filter(id = job.id).delete()
+	else:
+		Job.objects.filter(id = job.id).update(
+			status = Job.TypeStatus.done,
+			payload = {},
+			locked_at = None,
+			last_error = None
+		)
+
+	return True
+
+
+def run_pending(batch_size: int | None = None) -> int:
+	"""
+		Ejecuta un lote de tareas pendientes y devuelve cuántas se ejecutaron.
+	"""
+	jobs = claim_jobs(batch_size = batch_size)
+
+	for pending_job in jobs:
+		run_job(pending_job)
+
+	return len(jobs)
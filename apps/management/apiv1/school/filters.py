@@ -149,3 +149,20 @@ class InfraestructureFilter(django_filters.FilterSet):
 	class Meta:
 		model = models.Infraestructure
 		fields = ["name"]
+
+
+class PaymentReportFilter(django_filters.FilterSet):
+	student = django_filters.CharFilter(
+		field_name="fullname_student", lookup_expr="icontains"
+	)
+	created = django_filters.DateTimeFromToRangeFilter()
+	created_year = django_filters.NumberFilter(
+		field_name="created", lookup_expr = "year"
+	)
+	created_month = django_filters.NumberFilter(
+		field_name="created", lookup_expr = "month"
+	)
+
+	class Meta:
+		model = models.PaymentReport
+		fields = ["created", "grade"]
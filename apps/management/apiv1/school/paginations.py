@@ -1,5 +1,7 @@
 from rest_framework import pagination
 
+from apps.school.apiv1.paginations import KeysetCursorPaginate
+
 
 class BasicPaginate(pagination.PageNumberPagination):
 	page_size = 10
@@ -13,3 +15,19 @@ class CalendarPaginate(pagination.PageNumberPagination):
 	max_page_size = 50
 	page_query_param = "page"
 	page_size_query_param = "size"
+
+
+class BasicCursorPaginate(KeysetCursorPaginate):
+	page_size = 10
+	max_page_size = 20
+	cursor_query_param = "cursor"
+	page_size_query_param = "size"
+	ordering = ["-created", "-id"]
+
+
+class CalendarCursorPaginate(KeysetCursorPaginate):
+	page_size = 30
+	max_page_size = 50
+	cursor_query_param = "cursor"
+	page_size_query_param = "size"
+	ordering = ["date", "id"]
@@ -1,9 +1,8 @@
-from django.db.models import Subquery
 from django.db.models.base import ModelBase
 
 from rest_framework import permissions
 
-from apps.management import models
+from apps.management.services import membership
 from apps.school import models as school_models
 
 class IsUserPermission(permissions.DjangoModelPermissions):
@@ -22,17 +21,12 @@ class BelongToOurAdministrator(permissions.BasePermission):
 
 		school_id = view.kwargs.get("pk")
 
-		admin_school = models.Administrator.objects.filter(
+		return membership.is_member(
+			user_id = request.user.id, 
 			school_id = school_id,
-			users__id = request.user.id
-		).exists()
-
-		return admin_school
-
-
-def get_detail_data(model: ModelBase, id: int) -> dict[str, int]:
-	
-	return model.objects.filter(pk = id).values("school_id")
+			token = request.auth,
+			verify = request.method not in permissions.SAFE_METHODS
+		)
 
 
 IMPLEMENTATION_ERROR = "Debe definir la instancia del modelo para: 'model'"
@@ -45,24 +39,31 @@ class BasePermissionDetailObject(permissions.BasePermission):
 	model = None
 	message = "No tienes permisos para (acceder, modificar o eliminar) información que no te pertenece"
 	
-	def has_perm_detail(self, data_id:int, user_id:int):
+	def has_perm_detail(self, data_id:int, user_id:int, token = None, verify: bool = False):
 		
 		if not isinstance(getattr(self, 'model'), ModelBase):
 			raise NotImplementedError(IMPLEMENTATION_ERROR)
 
-		return models.Administrator.objects.filter(
-			school_id__in = Subquery(
-				get_detail_data(model = self.model, id = data_id)
-			), 
-			users__id = user_id
-		).exists()
+		school_id = membership.get_object_school(model = self.model, pk = data_id)
+
+		return membership.is_member(
+			user_id = user_id, 
+			school_id = school_id, 
+			token = token,
+			verify = verify
+		)
 
 	def has_permission(self, request, view):
 
 		data_id = view.kwargs.get("pk")
 		user_id = request.user.id
 
-		return self.has_perm_detail(data_id = data_id, user_id = user_id)
+		return self.has_perm_detail(
+			data_id = data_id, 
+			user_id = user_id, 
+			token = request.auth,
+			verify = request.method not in permissions.SAFE_METHODS
+		)
 
 
 class CoordinatePermissionDetail(BasePermissionDetailObject):
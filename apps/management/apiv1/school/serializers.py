@@ -4,6 +4,7 @@ from typing import TypeVar
 from django.core.files.uploadedfile import InMemoryUploadedFile
 
 from rest_framework import serializers
+from rest_framework.settings import api_settings
 
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema_field
@@ -119,6 +120,16 @@ class SchoolUpdateLogoRequest(serializers.Serializer):
 			)
 		
 		instance.logo = command.query
+		# Las versiones del nuevo logo se crean en segundo plano
+		instance.logo_renditions = {}
+		instance.save(update_fields = ["logo", "logo_renditions"])
+
+		commands.create_image_renditions(
+			model = models.School._meta.label,
+			ids = [instance.id],
+			field = "logo",
+			renditions_field = "logo_renditions"
+		)
 
 		return instance
 
@@ -538,6 +549,197 @@ class MSchoolOfficeHourListResponse(serializers.ModelSerializer):
 		fields = ["id", "interval_description", "time_group"]
 
 
+BULK_MAX_ITEMS = 500
+BULK_DUPLICATED_ITEM = "Este registro se repite en la misma petición"
+BULK_ITEM_DOES_NOT_EXIST = "No existe un registro con este ID en la escuela"
+
+class MSchoolBulkListSerializer(serializers.ListSerializer):
+	"""
+		Crea o actualiza varios registros de la escuela en una sola
+		operación ('bulk_create' / 'bulk_update').
+
+		Cada registro se valida con el serializador hijo, pero los
+		duplicados se buscan con una sola consulta para todo el lote.
+		Los errores se devuelven en el mismo orden de los registros.
+	"""
+	def __init__(self, *args, **kwargs):
+		kwargs.setdefault("allow_empty", False)
+		kwargs.setdefault("max_length", BULK_MAX_ITEMS)
+
+		super().__init__(*args, **kwargs)
+
+		self.item_instances = []
+
+	def get_item_instance(self, data):
+		if not hasattr(self, "_instances"):
+			self._instances = {str(instance.pk): instance for instance in self.instance}
+
+		pk = data.get("id") if isinstance(data, dict) else None
+
+		return self._instances.get(str(pk))
+
+	def run_child_validation(self, data):
+		instance = None
+
+		if self.instance is not None:
+			# Al actualizar, cada registro debe enviar el 'id'
+			instance = self.get_item_instance(data)
+
+			if instance is None:
+				raise serializers.ValidationError(
+					{"id": [BULK_ITEM_DOES_NOT_EXIST]},
+					code = "does-not-exist"
+				)
+
+			if instance.pk in {item.pk for item in self.item_instances}:
+				raise serializers.ValidationError(
+					{"id": [BULK_DUPLICATED_ITEM]},
+					code = "duplicated"
+				)
+
+		self.child.instance = instance
+
+		try:
+			value = super().run_child_validation(data)
+		finally:
+			self.child.instance = None
+
+		self.item_instances.append(instance)
+
+		return value
+
+	def to_internal_value(self, data):
+		self.item_instances = []
+
+		value = super().to_internal_value(data)
+
+		errors = self.validate_items(value)
+
+		if any(errors):
+			raise serializers.ValidationError(errors)
+
+		return value
+
+	def validate_items(self, value: list[dict]) -> list[dict]:
+		"""
+			Errores de cada registro que dependen del lote completo.
+		"""
+		keys = [
+			self.child.get_key(item, instance)
+			for item, instance in zip(value, self.item_instances)
+		]
+		search = [key for key in keys if key is not None]
+
+		existing = set(
+			self.child.get_existing_keys(
+				keys = search,
+				exclude = [instance.pk for instance in self.item_instances if instance]
+			)
+		) if search else set()
+
+		errors = []
+		seen = set()
+
+		for key in keys:
+			message = None
+
+			if key is not None and key in existing:
+				message = self.child.already_exists
+			elif key is not None and key in seen:
+				message = BULK_DUPLICATED_ITEM
+
+			seen.add(key)
+			errors.append(
+				{api_settings.NON_FIELD_ERRORS_KEY: [message]} if message else {}
+			)
+
+		return errors
+
+	def create(self, validated_data: list[dict]) -> list:
+		return self.child.bulk_create(validated_data)
+
+	def update(self, instance, validated_data: list[dict]) -> list:
+		return self.child.bulk_update(self.item_instances, validated_data)
+
+
+class MSchoolBulkMixin:
+	"""
+		Métodos del serializador hijo de 'MSchoolBulkListSerializer'.
+	"""
+	already_exists: str | None = None
+
+	def validate(self, data: dict) -> dict:
+		# Los duplicados se buscan para todo el lote
+		return data
+
+	def get_value(self, data: dict, instance, field: str):
+		return data.get(field, getattr(instance, field, None))
+
+	def get_key(self, data: dict, instance = None) -> tuple | None:
+		return None
+
+	def get_existing_keys(self, keys: list[tuple], exclude: list[int]) -> list[tuple]:
+		return []
+
+	def get_result(self, command):
+		if not command.status:
+			raise serializers.ValidationError(
+				ResponseError(
+					errors = command.errors
+				).model_dump(exclude_defaults = True),
+				code = "invalid"
+			)
+
+		return command.query
+
+	def bulk_create(self, validated_data: list[dict]) -> list:
+		raise NotImplementedError("Debe definir el método 'bulk_create'")
+
+	def bulk_update(self, instances: list, validated_data: list[dict]) -> list:
+		fields = set()
+
+		for instance, data in zip(instances, validated_data):
+			for field, value in data.items():
+				setattr(instance, field, value)
+				fields.add(field)
+
+		return self.get_result(
+			commands.bulk_update_records(
+				school_id = self.context.get("pk"),
+				records = instances,
+				fields = sorted(fields)
+			)
+		)
+
+
+class MSchoolBulkDeleteRequest(serializers.Serializer):
+	ids = serializers.ListField(
+		child = serializers.IntegerField(min_value = 1),
+		allow_empty = False,
+		max_length = BULK_MAX_ITEMS
+	)
+
+	def validate_ids(self, value: list[int]) -> list[int]:
+		exist = set(
+			commands.bulk_records_exist(
+				model = self.context.get("model"),
+				school_id = self.context.get("pk"),
+				ids = value
+			).query
+		)
+
+		errors = {
+			index: [BULK_ITEM_DOES_NOT_EXIST]
+			for index, pk in enumerate(value)
+			if pk not in exist
+		}
+
+		if errors:
+			raise serializers.ValidationError(errors, code = "does-not-exist")
+
+		return list(dict.fromkeys(value))
+
+
 class MSchoolCalendarListResponse(serializers.ModelSerializer):
 	class Meta:
 		model = models.Calendar
@@ -643,6 +845,34 @@ class MSchoolCalendarUpdateRequest(serializers.ModelSerializer):
 		}
 
 
+class MSchoolCalendarBulkRequest(MSchoolBulkMixin, MSchoolCalendarRequest):
+	already_exists = CALENDAR_ALREADY_EXISTS
+
+	class Meta(MSchoolCalendarRequest.Meta):
+		list_serializer_class = MSchoolBulkListSerializer
+
+	def get_key(self, data: dict[str, str | datetime.date], instance = None) -> tuple:
+		return (
+			self.get_value(data, instance, "title"),
+			self.get_value(data, instance, "date")
+		)
+
+	def get_existing_keys(self, keys: list[tuple], exclude: list[int]) -> list[tuple]:
+		return commands.bulk_calendar_exist(
+			school_id = self.context.get("pk"),
+			calendars = [{"title": title, "date": date} for title, date in keys],
+			exclude = exclude
+		).query
+
+	def bulk_create(self, validated_data: list[dict[str, str | datetime.date]]) -> list[models.Calendar]:
+		return self.get_result(
+			commands.bulk_create_calendar(
+				school_id = self.context.get("pk"),
+				calendars = validated_data
+			)
+		)
+
+
 SOCIALMEDIA_ALREADY_EXISTS = "Esta enviado una red social que ya se encuentra registrada"
 INVALID_SOCIALMEDIA = "Debes enviar un enlace de tu red social"
 INVALID_REQUEST_SOCIALMEDIA = "Debes solo enviar solo una opción [profile | profiles], pero no ambos."
@@ -817,6 +1047,38 @@ class MSchoolCoordinateUpdateRequest(serializers.ModelSerializer):
 		}
 
 
+class MSchoolCoordinateBulkRequest(MSchoolBulkMixin, MSchoolCoordinateRequest):
+	already_exists = COORDIANTE_ALREADY_EXISTS
+
+	class Meta(MSchoolCoordinateRequest.Meta):
+		list_serializer_class = MSchoolBulkListSerializer
+
+	def get_key(self, data: dict[str, str | float], instance = None) -> tuple:
+		return (
+			self.get_value(data, instance, "title"),
+			self.get_value(data, instance, "latitude"),
+			self.get_value(data, instance, "longitude")
+		)
+
+	def get_existing_keys(self, keys: list[tuple], exclude: list[int]) -> list[tuple]:
+		return commands.bulk_coordinate_exist(
+			school_id = self.context.get("pk"),
+			coordinates = [
+				{"title": title, "latitude": latitude, "longitude": longitude}
+				for title, latitude, longitude in keys
+			],
+			exclude = exclude
+		).query
+
+	def bulk_create(self, validated_data: list[dict[str, str | float]]) -> list[models.Coordinate]:
+		return self.get_result(
+			commands.bulk_create_coordinate(
+				school_id = self.context.get("pk"),
+				coordinates = validated_data
+			)
+		)
+
+
 class MSchoolStaffRequest(serializers.ModelSerializer):
 	class Meta:
 		model = models.SchoolStaff
@@ -862,6 +1124,20 @@ class MSchoolStaffRequest(serializers.ModelSerializer):
 		return command.query
 
 
+class MSchoolStaffBulkRequest(MSchoolBulkMixin, MSchoolStaffRequest):
+
+	class Meta(MSchoolStaffRequest.Meta):
+		list_serializer_class = MSchoolBulkListSerializer
+
+	def bulk_create(self, validated_data: list[dict[str, str]]) -> list[models.SchoolStaff]:
+		return self.get_result(
+			commands.bulk_create_staff(
+				school_id = self.context.get("pk"),
+				staff = validated_data
+			)
+		)
+
+
 GRADE_ALREADY_EXISTS = "Esta enviado los datos de un grado que ya se encuentra registrado"
 ONLY_TEACHING_STAFF = "Solo debe agregar personal docente"
 
@@ -1056,6 +1332,119 @@ class MSchoolGradeUpdateRequest(MSchoolGradeSerializer):
 
 		return data
 
+
+STAGE_DOES_NOT_EXIST = "No existe la etapa educativa seleccionada"
+STAFF_DOES_NOT_EXIST = "No existe personal con este ID en la escuela"
+
+class MSchoolGradeBulkListSerializer(MSchoolBulkListSerializer):
+
+	def validate_items(self, value: list[GradeData]) -> list[dict]:
+		errors = super().validate_items(value)
+
+		stages = {item["stage"] for item in value if item.get("stage")}
+		teachers = {teacher for item in value for teacher in item.get("teacher") or []}
+
+		# Una consulta para todas las etapas y otra para todo el personal
+		valid_stages = set(
+			commands.get_educational_stages(stages = list(stages)).query
+		) if stages else set()
+
+		occupations = commands.get_staff_occupations(
+			school_id = self.context.get("pk"),
+			staff = list(teachers)
+		).query if teachers else {}
+
+		for item, item_errors in zip(value, errors):
+			if item.get("stage") and item["stage"] not in valid_stages:
+				item_errors.setdefault("stage", []).append(STAGE_DOES_NOT_EXIST)
+
+			item_teachers = item.get("teacher") or []
+
+			if any(teacher not in occupations for teacher in item_teachers):
+				item_errors.setdefault("teacher", []).append(STAFF_DOES_NOT_EXIST)
+
+			if any(
+				occupations.get(teacher) == models.OccupationStaff.administrative
+				for teacher in item_teachers
+			):
+				item_errors.setdefault("teacher", []).append(ONLY_TEACHING_STAFF)
+
+		return errors
+
+
+class MSchoolGradeBulkRequest(MSchoolBulkMixin, MSchoolGradeSerializer):
+	# El ID de la etapa se valida para todo el lote, 
+	# y no con una consulta por cada registro.
+	stage = serializers.IntegerField(min_value = 1)
+
+	already_exists = GRADE_ALREADY_EXISTS
+
+	class Meta(MSchoolGradeSerializer.Meta):
+		list_serializer_class = MSchoolGradeBulkListSerializer
+
+	def validate_teacher(self, value: list[int]) -> list[int]:
+		return value
+
+	def get_key(self, data: GradeData, instance = None) -> tuple | None:
+		section = self.get_value(data, instance, "section")
+		stage = data.get("stage", getattr(instance, "stage_id", None))
+
+		if not section or not stage:
+			return None
+
+		return (section, self.get_value(data, instance, "level"), stage)
+
+	def get_existing_keys(self, keys: list[tuple], exclude: list[int]) -> list[tuple]:
+		return commands.bulk_grade_exist(
+			school_id = self.context.get("pk"),
+			grades = [
+				{"section": section, "level": level, "stage_id": stage}
+				for section, level, stage in keys
+			],
+			exclude = exclude
+		).query
+
+	def bulk_create(self, validated_data: list[GradeData]) -> list[models.Grade]:
+		grades = [
+			school_dto.GradeCreateDTO(
+				stage_id = data.pop("stage"),
+				teachers = data.pop("teacher", None),
+				**data
+			).data
+			for data in validated_data
+		]
+
+		return self.get_result(
+			commands.bulk_create_grade(
+				school_id = self.context.get("pk"),
+				grades = grades
+			)
+		)
+
+	def bulk_update(self, instances: list[models.Grade], validated_data: list[GradeData]) -> list[models.Grade]:
+		teachers = {
+			instance.id: data.pop("teacher")
+			for instance, data in zip(instances, validated_data)
+			if "teacher" in data
+		}
+
+		for data in validated_data:
+			if "stage" in data:
+				data["stage_id"] = data.pop("stage")
+
+		grades = super().bulk_update(instances, validated_data)
+
+		if teachers:
+			self.get_result(
+				commands.set_grades_teachers(
+					school_id = self.context.get("pk"),
+					teachers = teachers
+				)
+			)
+
+		return grades
+
+
 REPOSITORY_ALREADY_EXISTS = "Esta enviado los datos de un repositorio que ya se encuentra registrado"
 MAX_LENGTH_FILE_NAME = 30
 
@@ -1325,3 +1714,20 @@ class MSchoolInfraestructureListResponse(serializers.ModelSerializer):
 	class Meta:
 		model = models.Infraestructure
 		fields = ["id", "name", "description"]
+
+
+class MSchoolImportRequest(serializers.Serializer):
+	file = serializers.FileField()
+
+
+class MSchoolImportErrorResponse(serializers.Serializer):
+	# 'None' si el error es del archivo y no de una fila
+	row = serializers.IntegerField(allow_null = True)
+	field = serializers.CharField(allow_null = True)
+	message = serializers.CharField()
+
+
+class MSchoolImportResponse(serializers.Serializer):
+	created = serializers.IntegerField()
+	failed = serializers.IntegerField()
+	errors = MSchoolImportErrorResponse(many = True)
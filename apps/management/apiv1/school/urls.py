@@ -43,6 +43,11 @@ urlpatterns = [
 		views.CalendarDetailDeleteUpdateAPIView.as_view(),
 		name = "calendar-detail" 
 	),
+	path(
+		"<int:pk>/calendar/bulk",
+		views.CalendarBulkAPIView.as_view(),
+		name = "calendar-bulk" 
+	),
 	path(
 		"<int:pk>/socialmedia",
 		views.SocialMediaListCreateAPIView.as_view(),
@@ -63,6 +68,11 @@ urlpatterns = [
 		views.CoordinateDetailDeleteUpdateAPIView.as_view(),
 		name = "coordinate-detail" 
 	),
+	path(
+		"<int:pk>/coordinate/bulk",
+		views.CoordinateBulkAPIView.as_view(),
+		name = "coordinate-bulk" 
+	),
 	path(
 		"<int:pk>/staff",
 		views.StaffListCreateAPIView.as_view(),
@@ -73,6 +83,11 @@ urlpatterns = [
 		views.StaffDetailDeleteUpdateAPIView.as_view(),
 		name = "staff-detail" 
 	),
+	path(
+		"<int:pk>/staff/bulk",
+		views.StaffBulkAPIView.as_view(),
+		name = "staff-bulk" 
+	),
 	path(
 		"<int:pk>/grade",
 		views.GradeListCreateAPIView.as_view(),
@@ -83,6 +98,11 @@ urlpatterns = [
 		views.GradeDetailDeleteUpdateAPIView.as_view(),
 		name = "grade-detail" 
 	),
+	path(
+		"<int:pk>/grade/bulk",
+		views.GradeBulkAPIView.as_view(),
+		name = "grade-bulk" 
+	),
 	path(
 		"<int:pk>/repository",
 		views.RepositoryListCreateAPIView.as_view(),
@@ -103,4 +123,14 @@ urlpatterns = [
 		views.InfraestructureListCreateAPIView.as_view(),
 		name = "infraestructure-list-create"
 	),
+	path(
+		"<int:pk>/import/<str:resource>",
+		views.ImportAPIView.as_view(),
+		name = "import"
+	),
+	path(
+		"<int:pk>/export/<str:resource>",
+		views.ExportAPIView.as_view(),
+		name = "export"
+	),
 ]
\ No newline at end of file
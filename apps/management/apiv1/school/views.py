@@ -1,3 +1,5 @@
+from django.db import transaction
+from django.http import Http404, StreamingHttpResponse
 from django.utils import timezone
 
 from rest_framework.permissions import IsAuthenticated
@@ -7,13 +9,120 @@ from django_filters.rest_framework import DjangoFilterBackend
 
 from apps.school import models
 
+from apps.utils.result_commands import ResponseError
+from apps.management.commands import commands
+from apps.management.services import imports, exports
+
 from . import serializers, permissions, filters, paginations
+from apps.school.apiv1.paginations import CursorPaginationMixin
+
+
+class BulkAPIView(generics.GenericAPIView):
+	"""
+		Crear ('POST'), actualizar ('PATCH') o eliminar ('DELETE') varios
+		registros de la escuela en una sola petición. La validación y la
+		escritura de todo el lote se realizan en una sola transacción.
+	"""
+	response_serializer_class = None
+	permission_classes = [
+		IsAuthenticated, 
+		permissions.IsUserPermission,
+		permissions.BelongToOurAdministrator
+	]
+
+	def get_queryset(self):
+		return self.queryset.filter(
+			school_id = self.kwargs.get("pk")
+		)
+
+	def get_serializer_class(self):
+		if self.request.method == "DELETE":
+			return serializers.MSchoolBulkDeleteRequest
+
+		return self.serializer_class
 
+	def get_update_ids(self, data) -> list[int]:
+		if not isinstance(data, list):
+			return []
+
+		return [
+			int(item.get("id")) 
+			for item in data 
+			if isinstance(item, dict) and str(item.get("id")).isdigit()
+		]
+
+	def get_response_data(self, instances: list) -> list[dict]:
+		return self.response_serializer_class(instances, many = True).data
+
+	def save(self, serializer, status_code: int):
+		with transaction.atomic():
+			if not serializer.is_valid():
+				return response.Response(
+					data = serializer.errors,
+					status = status.HTTP_400_BAD_REQUEST
+				)
+
+			instances = serializer.save()
+
+		return response.Response(
+			data = self.get_response_data(instances),
+			status = status_code
+		)
+
+	def post(self, request, pk = None):
+		serializer = self.get_serializer(
+			data = request.data,
+			many = True,
+			context = {"pk": pk}
+		)
+
+		return self.save(serializer, status.HTTP_201_CREATED)
+
+	def patch(self, request, pk = None):
+		instances = self.get_queryset().filter(
+			pk__in = self.get_update_ids(request.data)
+		)
 
-class NewsListCreateAPIView(generics.ListCreateAPIView):
+		serializer = self.get_serializer(
+			instances,
+			data = request.data,
+			many = True,
+			partial = True,
+			context = {"pk": pk}
+		)
+
+		return self.save(serializer, status.HTTP_200_OK)
+
+	def delete(self, request, pk = None):
+		serializer = self.get_serializer(
+			data = request.data,
+			context = {"pk": pk, "model": self.queryset.model}
+		)
+
+		with transaction.atomic():
+			if not serializer.is_valid():
+				return response.Response(
+					data = serializer.errors,
+					status = status.HTTP_400_BAD_REQUEST
+				)
+
+			command = commands.bulk_delete_records(
+				model = self.queryset.model,
+				school_id = pk,
+				ids = serializer.validated_data.get("ids")
+			)
+
+		return response.Response(
+			data = {"ids": command.query},
+			status = status.HTTP_200_OK
+		)
+
+
+class NewsListCreateAPIView(CursorPaginationMixin, generics.ListCreateAPIView):
 	queryset = models.News.objects.all()
 	serializer_class = serializers.MSchoolNewsResponse
 	pagination_class = paginations.BasicPaginate
+	cursor_pagination_class = paginations.BasicCursorPaginate
 	permission_classes = [
 		IsAuthenticated, 
 		permissions.IsUserPermission,
@@ -217,10 +326,11 @@ class TimeGroupDetailDeleteUpdateAPIView(generics.RetrieveUpdateDestroyAPIView):
 		)
 
 
-class CalendarListCreateAPIView(generics.ListCreateAPIView):
+class CalendarListCreateAPIView(CursorPaginationMixin, generics.ListCreateAPIView):
 	queryset = models.Calendar.objects.all()
 	serializer_class = serializers.MSchoolCalendarRequest
 	pagination_class = paginations.CalendarPaginate
+	cursor_pagination_class = paginations.CalendarCursorPaginate
 	permission_classes = [
 		IsAuthenticated, 
 		permissions.IsUserPermission,
@@ -275,6 +385,13 @@ class CalendarDetailDeleteUpdateAPIView(generics.RetrieveUpdateDestroyAPIView):
 		return self.serializer_class
 
 
+
+class CalendarBulkAPIView(BulkAPIView):
+	queryset = models.Calendar.objects.all()
+	serializer_class = serializers.MSchoolCalendarBulkRequest
+	response_serializer_class = serializers.MSchoolCalendarResponse
+
+
 class SocialMediaListCreateAPIView(generics.ListCreateAPIView):
 	queryset = models.SocialMedia.objects.all()
 	serializer_class = serializers.MSchoolSocialMediaReponse
@@ -396,6 +513,13 @@ class CoordinateDetailDeleteUpdateAPIView(generics.RetrieveUpdateDestroyAPIView)
 		return self.serializer_class
 
 
+
+class CoordinateBulkAPIView(BulkAPIView):
+	queryset = models.Coordinate.objects.all()
+	serializer_class = serializers.MSchoolCoordinateBulkRequest
+	response_serializer_class = serializers.MSchoolCoordinateResponse
+
+
 class StaffListCreateAPIView(generics.ListCreateAPIView):
 	queryset = models.SchoolStaff.objects.all()
 	serializer_class = serializers.MSchoolStaffRequest
@@ -444,6 +568,13 @@ class StaffDetailDeleteUpdateAPIView(generics.RetrieveUpdateDestroyAPIView):
 	]
 
 
+
+class StaffBulkAPIView(BulkAPIView):
+	queryset = models.SchoolStaff.objects.all()
+	serializer_class = serializers.MSchoolStaffBulkRequest
+	response_serializer_class = serializers.MSchoolStaffRequest
+
+
 class GradeListCreateAPIView(generics.ListCreateAPIView):
 	queryset = models.Grade.objects.all()
 	serializer_class = serializers.MSchoolGradeRequest
@@ -530,10 +661,31 @@ class GradeDetailDeleteUpdateAPIView(generics.RetrieveUpdateDestroyAPIView):
 		)
 
 
-class RepositoryListCreateAPIView(generics.ListCreateAPIView):
+
+class GradeBulkAPIView(BulkAPIView):
+	queryset = models.Grade.objects.all()
+	serializer_class = serializers.MSchoolGradeBulkRequest
+	response_serializer_class = serializers.MSchoolGradeResponse
+
+	def get_response_data(self, instances: list[models.Grade]) -> list[dict]:
+		# Se vuelven a consultar para evitar una consulta por
+		# cada grado al mostrar la etapa y el personal docente
+		grades = self.get_queryset().select_related(
+			"stage"
+		).prefetch_related(
+			"teacher"
+		).in_bulk([grade.id for grade in instances])
+
+		return super().get_response_data(
+			[grades[grade.id] for grade in instances]
+		)
+
+
+class RepositoryListCreateAPIView(CursorPaginationMixin, generics.ListCreateAPIView):
 	queryset = models.Repository.objects.all()
 	serializer_class = serializers.MSchoolRepositoryResponse 
 	pagination_class = paginations.BasicPaginate
+	cursor_pagination_class = paginations.BasicCursorPaginate
 	permission_classes = [
 		IsAuthenticated, 
 		permissions.IsUserPermission,
@@ -634,3 +786,129 @@ class InfraestructureListCreateAPIView(generics.ListCreateAPIView):
 			data = self.serializer_class(infraestructure).data,
 			status = status.HTTP_201_CREATED
 		)
+
+
+class ImportAPIView(generics.GenericAPIView):
+	"""
+		Importa los registros de un recurso de la escuela ('calendar',
+		'staff', 'grade', 'payment', 'payment-info') desde un archivo CSV o XLSX.
+	"""
+	serializer_class = serializers.MSchoolImportRequest
+	permission_classes = [
+		IsAuthenticated, 
+		permissions.IsUserPermission,
+		permissions.BelongToOurAdministrator
+	]
+
+	def get_resource(self) -> imports.ImportResource:
+		resource = imports.RESOURCES.get(self.kwargs.get("resource"))
+
+		if resource is None:
+			raise Http404
+
+		return resource
+
+	def get_queryset(self):
+		# Los permisos ('add_<modelo>') dependen del recurso
+		return self.get_resource().model.objects.filter(
+			school_id = self.kwargs.get("pk")
+		)
+
+	def post(self, request, pk = None, resource = None):
+		serializer = self.get_serializer(data = request.data)
+
+		if not serializer.is_valid():
+			return response.Response(
+				data = serializer.errors,
+				status = status.HTTP_400_BAD_REQUEST
+			)
+
+		file = serializer.validated_data.get("file")
+
+		try:
+			result = imports.import_file(
+				resource_name = resource,
+				school_id = pk,
+				file = file,
+				name = file.name
+			)
+		except imports.ImportFileError as e:
+			return response.Response(
+				data = ResponseError(
+					errors = [{"message": str(e)}]
+				).model_dump(),
+				status = status.HTTP_400_BAD_REQUEST
+			)
+
+		return response.Response(
+			data = serializers.MSchoolImportResponse(result.data).data,
+			status = status.HTTP_200_OK
+		)
+
+
+
+class ExportAPIView(generics.GenericAPIView):
+	"""
+		Exporta los registros de un recurso de la escuela ('payment',
+		'news', 'calendar', 'staff') a un archivo CSV o NDJSON
+		('?output=csv|ndjson'), aplicando los mismos filtros de sus listas.
+	"""
+	permission_classes = [
+		IsAuthenticated, 
+		permissions.IsUserPermission,
+		permissions.BelongToOurAdministrator
+	]
+	filtersets = {
+		"payment": filters.PaymentReportFilter,
+		"news": filters.NewsFilter,
+		"calendar": filters.CalendarFilter,
+		"staff": filters.StaffFilter,
+	}
+
+	def get_resource(self) -> exports.ExportResource:
+		resource = exports.RESOURCES.get(self.kwargs.get("resource"))
+
+		if resource is None:
+			raise Http404
+
+		return resource
+
+	def get_queryset(self):
+		return self.get_resource().model.objects.filter(
+			school_id = self.kwargs.get("pk")
+		)
+
+	def get(self, request, pk = None, resource = None):
+		try:
+			file_format = exports.get_format(request.query_params.get("output"))
+		except exports.ExportFormatError as e:
+			return response.Response(
+				data = ResponseError(
+					errors = [{"message": str(e)}]
+				).model_dump(),
+				status = status.HTTP_400_BAD_REQUEST
+			)
+
+		filterset = self.filtersets[resource](
+			request.query_params, 
+			queryset = self.get_queryset(),
+			request = request
+		)
+
+		if not filterset.is_valid():
+			return response.Response(
+				data = filterset.errors,
+				status = status.HTTP_400_BAD_REQUEST
+			)
+
+		export = StreamingHttpResponse(
+			exports.export_queryset(
+				resource_name = resource,
+				queryset = filterset.qs,
+				file_format = file_format
+			),
+			content_type = exports.CONTENT_TYPES[file_format]
+		)
+		export["Content-Disposition"] = f'attachment; filename="{resource}.{file_format}"'
+
+		return export
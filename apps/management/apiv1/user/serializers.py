@@ -1,14 +1,20 @@
-from django.contrib.auth.models import Permission
+from django.contrib.auth.models import Permission, update_last_login
 from rest_framework.validators import UniqueValidator
 
 from rest_framework import serializers
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.serializers import (
+    TokenObtainSerializer, 
+    TokenObtainPairSerializer
+)
+from rest_framework_simplejwt.settings import api_settings
 
 from apps.school.apiv1 import serializers as school_serializers
+from apps.school.services.subdomains import get_request_school_id
 
 from apps.user import models as user_models
 
 from apps.management import models as admin_models
+from apps.management.services import membership
 from apps.management.commands import commands_admin_user
 
 SCHOOL_HEADER = "X-School-Subdomain"
@@ -172,7 +178,14 @@ class AdminTokenPairSerializer(TokenObtainPairSerializer):
                 {"detail": f"El encabezado [{SCHOOL_HEADER}] es requerido."}
             )
 
-        data = super().validate(attrs)
+        # Solo autentica al usuario, los tokens se crean con los
+        # 'claims' de la escuela más abajo
+        data = TokenObtainSerializer.validate(self, attrs)
+
+        if api_settings.UPDATE_LAST_LOGIN:
+            update_last_login(None, self.user)
+
+        school_id = get_request_school_id(request, school_subdomain)
 
         admin = admin_models.Administrator.objects.prefetch_related(
             "users__user_permissions"
@@ -180,7 +193,7 @@ class AdminTokenPairSerializer(TokenObtainPairSerializer):
             "school"
         ).filter(
             users__id = self.user.id, 
-            school__subdomain = school_subdomain
+            school_id = school_id
         ).first()
 
         if not admin:
@@ -191,13 +204,12 @@ class AdminTokenPairSerializer(TokenObtainPairSerializer):
         refresh = self.get_token(self.user)
 
         refresh["school_id"] = str(admin.school.id)
-
-        token_access = data.pop("access")
-        token_refresh = data.pop("refresh")
+        membership.add_claims(refresh, user_id = self.user.id)
 
         data["auth"] = {
-            "access": token_access,
-            "refresh": token_refresh
+            # 'access_token' copia los 'claims' del token 'refresh'
+            "access": str(refresh.access_token),
+            "refresh": str(refresh)
         }
 
         data["user"] = {
@@ -1,14 +1,22 @@
 import datetime
+from typing import Any
 
 from rest_framework import status as status_code
 from pydantic import validate_call, ConfigDict
 
-from faker import Faker
-
 from apps.school import models
+from apps.school.services.cache import (
+	school_cache, 
+	school_scope, 
+	object_scope,
+	RESOURCE_BOOTSTRAP,
+	RESOURCE_CALENDAR
+)
 from apps.utils.result_commands import ResultCommand
+from apps.management.services import storage
+from apps.management.jobs import JOB_IMAGE_RENDITIONS
+from apps.jobs.services import queue
 
-from .utils.functions import set_name_file
 from .utils.errors_messages import SchoolErrorsMessages, TimeGroupErrorsMessages
 from .utils.props import (
 	NewsParam,
@@ -31,8 +39,6 @@ from .utils.props import (
 	InfraestructureParam,
 )
 
-faker = Faker(locale="es")
-
 
 @validate_call(config = ConfigDict(hide_input_in_errors=True, arbitrary_types_allowed = True))
 def update_school_logo(image:UploadedFile = None) -> ResultCommand:
@@ -41,15 +47,39 @@ def update_school_logo(image:UploadedFile = None) -> ResultCommand:
 	}
 
 	if not image:
-		context.update({"errors": ["Debe pasar una imagen"]})
-	
-	# Conectarme a un servicio para subir la imagen
+		context.update({
+			"errors": [{"message": "Debe pasar una imagen"}],
+			"error_code": status_code.HTTP_400_BAD_REQUEST
+		})
 
-	context.update({"query": faker.image_url(), "status": True})
+		return ResultCommand(**context)
+
+	context.update({
+		"query": storage.upload_file(file = image, folder = storage.FOLDER_LOGO), 
+		"status": True
+	})
 
 	return ResultCommand(**context)
 
 
+@validate_call(config = ConfigDict(hide_input_in_errors=True))
+def create_image_renditions(model: str, ids: list[int], field: str = "photo", renditions_field: str = "renditions") -> ResultCommand:
+	"""
+		Encola la creación de las versiones de las imágenes ya guardadas
+		('apps.management.jobs').
+	"""
+	if ids:
+		queue.enqueue(
+			JOB_IMAGE_RENDITIONS,
+			model = model,
+			ids = ids,
+			field = field,
+			renditions_field = renditions_field
+		)
+
+	return ResultCommand(status = True)
+
+
 @validate_call(config = ConfigDict(hide_input_in_errors=True))
 def get_school_by_id(id: int) -> ResultCommand:
 	school = models.School.objects.filter(id = id).first()
@@ -70,32 +100,23 @@ def get_school_by_id(id: int) -> ResultCommand:
 
 @validate_call(config = ConfigDict(hide_input_in_errors=True, arbitrary_types_allowed = True))
 def add_newsmedia(media: ListUploadedFile) -> ResultCommand:
-	# Conectarme a un servicio para subir la imagen
-	upload_images = [
-		{
-			"title": set_name_file(file_name = image.name),
-			"photo": faker.image_url()
-		}
-		for image in media
-	]
-	# Simulamos: 
-	# Cambiar el nombre de los archivos 
-	# El resultado de la carga de imagenes
-	# Obtener la url del archivo almacenado
+	# Las imágenes se suben en paralelo, sus versiones en segundo plano
+	upload_images = storage.upload_files(files = media, folder = storage.FOLDER_NEWS)
 
 	newsmedia = [
-		models.NewsMedia(
-			title = image.get("title"),
-			photo = image.get("photo")
-		)
-		for image in upload_images
+		models.NewsMedia(title = title, photo = photo)
+		for title, photo in upload_images
 	]
 
-	return ResultCommand(
-		query = models.NewsMedia.objects.bulk_create(newsmedia),
-		status = True
+	newsmedia = models.NewsMedia.objects.bulk_create(newsmedia)
+
+	create_image_renditions(
+		model = models.NewsMedia._meta.label,
+		ids = [image.id for image in newsmedia]
 	)
 
+	return ResultCommand(query = newsmedia, status = True)
+
 @validate_call(config = ConfigDict(hide_input_in_errors=True))
 def add_news(news:NewsParam, school_id:int) -> models.News:
 	return models.News.objects.create(
@@ -217,6 +238,44 @@ def calendar_exist(school_id: int, title: str, date: datetime.date) -> ResultCom
 
 	return ResultCommand(query = result, status = True)
 
+@validate_call(config = ConfigDict(hide_input_in_errors=True))
+def bulk_calendar_exist(school_id: int, calendars: list[CalendarParam], exclude: list[int] | None = None) -> ResultCommand:
+	"""
+		Busca en una sola consulta cuáles de los registros ya existen,
+		'query' contiene los pares (título, fecha) encontrados.
+	"""
+	result = models.Calendar.objects.filter(
+		school_id = school_id,
+		title__in = {calendar.title for calendar in calendars},
+		date__in = {calendar.date for calendar in calendars}
+	).exclude(
+		pk__in = exclude or []
+	).values_list("title", "date")
+
+	return ResultCommand(query = list(result), status = True)
+
+@validate_call(config = ConfigDict(hide_input_in_errors=True))
+def bulk_create_calendar(school_id: int, calendars: list[CalendarParam]) -> ResultCommand:
+	command = get_school_by_id(id = school_id)
+
+	if not command.status:
+		return command
+
+	result = models.Calendar.objects.bulk_create([
+		models.Calendar(
+			school_id = school_id,
+			title = calendar.title,
+			description = calendar.description,
+			date = calendar.date
+		)
+		for calendar in calendars
+	])
+
+	# 'bulk_create' no envía la señal 'post_save'
+	school_cache.bump(RESOURCE_CALENDAR, school_scope(school_id))
+
+	return ResultCommand(query = result, status = True)
+
 formatValueURL = lambda url: [url] if isinstance(url, IsProfileURL) else url
 
 @validate_call(config = ConfigDict(hide_input_in_errors=True))
@@ -243,7 +302,12 @@ def bulk_add_social_media(school_id, profiles: ListProfileURL) -> list[models.So
 		for profile in profiles
 	]
 
-	return models.SocialMedia.objects.bulk_create(social_media)
+	result = models.SocialMedia.objects.bulk_create(social_media)
+
+	# 'bulk_create' no envía la señal 'post_save'
+	school_cache.bump(RESOURCE_BOOTSTRAP, school_scope(school_id))
+
+	return result
 
 
 @validate_call(config = ConfigDict(hide_input_in_errors=True))
@@ -302,6 +366,41 @@ def create_coordinate(school_id: int, coordinate: CoordinateParam) -> ResultComm
 
 	return ResultCommand(query = coordinate, status = True)
 
+@validate_call(config = ConfigDict(hide_input_in_errors=True))
+def bulk_coordinate_exist(school_id: int, coordinates: list[CoordinateParam], exclude: list[int] | None = None) -> ResultCommand:
+	result = models.Coordinate.objects.filter(
+		school_id = school_id,
+		title__in = {coordinate.title for coordinate in coordinates},
+		latitude__in = {coordinate.latitude for coordinate in coordinates},
+		longitude__in = {coordinate.longitude for coordinate in coordinates},
+	).exclude(
+		pk__in = exclude or []
+	).values_list("title", "latitude", "longitude")
+
+	return ResultCommand(query = list(result), status = True)
+
+@validate_call(config = ConfigDict(hide_input_in_errors=True))
+def bulk_create_coordinate(school_id: int, coordinates: list[CoordinateParam]) -> ResultCommand:
+	command = get_school_by_id(id = school_id)
+
+	if not command.status:
+		return command
+
+	result = models.Coordinate.objects.bulk_create([
+		models.Coordinate(
+			school_id = school_id,
+			title = coordinate.title,
+			latitude = coordinate.latitude,
+			longitude = coordinate.longitude,
+		)
+		for coordinate in coordinates
+	])
+
+	# 'bulk_create' no envía la señal 'post_save'
+	school_cache.bump(RESOURCE_BOOTSTRAP, school_scope(school_id))
+
+	return ResultCommand(query = result, status = True)
+
 @validate_call(config = ConfigDict(hide_input_in_errors=True))
 def get_administrative_staff(school_id: int, admins: list[int]) -> models.SchoolStaff:
 	return models.SchoolStaff.objects.filter(
@@ -325,6 +424,24 @@ def create_staff(school_id: int, staff: StaffParam) -> ResultCommand:
 
 	return ResultCommand(query = staff, status = True)
 
+@validate_call(config = ConfigDict(hide_input_in_errors=True))
+def bulk_create_staff(school_id: int, staff: list[StaffParam]) -> ResultCommand:
+	command = get_school_by_id(id = school_id)
+
+	if not command.status:
+		return command
+
+	result = models.SchoolStaff.objects.bulk_create([
+		models.SchoolStaff(
+			school_id = school_id,
+			name = person.name,
+			occupation = person.occupation or models.OccupationStaff.administrative
+		)
+		for person in staff
+	])
+
+	return ResultCommand(query = result, status = True)
+
 @validate_call(config=ConfigDict(hide_input_in_errors=True))
 def grade_exist(school_id: int, grade: GradeValidateParam) -> ResultCommand:
 
@@ -364,29 +481,156 @@ def create_grade(school_id: int, grade: GradeParam) -> ResultCommand:
 
 	return ResultCommand(query = new_grade, status = True)
 
+@validate_call(config=ConfigDict(hide_input_in_errors=True))
+def bulk_grade_exist(school_id: int, grades: list[GradeValidateParam], exclude: list[int] | None = None) -> ResultCommand:
+	result = models.Grade.objects.filter(
+		school_id = school_id,
+		section__in = {grade.section for grade in grades},
+		level__in = {grade.level for grade in grades},
+		stage_id__in = {grade.stage_id for grade in grades},
+	).exclude(
+		pk__in = exclude or []
+	).values_list("section", "level", "stage_id")
+
+	return ResultCommand(query = list(result), status = True)
+
+@validate_call(config=ConfigDict(hide_input_in_errors=True))
+def get_educational_stages(stages: list[int]) -> ResultCommand:
+	result = models.EducationalStage.objects.filter(
+		id__in = stages
+	).values_list("id", flat = True)
+
+	return ResultCommand(query = list(result), status = True)
+
+@validate_call(config=ConfigDict(hide_input_in_errors=True))
+def get_staff_occupations(school_id: int, staff: list[int]) -> ResultCommand:
+	"""
+		Ocupación del personal de la escuela ('{id: ocupación}'), 
+		los IDs que no existen o son de otra escuela no se incluyen.
+	"""
+	result = models.SchoolStaff.objects.filter(
+		id__in = staff,
+		school_id = school_id
+	).values_list("id", "occupation")
+
+	return ResultCommand(query = dict(result), status = True)
+
+@validate_call(config=ConfigDict(hide_input_in_errors=True))
+def set_grades_teachers(school_id: int, teachers: dict[int, list[int]]) -> ResultCommand:
+	"""
+		Reemplaza el personal docente de varios grados ('{grado: [docentes]}')
+		con una consulta por operación, sin importar la cantidad de grados.
+	"""
+	GradeTeacher = models.Grade.teacher.through
+
+	valid_teachers = set(
+		models.SchoolStaff.objects.filter(
+			id__in = {teacher for ids in teachers.values() for teacher in ids},
+			school_id = school_id,
+			occupation = models.OccupationStaff.teacher
+		).values_list("id", flat = True)
+	)
+
+	GradeTeacher.objects.filter(grade_id__in = teachers.keys()).delete()
+
+	result = GradeTeacher.objects.bulk_create([
+		GradeTeacher(grade_id = grade_id, schoolstaff_id = teacher)
+		for grade_id, ids in teachers.items()
+		for teacher in dict.fromkeys(ids)
+		if teacher in valid_teachers
+	])
+
+	return ResultCommand(query = result, status = True)
+
+@validate_call(config=ConfigDict(hide_input_in_errors=True))
+def bulk_create_grade(school_id: int, grades: list[GradeParam]) -> ResultCommand:
+	command = get_school_by_id(id = school_id)
+
+	if not command.status:
+		return command
+
+	result = models.Grade.objects.bulk_create([
+		models.Grade(
+			name = grade.name,
+			level = grade.level,
+			section = grade.section,
+			description = grade.description,
+			school_id = school_id,
+			stage_id = grade.stage_id,
+		)
+		for grade in grades
+	])
+
+	teachers = {
+		new_grade.id: grade.teachers
+		for new_grade, grade in zip(result, grades)
+		if grade.teachers
+	}
+
+	if teachers:
+		set_grades_teachers(school_id = school_id, teachers = teachers)
+
+	return ResultCommand(query = result, status = True)
+
+
+# Recurso del caché de cada modelo, 'bulk_update' y la eliminación
+# de los registros de la escuela se reflejan en su versión
+BULK_RESOURCES = {
+	models.Calendar: RESOURCE_CALENDAR,
+	models.Coordinate: RESOURCE_BOOTSTRAP,
+}
+
+@validate_call(config = ConfigDict(hide_input_in_errors=True, arbitrary_types_allowed = True))
+def bulk_update_records(school_id: int, records: list[Any], fields: list[str]) -> ResultCommand:
+	if not records or not fields:
+		return ResultCommand(query = records, status = True)
+
+	model = type(records[0])
+
+	model.objects.bulk_update(records, fields)
+
+	resource = BULK_RESOURCES.get(model)
+
+	if resource:
+		# 'bulk_update' no envía la señal 'post_save'
+		school_cache.bump(resource, school_scope(school_id))
+
+		for record in records:
+			school_cache.bump(resource, object_scope(record.pk))
+
+	return ResultCommand(query = records, status = True)
+
+@validate_call(config = ConfigDict(hide_input_in_errors=True, arbitrary_types_allowed = True))
+def bulk_records_exist(model: Any, school_id: int, ids: list[int]) -> ResultCommand:
+	"""
+		ID de los registros que pertenecen a la escuela.
+	"""
+	result = model.objects.filter(
+		school_id = school_id,
+		id__in = ids
+	).values_list("id", flat = True)
+
+	return ResultCommand(query = list(result), status = True)
+
+@validate_call(config = ConfigDict(hide_input_in_errors=True, arbitrary_types_allowed = True))
+def bulk_delete_records(model: Any, school_id: int, ids: list[int]) -> ResultCommand:
+	# 'delete' envía 'post_delete' por cada registro, lo que invalida el caché
+	model.objects.filter(
+		school_id = school_id,
+		id__in = ids
+	).delete()
+
+	return ResultCommand(query = ids, status = True)
+
 
 @validate_call(config = ConfigDict(hide_input_in_errors=True, arbitrary_types_allowed = True))
 def add_repository_media(media: ListUploadedFile) -> ResultCommand:
-	# Conectarme a un servicio para subir los archivos
-
-	upload_files = [
-		{
-			"title": set_name_file(file_name = file.name),
-			"file": f"{faker.url()}{set_name_file(file_name = file.name)}"
-		}
-		for file in media
-	]
-	# Simulamos: 
-	# Cambiar el nombre de los archivos .
-	# El resultado de la carga de archivos.
-	# Obtener la url del archivo almacenado.
+	# Los archivos se suben en paralelo
+	upload_files = storage.upload_files(files = media, folder = storage.FOLDER_REPOSITORY)
 
 	repository_media = [
-		models.RepositoryMediaFile(
-			title = file.get("title"),
-			file = file.get("file")
-		)
-		for file in upload_files
+		models.RepositoryMediaFile(title = title, file = file)
+		for title, file in upload_files
 	]
 
 	return ResultCommand(
@@ -431,34 +675,25 @@ def create_repository(school_id: int, repository: RepositoryParam) -> ResultComm
 
 @validate_call(config = ConfigDict(hide_input_in_errors=True, arbitrary_types_allowed = True))
 def add_infraestructure_media(media: ListUploadedFile) -> ResultCommand:
-	# Conectarme a un servicio para subir los archivos
-	upload_images = [
-		{
-			"title": set_name_file(file_name = image.name),
-			"photo": faker.image_url()
-		}
-		for image in media
-	]
-	# Simulamos: 
-	# Cambiar el nombre de los archivos 
-	# El resultado de la carga de imagenes
-	# Obtener la url del archivo almacenado
+	# Las imágenes se suben en paralelo, sus versiones en segundo plano
+	upload_images = storage.upload_files(files = media, folder = storage.FOLDER_INFRAESTRUCTURE)
 
 	infraestructure_media = [
-		models.InfraestructureMedia(
-			title = file.get("title"),
-			photo = file.get("photo")
-		)
-		for file in upload_images
+		models.InfraestructureMedia(title = title, photo = photo)
+		for title, photo in upload_images
 	]
 
-	return ResultCommand(
-		query = models.InfraestructureMedia.objects.bulk_create(
-			infraestructure_media
-		), 
-		status = True
+	infraestructure_media = models.InfraestructureMedia.objects.bulk_create(
+		infraestructure_media
 	)
 
+	create_image_renditions(
+		model = models.InfraestructureMedia._meta.label,
+		ids = [image.id for image in infraestructure_media]
+	)
+
+	return ResultCommand(query = infraestructure_media, status = True)
+
 
 @validate_call(config = ConfigDict(hide_input_in_errors=True))
 def infraestructure_exist(school_id: int, name: str) -> ResultCommand:
@@ -5,7 +5,7 @@ from typing_extensions import Annotated
 from django.utils.datastructures import MultiValueDict
 from django.core.files.uploadedfile import InMemoryUploadedFile
 
-from pydantic import BaseModel, AnyHttpUrl, ConfigDict
+from pydantic import BaseModel, AnyHttpUrl, ConfigDict, Field
 
 from apps.school import models
 
@@ -93,3 +93,55 @@ class InfraestructureParam(BaseModel):
 	name: str
 	description: str = None
 	media: ListUploadedFile | None = None
+
+
+# Filas de los archivos que se importan (apps.management.services.imports),
+# agregan los límites de los modelos a los 'props' anteriores.
+
+class CalendarRowParam(CalendarParam):
+	title: str = Field(
+		min_length = models.MIN_LENGTH_CALENDAR_TITLE,
+		max_length = models.MAX_LENGTH_CALENDAR_TITLE
+	)
+
+
+class StaffRowParam(StaffParam):
+	name: str = Field(
+		min_length = models.MIN_LENGTH_SCHOOSTAFF_NAME,
+		max_length = models.MAX_LENGTH_SCHOOSTAFF_NAME
+	)
+	occupation: models.OccupationStaff | None = None
+
+
+class GradeRowParam(GradeParam):
+	name: str = Field(
+		min_length = models.MIN_LENGTH_GRADE_NAME,
+		max_length = models.MAX_LENGTH_GRADE_NAME
+	)
+	level: int = Field(
+		ge = models.MIN_LENGTH_GRADE_LEVEL,
+		le = models.MAX_LENGTH_GRADE_LEVEL
+	)
+	section: str | None = Field(
+		default = None,
+		max_length = models.MAX_LENGTH_GRADE_SECTION
+	)
+
+
+class PaymentReportRowParam(BaseModel):
+	fullname_student: str = Field(
+		min_length = models.MIN_LENGTH_PAYMENTREPORT_FULLNAME_STUDENT,
+		max_length = models.MAX_LENGTH_PAYMENTREPORT_FULLNAME_STUDENT
+	)
+	payment_detail: AnyHttpUrl
+	grade_id: int | None = None
+
+
+class PaymentInfoRowParam(BaseModel):
+	title: str | None = Field(
+		default = None,
+		min_length = models.MIN_LENGTH_SCHOOLMEDIA_TITLE,
+		max_length = models.MAX_LENGTH_SCHOOLMEDIA_TITLE
+	)
+	photo: AnyHttpUrl
+	description: str | None = None
@@ -0,0 +1,34 @@
+from django.apps import apps
+
+from apps.jobs.services.queue import job
+from apps.management.services import storage
+
+JOB_IMAGE_RENDITIONS = "management.image_renditions"
+
+
+@job(JOB_IMAGE_RENDITIONS)
+def create_image_renditions(model: str, ids: list[int], field: str = "photo", renditions_field: str = "renditions") -> int:
+	"""
+		Crea las versiones de las imágenes ya guardadas de los registros
+		'ids' del modelo 'model' ('<app>.<Modelo>').
+	"""
+	instances = list(
+		apps.get_model(model).objects.filter(id__in = ids)
+	)
+
+	renditions = storage.upload_renditions(
+		urls = [getattr(instance, field) for instance in instances]
+	)
+
+	updated = 0
+
+	for instance, rendition in zip(instances, renditions):
+		if not rendition:
+			continue
+
+		setattr(instance, renditions_field, rendition)
+		# 'save' envía 'post_save', lo que invalida el caché de los recursos
+		instance.save(update_fields = [renditions_field])
+		updated += 1
+
+	return updated
@@ -0,0 +1,149 @@
+"""
+	Exportación de los datos de una escuela a archivos CSV o NDJSON.
+
+	Las filas se leen con 'iterator(chunk_size = CHUNK_SIZE)' (cursores del
+	lado del servidor en PostgreSQL) y se escriben una a una en la respuesta
+	('StreamingHttpResponse'), así la memoria usada no depende de la
+	cantidad de registros exportados.
+"""
+import csv, json
+from dataclasses import dataclass
+from typing import Iterator
+
+from django.conf import settings
+from django.db.models import QuerySet
+from django.core.serializers.json import DjangoJSONEncoder
+
+from apps.school import models
+
+DEFAULT_CHUNK_SIZE = 2000
+
+FORMAT_CSV = "csv"
+FORMAT_NDJSON = "ndjson"
+
+CONTENT_TYPES = {
+	FORMAT_CSV: "text/csv; charset=utf-8",
+	FORMAT_NDJSON: "application/x-ndjson",
+}
+
+UNSUPPORTED_FORMAT = "Formato de exportación no soportado, debe ser: csv o ndjson"
+
+# Caracteres con los que una hoja de cálculo interpreta la celda como fórmula
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+class ExportFormatError(ValueError):
+	pass
+
+
+def get_config() -> dict:
+	return getattr(settings, "SCHOOL_EXPORT", {})
+
+
+@dataclass(frozen = True)
+class ExportResource:
+	model: type
+	# Columnas del archivo, en el mismo orden
+	fields: tuple[str, ...]
+	ordering: tuple[str, ...] = ("id", )
+
+
+RESOURCES: dict[str, ExportResource] = {
+	"payment": ExportResource(
+		model = models.PaymentReport,
+		fields = ("id", "fullname_student", "payment_detail", "created", "grade_id"),
+		ordering = ("-created", "-id")
+	),
+	"news": ExportResource(
+		model = models.News,
+		fields = ("id", "title", "description", "status", "created", "updated"),
+		ordering = ("-created", "-id")
+	),
+	"calendar": ExportResource(
+		model = models.Calendar,
+		fields = ("id", "title", "description", "date"),
+		ordering = ("-date", "-id")
+	),
+	"staff": ExportResource(
+		model = models.SchoolStaff,
+		fields = ("id", "name", "occupation")
+	),
+}
+
+
+def get_format(file_format: str | None) -> str:
+	file_format = (file_format or FORMAT_CSV).lower()
+
+	if file_format not in CONTENT_TYPES:
+		raise ExportFormatError(UNSUPPORTED_FORMAT)
+
+	return file_format
+
+
+def get_rows(resource: ExportResource, queryset: QuerySet, chunk_size: int | None = None) -> Iterator[tuple]:
+	chunk_size = chunk_size or get_config().get("CHUNK_SIZE", DEFAULT_CHUNK_SIZE)
+
+	# 'values_list' evita crear una instancia del modelo por cada fila
+	return queryset.order_by(
+		*resource.ordering
+	).values_list(
+		*resource.fields
+	).iterator(chunk_size = chunk_size)
+
+
+class Echo:
+	"""
+		Objeto con la interfaz de un archivo que devuelve lo que se
+		escribe en él, en lugar de guardarlo.
+	"""
+	def write(self, value: str) -> str:
+		return value
+
+
+def escape_formula(value):
+	"""
+		Antepone "'" a los textos que una hoja de cálculo (Excel,
+		LibreOffice) ejecutaría como fórmula al abrir el archivo CSV.
+	"""
+	if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+		return f"'{value}"
+
+	return value
+
+
+def stream_csv(fields: tuple[str, ...], rows: Iterator[tuple]) -> Iterator[str]:
+	writer = csv.writer(Echo())
+
+	yield writer.writerow(fields)
+
+	for row in rows:
+		yield writer.writerow([escape_formula(value) for value in row])
+
+
+def stream_ndjson(fields: tuple[str, ...], rows: Iterator[tuple]) -> Iterator[str]:
+	for row in rows:
+		yield json.dumps(
+			dict(zip(fields, row)),
+			cls = DjangoJSONEncoder,
+			ensure_ascii = False
+		) + "\n"
+
+
+STREAMS = {
+	FORMAT_CSV: stream_csv,
+	FORMAT_NDJSON: stream_ndjson,
+}
+
+
+def export_queryset(resource_name: str, queryset: QuerySet, file_format: str, chunk_size: int | None = None) -> Iterator[str]:
+	"""
+		Genera el contenido del archivo ('csv' o 'ndjson') con los
+		registros de 'queryset' del recurso 'resource_name'
+		('payment', 'news', 'calendar', 'staff').
+	"""
+	resource = RESOURCES[resource_name]
+
+	return STREAMS[file_format](
+		resource.fields,
+		get_rows(resource, queryset, chunk_size)
+	)
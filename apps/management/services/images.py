@@ -0,0 +1,124 @@
+"""
+	Versiones ('renditions') de las imágenes que suben los administradores.
+
+	Por cada imagen se generan las versiones de 'SCHOOL_IMAGES["RENDITIONS"]'
+	(nombre: lado mayor en píxeles) en el formato 'SCHOOL_IMAGES["FORMAT"]'
+	(WEBP o JPEG), sin los metadatos EXIF (ubicación, cámara, ...). La
+	orientación del EXIF se aplica antes de quitarlos.
+
+	Las versiones nunca son más grandes que la imagen original y se generan
+	de la más grande a la más pequeña, cada una a partir de la anterior.
+"""
+import io
+from pathlib import Path
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+DEFAULT_FORMAT = "WEBP"
+DEFAULT_QUALITY = 80
+DEFAULT_RENDITIONS = {
+	"thumbnail": 320,
+	"medium": 960,
+	"full": 1920,
+}
+
+EXTENSIONS = {
+	"WEBP": "webp",
+	"JPEG": "jpg",
+}
+
+CONTENT_TYPES = {
+	"WEBP": "image/webp",
+	"JPEG": "image/jpeg",
+}
+
+# Las animaciones y los vectores se guardan solo como el original
+SKIP_CONTENT_TYPES = ("image/gif", "image/svg+xml")
+SKIP_EXTENSIONS = (".gif", ".svg")
+
+
+def get_config() -> dict:
+	return getattr(settings, "SCHOOL_IMAGES", {})
+
+
+def get_renditions() -> list[tuple[str, int]]:
+	renditions = get_config().get("RENDITIONS", DEFAULT_RENDITIONS)
+
+	return sorted(renditions.items(), key = lambda rendition: rendition[1], reverse = True)
+
+
+def open_image(file, max_size: int) -> Image.Image | None:
+	if getattr(file, "content_type", None) in SKIP_CONTENT_TYPES:
+		return None
+
+	file.seek(0)
+
+	try:
+		image = Image.open(file)
+
+		# Los JPEG se decodifican directamente a una escala cercana a
+		# 'max_size', lo que reduce el tiempo y la memoria usada
+		image.draft("RGB", (max_size, max_size))
+		image = ImageOps.exif_transpose(image)
+	except (UnidentifiedImageError, OSError, Image.DecompressionBombError):
+		return None
+	finally:
+		file.seek(0)
+
+	return image
+
+
+def convert_image(image: Image.Image, image_format: str) -> Image.Image:
+	if image_format == "JPEG" or image.mode not in ("RGB", "RGBA"):
+		has_alpha = image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info
+
+		return image.convert("RGBA" if has_alpha and image_format != "JPEG" else "RGB")
+
+	return image
+
+
+def create_renditions(file, name: str) -> list[tuple[str, str, ContentFile]]:
+	"""
+		Devuelve una lista con el nombre de la versión, el nombre del
+		archivo ('<name>_<versión>.<formato>') y su contenido.
+		Si el archivo no es una imagen que se pueda procesar devuelve '[]'.
+	"""
+	renditions = get_renditions()
+
+	if not renditions or Path(name).suffix.lower() in SKIP_EXTENSIONS:
+		return []
+
+	config = get_config()
+	image_format = config.get("FORMAT", DEFAULT_FORMAT).upper()
+	quality = config.get("QUALITY", DEFAULT_QUALITY)
+
+	image = open_image(file, max_size = renditions[0][1])
+
+	if image is None:
+		return []
+
+	stem = str(Path(name).with_suffix(""))
+	extension = EXTENSIONS[image_format]
+
+	image = convert_image(image, image_format)
+	result = []
+
+	for rendition, size in renditions:
+		image = image.copy()
+		image.thumbnail((size, size), Image.Resampling.LANCZOS)
+
+		buffer = io.BytesIO()
+		# Sin 'exif' ni 'icc_profile' en los parámetros, 'save' no escribe los metadatos
+		image.save(buffer, format = image_format, quality = quality, optimize = True)
+
+		content = ContentFile(buffer.getvalue(), name = f"{stem}_{rendition}.{extension}")
+		content.content_type = CONTENT_TYPES[image_format]
+
+		result.append((rendition, content.name, content))
+
+	image.close()
+
+	return result
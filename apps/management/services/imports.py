@@ -0,0 +1,384 @@
+"""
+	Importación de los datos de una escuela desde archivos CSV o XLSX.
+
+	El archivo se lee como un flujo de filas (nunca se carga completo en
+	memoria) y se procesa por lotes de 'BATCH_SIZE' filas: cada fila se
+	valida con los 'props' de 'apps.management.commands.utils.props', los
+	duplicados se buscan con una consulta por lote y las filas válidas se
+	guardan con 'bulk_create' en una transacción por lote.
+
+	Cada lote se guarda antes de leer el siguiente, así los duplicados de
+	lotes anteriores los encuentra la consulta del lote y solo se guardan
+	en memoria las llaves del lote actual.
+
+	Las filas con errores no detienen la importación, se informan con su
+	número de línea (la línea 1 es la cabecera). Si el archivo no se puede
+	leer después de guardar algún lote, el error se informa sin número de
+	línea ('row: null') junto con los registros ya creados.
+"""
+import csv, io
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+from django.conf import settings
+from django.db import transaction
+
+from pydantic import BaseModel, ValidationError
+
+from apps.school import models
+from apps.school.services.cache import school_cache, school_scope, RESOURCE_CALENDAR
+from apps.management.commands import commands
+from apps.management.commands.utils import props
+
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_MAX_ERRORS = 100
+
+FORMAT_CSV = ".csv"
+FORMAT_XLSX = ".xlsx"
+
+UNSUPPORTED_FORMAT = "Formato de archivo no soportado, debe ser: CSV o XLSX"
+XLSX_NOT_AVAILABLE = "Para importar archivos XLSX se debe instalar 'openpyxl'"
+INVALID_FILE = "No se pudo leer el archivo, verifique su formato y codificación (UTF-8)"
+ROW_ALREADY_EXISTS = "Ya existe un registro con estos datos"
+ROW_DUPLICATED = "Este registro se repite en el archivo"
+STAGE_DOES_NOT_EXIST = "No existe la etapa educativa seleccionada"
+GRADE_DOES_NOT_EXIST = "No existe el grado seleccionado en la escuela"
+
+# La línea 1 del archivo es la cabecera
+FIRST_ROW = 2
+
+
+class ImportFileError(ValueError):
+	pass
+
+
+def get_config() -> dict:
+	return getattr(settings, "SCHOOL_IMPORT", {})
+
+
+@dataclass
+class ImportResult:
+	created: int = 0
+	failed: int = 0
+	errors: list[dict] = field(default_factory = list)
+	max_errors: int = DEFAULT_MAX_ERRORS
+
+	def add_error(self, row: int, message: str, field: str | None = None) -> None:
+		self.add_errors(row, [{"field": field, "message": message}])
+
+	def add_errors(self, row: int, errors: list[dict]) -> None:
+		self.failed += 1
+
+		# Solo se guardan los primeros errores, así la memoria no
+		# crece con el tamaño del archivo
+		for error in errors:
+			if len(self.errors) >= self.max_errors:
+				return
+
+			self.errors.append({"row": row, **error})
+
+	def add_file_error(self, message: str) -> None:
+		# Error del archivo (no de una fila), siempre se informa
+		self.errors.append({"row": None, "field": None, "message": message})
+
+	@property
+	def data(self) -> dict:
+		return {
+			"created": self.created,
+			"failed": self.failed,
+			"errors": self.errors
+		}
+
+
+@dataclass(frozen = True)
+class ImportResource:
+	model: type
+	param: type[BaseModel]
+	build: Callable[[int, BaseModel], Any]
+	# Llave para buscar duplicados ('None' si no se busca)
+	get_key: Callable[[BaseModel], tuple | None] = lambda row: None
+	# Llaves que ya existen en la escuela, una consulta por lote
+	get_existing_keys: Callable[[int, list[BaseModel]], Iterable[tuple]] | None = None
+	# Error de cada fila que depende de la base de datos, una consulta por lote
+	validate: Callable[[int, list[BaseModel]], list[str | None]] | None = None
+	# Recurso del caché de la escuela, 'bulk_create' no envía 'post_save'
+	cache_resource: str | None = None
+
+
+def get_calendar_keys(school_id: int, rows: list[props.CalendarRowParam]) -> list[tuple]:
+	return commands.bulk_calendar_exist(
+		school_id = school_id,
+		calendars = rows
+	).query
+
+
+def get_grade_key(row: props.GradeRowParam) -> tuple | None:
+	if not row.section:
+		return None
+
+	return (row.section, row.level, row.stage_id)
+
+
+def get_grade_keys(school_id: int, rows: list[props.GradeRowParam]) -> list[tuple]:
+	return commands.bulk_grade_exist(
+		school_id = school_id,
+		grades = [
+			{"section": row.section, "level": row.level, "stage_id": row.stage_id}
+			for row in rows
+		]
+	).query
+
+
+def validate_grades(school_id: int, rows: list[props.GradeRowParam]) -> list[str | None]:
+	stages = set(
+		commands.get_educational_stages(
+			stages = list({row.stage_id for row in rows})
+		).query
+	)
+
+	return [
+		None if row.stage_id in stages else STAGE_DOES_NOT_EXIST
+		for row in rows
+	]
+
+
+def validate_payment_reports(school_id: int, rows: list[props.PaymentReportRowParam]) -> list[str | None]:
+	grade_ids = list({row.grade_id for row in rows if row.grade_id})
+
+	grades = set(
+		commands.bulk_records_exist(
+			model = models.Grade,
+			school_id = school_id,
+			ids = grade_ids
+		).query
+	) if grade_ids else set()
+
+	return [
+		GRADE_DOES_NOT_EXIST if row.grade_id and row.grade_id not in grades else None
+		for row in rows
+	]
+
+
+RESOURCES: dict[str, ImportResource] = {
+	"calendar": ImportResource(
+		model = models.Calendar,
+		param = props.CalendarRowParam,
+		build = lambda school_id, row: models.Calendar(
+			school_id = school_id,
+			title = row.title,
+			description = row.description,
+			date = row.date
+		),
+		get_key = lambda row: (row.title, row.date),
+		get_existing_keys = get_calendar_keys,
+		cache_resource = RESOURCE_CALENDAR
+	),
+	"staff": ImportResource(
+		model = models.SchoolStaff,
+		param = props.StaffRowParam,
+		build = lambda school_id, row: models.SchoolStaff(
+			school_id = school_id,
+			name = row.name,
+			occupation = row.occupation or models.OccupationStaff.administrative
+		)
+	),
+	"grade": ImportResource(
+		model = models.Grade,
+		param = props.GradeRowParam,
+		build = lambda school_id, row: models.Grade(
+			school_id = school_id,
+			name = row.name,
+			level = row.level,
+			section = row.section,
+			description = row.description,
+			stage_id = row.stage_id
+		),
+		get_key = get_grade_key,
+		get_existing_keys = get_grade_keys,
+		validate = validate_grades
+	),
+	"payment": ImportResource(
+		model = models.PaymentReport,
+		param = props.PaymentReportRowParam,
+		build = lambda school_id, row: models.PaymentReport(
+			school_id = school_id,
+			fullname_student = row.fullname_student,
+			payment_detail = str(row.payment_detail),
+			grade_id = row.grade_id
+		),
+		validate = validate_payment_reports
+	),
+	"payment-info": ImportResource(
+		model = models.PaymentInfo,
+		param = props.PaymentInfoRowParam,
+		build = lambda school_id, row: models.PaymentInfo(
+			school_id = school_id,
+			title = row.title,
+			photo = str(row.photo),
+			description = row.description
+		)
+	),
+}
+
+
+def get_format(name: str) -> str:
+	file_format = Path(name or "").suffix.lower()
+
+	if file_format not in (FORMAT_CSV, FORMAT_XLSX):
+		raise ImportFileError(UNSUPPORTED_FORMAT)
+
+	return file_format
+
+
+def read_csv(file) -> Iterator[dict]:
+	stream = io.TextIOWrapper(file, encoding = "utf-8-sig", newline = "")
+
+	try:
+		yield from csv.DictReader(stream)
+	except (UnicodeDecodeError, csv.Error) as e:
+		raise ImportFileError(INVALID_FILE) from e
+	finally:
+		# El archivo lo cierra quien lo abrió
+		stream.detach()
+
+
+def read_xlsx(file) -> Iterator[dict]:
+	try:
+		from openpyxl import load_workbook
+	except ImportError as e:
+		raise ImportFileError(XLSX_NOT_AVAILABLE) from e
+
+	try:
+		# 'read_only' lee las filas bajo demanda
+		workbook = load_workbook(file, read_only = True, data_only = True)
+	except Exception as e:
+		raise ImportFileError(INVALID_FILE) from e
+
+	try:
+		rows = workbook.active.iter_rows(values_only = True)
+		headers = [str(header or "").strip() for header in next(rows, ())]
+
+		for values in rows:
+			yield dict(zip(headers, values))
+	finally:
+		workbook.close()
+
+
+def read_rows(file, name: str) -> Iterator[dict]:
+	file = getattr(file, "file", file)
+	file.seek(0)
+
+	if get_format(name) == FORMAT_XLSX:
+		return read_xlsx(file)
+
+	return read_csv(file)
+
+
+def clean_row(row: dict) -> dict:
+	# Las celdas vacías se toman como valores no enviados
+	return {
+		key.strip(): value.strip() if isinstance(value, str) else value
+		for key, value in row.items()
+		if key and value is not None and value != ""
+	}
+
+
+def get_batches(rows: Iterable[dict], size: int) -> Iterator[list[tuple[int, dict]]]:
+	numbered = enumerate(rows, start = FIRST_ROW)
+
+	while batch := list(islice(numbered, size)):
+		yield batch
+
+
+def import_batch(
+	resource: ImportResource,
+	school_id: int,
+	batch: list[tuple[int, dict]],
+	result: ImportResult
+) -> None:
+	valid = []
+
+	for line, row in batch:
+		try:
+			valid.append((line, resource.param.model_validate(clean_row(row))))
+		except ValidationError as e:
+			result.add_errors(line, [
+				{
+					"field": ".".join(str(loc) for loc in error["loc"]) or None,
+					"message": error["msg"]
+				}
+				for error in e.errors(include_url = False)
+			])
+
+	rows = [row for _, row in valid]
+
+	messages = resource.validate(school_id, rows) if resource.validate and rows else [None] * len(rows)
+
+	keys = [resource.get_key(row) for row in rows]
+	search = [row for row, key in zip(rows, keys) if key is not None]
+
+	existing = set(
+		resource.get_existing_keys(school_id, search)
+	) if resource.get_existing_keys and search else set()
+
+	# Llaves de las filas del lote, los lotes anteriores ya están en 'existing'
+	seen = set()
+	instances = []
+
+	for (line, row), key, message in zip(valid, keys, messages):
+		if message is None and key is not None:
+			if key in existing:
+				message = ROW_ALREADY_EXISTS
+			elif key in seen:
+				message = ROW_DUPLICATED
+
+		if message is not None:
+			result.add_error(line, message)
+			continue
+
+		if key is not None:
+			seen.add(key)
+
+		instances.append(resource.build(school_id, row))
+
+	if not instances:
+		return
+
+	with transaction.atomic():
+		resource.model.objects.bulk_create(instances)
+
+		if resource.cache_resource:
+			school_cache.bump(resource.cache_resource, school_scope(school_id))
+
+	result.created += len(instances)
+
+
+def import_file(resource_name: str, school_id: int, file, name: str, batch_size: int | None = None) -> ImportResult:
+	"""
+		Importa las filas del archivo ('.csv' o '.xlsx') al recurso
+		'resource_name' ('calendar', 'staff', 'grade', 'payment',
+		'payment-info').
+	"""
+	config = get_config()
+	resource = RESOURCES[resource_name]
+
+	batch_size = batch_size or config.get("BATCH_SIZE", DEFAULT_BATCH_SIZE)
+	result = ImportResult(max_errors = config.get("MAX_ERRORS", DEFAULT_MAX_ERRORS))
+
+	rows = read_rows(file, name)
+
+	try:
+		for batch in get_batches(rows, batch_size):
+			import_batch(resource, school_id, batch, result)
+	except ImportFileError as e:
+		# El archivo se lee bajo demanda, un error de codificación puede
+		# aparecer después de guardar algunos lotes. En ese caso se informa
+		# lo que ya se guardó junto con el error.
+		if not result.created:
+			raise
+
+		result.add_file_error(str(e))
+
+	return result
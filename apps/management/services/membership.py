@@ -0,0 +1,195 @@
+"""
+	Caché de la pertenencia de los usuarios a la administración de
+	las escuelas, usada por los permisos de 'apps.management.apiv1'.
+
+	- Por usuario: el conjunto de 'id' de las escuelas que administra.
+	- Por registro: '(modelo, pk) -> school_id'.
+
+	Se invalida con las señales de 'apps.management.services.receivers'.
+
+	Los tokens de administración llevan las escuelas del usuario y la
+	versión de su pertenencia ('add_claims'); mientras esa versión sea
+	la actual no hace falta consultar la pertenencia.
+
+	El caché y las versiones solo se invalidan en el proceso que hace el
+	cambio si la caché es local ('locmemcache://', ver 'school.W001'), por
+	eso las escrituras ('verify = True') siempre consultan la base de datos:
+	un usuario que deja de ser administrador no puede seguir modificando
+	la escuela aunque otro proceso o su token digan lo contrario.
+"""
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models.base import ModelBase
+
+from apps.management import models
+
+KEY_PREFIX = "membership"
+
+CLAIM_SCHOOLS = "schools"
+CLAIM_VERSION = "membership_version"
+
+
+def get_cache():
+	config = getattr(settings, "SCHOOL_CACHE", {})
+	return caches[config.get("ALIAS", "default")]
+
+
+def get_timeout() -> int:
+	# Se guarda, como máximo, lo que dura un token de acceso
+	lifetime = getattr(settings, "SIMPLE_JWT", {}).get("ACCESS_TOKEN_LIFETIME")
+	return int(lifetime.total_seconds()) if lifetime else 60 * 60
+
+
+def user_key(user_id: int) -> str:
+	return f"{KEY_PREFIX}:user:{user_id}"
+
+
+def object_key(model: ModelBase, pk: int) -> str:
+	return f"{KEY_PREFIX}:object:{model._meta.label_lower}:{pk}"
+
+
+def version_key(user_id: int) -> str:
+	return f"{KEY_PREFIX}:version:{user_id}"
+
+
+def claims_enabled() -> bool:
+	return getattr(settings, "ADMIN_TOKEN_CLAIMS", True)
+
+
+def get_version(user_id: int) -> int:
+	cache = get_cache()
+	key = version_key(user_id)
+
+	version = cache.get(key)
+
+	if version is None:
+		# Una versión desalojada del caché no puede repetirse,
+		# los tokens anteriores quedan desactualizados
+		cache.add(key, time.time_ns(), timeout = None)
+		version = cache.get(key)
+
+	return version
+
+
+def get_user_schools(user_id: int) -> frozenset[int]:
+	cache = get_cache()
+	key = user_key(user_id)
+
+	schools = cache.get(key)
+
+	if schools is None:
+		schools = frozenset(
+			models.Administrator.objects.filter(
+				users__id = user_id
+			).values_list("school_id", flat = True)
+		)
+		cache.set(key, schools, timeout = get_timeout())
+
+	return schools
+
+
+def get_object_school(model: ModelBase, pk: int) -> int | None:
+	cache = get_cache()
+	key = object_key(model, pk)
+
+	school_id = cache.get(key)
+
+	if school_id is None:
+		school_id = model.objects.filter(
+			pk = pk
+		).values_list("school_id", flat = True).first()
+
+		if school_id is not None:
+			cache.set(key, school_id, timeout = get_timeout())
+
+	return school_id
+
+
+def add_claims(token, user_id: int) -> None:
+	# La versión se obtiene primero, si la pertenencia cambia mientras
+	# tanto el token queda desactualizado y no con escuelas de más
+	version = get_version(user_id)
+
+	token[CLAIM_SCHOOLS] = sorted(get_user_schools(user_id))
+	token[CLAIM_VERSION] = version
+
+
+def get_claim_schools(token, user_id: int) -> frozenset[int] | None:
+	"""
+		Escuelas del token, o 'None' si el token no las tiene o su
+		versión de la pertenencia ya no es la actual.
+	"""
+	if token is None or not claims_enabled():
+		return None
+
+	schools = token.get(CLAIM_SCHOOLS)
+	version = token.get(CLAIM_VERSION)
+
+	if schools is None or version is None:
+		return None
+
+	if version != get_version(user_id):
+		return None
+
+	return frozenset(schools)
+
+
+def is_member(
+	user_id: int | None, 
+	school_id: int | str | None, 
+	token = None, 
+	verify: bool = False
+) -> bool:
+	"""
+		Con 'verify' se consulta la base de datos, sin el caché ni el token.
+	"""
+	if user_id is None or school_id is None:
+		return False
+
+	if verify:
+		return models.Administrator.objects.filter(
+			users__id = user_id,
+			school_id = school_id
+		).exists()
+
+	schools = get_claim_schools(token, user_id)
+
+	if schools is None:
+		schools = get_user_schools(user_id)
+
+	return int(school_id) in schools
+
+
+def _delete(keys: list[str]) -> None:
+	cache = get_cache()
+
+	cache.delete_many(keys)
+	# Se vuelve a eliminar al confirmar la transacción, así una lectura
+	# concurrente no deja guardada la pertenencia previa a la escritura
+	transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def _set_versions(user_ids: list[int]) -> None:
+	version = time.time_ns()
+
+	get_cache().set_many(
+		{version_key(user_id): version for user_id in user_ids}, 
+		timeout = None
+	)
+
+
+def invalidate_users(user_ids) -> None:
+	user_ids = list(user_ids)
+
+	_delete([user_key(user_id) for user_id in user_ids])
+
+	# Los tokens emitidos antes del cambio quedan desactualizados
+	_set_versions(user_ids)
+	transaction.on_commit(lambda: _set_versions(user_ids))
+
+
+def invalidate_object(model: ModelBase, pk: int) -> None:
+	_delete([object_key(model, pk)])
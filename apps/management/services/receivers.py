@@ -0,0 +1,56 @@
+from django.apps import apps
+from django.dispatch import receiver
+from django.db.models import signals
+from django.contrib.auth import get_user_model
+from django.core.exceptions import FieldDoesNotExist
+
+from apps.management.models import Administrator
+from apps.management.services import membership
+
+
+@receiver(signals.m2m_changed, sender=Administrator.users.through)
+def invalidate_membership(sender, instance=None, action=None, reverse=False, pk_set=None, **kwargs):
+	if action not in ("post_add", "post_remove", "pre_clear"):
+		return
+
+	if reverse:
+		membership.invalidate_users([instance.pk])
+	elif action == "pre_clear":
+		membership.invalidate_users(instance.users.values_list("id", flat = True))
+	else:
+		membership.invalidate_users(pk_set)
+
+
+@receiver(signals.pre_delete, sender=Administrator)
+def invalidate_administrator_users(sender, instance=None, **kwargs):
+	# Las filas de 'users' se eliminan en cascada sin enviar 'm2m_changed'
+	membership.invalidate_users(instance.users.values_list("id", flat = True))
+
+
+@receiver(signals.post_save, sender=get_user_model())
+@receiver(signals.post_delete, sender=get_user_model())
+def invalidate_user(sender, instance=None, created=True, **kwargs):
+	# Un 'id' puede volver a usarse, se invalida también al crear
+	if created:
+		membership.invalidate_users([instance.pk])
+
+
+def invalidate_object(sender, instance=None, **kwargs):
+	membership.invalidate_object(sender, instance.pk)
+
+
+def has_school(model) -> bool:
+	try:
+		model._meta.get_field("school")
+	except FieldDoesNotExist:
+		return False
+
+	return True
+
+
+for model in apps.get_app_config("school").get_models():
+	if not has_school(model):
+		continue
+
+	signals.post_save.connect(invalidate_object, sender = model)
+	signals.post_delete.connect(invalidate_object, sender = model)
@@ -0,0 +1,286 @@
+"""
+	Almacenamiento de los archivos que suben los administradores
+	(imágenes de noticias, infraestructura, logo y archivos de repositorios).
+
+	El backend se configura en 'SCHOOL_STORAGE' (settings.py):
+
+		- 'LocalStorage': sistema de archivos ('MEDIA_ROOT').
+		- 'S3Storage': servicios compatibles con S3 (AWS, MinIO, R2, ...).
+		- 'MemoryStorage': guarda los archivos en memoria (pruebas).
+
+	Los archivos de una petición se suben en paralelo con un 'pool' de
+	hilos acotado ('MAX_WORKERS'), así el tiempo de la petición es cercano
+	al del archivo más lento y no a la suma de todos.
+
+	Las versiones de las imágenes ('apps.management.services.images') se
+	crean después, a partir de los archivos ya guardados ('upload_renditions').
+"""
+import io, uuid, tempfile, posixpath, threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from pathlib import Path
+from urllib.parse import urljoin
+
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+from apps.management.commands.utils.functions import set_name_file
+from apps.management.services import images
+
+DEFAULT_BACKEND = "apps.management.services.storage.LocalStorage"
+DEFAULT_MAX_WORKERS = 4
+
+# Códigos de error de S3 para un objeto que no existe
+S3_NOT_FOUND_CODES = ("404", "NoSuchKey", "NotFound")
+
+FOLDER_NEWS = "news"
+FOLDER_REPOSITORY = "repository"
+FOLDER_INFRAESTRUCTURE = "infraestructure"
+FOLDER_LOGO = "logo"
+
+
+def get_config() -> dict:
+	return getattr(settings, "SCHOOL_STORAGE", {})
+
+
+class BaseStorage:
+	"""
+		Un backend debe implementar 'save' y devolver la URL pública
+		del archivo. 'save' se llama desde varios hilos a la vez.
+	"""
+	def __init__(self, base_url: str = ""):
+		self.base_url = base_url
+
+	def save(self, file, name: str) -> str:
+		raise NotImplementedError("Debe implementar el método: 'save'")
+
+	def open(self, name: str):
+		raise NotImplementedError("Debe implementar el método: 'open'")
+
+	def url(self, name: str) -> str:
+		return urljoin(self.base_url, name)
+
+	def get_name(self, url: str) -> str | None:
+		"""
+			Nombre del archivo a partir de su URL, 'None' si la URL
+			no pertenece a este almacenamiento.
+		"""
+		if not url or not url.startswith(self.base_url):
+			return None
+
+		return url.removeprefix(self.base_url)
+
+
+class LocalStorage(BaseStorage):
+	def __init__(self, location: str | Path | None = None, base_url: str | None = None):
+		super().__init__(base_url = base_url or settings.MEDIA_URL)
+
+		# 'FileSystemStorage' escribe el archivo por bloques ('chunks') y si
+		# está en disco ('TemporaryUploadedFile') lo mueve sin copiarlo
+		self.storage = FileSystemStorage(
+			location = location or settings.MEDIA_ROOT,
+			base_url = self.base_url
+		)
+
+	def save(self, file, name: str) -> str:
+		return self.storage.url(self.storage.save(name, file))
+
+	def open(self, name: str):
+		return self.storage.open(name, "rb")
+
+
+class S3Storage(BaseStorage):
+	def __init__(
+		self,
+		bucket: str,
+		base_url: str | None = None,
+		endpoint_url: str | None = None,
+		region_name: str | None = None,
+		access_key: str | None = None,
+		secret_key: str | None = None,
+		client = None
+	):
+		if not base_url:
+			base_url = f"{endpoint_url or 'https://s3.amazonaws.com'}/{bucket}/"
+
+		super().__init__(base_url = base_url)
+
+		self.bucket = bucket
+		self.options = {
+			"endpoint_url": endpoint_url,
+			"region_name": region_name,
+			"aws_access_key_id": access_key,
+			"aws_secret_access_key": secret_key,
+		}
+		self._client = client
+		self._lock = threading.Lock()
+
+	@property
+	def client(self):
+		# El cliente de boto3 se puede compartir entre hilos,
+		# pero su creación no es 'thread-safe'
+		with self._lock:
+			if self._client is None:
+				import boto3
+
+				self._client = boto3.session.Session().client("s3", **self.options)
+
+		return self._client
+
+	def save(self, file, name: str) -> str:
+		file.seek(0)
+
+		# 'upload_fileobj' lee el archivo por partes, sin copiarlo en memoria
+		self.client.upload_fileobj(
+			file,
+			self.bucket,
+			name,
+			ExtraArgs = {
+				"ContentType": getattr(file, "content_type", None) or "application/octet-stream"
+			}
+		)
+
+		return self.url(name)
+
+	def open(self, name: str):
+		from botocore.exceptions import ClientError
+
+		# En memoria hasta 'max_size', los archivos más grandes se pasan a disco
+		file = tempfile.SpooledTemporaryFile(max_size = 10 * 1024 * 1024)
+
+		try:
+			self.client.download_fileobj(self.bucket, name, file)
+		except ClientError as e:
+			file.close()
+
+			# Igual que 'LocalStorage', un archivo eliminado del bucket
+			# genera 'FileNotFoundError'
+			if e.response.get("Error", {}).get("Code") in S3_NOT_FOUND_CODES:
+				raise FileNotFoundError(name) from e
+
+			raise
+
+		file.seek(0)
+
+		return file
+
+
+class MemoryStorage(BaseStorage):
+	"""
+		Guarda el contenido de los archivos en un diccionario.
+		Sirve como reemplazo de los servicios externos en las pruebas.
+	"""
+	def __init__(self, base_url: str = "http://localhost/media/"):
+		super().__init__(base_url = base_url)
+
+		self.files: dict[str, bytes] = {}
+		self._lock = threading.Lock()
+
+	def save(self, file, name: str) -> str:
+		file.seek(0)
+		content = b"".join(file.chunks()) if hasattr(file, "chunks") else file.read()
+
+		with self._lock:
+			self.files[name] = content
+
+		return self.url(name)
+
+	def open(self, name: str):
+		return io.BytesIO(self.files[name])
+
+
+@cache
+def get_storage() -> BaseStorage:
+	config = get_config()
+
+	backend = import_string(config.get("BACKEND", DEFAULT_BACKEND))
+
+	return backend(**config.get("OPTIONS", {}))
+
+
+@receiver(setting_changed)
+def reset_storage(setting: str, **kwargs) -> None:
+	if setting in ("SCHOOL_STORAGE", "MEDIA_ROOT", "MEDIA_URL"):
+		get_storage.cache_clear()
+
+
+def get_file_name(folder: str, file) -> str:
+	# Sin una extensión reconocible el archivo se guarda solo con el 'uuid'
+	name = set_name_file(file_name = file.name) or str(uuid.uuid4())
+
+	return posixpath.join(folder, name)
+
+
+def upload_files(files: list, folder: str, storage: BaseStorage | None = None) -> list[tuple[str, str]]:
+	"""
+		Sube los archivos en paralelo y devuelve una lista con el nombre y
+		la URL de cada uno ('(name, url)'), en el mismo orden de 'files'.
+	"""
+	storage = storage or get_storage()
+
+	names = [get_file_name(folder, file) for file in files]
+	urls = save_files(storage, files, names)
+
+	return [(posixpath.basename(name), url) for name, url in zip(names, urls)]
+
+
+def upload_file(file, folder: str, storage: BaseStorage | None = None) -> str:
+	_, url = upload_files([file], folder, storage)[0]
+
+	return url
+
+
+def run_tasks(task, *iterables) -> list:
+	size = min(len(iterable) for iterable in iterables)
+
+	if size <= 1:
+		return list(map(task, *iterables))
+
+	max_workers = min(get_config().get("MAX_WORKERS", DEFAULT_MAX_WORKERS), size)
+
+	with ThreadPoolExecutor(max_workers = max_workers) as executor:
+		return list(executor.map(task, *iterables))
+
+
+def save_files(storage: BaseStorage, files: list, names: list[str]) -> list[str]:
+	return run_tasks(storage.save, files, names)
+
+
+def upload_renditions(urls: list[str], storage: BaseStorage | None = None) -> list[dict[str, str]]:
+	"""
+		Crea y sube las versiones de imágenes que ya están guardadas en
+		el almacenamiento. Devuelve las URL de las versiones de cada
+		imagen ('{}' si no se pudo leer), en el mismo orden de 'urls'.
+	"""
+	storage = storage or get_storage()
+
+	names = [storage.get_name(url) for url in urls]
+
+	def create_renditions(name: str | None) -> list:
+		if name is None:
+			return []
+
+		try:
+			file = storage.open(name)
+		except (FileNotFoundError, KeyError):
+			# El archivo ya no existe, no hay versiones que crear
+			return []
+
+		with file:
+			return images.create_renditions(file, name)
+
+	renditions = run_tasks(create_renditions, names)
+
+	uploads = [content for rendition in renditions for *_, content in rendition]
+	upload_names = [name for rendition in renditions for _, name, _ in rendition]
+
+	uploaded = iter(save_files(storage, uploads, upload_names))
+
+	return [
+		{version: next(uploaded) for version, *_ in rendition}
+		for rendition in renditions
+	]
+
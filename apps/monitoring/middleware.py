@@ -0,0 +1,73 @@
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from django.core.exceptions import MiddlewareNotUsed
+
+from .services import requests
+
+
+class RequestMetricsMiddleware:
+	"""
+		Registra las métricas de cada petición ('apps.monitoring.services.requests').
+		Se activa con 'REQUEST_METRICS["ENABLED"]'; con 'SERVER_TIMING' agrega
+		el encabezado 'Server-Timing' (tiempo en la base de datos, en los
+		serializers y total) a las respuestas.
+	"""
+	sync_capable = True
+	async_capable = True
+
+	def __init__(self, get_response):
+		if not requests.is_enabled():
+			raise MiddlewareNotUsed()
+
+		self.get_response = get_response
+		self.server_timing = requests.get_config().get("SERVER_TIMING", False)
+
+		requests.instrument_connections()
+		requests.instrument_serializers()
+
+		if iscoroutinefunction(self.get_response):
+			markcoroutinefunction(self)
+
+	def observe(self, request, response, metrics: requests.RequestMetrics, start: float) -> None:
+		duration = time.perf_counter() - start
+
+		requests.registry.observe(
+			endpoint = requests.get_endpoint(request, metrics),
+			method = request.method,
+			status = response.status_code,
+			metrics = metrics,
+			duration = duration,
+			response_size = requests.get_response_size(response)
+		)
+
+		if self.server_timing:
+			response["Server-Timing"] = metrics.server_timing(duration)
+
+	def __call__(self, request):
+		if iscoroutinefunction(self):
+			return self.__acall__(request)
+
+		token = requests.start()
+		start = time.perf_counter()
+
+		try:
+			response = self.get_response(request)
+			self.observe(request, response, requests.get_current(), start)
+		finally:
+			requests.finish(token)
+
+		return response
+
+	async def __acall__(self, request):
+		token = requests.start()
+		start = time.perf_counter()
+
+		try:
+			response = await self.get_response(request)
+			self.observe(request, response, requests.get_current(), start)
+		finally:
+			requests.finish(token)
+
+		return response
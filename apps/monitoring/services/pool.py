@@ -0,0 +1,138 @@
+"""
+	Estado y métricas de las conexiones a la base de datos.
+
+	Con el pool de psycopg ('school/database.py') se exponen, por cada
+	base de datos: conexiones abiertas, en uso y libres, peticiones en
+	espera y el tiempo total de espera por una conexión ('get_stats').
+"""
+import time
+
+from django.db import connections, DatabaseError
+
+from school import routers
+
+from .prometheus import collector, Metric, GAUGE, COUNTER
+
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+# Solo fallan réplicas, las lecturas van a 'default'
+STATUS_DEGRADED = "degraded"
+
+# (métrica, tipo, descripción, valor a partir de 'pool.get_stats()')
+POOL_METRICS = (
+	("school_db_pool_min_size", GAUGE, "Conexiones mínimas del pool", lambda stats: stats.get("pool_min", 0)),
+	("school_db_pool_max_size", GAUGE, "Conexiones máximas del pool", lambda stats: stats.get("pool_max", 0)),
+	("school_db_pool_size", GAUGE, "Conexiones abiertas por el pool", lambda stats: stats.get("pool_size", 0)),
+	("school_db_pool_available", GAUGE, "Conexiones libres en el pool", lambda stats: stats.get("pool_available", 0)),
+	(
+		"school_db_pool_in_use", GAUGE, "Conexiones en uso",
+		lambda stats: stats.get("pool_size", 0) - stats.get("pool_available", 0)
+	),
+	("school_db_pool_waiting", GAUGE, "Peticiones esperando por una conexión", lambda stats: stats.get("requests_waiting", 0)),
+	("school_db_pool_requests_total", COUNTER, "Conexiones solicitadas al pool", lambda stats: stats.get("requests_num", 0)),
+	("school_db_pool_requests_queued_total", COUNTER, "Solicitudes que tuvieron que esperar", lambda stats: stats.get("requests_queued", 0)),
+	(
+		"school_db_pool_wait_seconds_total", COUNTER, "Tiempo total de espera por una conexión",
+		lambda stats: stats.get("requests_wait_ms", 0) / 1000
+	),
+	("school_db_pool_errors_total", COUNTER, "Solicitudes que fallaron (tiempo de espera agotado)", lambda stats: stats.get("requests_errors", 0)),
+	("school_db_pool_connections_total", COUNTER, "Conexiones creadas por el pool", lambda stats: stats.get("connections_num", 0)),
+	("school_db_pool_connections_lost_total", COUNTER, "Conexiones cerradas por no pasar la validación", lambda stats: stats.get("connections_lost", 0)),
+)
+
+
+def get_pool(alias: str):
+	"""
+		Pool de la base de datos 'alias', 'None' sin pool (SQLite, ...).
+	"""
+	return getattr(connections[alias], "pool", None)
+
+
+def get_pool_stats() -> dict[str, dict[str, int]]:
+	stats = {}
+
+	for alias in connections:
+		pool = get_pool(alias)
+
+		if pool is not None:
+			# 'get_stats' no reinicia los contadores ('pop_stats' sí)
+			stats[alias] = pool.get_stats()
+
+	return stats
+
+
+@collector
+def collect_pool_metrics() -> list[Metric]:
+	stats = get_pool_stats()
+
+	if not stats:
+		return []
+
+	metrics = []
+
+	for name, metric_type, description, get_value in POOL_METRICS:
+		metric = Metric(name = name, type = metric_type, help = description)
+
+		for alias, values in stats.items():
+			metric.add(get_value(values), database = alias)
+
+		metrics.append(metric)
+
+	return metrics
+
+
+@collector
+def collect_replica_metrics() -> list[Metric]:
+	replicas = routers.get_replicas()
+
+	if not replicas:
+		return []
+
+	metric = Metric(
+		name = "school_db_replica_healthy",
+		type = GAUGE,
+		help = "Réplica disponible para las lecturas (1) o fuera de uso (0)"
+	)
+
+	for alias in replicas:
+		metric.add(int(routers.is_healthy(alias)), database = alias)
+
+	return [metric]
+
+
+def check_database(alias: str) -> dict:
+	start = time.perf_counter()
+
+	try:
+		with connections[alias].cursor() as cursor:
+			cursor.execute("SELECT 1")
+			cursor.fetchone()
+	except DatabaseError as e:
+		if alias in routers.get_replicas():
+			routers.mark_unhealthy(alias)
+
+		return {"status": STATUS_ERROR, "error": e.__class__.__name__}
+
+	return {
+		"status": STATUS_OK,
+		"ms": round((time.perf_counter() - start) * 1000, 2)
+	}
+
+
+def check_databases() -> dict[str, dict]:
+	"""
+		Verifica que cada base de datos responda una consulta.
+	"""
+	return {alias: check_database(alias) for alias in connections}
+
+
+def get_status(databases: dict[str, dict]) -> str:
+	failed = {alias for alias, database in databases.items() if database["status"] != STATUS_OK}
+
+	if not failed:
+		return STATUS_OK
+
+	if failed <= set(routers.get_replicas()):
+		return STATUS_DEGRADED
+
+	return STATUS_ERROR
@@ -0,0 +1,80 @@
+"""
+	Métricas en el formato de texto de Prometheus.
+
+	Cada módulo registra una función ('@collector') que devuelve sus
+	métricas; la vista '/metrics' las recolecta en cada 'scrape'.
+"""
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+GAUGE = "gauge"
+COUNTER = "counter"
+HISTOGRAM = "histogram"
+
+
+@dataclass
+class Metric:
+	name: str
+	type: str
+	help: str
+	# (sufijo del nombre, etiquetas, valor), el sufijo en los histogramas:
+	# '_bucket', '_sum' y '_count'
+	samples: list[tuple[str, dict[str, str], float]] = field(default_factory = list)
+
+	def add(self, value: float, suffix: str = "", **labels: str) -> None:
+		self.samples.append((suffix, labels, value))
+
+	def add_histogram(self, buckets: tuple[float, ...], counts: list[int], total: float, **labels: str) -> None:
+		"""
+			'counts' tiene la cantidad de observaciones de cada 'bucket' (no
+			acumuladas) y al final las mayores al último 'bucket' ('+Inf').
+		"""
+		accumulated = 0
+
+		for bucket, count in zip((*buckets, "+Inf"), counts):
+			accumulated += count
+			self.add(accumulated, "_bucket", **labels, le = str(bucket))
+
+		self.add(total, "_sum", **labels)
+		self.add(accumulated, "_count", **labels)
+
+
+collectors: list[Callable[[], Iterable[Metric]]] = []
+
+
+def collector(func: Callable[[], Iterable[Metric]]):
+	if func not in collectors:
+		collectors.append(func)
+
+	return func
+
+
+def escape_label(value) -> str:
+	return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_sample(name: str, labels: dict[str, str], value: float) -> str:
+	if labels:
+		labels = ",".join(f'{key}="{escape_label(label)}"' for key, label in labels.items())
+		name = f"{name}{{{labels}}}"
+
+	return f"{name} {value}"
+
+
+def render(metrics: Iterable[Metric]) -> str:
+	lines = []
+
+	for metric in metrics:
+		lines.append(f"# HELP {metric.name} {metric.help}")
+		lines.append(f"# TYPE {metric.name} {metric.type}")
+
+		for suffix, labels, value in metric.samples:
+			lines.append(format_sample(f"{metric.name}{suffix}", labels, value))
+
+	return "\n".join(lines) + "\n"
+
+
+def collect() -> list[Metric]:
+	return [metric for func in collectors for metric in func()]
@@ -0,0 +1,271 @@
+"""
+	Métricas de cada petición: consultas a la base de datos, tiempo en la
+	base de datos, tiempo de los serializers y tamaño de la respuesta.
+
+	Se agrupan por endpoint: el nombre de la URL ('school:news',
+	'management:grade-detail') o la operación de '/graphql'
+	('graphql:<operationName>'), y se exponen en '/metrics'.
+
+	Las consultas se miden con un 'execute_wrapper' en cada conexión y los
+	serializers en 'BaseSerializer.data' (solo el más externo, los que se
+	crean dentro de otro serializer ya están incluidos en su tiempo).
+
+	Las métricas se acumulan en la memoria de cada proceso, con varios
+	'workers' cada uno expone las suyas.
+"""
+import time, threading
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+from .prometheus import collector, Metric, COUNTER, HISTOGRAM
+
+DEFAULT_MAX_ENDPOINTS = 500
+DEFAULT_DURATION_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+DEFAULT_QUERIES_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+GRAPHQL_ENDPOINT = "graphql:{operation}"
+GRAPHQL_ANONYMOUS = "anonymous"
+# Peticiones que no coinciden con ninguna URL
+UNMATCHED_ENDPOINT = "unmatched"
+# Endpoints que superan 'MAX_ENDPOINTS' (operaciones de GraphQL con nombres arbitrarios)
+OTHER_ENDPOINT = "other"
+
+
+def get_config() -> dict:
+	return getattr(settings, "REQUEST_METRICS", {})
+
+
+def is_enabled() -> bool:
+	return get_config().get("ENABLED", False)
+
+
+@dataclass
+class RequestMetrics:
+	queries: int = 0
+	db_time: float = 0.0
+	serializer_time: float = 0.0
+	serializer_depth: int = 0
+	operation: str | None = None
+	# Las consultas de GraphQL se ejecutan en otros hilos ('sync_to_async')
+	lock: threading.Lock = field(default_factory = threading.Lock, repr = False)
+
+	def add_query(self, duration: float) -> None:
+		with self.lock:
+			self.queries += 1
+			self.db_time += duration
+
+	def server_timing(self, duration: float) -> str:
+		return ", ".join((
+			f'db;dur={self.db_time * 1000:.2f};desc="{self.queries} queries"',
+			f"serializer;dur={self.serializer_time * 1000:.2f}",
+			f"total;dur={duration * 1000:.2f}",
+		))
+
+
+_current: ContextVar[RequestMetrics | None] = ContextVar("request_metrics", default = None)
+
+
+def get_current() -> RequestMetrics | None:
+	return _current.get()
+
+
+def start():
+	return _current.set(RequestMetrics())
+
+
+def finish(token) -> None:
+	_current.reset(token)
+
+
+def record_query(execute, sql, params, many, context):
+	metrics = _current.get()
+
+	if metrics is None:
+		return execute(sql, params, many, context)
+
+	start_time = time.perf_counter()
+
+	try:
+		return execute(sql, params, many, context)
+	finally:
+		metrics.add_query(time.perf_counter() - start_time)
+
+
+def instrument(connection) -> None:
+	if record_query not in connection.execute_wrappers:
+		connection.execute_wrappers.append(record_query)
+
+
+def instrument_connections() -> None:
+	"""
+		Conexiones ya creadas en este hilo, el resto al conectarse
+		('connection_created').
+	"""
+	for connection in connections.all(initialized_only = True):
+		instrument(connection)
+
+
+@receiver(connection_created)
+def instrument_connection(sender, connection, **kwargs) -> None:
+	if is_enabled():
+		instrument(connection)
+
+
+_serializers_lock = threading.Lock()
+_serializers_instrumented = False
+
+
+def instrument_serializers() -> None:
+	global _serializers_instrumented
+
+	from rest_framework.serializers import BaseSerializer
+
+	with _serializers_lock:
+		if _serializers_instrumented:
+			return
+
+		data = BaseSerializer.data
+
+		def timed_data(self):
+			metrics = _current.get()
+
+			if metrics is None:
+				return data.fget(self)
+
+			metrics.serializer_depth += 1
+			start_time = time.perf_counter()
+
+			try:
+				return data.fget(self)
+			finally:
+				metrics.serializer_depth -= 1
+
+				if metrics.serializer_depth == 0:
+					metrics.serializer_time += time.perf_counter() - start_time
+
+		BaseSerializer.data = property(timed_data)
+		_serializers_instrumented = True
+
+
+def get_endpoint(request, metrics: RequestMetrics) -> str:
+	if metrics.operation is not None:
+		return GRAPHQL_ENDPOINT.format(operation = metrics.operation or GRAPHQL_ANONYMOUS)
+
+	resolver_match = getattr(request, "resolver_match", None)
+
+	if resolver_match is None:
+		return UNMATCHED_ENDPOINT
+
+	return resolver_match.view_name
+
+
+def get_response_size(response) -> int | None:
+	if response.streaming:
+		return None
+
+	return len(response.content)
+
+
+@dataclass
+class EndpointStats:
+	queries: int = 0
+	db_time: float = 0.0
+	serializer_time: float = 0.0
+	response_bytes: int = 0
+	duration_total: float = 0.0
+	# Cantidad de peticiones por cada 'bucket' (el último: '+Inf')
+	duration_counts: list[int] = field(default_factory = lambda: [0] * (len(DEFAULT_DURATION_BUCKETS) + 1))
+	queries_counts: list[int] = field(default_factory = lambda: [0] * (len(DEFAULT_QUERIES_BUCKETS) + 1))
+
+
+class MetricsRegistry:
+	def __init__(self):
+		self.lock = threading.Lock()
+		self.clear()
+
+	def clear(self) -> None:
+		with self.lock:
+			self.requests: dict[tuple[str, str, str], int] = {}
+			self.endpoints: dict[str, EndpointStats] = {}
+
+	def get_stats(self, endpoint: str) -> tuple[str, EndpointStats]:
+		if endpoint not in self.endpoints:
+			max_endpoints = get_config().get("MAX_ENDPOINTS", DEFAULT_MAX_ENDPOINTS)
+
+			if len(self.endpoints) >= max_endpoints:
+				endpoint = OTHER_ENDPOINT
+
+		return endpoint, self.endpoints.setdefault(endpoint, EndpointStats())
+
+	def observe(
+		self,
+		endpoint: str,
+		method: str,
+		status: int,
+		metrics: RequestMetrics,
+		duration: float,
+		response_size: int | None
+	) -> None:
+		with self.lock:
+			endpoint, stats = self.get_stats(endpoint)
+
+			key = (endpoint, method, str(status))
+			self.requests[key] = self.requests.get(key, 0) + 1
+
+			stats.queries += metrics.queries
+			stats.db_time += metrics.db_time
+			stats.serializer_time += metrics.serializer_time
+			stats.response_bytes += response_size or 0
+			stats.duration_total += duration
+			stats.duration_counts[bisect_left(DEFAULT_DURATION_BUCKETS, duration)] += 1
+			stats.queries_counts[bisect_left(DEFAULT_QUERIES_BUCKETS, metrics.queries)] += 1
+
+	def collect(self) -> list[Metric]:
+		requests = Metric("school_http_requests_total", COUNTER, "Peticiones atendidas")
+		duration = Metric("school_http_request_duration_seconds", HISTOGRAM, "Duración de las peticiones")
+		queries = Metric("school_http_request_queries", HISTOGRAM, "Consultas a la base de datos por petición")
+		queries_total = Metric("school_db_queries_total", COUNTER, "Consultas a la base de datos")
+		db_time = Metric("school_db_query_seconds_total", COUNTER, "Tiempo en la base de datos")
+		serializer_time = Metric("school_serializer_seconds_total", COUNTER, "Tiempo de los serializers")
+		response_bytes = Metric("school_http_response_bytes_total", COUNTER, "Tamaño de las respuestas")
+
+		with self.lock:
+			for (endpoint, method, status), count in self.requests.items():
+				requests.add(count, endpoint = endpoint, method = method, status = status)
+
+			for endpoint, stats in self.endpoints.items():
+				duration.add_histogram(
+					DEFAULT_DURATION_BUCKETS,
+					stats.duration_counts,
+					stats.duration_total,
+					endpoint = endpoint
+				)
+				queries.add_histogram(
+					DEFAULT_QUERIES_BUCKETS,
+					stats.queries_counts,
+					stats.queries,
+					endpoint = endpoint
+				)
+				queries_total.add(stats.queries, endpoint = endpoint)
+				db_time.add(stats.db_time, endpoint = endpoint)
+				serializer_time.add(stats.serializer_time, endpoint = endpoint)
+				response_bytes.add(stats.response_bytes, endpoint = endpoint)
+
+		if not requests.samples:
+			return []
+
+		return [requests, duration, queries, queries_total, db_time, serializer_time, response_bytes]
+
+
+registry = MetricsRegistry()
+
+
+@collector
+def collect_request_metrics() -> list[Metric]:
+	return registry.collect()
@@ -0,0 +1,51 @@
+import secrets
+
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse
+from django.views.decorators.http import require_GET
+
+from .services import prometheus
+from .services.pool import check_databases, get_status, STATUS_ERROR
+
+
+def has_access(request) -> bool:
+	"""
+		Con 'MONITORING["TOKEN"]' se exige 'Authorization: Bearer <token>',
+		sin el token solo se permite el acceso con DEBUG (desarrollo).
+	"""
+	token = getattr(settings, "MONITORING", {}).get("TOKEN")
+
+	if not token:
+		return settings.DEBUG
+
+	authorization = request.headers.get("Authorization", "")
+
+	return secrets.compare_digest(authorization, f"Bearer {token}")
+
+
+@require_GET
+def health(request):
+	if not has_access(request):
+		return JsonResponse({"detail": "No autorizado"}, status = 401)
+
+	databases = check_databases()
+	status = get_status(databases)
+
+	return JsonResponse(
+		{
+			"status": status,
+			"databases": databases
+		},
+		status = 503 if status == STATUS_ERROR else 200
+	)
+
+
+@require_GET
+def metrics(request):
+	if not has_access(request):
+		return HttpResponse(status = 401)
+
+	return HttpResponse(
+		prometheus.render(prometheus.collect()),
+		content_type = prometheus.CONTENT_TYPE
+	)
@@ -0,0 +1,123 @@
+import hashlib
+from functools import cached_property
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from rest_framework import response, status
+
+from apps.school.services.cache import (
+	school_cache,
+	school_scope,
+	object_scope,
+	SCOPE_SCHOOLS
+)
+from school import routers
+
+
+class CacheResponseMixin:
+	"""
+		Guarda en caché las respuestas exitosas de una vista de lectura.
+		La respuesta se invalida cuando cambia la versión del recurso
+		(ver 'apps.school.services.receivers').
+	"""
+	cache_resource: str = None
+	cache_detail: bool = False
+	cache_header = "X-Cache"
+
+	def get_cache_scopes(self) -> list[str] | None:
+		pk = self.kwargs.get("pk")
+
+		if self.cache_detail:
+			return [object_scope(pk), SCOPE_SCHOOLS]
+
+		return [school_scope(pk)]
+
+	@cached_property
+	def cache_scopes(self) -> list[str] | None:
+		return self.get_cache_scopes()
+
+	def get_cache_key(self) -> str:
+		return self.request.build_absolute_uri()
+
+	def get(self, request, *args, **kwargs):
+		scopes = self.cache_scopes
+
+		if scopes is None:
+			return super().get(request, *args, **kwargs)
+
+		key = self.get_cache_key()
+		data = school_cache.get(self.cache_resource, scopes, key)
+
+		if data is not None:
+			return response.Response(
+				data = data,
+				status = status.HTTP_200_OK,
+				headers = {self.cache_header: "HIT"}
+			)
+
+		res = super().get(request, *args, **kwargs)
+
+		if res.status_code == status.HTTP_200_OK:
+			school_cache.set(self.cache_resource, scopes, key, res.data)
+
+		res[self.cache_header] = "MISS"
+
+		return res
+
+
+class ConditionalResponseMixin:
+	"""
+		Responde [304] a las peticiones con 'If-None-Match' o
+		'If-Modified-Since' cuando el recurso no ha cambiado, sin
+		consultar ni serializar la información.
+
+		Los validadores se obtienen de la versión del recurso en el
+		caché, por lo que debe usarse junto a 'CacheResponseMixin'.
+		No se envían si la respuesta se leyó de una réplica que puede
+		no tener el último cambio del recurso.
+	"""
+	# Momento del último cambio del recurso (la mayor versión)
+	changed_at: int = 0
+
+	def get_validators(self) -> tuple[str | None, int | None]:
+		scopes = self.cache_scopes
+
+		if scopes is None:
+			return None, None
+
+		versions = school_cache.get_versions(self.cache_resource, scopes)
+		key = f"{self.cache_resource}:{versions}:{self.get_cache_key()}"
+
+		self.changed_at = max(versions)
+
+		etag = quote_etag(hashlib.md5(key.encode()).hexdigest())
+		# La versión es el momento (en nanosegundos) del último cambio
+		last_modified = max(versions) // 10**9
+
+		return etag, last_modified
+
+	def get(self, request, *args, **kwargs):
+		etag, last_modified = self.get_validators()
+
+		if etag is None:
+			return super().get(request, *args, **kwargs)
+
+		res = get_conditional_response(
+			request,
+			etag = etag,
+			last_modified = last_modified
+		)
+
+		if res is not None:
+			res["ETag"] = etag
+			res["Last-Modified"] = http_date(last_modified)
+			return res
+
+		res = super().get(request, *args, **kwargs)
+
+		if res.status_code == status.HTTP_200_OK and not routers.may_be_stale(self.changed_at):
+			res["ETag"] = etag
+			res["Last-Modified"] = http_date(last_modified)
+
+		return res
@@ -1,8 +1,168 @@
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+
 from rest_framework import pagination
+from rest_framework.exceptions import NotFound
 
 
 class BasicPaginate(pagination.PageNumberPagination):
 	page_size = 5
 	max_page_size = 10
 	page_query_param = "page"
-	page_size_query_param = "size"
\ No newline at end of file
+	page_size_query_param = "size"
+
+
+class KeysetCursorPaginate(pagination.CursorPagination):
+	"""
+		Paginación por cursor con posición compuesta.
+
+		'CursorPagination' de DRF guarda en el cursor solo el primer campo
+		del orden y resuelve los empates con un 'OFFSET'. Aquí la posición
+		guarda todos los campos del orden (p. ej. '("date", "id")') y se
+		filtra por comparación lexicográfica, así los registros con la misma
+		fecha no se saltan ni se repiten entre páginas.
+	"""
+	def _get_position_from_instance(self, instance, ordering):
+		values = []
+
+		for order in ordering:
+			field_name = order.lstrip("-")
+
+			if isinstance(instance, dict):
+				attr = instance[field_name]
+			else:
+				attr = getattr(instance, field_name)
+
+			values.append(str(attr))
+
+		return json.dumps(values, separators = (",", ":"))
+
+	def decode_position(self, position: str) -> list[str]:
+		try:
+			values = json.loads(position)
+		except ValueError:
+			raise NotFound(self.invalid_cursor_message)
+
+		if not isinstance(values, list) or len(values) != len(self.ordering):
+			raise NotFound(self.invalid_cursor_message)
+
+		return values
+
+	def get_position_filter(self, position: str, reverse: bool) -> Q:
+		"""
+			(a, b) > (x, y)  =>  a > x OR (a = x AND b > y)
+		"""
+		values = self.decode_position(position)
+
+		position_filter = Q()
+		equals = {}
+
+		for order, value in zip(self.ordering, values):
+			order_attr = order.lstrip("-")
+			lookup = "lt" if reverse != order.startswith("-") else "gt"
+
+			position_filter |= Q(**equals, **{f"{order_attr}__{lookup}": value})
+			equals[order_attr] = value
+
+		return position_filter
+
+	def paginate_queryset(self, queryset, request, view = None):
+		self.request = request
+		self.page_size = self.get_page_size(request)
+		if not self.page_size:
+			return None
+
+		self.base_url = request.build_absolute_uri()
+		self.ordering = self.get_ordering(request, queryset, view)
+
+		self.cursor = self.decode_cursor(request)
+		if self.cursor is None:
+			(offset, reverse, current_position) = (0, False, None)
+		else:
+			(offset, reverse, current_position) = self.cursor
+
+		if reverse:
+			queryset = queryset.order_by(*pagination._reverse_ordering(self.ordering))
+		else:
+			queryset = queryset.order_by(*self.ordering)
+
+		try:
+			if current_position is not None:
+				queryset = queryset.filter(
+					self.get_position_filter(current_position, reverse)
+				)
+
+			results = list(queryset[offset:offset + self.page_size + 1])
+		except (ValidationError, ValueError, TypeError):
+			raise NotFound(self.invalid_cursor_message)
+
+		self.page = list(results[:self.page_size])
+
+		if len(results) > len(self.page):
+			has_following_position = True
+			following_position = self._get_position_from_instance(results[-1], self.ordering)
+		else:
+			has_following_position = False
+			following_position = None
+
+		if reverse:
+			self.page = list(reversed(self.page))
+
+			self.has_next = (current_position is not None) or (offset > 0)
+			self.has_previous = has_following_position
+			if self.has_next:
+				self.next_position = current_position
+			if self.has_previous:
+				self.previous_position = following_position
+		else:
+			self.has_next = has_following_position
+			self.has_previous = (current_position is not None) or (offset > 0)
+			if self.has_next:
+				self.next_position = following_position
+			if self.has_previous:
+				self.previous_position = current_position
+
+		if (self.has_previous or self.has_next) and self.template is not None:
+			self.display_page_controls = True
+
+		return self.page
+
+
+class BasicCursorPaginate(KeysetCursorPaginate):
+	page_size = 5
+	max_page_size = 10
+	cursor_query_param = "cursor"
+	page_size_query_param = "size"
+	ordering = ["-created", "-id"]
+
+
+class CursorPaginationMixin:
+	"""
+		Permite elegir la paginación por cursor con '?pagination=cursor'.
+
+		A diferencia de 'PageNumberPagination' no ejecuta 'COUNT(*)' ni
+		'OFFSET', por lo que el tiempo de respuesta no depende de la página.
+		El orden ('cursor_ordering') debe terminar en un campo único (ver
+		'KeysetCursorPaginate').
+	"""
+	pagination_query_param = "pagination"
+	cursor_pagination_class = BasicCursorPaginate
+	cursor_ordering: list[str] = None
+
+	def use_cursor_pagination(self) -> bool:
+		return self.request.query_params.get(self.pagination_query_param) == "cursor"
+
+	@property
+	def paginator(self):
+		if not hasattr(self, "_paginator"):
+			if self.use_cursor_pagination():
+				self._paginator = self.cursor_pagination_class()
+
+				if self.cursor_ordering:
+					self._paginator.ordering = self.cursor_ordering
+			else:
+				self._paginator = super().paginator
+
+		return self._paginator
@@ -7,6 +7,20 @@ from drf_spectacular.types import OpenApiTypes
 
 from apps.school import models
 
+# Versión de la imagen que se muestra en las listas
+LIST_RENDITION = "thumbnail"
+
+def get_list_photo(image) -> str | None:
+	"""
+		URL de la versión pequeña de la imagen, o la original si la
+		imagen no tiene versiones (imágenes anteriores a las versiones).
+	"""
+	if not image:
+		return None
+
+	return (image.renditions or {}).get(LIST_RENDITION, image.photo)
+
+
 class SchoolResponse(serializers.ModelSerializer):
 	class Meta:
 		model = models.School
@@ -15,6 +29,7 @@ class SchoolResponse(serializers.ModelSerializer):
 			"name",
 			"subdomain",
 			"logo",
+			"logo_renditions",
 			"address",
 			"mission",
 			"private"
@@ -63,8 +78,7 @@ class InfraestructureMediaSerializer(serializers.ModelSerializer):
 @extend_schema_field(OpenApiTypes.URI)
 class InfraestructureMediaField(serializers.RelatedField):
 	def to_representation(self, value):
-		image = value.first()
-		return image.photo if image else None
+		return get_list_photo(value.first())
 
 class InfraestructureListResponse(serializers.ModelSerializer):
 	media = InfraestructureMediaField(read_only = True)
@@ -140,8 +154,7 @@ class CulturalEventMediaSerializer(serializers.ModelSerializer):
 @extend_schema_field(OpenApiTypes.URI)
 class CulturalEventMediaField(serializers.RelatedField):
 	def to_representation(self, value):
-		image = value.first()
-		return image.photo
+		return get_list_photo(value.first())
 
 
 class CulturalEventListResponse(serializers.ModelSerializer):
@@ -198,8 +211,7 @@ class NewsMediaSerializer(serializers.ModelSerializer):
 @extend_schema_field(OpenApiTypes.URI)
 class NewsMediaField(serializers.RelatedField):
 	def to_representation(self, value):
-		image = value.first()
-		return image.photo if image else None
+		return get_list_photo(value.first())
 
 class NewsListResponse(serializers.ModelSerializer):
 	media = NewsMediaField(read_only = True)
@@ -221,7 +233,7 @@ class NewsDetailResponse(serializers.ModelSerializer):
 class PaymentInfoResponse(serializers.ModelSerializer):
 	class Meta:
 		model = models.PaymentInfo
-		fields = ["id", "title", "photo", "description"]
+		fields = ["id", "title", "photo", "renditions", "description"]
 
 
 class PaymentInfoDetailResponse(serializers.ModelSerializer):
@@ -358,8 +370,9 @@ class ExtraActivityScheduleShortSerializer(serializers.ModelSerializer):
 @extend_schema_field(OpenApiTypes.URI)
 class ExtraActivityPhotoField(serializers.RelatedField):
 	def to_representation(self, value):
-		image = value.first()
-		return image.photo
+		# 'all()' usa las fotos de 'prefetch_related', 'first()' las volvería a consultar
+		photos = value.all()
+		return get_list_photo(photos[0] if photos else None)
 
 
 class ExtraActivityListResponse(serializers.ModelSerializer):
@@ -389,3 +402,45 @@ class ExtraActivityDetailResponse(serializers.ModelSerializer):
 			"school",
 		]
 
+
+
+class SchoolBootstrapResponse(serializers.ModelSerializer):
+	settings = SettingFormatResponse(source = "setting", read_only = True)
+	social_media = SocialMediaResponse(
+		source = "socialMediasList", 
+		many = True, 
+		read_only = True
+	)
+	contacts = ContactInfoResponse(
+		source = "contactsList", 
+		many = True, 
+		read_only = True
+	)
+	coordinates = CoordinateResponse(
+		source = "coordinatesList", 
+		many = True, 
+		read_only = True
+	)
+	office_hours = OfficeHourListResponse(
+		source = "officeHoursList", 
+		many = True, 
+		read_only = True
+	)
+
+	class Meta:
+		model = models.School
+		fields = [
+			"id",
+			"name",
+			"subdomain",
+			"logo",
+			"logo_renditions",
+			"address",
+			"mission",
+			"private",
+			"settings",
+			"social_media",
+			"contacts",
+			"coordinates",
+			"office_hours",
+		]
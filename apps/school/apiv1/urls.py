@@ -15,6 +15,11 @@ urlpatterns = [
 		views.SchoolDetailAPIView.as_view(), 
 		name='detail'
 	),
+	path(
+		"<slug:subdomain>/bootstrap", 
+		views.SchoolBootstrapAPIView.as_view(), 
+		name='bootstrap'
+	),
 	path(
 		"settings/<int:pk>/", 
 		views.SettingsFormatAPIView.as_view(), 
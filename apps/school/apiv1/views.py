@@ -1,6 +1,6 @@
 from django.utils import timezone
 
-from django.db.models import F
+from django.db.models import F, Prefetch
 
 from rest_framework import (
 	permissions,
@@ -24,8 +24,13 @@ from apps.utils.result_commands import (
 )
 
 from . import paginations
+from .paginations import CursorPaginationMixin
 from . import serializers
+from .mixins import CacheResponseMixin, ConditionalResponseMixin
 from apps.school import models
+from apps.school.services import cache
+from apps.school.services.cache import school_scope
+from apps.school.services.subdomains import get_request_school_id
 
 
 
@@ -63,6 +68,8 @@ class SchoolAPIView(views.APIView):
 				status = status.HTTP_422_UNPROCESSABLE_ENTITY
 			)
 
+		school_id = get_request_school_id(request, query_subdomain)
+
 		try:
 			school = models.School.objects.values(
 				"id",
@@ -72,7 +79,7 @@ class SchoolAPIView(views.APIView):
 				"address",
 				"mission",
 				"private"
-			).get(subdomain = query_subdomain)
+			).get(pk = school_id)
 		except models.School.DoesNotExist as e:
 
 			return response.Response(
@@ -92,6 +99,72 @@ class SchoolAPIView(views.APIView):
 		)
 
 
+class SchoolBootstrapAPIView(ConditionalResponseMixin, CacheResponseMixin, generics.RetrieveAPIView):
+	"""
+		Toda la información necesaria para la página principal
+		de una escuela, en una sola respuesta y un número fijo de consultas.
+	"""
+	queryset = models.School.objects.all()
+	serializer_class = serializers.SchoolBootstrapResponse
+	lookup_field = "subdomain"
+	cache_resource = cache.RESOURCE_BOOTSTRAP
+
+	def get_cache_scopes(self):
+		school_id = get_request_school_id(self.request, self.kwargs.get("subdomain"))
+
+		return [school_scope(school_id)] if school_id else None
+
+	def get_queryset(self):
+		return self.queryset.select_related(
+			"setting"
+		).prefetch_related(
+			"setting__colors",
+			Prefetch(
+				"socialMediasList",
+				queryset = models.SocialMedia.objects.order_by("id")
+			),
+			Prefetch(
+				"contactsList",
+				queryset = models.ContactInfo.objects.order_by("id")
+			),
+			Prefetch(
+				"coordinatesList",
+				queryset = models.Coordinate.objects.order_by("id")
+			),
+			Prefetch(
+				"officeHoursList",
+				queryset = models.OfficeHour.objects.select_related(
+					"time_group"
+				).prefetch_related(
+					"time_group__daysweek"
+				).order_by("-id")
+			),
+		)
+
+	def get_object(self):
+		try:
+			return self.get_queryset().get(
+				subdomain = self.kwargs.get("subdomain")
+			)
+		except models.School.DoesNotExist as e:
+			return None
+
+	def retrieve(self, request, *args, **kwargs):
+		obj = self.get_object()
+
+		if not obj:
+			return response.Response(
+				data = {
+					"error": {"message": f"No existe información sobre alguna escuela con este subdominio ({kwargs.get('subdomain')})"}
+				},
+				status = status.HTTP_404_NOT_FOUND
+			)
+
+		serializer = self.get_serializer(obj)
+
+		return response.Response(data = serializer.data, status = status.HTTP_200_OK)
+
+
 class SchoolDetailAPIView(generics.RetrieveAPIView):
 	queryset = models.School.objects.all()
 	serializer_class = serializers.SchoolDetailResponse
@@ -147,17 +220,28 @@ class OfficeHourDetailAPIView(generics.RetrieveAPIView):
 		return response.Response(data = serializer.data, status = status.HTTP_200_OK)
 
 
-class CalendarListAPIView(generics.ListAPIView):
+class CalendarListAPIView(ConditionalResponseMixin, CacheResponseMixin, CursorPaginationMixin, generics.ListAPIView):
 	queryset = models.Calendar.objects.all()
 	serializer_class = serializers.CalendarListResponse
 	pagination_class = paginations.BasicPaginate
+	cursor_ordering = ["date", "id"]
 	#Se puede cambiar el filtro usando 'djago_filter'
+	cache_resource = cache.RESOURCE_CALENDAR
 
-	def get_queryset(self):
+	def get_month(self):
 		query_param = self.request.query_params.get("month")
 		
 		if not query_param:
 			query_param = timezone.localtime().month
+
+		return query_param
+
+	def get_cache_key(self):
+		# Sin el parametro 'month' la respuesta cambia con la fecha actual
+		return f"{super().get_cache_key()}#month={self.get_month()}"
+
+	def get_queryset(self):
+		query_param = self.get_month()
  
 		return self.queryset.filter(
 			school_id = self.kwargs.get("pk"),
@@ -165,9 +249,11 @@ class CalendarListAPIView(generics.ListAPIView):
 		).order_by("date")
 
 
-class CalendarDetailAPIView(generics.RetrieveAPIView):
+class CalendarDetailAPIView(ConditionalResponseMixin, CacheResponseMixin, generics.RetrieveAPIView):
 	queryset = models.Calendar.objects.all()
 	serializer_class = serializers.CalendarDetailResponse
+	cache_resource = cache.RESOURCE_CALENDAR
+	cache_detail = True
 
 
 class SocialMediaListAPIView(generics.ListAPIView):
@@ -237,10 +323,11 @@ class GradeDetailAPIView(generics.RetrieveAPIView):
 		return response.Response(data = serializer.data, status = status.HTTP_200_OK)
 
 
-class RepositoryListAPIView(generics.ListAPIView):
+class RepositoryListAPIView(ConditionalResponseMixin, CacheResponseMixin, CursorPaginationMixin, generics.ListAPIView):
 	queryset = models.Repository.objects.all()
 	serializer_class = serializers.RepositoryListResponse
 	pagination_class = paginations.BasicPaginate
+	cache_resource = cache.RESOURCE_REPOSITORY
 
 	def get_queryset(self):
 		return self.queryset.filter(
@@ -248,9 +335,11 @@ class RepositoryListAPIView(generics.ListAPIView):
 		).order_by("-created", "-updated")
 
 
-class RepositoryDetailAPIView(generics.RetrieveAPIView):
+class RepositoryDetailAPIView(ConditionalResponseMixin, CacheResponseMixin, generics.RetrieveAPIView):
 	queryset = models.Repository.objects.all()
 	serializer_class = serializers.RepositoryDetailResponse
+	cache_resource = cache.RESOURCE_REPOSITORY
+	cache_detail = True
 
 	def get_object(self):
 		try:
@@ -279,10 +368,11 @@ class RepositoryDetailAPIView(generics.RetrieveAPIView):
 		return response.Response(data = serializer.data, status = status.HTTP_200_OK)
 
 
-class InfraestructureListAPIView(generics.ListAPIView):
+class InfraestructureListAPIView(ConditionalResponseMixin, CacheResponseMixin, generics.ListAPIView):
 	queryset = models.Infraestructure.objects.all()
 	serializer_class = serializers.InfraestructureListResponse
 	pagination_class = paginations.BasicPaginate
+	cache_resource = cache.RESOURCE_INFRAESTRUCTURE
 
 	def get_queryset(self):
 		return self.queryset.filter(
@@ -290,9 +380,11 @@ class InfraestructureListAPIView(generics.ListAPIView):
 		).order_by("id")
 
 
-class InfraestructureDetailAPIView(generics.RetrieveAPIView):
+class InfraestructureDetailAPIView(ConditionalResponseMixin, CacheResponseMixin, generics.RetrieveAPIView):
 	queryset = models.Infraestructure.objects.all()
 	serializer_class = serializers.InfraestructureDetailResponse
+	cache_resource = cache.RESOURCE_INFRAESTRUCTURE
+	cache_detail = True
 	
 	def get_object(self):
 		try:
@@ -322,10 +414,11 @@ class InfraestructureDetailAPIView(generics.RetrieveAPIView):
 		return response.Response(data = serializer.data, status = status.HTTP_200_OK)
 		  
 
-class DownloadsListAPIView(generics.ListAPIView):
+class DownloadsListAPIView(ConditionalResponseMixin, CacheResponseMixin, generics.ListAPIView):
 	queryset = models.Download.objects.all()
 	serializer_class = serializers.DownloadListResponse
 	pagination_class = paginations.BasicPaginate
+	cache_resource = cache.RESOURCE_DOWNLOAD
 
 	def get_queryset(self):
 		return self.queryset.filter(
@@ -333,9 +426,11 @@ class DownloadsListAPIView(generics.ListAPIView):
 		).order_by("id")
 
 
-class DownloadsDetailAPIView(generics.RetrieveAPIView):
+class DownloadsDetailAPIView(ConditionalResponseMixin, CacheResponseMixin, generics.RetrieveAPIView):
 	queryset = models.Download.objects.all()
 	serializer_class = serializers.DownloadDetailResponse
+	cache_resource = cache.RESOURCE_DOWNLOAD
+	cache_detail = True
 
 	def get_object(self):
 		try:
@@ -364,10 +459,11 @@ class DownloadsDetailAPIView(generics.RetrieveAPIView):
 
 		
 
-class NewsListAPIView(generics.ListAPIView):
+class NewsListAPIView(ConditionalResponseMixin, CacheResponseMixin, CursorPaginationMixin, generics.ListAPIView):
 	queryset = models.News.objects.all()
 	serializer_class = serializers.NewsListResponse
 	pagination_class = paginations.BasicPaginate
+	cache_resource = cache.RESOURCE_NEWS
 
 	def get_queryset(self):
 		return self.queryset.filter(
@@ -375,9 +471,11 @@ class NewsListAPIView(generics.ListAPIView):
 		).order_by("-created", "-updated")
 
 
-class NewsDetailAPIView(generics.RetrieveAPIView):
+class NewsDetailAPIView(ConditionalResponseMixin, CacheResponseMixin, generics.RetrieveAPIView):
 	queryset = models.News.objects.all()
 	serializer_class = serializers.NewsDetailResponse
+	cache_resource = cache.RESOURCE_NEWS
+	cache_detail = True
 
 	def get_object(self):
 		try:
@@ -407,10 +505,11 @@ class NewsDetailAPIView(generics.RetrieveAPIView):
 		return response.Response(data = serializer.data, status = status.HTTP_200_OK)
 		
 
-class CulturalEventsListAPIView(generics.ListAPIView):
+class CulturalEventsListAPIView(ConditionalResponseMixin, CacheResponseMixin, generics.ListAPIView):
 	queryset = models.CulturalEvent.objects.all()
 	serializer_class = serializers.CulturalEventListResponse
 	pagination_class = paginations.BasicPaginate
+	cache_resource = cache.RESOURCE_CULTURAL_EVENT
 
 
 	def get_queryset(self):
@@ -418,9 +517,11 @@ class CulturalEventsListAPIView(generics.ListAPIView):
 			school_id = self.kwargs.get("pk")
 		)
 
-class CulturalEventsDetailAPIView(generics.RetrieveAPIView):
+class CulturalEventsDetailAPIView(ConditionalResponseMixin, CacheResponseMixin, generics.RetrieveAPIView):
 	queryset = models.CulturalEvent.objects.all()
 	serializer_class = serializers.CulturalEventDetailResponse
+	cache_resource = cache.RESOURCE_CULTURAL_EVENT
+	cache_detail = True
 
 
 	def get_object(self):
@@ -507,27 +608,35 @@ class ContactInfoAPIView(generics.ListAPIView):
 		).order_by("id")
 
 
-class ExtraActivityListAPIView(generics.ListAPIView):
+class ExtraActivityListAPIView(ConditionalResponseMixin, CacheResponseMixin, CursorPaginationMixin, generics.ListAPIView):
 	queryset = models.ExtraActivity.objects.all()
 	serializer_class = serializers.ExtraActivityListResponse
 	pagination_class = paginations.BasicPaginate
+	cache_resource = cache.RESOURCE_ACTIVITY
 
 	def get_queryset(self):
 		return self.queryset.prefetch_related(
-			"photos", "schedules"
+			# El mismo orden de 'first()': la primera foto por 'id'
+			Prefetch(
+				"photos",
+				queryset = models.ExtraActivityPhoto.objects.order_by("id")
+			),
+			"schedules__daysweek"
 		).filter(
 			school_id = self.kwargs.get("pk")
 		).order_by("-created", "-updated")
 
 
-class ExtraActivityDetailAPIView(generics.RetrieveAPIView):
+class ExtraActivityDetailAPIView(ConditionalResponseMixin, CacheResponseMixin, generics.RetrieveAPIView):
 	queryset = models.ExtraActivity.objects.all()
 	serializer_class = serializers.ExtraActivityDetailResponse
+	cache_resource = cache.RESOURCE_ACTIVITY
+	cache_detail = True
 
 	def get_object(self):
 		try:
 			return self.queryset.prefetch_related(
-				"schedules", "files", "photos"
+				"schedules__daysweek", "files", "photos"
 			).select_related(
 				"school"
 			).get(pk = self.kwargs.get("pk"))
@@ -7,6 +7,7 @@ class SchoolConfig(AppConfig):
 
     def ready(self):
         import apps.school.services.receivers
+        from . import checks
 
 
    
@@ -0,0 +1,73 @@
+"""
+	Verificaciones de la configuración ('manage.py check --deploy').
+"""
+from django.conf import settings
+from django.core import checks
+
+# Cachés que guardan los datos en la memoria de cada proceso
+LOCAL_CACHE_BACKENDS = (
+	"django.core.cache.backends.locmem.LocMemCache",
+)
+
+LOCAL_CACHE = "La caché '{alias}' ({backend}) es local a cada proceso"
+LOCAL_CACHE_HINT = (
+	"Con varios 'workers', al cambiar la versión de un recurso en un proceso "
+	"el resto sigue respondiendo datos desactualizados. Use una caché "
+	"compartida (Redis/Memcached) con 'CACHE_URL'."
+)
+REPLICAS_DISABLED = "Las réplicas {aliases} no se usan, la caché '{alias}' ({backend}) es local a cada proceso"
+REPLICAS_DISABLED_HINT = (
+	"Después de escribir, el cliente se fija a 'default' en esta caché; "
+	"con una caché local el resto de los 'workers' leerían de una réplica "
+	"atrasada. Use una caché compartida en 'DATABASE_REPLICAS[\"CACHE_ALIAS\"]'."
+)
+
+
+def get_cache_alias() -> str:
+	return getattr(settings, "SCHOOL_CACHE", {}).get("ALIAS", "default")
+
+
+def is_local_cache(alias: str) -> bool:
+	backend = settings.CACHES.get(alias, {}).get("BACKEND")
+	return backend in LOCAL_CACHE_BACKENDS
+
+
+@checks.register(checks.Tags.caches, deploy = True)
+def check_school_cache(app_configs, **kwargs) -> list[checks.CheckMessage]:
+	alias = get_cache_alias()
+
+	if not getattr(settings, "SCHOOL_CACHE", {}).get("ENABLED", True):
+		return []
+
+	if not is_local_cache(alias):
+		return []
+
+	return [
+		checks.Warning(
+			LOCAL_CACHE.format(alias = alias, backend = settings.CACHES[alias]["BACKEND"]),
+			hint = LOCAL_CACHE_HINT,
+			id = "school.W001",
+		)
+	]
+
+
+@checks.register(checks.Tags.database, checks.Tags.caches)
+def check_replica_cache(app_configs, **kwargs) -> list[checks.CheckMessage]:
+	replicas = getattr(settings, "DATABASE_REPLICAS", {})
+	aliases = replicas.get("ALIASES", [])
+	alias = replicas.get("CACHE_ALIAS", "default")
+
+	if not aliases or not is_local_cache(alias):
+		return []
+
+	return [
+		checks.Warning(
+			REPLICAS_DISABLED.format(
+				aliases = ", ".join(aliases),
+				alias = alias,
+				backend = settings.CACHES[alias]["BACKEND"]
+			),
+			hint = REPLICAS_DISABLED_HINT,
+			id = "school.W002",
+		)
+	]
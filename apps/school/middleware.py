@@ -0,0 +1,158 @@
+import hashlib
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from apps.school.services.subdomains import get_school_id, aget_school_id
+from school import routers
+
+SCHOOL_HEADER = "X-School-Subdomain"
+SCHOOL_QUERY_PARAM = "subdomain"
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+PRIMARY_COOKIE = "db_primary"
+PRIMARY_KEY_PREFIX = "db-primary"
+# Vistas públicas (solo lectura) que pueden leer de las réplicas
+REPLICA_NAMESPACES = ("school", )
+
+
+class SchoolSubdomainMiddleware:
+	"""
+		Agrega a la petición la escuela a la que va dirigida:
+		'request.school_subdomain' (del encabezado 'X-School-Subdomain'
+		o del parametro '?subdomain=') y 'request.school_id'.
+
+		Las vistas lo leen con 'get_request_school_id' ('services.subdomains').
+
+		Funciona en modo síncrono (WSGI) y asíncrono (ASGI), bajo ASGI no
+		necesita ejecutarse en un hilo aparte.
+	"""
+	sync_capable = True
+	async_capable = True
+
+	def __init__(self, get_response):
+		self.get_response = get_response
+
+		if iscoroutinefunction(self.get_response):
+			markcoroutinefunction(self)
+
+	def get_subdomain(self, request) -> str | None:
+		return (
+			request.headers.get(SCHOOL_HEADER)
+			or request.GET.get(SCHOOL_QUERY_PARAM)
+		)
+
+	def __call__(self, request):
+		if iscoroutinefunction(self):
+			return self.__acall__(request)
+
+		request.school_subdomain = self.get_subdomain(request)
+		request.school_id = get_school_id(request.school_subdomain)
+
+		return self.get_response(request)
+
+	async def __acall__(self, request):
+		request.school_subdomain = self.get_subdomain(request)
+		request.school_id = await aget_school_id(request.school_subdomain)
+
+		return await self.get_response(request)
+
+
+class SchoolReplicaMiddleware:
+	"""
+		Envía las lecturas de las vistas públicas ('REPLICA_NAMESPACES') a
+		las réplicas de la base de datos ('school.routers').
+
+		Si la petición escribe en la base de datos, el cliente (por su
+		encabezado 'Authorization' o la cookie 'db_primary') lee de
+		'default' durante 'DATABASE_REPLICAS["PIN_SECONDS"]' segundos.
+		El encabezado se guarda en la caché 'DATABASE_REPLICAS["CACHE_ALIAS"]',
+		sin una caché compartida no se usan las réplicas.
+	"""
+	sync_capable = True
+	async_capable = True
+
+	def __init__(self, get_response):
+		self.get_response = get_response
+
+		if iscoroutinefunction(self.get_response):
+			markcoroutinefunction(self)
+
+	def get_pin_seconds(self) -> int:
+		return routers.get_pin_seconds()
+
+	def get_pin_key(self, request) -> str | None:
+		authorization = request.headers.get("Authorization")
+
+		if not authorization:
+			return None
+
+		return f"{PRIMARY_KEY_PREFIX}:{hashlib.sha256(authorization.encode()).hexdigest()}"
+
+	def set_pin_cookie(self, response) -> None:
+		response.set_cookie(
+			PRIMARY_COOKIE, 
+			"1", 
+			max_age = self.get_pin_seconds(), 
+			httponly = True, 
+			samesite = "Lax"
+		)
+
+	def __call__(self, request):
+		if iscoroutinefunction(self):
+			return self.__acall__(request)
+
+		if not routers.replicas_enabled():
+			return self.get_response(request)
+
+		key = self.get_pin_key(request)
+		cache = routers.get_pin_cache()
+
+		routers.start_request(
+			pinned = PRIMARY_COOKIE in request.COOKIES or bool(key and cache.get(key))
+		)
+
+		try:
+			response = self.get_response(request)
+
+			if routers.has_written():
+				self.set_pin_cookie(response)
+
+				if key:
+					cache.set(key, True, self.get_pin_seconds())
+		finally:
+			routers.end_request()
+
+		return response
+
+	async def __acall__(self, request):
+		if not routers.replicas_enabled():
+			return await self.get_response(request)
+
+		key = self.get_pin_key(request)
+		cache = routers.get_pin_cache()
+
+		routers.start_request(
+			pinned = PRIMARY_COOKIE in request.COOKIES or bool(key and await cache.aget(key))
+		)
+
+		try:
+			response = await self.get_response(request)
+
+			if routers.has_written():
+				self.set_pin_cookie(response)
+
+				if key:
+					await cache.aset(key, True, self.get_pin_seconds())
+		finally:
+			routers.end_request()
+
+		return response
+
+	def process_view(self, request, view_func, view_args, view_kwargs):
+		if request.method not in SAFE_METHODS or not routers.replicas_enabled():
+			return None
+
+		if set(request.resolver_match.namespaces) & set(REPLICA_NAMESPACES):
+			routers.enable_replica_reads()
+
+		return None
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.2 on 2026-10-18 20:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('school', '0018_alter_educationalstage_type_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='calendar',
+            index=models.Index(fields=['school', 'date', 'id'], name='calendar_school_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='extraactivity',
+            index=models.Index(fields=['school', 'created', 'id'], name='activity_school_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='news',
+            index=models.Index(fields=['school', 'created', 'id'], name='news_school_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notificationcdce',
+            index=models.Index(fields=['school', 'created', 'id'], name='notif_school_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='paymentreport',
+            index=models.Index(fields=['school', 'created', 'id'], name='payment_school_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='repository',
+            index=models.Index(fields=['school', 'created', 'id'], name='repo_school_created_idx'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.2 on 2026-10-18 21:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('school', '0019_school_cursor_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='culturaleventmedia',
+            name='renditions',
+            field=models.JSONField(blank=True, default=dict, help_text="URL de las versiones de la imagen ('thumbnail', 'medium', 'full')"),
+        ),
+        migrations.AddField(
+            model_name='extraactivityphoto',
+            name='renditions',
+            field=models.JSONField(blank=True, default=dict, help_text="URL de las versiones de la imagen ('thumbnail', 'medium', 'full')"),
+        ),
+        migrations.AddField(
+            model_name='infraestructuremedia',
+            name='renditions',
+            field=models.JSONField(blank=True, default=dict, help_text="URL de las versiones de la imagen ('thumbnail', 'medium', 'full')"),
+        ),
+        migrations.AddField(
+            model_name='newsmedia',
+            name='renditions',
+            field=models.JSONField(blank=True, default=dict, help_text="URL de las versiones de la imagen ('thumbnail', 'medium', 'full')"),
+        ),
+        migrations.AddField(
+            model_name='paymentinfo',
+            name='renditions',
+            field=models.JSONField(blank=True, default=dict, help_text="URL de las versiones de la imagen ('thumbnail', 'medium', 'full')"),
+        ),
+        migrations.AddField(
+            model_name='school',
+            name='logo_renditions',
+            field=models.JSONField(blank=True, default=dict, help_text="URL de las versiones del logo ('thumbnail', 'medium', 'full')"),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.2 on 2026-10-19 01:10
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('school', '0020_media_renditions'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='notificationcdce',
+            name='notif_school_created_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='paymentreport',
+            name='payment_school_created_idx',
+        ),
+    ]
@@ -24,6 +24,11 @@ class SchoolPhoto(models.Model):
 		]
 	)
 	photo = models.URLField()
+	renditions = models.JSONField(
+		default = dict, 
+		blank = True,
+		help_text = "URL de las versiones de la imagen ('thumbnail', 'medium', 'full')"
+	)
 
 	class Meta:
 		abstract = True
@@ -58,6 +63,11 @@ class School(models.Model):
 	)
 	subdomain = models.SlugField(unique = True)
 	logo = models.URLField(blank = True, null = True)
+	logo_renditions = models.JSONField(
+		default = dict, 
+		blank = True,
+		help_text = "URL de las versiones del logo ('thumbnail', 'medium', 'full')"
+	)
 	address = models.CharField(
 		max_length=MAX_LENGTH_SCHOOL_ADDRESS,
 		validators = [
@@ -601,7 +611,8 @@ class Calendar(models.Model):
 		ordering = ["-date"]
 		indexes = [
 			models.Index(fields = ["school"], name = "calendar_school_idx"),
-			models.Index(fields = ["date"], name = "calendar_date_idx")
+			models.Index(fields = ["date"], name = "calendar_date_idx"),
+			models.Index(fields = ["school", "date", "id"], name = "calendar_school_date_idx")
 		]
 
 	def __str__(self):
@@ -711,7 +722,8 @@ class News(models.Model):
 		ordering = ["-created", "-updated"]
 		indexes = [
 			models.Index(fields = ["school"], name = "news_school_idx"),
-			models.Index(fields = ["created"], name = "news_created_idx")
+			models.Index(fields = ["created"], name = "news_created_idx"),
+			models.Index(fields = ["school", "created", "id"], name = "news_school_created_idx")
 		]
 
 
@@ -973,7 +985,8 @@ class Repository(models.Model):
 		indexes = [
 			models.Index(fields = ["name_project"], name = "repository_name_project_idx"),
 			models.Index(fields = ["created"], name = "repository_created_idx"),
-			models.Index(fields = ["school"], name = "repository_school_idx")
+			models.Index(fields = ["school"], name = "repository_school_idx"),
+			models.Index(fields = ["school", "created", "id"], name = "repo_school_created_idx")
 		]
 
 
@@ -1082,7 +1095,8 @@ class ExtraActivity(models.Model):
 		ordering = ["-created", "-updated"]
 		indexes = [
 			models.Index(fields = ["school"], name = "extra_activity_school_idx"),
-			models.Index(fields = ["created"], name = "extra_activity_created_idx")
+			models.Index(fields = ["created"], name = "extra_activity_created_idx"),
+			models.Index(fields = ["school", "created", "id"], name = "activity_school_created_idx")
 		]
 
 	def __str__(self):
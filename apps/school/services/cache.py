@@ -0,0 +1,188 @@
+"""
+	Caché de lectura para los recursos públicos de una escuela.
+
+	Cada recurso (noticias, calendario, repositorios, ...) tiene una
+	'versión' por alcance (la escuela o un registro en particular).
+	Los datos se guardan bajo una llave que incluye esa versión, por lo que
+	al escribir en la base de datos basta con cambiar la versión para que
+	las lecturas siguientes ignoren lo guardado anteriormente.
+
+	La versión es el momento del cambio: lo leído de una réplica atrasada
+	no se guarda mientras el cambio pueda no haber llegado a la réplica
+	('school.routers.may_be_stale').
+"""
+import time, hashlib
+from threading import Lock
+from collections import Counter
+from typing import Any, Callable
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from school import routers
+
+RESOURCE_BOOTSTRAP = "bootstrap"
+RESOURCE_NEWS = "news"
+RESOURCE_CALENDAR = "calendar"
+RESOURCE_REPOSITORY = "repository"
+RESOURCE_INFRAESTRUCTURE = "infraestructure"
+RESOURCE_DOWNLOAD = "download"
+RESOURCE_CULTURAL_EVENT = "cultural-event"
+RESOURCE_ACTIVITY = "activity"
+
+RESOURCES = [
+	RESOURCE_BOOTSTRAP,
+	RESOURCE_NEWS,
+	RESOURCE_CALENDAR,
+	RESOURCE_REPOSITORY,
+	RESOURCE_INFRAESTRUCTURE,
+	RESOURCE_DOWNLOAD,
+	RESOURCE_CULTURAL_EVENT,
+	RESOURCE_ACTIVITY,
+]
+
+# Alcance compartido por todos los detalles que muestran
+# información de la escuela (nombre, subdominio)
+SCOPE_SCHOOLS = "schools"
+
+school_scope = lambda school_id: f"school-{school_id}"
+object_scope = lambda pk: f"object-{pk}"
+
+
+class SchoolCache:
+	KEY_PREFIX = "school-cache"
+
+	def __init__(self, alias: str = None, timeout: int = None) -> None:
+		self._alias = alias
+		self._timeout = timeout
+		self._lock = Lock()
+		self._stats = Counter()
+
+	@property
+	def config(self) -> dict:
+		return getattr(settings, "SCHOOL_CACHE", {})
+
+	@property
+	def cache(self):
+		return caches[self._alias or self.config.get("ALIAS", "default")]
+
+	@property
+	def timeout(self) -> int:
+		return self._timeout or self.config.get("TIMEOUT", 60 * 15)
+
+	@property
+	def enabled(self) -> bool:
+		return self.config.get("ENABLED", True)
+
+	def _version_key(self, resource: str, scope: str) -> str:
+		return f"{self.KEY_PREFIX}:version:{resource}:{scope}"
+
+	def _data_key(self, resource: str, versions: list[int], key: str) -> str:
+		digest = hashlib.md5(key.encode()).hexdigest()
+		version = ".".join(str(v) for v in versions)
+
+		return f"{self.KEY_PREFIX}:data:{resource}:{version}:{digest}"
+
+	def get_versions(self, resource: str, scopes: list[str]) -> list[int]:
+		keys = [self._version_key(resource, scope) for scope in scopes]
+		versions = self.cache.get_many(keys)
+
+		for key in keys:
+			if key in versions:
+				continue
+			# Se usa el tiempo actual como versión inicial para que
+			# una versión desalojada del caché no pueda repetirse
+			self.cache.add(key, time.time_ns(), timeout = None)
+			versions[key] = self.cache.get(key)
+
+		return [versions[key] for key in keys]
+
+	async def aget_versions(self, resource: str, scopes: list[str]) -> list[int]:
+		"""
+			Versión asíncrona de 'get_versions' (usa la API asíncrona del caché).
+		"""
+		keys = [self._version_key(resource, scope) for scope in scopes]
+		versions = await self.cache.aget_many(keys)
+
+		for key in keys:
+			if key in versions:
+				continue
+
+			await self.cache.aadd(key, time.time_ns(), timeout = None)
+			versions[key] = await self.cache.aget(key)
+
+		return [versions[key] for key in keys]
+
+	def get_version(self, resource: str, scope: str) -> int:
+		return self.get_versions(resource, [scope])[0]
+
+	def _set_versions(self, resources: list[str], scope: str) -> None:
+		version = time.time_ns()
+
+		self.cache.set_many(
+			{self._version_key(resource, scope): version for resource in resources},
+			timeout = None
+		)
+
+	def bump(self, resources: str | list[str], scope: str) -> None:
+		if isinstance(resources, str):
+			resources = [resources]
+
+		self._set_versions(resources, scope)
+		# Se vuelve a cambiar la versión al confirmar la transacción, así
+		# una lectura concurrente no deja guardados datos previos a la escritura
+		transaction.on_commit(lambda: self._set_versions(resources, scope))
+
+	def get(self, resource: str, scopes: list[str], key: str) -> Any | None:
+		if not self.enabled:
+			return None
+
+		versions = self.get_versions(resource, scopes)
+		data = self.cache.get(self._data_key(resource, versions, key))
+
+		self._count(resource, hit = data is not None)
+
+		return data
+
+	def set(self, resource: str, scopes: list[str], key: str, data: Any) -> None:
+		if not self.enabled:
+			return
+
+		versions = self.get_versions(resource, scopes)
+
+		if routers.may_be_stale(max(versions)):
+			return
+
+		self.cache.set(
+			self._data_key(resource, versions, key),
+			data,
+			timeout = self.timeout
+		)
+
+	def get_or_set(self, resource: str, scopes: list[str], key: str, default: Callable[[], Any]) -> Any:
+		data = self.get(resource, scopes, key)
+
+		if data is None:
+			data = default()
+			self.set(resource, scopes, key, data)
+
+		return data
+
+	def _count(self, resource: str, hit: bool) -> None:
+		result = "hits" if hit else "misses"
+
+		with self._lock:
+			self._stats[result] += 1
+			self._stats[f"{resource}:{result}"] += 1
+
+	def stats(self) -> dict[str, int]:
+		with self._lock:
+			return {"hits": 0, "misses": 0, **self._stats}
+
+	def reset_stats(self) -> None:
+		with self._lock:
+			self._stats.clear()
+
+
+school_cache = SchoolCache()
@@ -13,4 +13,155 @@ def create_administrator_site(sender, instance=None, created=False, **kwargs):
 @receiver(signals.post_save, sender=School)
 def create_setting_format(sender, instance=None, created=False, **kwargs):
 	if created:
-		SettingFormat.objects.create(school = instance)
\ No newline at end of file
+		SettingFormat.objects.create(school = instance)
+
+
+"""
+	Invalidación del caché de los recursos públicos.
+	Cualquier escritura sobre un modelo de la escuela cambia la versión
+	del recurso afectado, tanto de la escuela como del registro.
+"""
+
+from apps.school import models
+from apps.school.services import cache
+from apps.school.services.cache import school_cache, school_scope, object_scope
+from apps.school.services import subdomains
+
+
+# Modelos con relación directa a la escuela y el recurso al que pertenecen
+SCHOOL_RESOURCES = {
+	models.News: cache.RESOURCE_NEWS,
+	models.Calendar: cache.RESOURCE_CALENDAR,
+	models.Repository: cache.RESOURCE_REPOSITORY,
+	models.Infraestructure: cache.RESOURCE_INFRAESTRUCTURE,
+	models.Download: cache.RESOURCE_DOWNLOAD,
+	models.CulturalEvent: cache.RESOURCE_CULTURAL_EVENT,
+	models.ExtraActivity: cache.RESOURCE_ACTIVITY,
+	models.SocialMedia: cache.RESOURCE_BOOTSTRAP,
+	models.ContactInfo: cache.RESOURCE_BOOTSTRAP,
+	models.Coordinate: cache.RESOURCE_BOOTSTRAP,
+	models.OfficeHour: cache.RESOURCE_BOOTSTRAP,
+	models.SettingFormat: cache.RESOURCE_BOOTSTRAP,
+}
+
+# Relaciones 'ManyToMany' que forman parte de un recurso: (modelo, campo)
+SCHOOL_RESOURCES_RELATED = [
+	(models.News, "media"),
+	(models.Repository, "media"),
+	(models.Infraestructure, "media"),
+	(models.CulturalEvent, "media"),
+	(models.ExtraActivity, "photos"),
+	(models.ExtraActivity, "files"),
+	(models.ExtraActivity, "schedules"),
+	(models.SettingFormat, "colors"),
+]
+
+
+def bump_instances(model, queryset) -> None:
+	resource = SCHOOL_RESOURCES[model]
+
+	for pk, school_id in queryset.values_list("pk", "school_id"):
+		school_cache.bump(resource, school_scope(school_id))
+		school_cache.bump(resource, object_scope(pk))
+
+
+def bump_school(school_id: int) -> None:
+	school_cache.bump(cache.RESOURCES, school_scope(school_id))
+
+
+def bump_resource(sender, instance = None, **kwargs):
+	resource = SCHOOL_RESOURCES[sender]
+
+	school_cache.bump(resource, school_scope(instance.school_id))
+	school_cache.bump(resource, object_scope(instance.pk))
+
+
+def bump_related_owners(model, field: str):
+	"""
+		Cambios en un registro relacionado (una imagen, un archivo, ...)
+		invalidan a los recursos que lo usan.
+	"""
+	def receiver_related(sender, instance = None, **kwargs):
+		bump_instances(model, model.objects.filter(**{field: instance}))
+
+	return receiver_related
+
+
+def bump_related_changed(model, field: str):
+	def receiver_m2m(sender, instance = None, action = None, reverse = False, pk_set = None, **kwargs):
+		if action not in ("post_add", "post_remove", "pre_clear"):
+			return
+
+		if not reverse:
+			bump_resource(model, instance = instance)
+		elif pk_set:
+			bump_instances(model, model.objects.filter(pk__in = pk_set))
+		else:
+			bump_instances(model, model.objects.filter(**{field: instance}))
+
+	return receiver_m2m
+
+
+for model in SCHOOL_RESOURCES:
+	signals.post_save.connect(bump_resource, sender = model)
+	signals.post_delete.connect(bump_resource, sender = model)
+
+
+for model, field in SCHOOL_RESOURCES_RELATED:
+	related_model = model._meta.get_field(field).related_model
+	through = getattr(model, field).through
+	uid = f"school-cache-{model._meta.model_name}-{field}"
+	
+	signals.m2m_changed.connect(
+		bump_related_changed(model, field), 
+		sender = through, 
+		weak = False,
+		dispatch_uid = uid
+	)
+	signals.post_save.connect(
+		bump_related_owners(model, field), 
+		sender = related_model, 
+		weak = False,
+		dispatch_uid = f"{uid}-save"
+	)
+	# Antes de eliminar, mientras aún existe la relación
+	signals.pre_delete.connect(
+		bump_related_owners(model, field), 
+		sender = related_model, 
+		weak = False,
+		dispatch_uid = f"{uid}-delete"
+	)
+
+
+@receiver(signals.m2m_changed, sender=models.ExtraActivitySchedule.daysweek.through)
+@receiver(signals.post_save, sender=models.TimeGroup)
+@receiver(signals.m2m_changed, sender=models.TimeGroup.daysweek.through)
+def bump_schedules(sender, instance = None, **kwargs):
+	if isinstance(instance, models.TimeGroup):
+		bump_instances(
+			models.OfficeHour,
+			models.OfficeHour.objects.filter(time_group = instance)
+		)
+	elif isinstance(instance, models.ExtraActivitySchedule):
+		bump_instances(
+			models.ExtraActivity,
+			models.ExtraActivity.objects.filter(schedules = instance)
+		)
+
+
+@receiver(signals.post_save, sender=School)
+@receiver(signals.post_delete, sender=School)
+def bump_school_cache(sender, instance = None, **kwargs):
+	# Un 'id' puede volver a usarse, se invalida también al crear
+	bump_school(instance.pk)
+	school_cache.bump(cache.RESOURCES, cache.SCOPE_SCHOOLS)
+
+
+@receiver(signals.post_save, sender=School)
+def update_school_subdomain(sender, instance=None, **kwargs):
+	subdomains.update_school(instance)
+
+
+@receiver(signals.post_delete, sender=School)
+def delete_school_subdomain(sender, instance=None, **kwargs):
+	subdomains.delete_school(instance)
@@ -0,0 +1,182 @@
+"""
+	Resolución 'subdominio -> id' de las escuelas.
+
+	Se guarda en memoria del proceso (LRU con tiempo de expiración), por lo
+	que la mayoría de las peticiones no necesitan consultar la base de datos
+	para saber a qué escuela pertenecen. Los cambios sobre 'School' se
+	reflejan al instante en el proceso que los realiza; en el resto, al
+	expirar la entrada.
+
+	Los subdominios que no existen también se guardan, con un tiempo de
+	expiración corto ('MISSING_TTL'), así un subdominio inválido no
+	consulta la base de datos en cada petición.
+"""
+import time
+from threading import Lock
+from collections import OrderedDict
+from typing import Callable
+
+from django.conf import settings
+
+from apps.school import models
+
+# Valor de 'SubdomainCache.get' cuando el subdominio no está en caché
+MISSING = object()
+
+
+class SubdomainCache:
+	def __init__(
+		self,
+		maxsize: int = 1024,
+		ttl: float = 60 * 5,
+		timer: Callable[[], float] = time.monotonic
+	) -> None:
+		self.maxsize = maxsize
+		self.ttl = ttl
+		self.timer = timer
+		self._data: OrderedDict[str, tuple[int | None, float]] = OrderedDict()
+		self._lock = Lock()
+
+	def __len__(self) -> int:
+		return len(self._data)
+
+	def get(self, subdomain: str, default = None) -> int | None:
+		with self._lock:
+			item = self._data.get(subdomain)
+
+			if item is None:
+				return default
+
+			school_id, expires = item
+
+			if expires <= self.timer():
+				del self._data[subdomain]
+				return default
+
+			self._data.move_to_end(subdomain)
+
+			return school_id
+
+	def set(self, subdomain: str, school_id: int | None, ttl: float | None = None) -> None:
+		with self._lock:
+			self._data[subdomain] = (
+				school_id, 
+				self.timer() + (self.ttl if ttl is None else ttl)
+			)
+			self._data.move_to_end(subdomain)
+
+			while len(self._data) > self.maxsize:
+				self._data.popitem(last = False)
+
+	def delete(self, subdomain: str) -> None:
+		with self._lock:
+			self._data.pop(subdomain, None)
+
+	def delete_school(self, school_id: int) -> None:
+		with self._lock:
+			for subdomain, (value, _) in list(self._data.items()):
+				if value == school_id:
+					del self._data[subdomain]
+
+	def clear(self) -> None:
+		with self._lock:
+			self._data.clear()
+
+
+def _create_cache() -> SubdomainCache:
+	config = getattr(settings, "SCHOOL_SUBDOMAIN_CACHE", {})
+
+	return SubdomainCache(
+		maxsize = config.get("MAXSIZE", 1024),
+		ttl = config.get("TTL", 60 * 5)
+	)
+
+
+subdomains = _create_cache()
+
+
+def get_missing_ttl() -> float:
+	config = getattr(settings, "SCHOOL_SUBDOMAIN_CACHE", {})
+
+	return config.get("MISSING_TTL", 10)
+
+
+def get_school_id(subdomain: str | None) -> int | None:
+	"""
+		Devuelve el 'id' de la escuela con este subdominio o 'None' si no existe.
+	"""
+	if not subdomain:
+		return None
+
+	school_id = subdomains.get(subdomain, MISSING)
+
+	if school_id is MISSING:
+		school_id = models.School.objects.filter(
+			subdomain = subdomain
+		).values_list("id", flat = True).first()
+
+		# Una escuela creada desde otro proceso con un subdominio que no
+		# existía se puede usar al expirar 'MISSING_TTL'
+		subdomains.set(
+			subdomain, 
+			school_id, 
+			ttl = None if school_id is not None else get_missing_ttl()
+		)
+
+	return school_id
+
+
+async def aget_school_id(subdomain: str | None) -> int | None:
+	"""
+		Versión asíncrona de 'get_school_id'.
+	"""
+	if not subdomain:
+		return None
+
+	school_id = subdomains.get(subdomain, MISSING)
+
+	if school_id is MISSING:
+		school_id = await models.School.objects.filter(
+			subdomain = subdomain
+		).values_list("id", flat = True).afirst()
+
+		subdomains.set(
+			subdomain, 
+			school_id, 
+			ttl = None if school_id is not None else get_missing_ttl()
+		)
+
+	return school_id
+
+
+def get_request_school_id(request, subdomain: str | None) -> int | None:
+	"""
+		Igual que 'get_school_id', pero usa 'request.school_id' (agregado por
+		'SchoolSubdomainMiddleware') si la petición va dirigida al mismo
+		subdominio.
+	"""
+	if subdomain and getattr(request, "school_subdomain", None) == subdomain:
+		return request.school_id
+
+	return get_school_id(subdomain)
+
+
+async def aget_request_school_id(request, subdomain: str | None) -> int | None:
+	"""
+		Versión asíncrona de 'get_request_school_id'.
+	"""
+	if subdomain and getattr(request, "school_subdomain", None) == subdomain:
+		return request.school_id
+
+	return await aget_school_id(subdomain)
+
+
+def update_school(school: models.School) -> None:
+	# El subdominio pudo cambiar, se elimina el anterior
+	subdomains.delete_school(school.id)
+	subdomains.set(school.subdomain, school.id)
+
+
+def delete_school(school: models.School) -> None:
+	subdomains.delete_school(school.id)
+	subdomains.delete(school.subdomain)
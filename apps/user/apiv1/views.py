@@ -20,11 +20,8 @@ from .permissions import (
 )
 
 from apps.user import models
-from apps.user.commands.commands import (
-    change_password,
-    generate_password,
-    get_user_by_email
-)
+from apps.user.commands.commands import get_user_by_email
+from apps.user.jobs import JOB_RESET_PASSWORD
 
 from apps.utils.result_commands import (
     MessageError,
@@ -32,7 +29,7 @@ from apps.utils.result_commands import (
     ResponseError
 )
 
-from apps.user.services.signals.signals import SignalResetPassword
+from apps.jobs.services import queue
 
 
 class UserAPIView(generics.RetrieveUpdateDestroyAPIView):
@@ -113,8 +110,6 @@ class UserResetPasswordAPIView(views.APIView):
         ]
     )
     def patch(self, request):
-        signal = SignalResetPassword()
-
         query_email = request.query_params.get("email")
         
         if not query_email:
@@ -139,20 +134,8 @@ class UserResetPasswordAPIView(views.APIView):
 
         user = command.query
 
-        command_password = generate_password()
-
-        plain_password = command_password.query
-
-        change_password(
-            pk = user.id,
-            new_password = plain_password
-        )
-
-        signal.send(
-            plain_password = plain_password,
-            name = user.name,
-            email = user.email
-        )
+        # La contraseña se genera en la tarea, así no se guarda en la cola
+        queue.enqueue(JOB_RESET_PASSWORD, user_id = user.id)
         
         return response.Response(
             data=ResponseSuccess(
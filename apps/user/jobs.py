@@ -0,0 +1,36 @@
+from apps.jobs.services.queue import job
+
+from apps.user.commands.commands import (
+	change_password,
+	generate_password,
+	get_user
+)
+from apps.user.services.signals.signals import SignalResetPassword
+
+JOB_RESET_PASSWORD = "user.reset_password"
+
+
+@job(JOB_RESET_PASSWORD)
+def reset_password(user_id: int) -> None:
+	"""
+		Genera la nueva contraseña del usuario y se la envía por correo.
+
+		Solo se encola el 'id' del usuario, la contraseña no se guarda
+		en la cola ('Job.payload').
+	"""
+	command = get_user(pk = user_id)
+
+	# El usuario se eliminó antes de ejecutar la tarea
+	if not command.status:
+		return
+
+	user = command.query
+	plain_password = generate_password().query
+
+	change_password(pk = user.id, new_password = plain_password)
+
+	SignalResetPassword().send(
+		plain_password = plain_password,
+		name = user.name,
+		email = user.email
+	)
@@ -14,7 +14,7 @@ from .utils.class_receivers import ChangeRole
 @receiver(reset_password, sender=SignalResetPassword)
 def reset_password_receiver(sender, **kwargs):
 	if "plain_password" in kwargs and "name" in kwargs and "email" in kwargs:
-
+		# Se ejecuta desde la tarea 'user.reset_password' ('apps.user.jobs')
 		email = EmailResetPassword(
 			data_message = {
 				"name_user": kwargs.get("name"),
@@ -22,7 +22,7 @@ def reset_password_receiver(sender, **kwargs):
 			},
 			emails_to = [kwargs.get("email")]
 		)
-		
+
 		email.send()
 
 
@@ -0,0 +1,52 @@
+"""
+Configuración de las conexiones a la base de datos.
+
+Con PostgreSQL se usa el pool de conexiones de psycopg 3 ('psycopg_pool'),
+cada proceso mantiene entre 'MIN_SIZE' y 'MAX_SIZE' conexiones abiertas y
+las peticiones las toman prestadas, sin pagar el costo de conectarse (TCP,
+TLS y autenticación) en cada petición.
+
+Con otros motores (SQLite en desarrollo y pruebas) se usan las conexiones
+persistentes de Django ('CONN_MAX_AGE').
+"""
+POSTGRESQL_ENGINES = (
+    "django.db.backends.postgresql",
+    "django.contrib.gis.db.backends.postgis",
+)
+
+
+def get_pool_options(config: dict) -> dict:
+    """
+    Parámetros de 'psycopg_pool.ConnectionPool' a partir de 'DATABASE_POOL'.
+    """
+    return {
+        "min_size": config.get("MIN_SIZE", 2),
+        "max_size": config.get("MAX_SIZE", 20),
+        # Segundos que una petición espera por una conexión libre
+        "timeout": config.get("TIMEOUT", 10),
+        # Peticiones en espera antes de rechazar las nuevas ('0' sin límite)
+        "max_waiting": config.get("MAX_WAITING", 0),
+        "max_idle": config.get("MAX_IDLE", 60 * 10),
+        "max_lifetime": config.get("MAX_LIFETIME", 60 * 60),
+    }
+
+
+def configure_database(database: dict, config: dict) -> dict:
+    """
+    Agrega el pool (PostgreSQL) o las conexiones persistentes a la
+    configuración de una base de datos ('env.db()').
+    """
+    database = {**database, "OPTIONS": {**database.get("OPTIONS", {})}}
+
+    # Con el pool, la conexión se valida al tomarla ('check_connection'),
+    # sin él, al inicio de cada petición que reutiliza la conexión
+    database["CONN_HEALTH_CHECKS"] = config.get("HEALTH_CHECKS", True)
+
+    if database.get("ENGINE") in POSTGRESQL_ENGINES and config.get("ENABLED", True):
+        # El pool no admite conexiones persistentes
+        database["CONN_MAX_AGE"] = 0
+        database["OPTIONS"]["pool"] = get_pool_options(config)
+    else:
+        database["CONN_MAX_AGE"] = config.get("CONN_MAX_AGE", 0)
+
+    return database
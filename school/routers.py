@@ -0,0 +1,214 @@
+"""
+Réplicas de lectura de la base de datos.
+
+Solo las lecturas de las peticiones públicas (vistas de 'apps.school.apiv1'
+y queries anónimas de '/graphql') van a las réplicas, el resto de las
+consultas (escrituras, administración, tareas, comandos) van a 'default'.
+
+- 'SchoolReplicaMiddleware' (apps/school/middleware.py) activa las
+  réplicas en las peticiones de solo lectura ('replica_reads').
+- Después de escribir, el cliente queda fijado a 'default' por
+  'PIN_SECONDS' segundos (las réplicas se actualizan con retraso), así
+  lee lo que acaba de escribir.
+- Si no se puede conectar a una réplica, se deja de usar por
+  'RETRY_SECONDS' segundos y se lee de otra réplica o de 'default'.
+- El cliente se fija en la caché 'CACHE_ALIAS', que debe ser compartida
+  por todos los procesos: con una caché local ('locmem') otro 'worker'
+  no sabría que el cliente escribió, por lo que las réplicas no se usan.
+- Lo leído de una réplica no se guarda en las cachés compartidas si el
+  recurso cambió hace menos de 'PIN_SECONDS' segundos ('may_be_stale'),
+  la réplica puede no tener ese cambio todavía.
+"""
+import time, random, threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections, DEFAULT_DB_ALIAS, DatabaseError
+
+from apps.school.checks import is_local_cache
+
+DEFAULT_PIN_SECONDS = 5
+DEFAULT_RETRY_SECONDS = 30
+DEFAULT_CACHE_ALIAS = "default"
+
+# Estado de la petición actual (hilo o tarea de 'asyncio')
+_replica_reads: ContextVar[bool] = ContextVar("replica_reads", default = False)
+_primary_pinned: ContextVar[bool] = ContextVar("primary_pinned", default = False)
+_written: ContextVar[bool] = ContextVar("database_written", default = False)
+# Réplicas leídas en la petición, un 'set' (mutable) para que lo
+# actualicen también las tareas de 'asyncio' de la misma petición
+_replicas_read: ContextVar[set[str] | None] = ContextVar("replicas_read", default = None)
+
+# Réplicas que fallaron: alias -> momento desde el que se vuelve a intentar
+_unhealthy: dict[str, float] = {}
+_unhealthy_lock = threading.Lock()
+
+
+def get_config() -> dict:
+    return getattr(settings, "DATABASE_REPLICAS", {})
+
+
+def get_replicas() -> list[str]:
+    return get_config().get("ALIASES", [])
+
+
+def get_pin_seconds() -> int:
+    return get_config().get("PIN_SECONDS", DEFAULT_PIN_SECONDS)
+
+
+def get_cache_alias() -> str:
+    return get_config().get("CACHE_ALIAS", DEFAULT_CACHE_ALIAS)
+
+
+def get_pin_cache():
+    return caches[get_cache_alias()]
+
+
+def replicas_enabled() -> bool:
+    """
+    Hay réplicas y la caché que fija a los clientes es compartida.
+    """
+    return bool(get_replicas()) and not is_local_cache(get_cache_alias())
+
+
+@contextmanager
+def replica_reads():
+    """
+    Las lecturas dentro del bloque pueden ir a las réplicas.
+    """
+    previous = _replica_reads.get()
+    _replica_reads.set(True)
+
+    try:
+        yield
+    finally:
+        _replica_reads.set(previous)
+
+
+def start_request(pinned: bool = False) -> None:
+    _replica_reads.set(False)
+    _primary_pinned.set(pinned)
+    _written.set(False)
+    _replicas_read.set(set())
+
+
+def end_request() -> None:
+    start_request()
+
+
+def enable_replica_reads() -> None:
+    _replica_reads.set(True)
+
+
+def has_written() -> bool:
+    return _written.get()
+
+
+def uses_replicas() -> bool:
+    return _replica_reads.get() and not _primary_pinned.get()
+
+
+def has_read_replica() -> bool:
+    return bool(_replicas_read.get())
+
+
+def may_be_stale(changed_at: int) -> bool:
+    """
+    La petición leyó de una réplica y el cambio hecho en 'changed_at'
+    (nanosegundos, la versión de 'apps.school.services.cache') puede no
+    haber llegado a la réplica.
+    """
+    if not has_read_replica():
+        return False
+
+    return time.time_ns() - changed_at < get_pin_seconds() * 10**9
+
+
+def mark_unhealthy(alias: str) -> None:
+    retry = get_config().get("RETRY_SECONDS", DEFAULT_RETRY_SECONDS)
+
+    with _unhealthy_lock:
+        _unhealthy[alias] = time.monotonic() + retry
+
+
+def is_healthy(alias: str) -> bool:
+    with _unhealthy_lock:
+        retry_at = _unhealthy.get(alias)
+
+        if retry_at is not None and retry_at <= time.monotonic():
+            del _unhealthy[alias]
+            retry_at = None
+
+    return retry_at is None
+
+
+def reset_health() -> None:
+    with _unhealthy_lock:
+        _unhealthy.clear()
+
+
+def connect(alias: str) -> bool:
+    try:
+        # Sin costo si la petición ya tiene la conexión abierta
+        connections[alias].ensure_connection()
+    except DatabaseError:
+        mark_unhealthy(alias)
+        return False
+
+    return True
+
+
+def get_replica() -> str | None:
+    """
+    Una réplica disponible al azar, 'None' si ninguna responde.
+    """
+    replicas = [alias for alias in get_replicas() if is_healthy(alias)]
+    random.shuffle(replicas)
+
+    for alias in replicas:
+        if connect(alias):
+            return alias
+
+    return None
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints) -> str:
+        if not uses_replicas():
+            return DEFAULT_DB_ALIAS
+
+        alias = get_replica()
+
+        if alias is None:
+            return DEFAULT_DB_ALIAS
+
+        replicas_read = _replicas_read.get()
+
+        if replicas_read is not None:
+            replicas_read.add(alias)
+
+        return alias
+
+    def db_for_write(self, model, **hints) -> str:
+        # El resto de la petición lee de 'default'
+        _written.set(True)
+        _primary_pinned.set(True)
+
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints) -> bool | None:
+        databases = {DEFAULT_DB_ALIAS, *get_replicas()}
+
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+
+        return None
+
+    def allow_migrate(self, db, app_label, model_name = None, **hints) -> bool | None:
+        # Las réplicas reciben los cambios por la replicación
+        if db in get_replicas():
+            return False
+
+        return None
@@ -14,6 +14,8 @@ from datetime import timedelta
 
 import environ
 
+from school.database import configure_database
+
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 environ.Env.read_env(os.path.join(BASE_DIR, '.env'))
@@ -47,7 +49,9 @@ LOCAL_APPS = [
     "apps.school",
     "apps.emails",
     "apps.graphql",
-    "apps.management"
+    "apps.management",
+    "apps.jobs",
+    "apps.monitoring"
 ]
 
 
@@ -63,6 +67,8 @@ THIRDY_PARTY_APPS = [
 INSTALLED_APPS = DJANGO_APPS + LOCAL_APPS + THIRDY_PARTY_APPS
 
 MIDDLEWARE = [
+    # Solo con REQUEST_METRICS_ENABLED=True
+    'apps.monitoring.middleware.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -70,6 +76,8 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'apps.school.middleware.SchoolSubdomainMiddleware',
+    'apps.school.middleware.SchoolReplicaMiddleware',
 ]
 
 
@@ -96,8 +104,105 @@ WSGI_APPLICATION = 'school.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# Pool de conexiones de psycopg 3, solo con PostgreSQL (school/database.py)
+DATABASE_POOL = {
+    "ENABLED": env.bool("DB_POOL_ENABLED", default = True),
+    "MIN_SIZE": env.int("DB_POOL_MIN_SIZE", default = 2),
+    "MAX_SIZE": env.int("DB_POOL_MAX_SIZE", default = 20),
+    # Segundos de espera por una conexión libre antes de fallar
+    "TIMEOUT": env.float("DB_POOL_TIMEOUT", default = 10),
+    "MAX_WAITING": env.int("DB_POOL_MAX_WAITING", default = 0),
+    "MAX_IDLE": env.float("DB_POOL_MAX_IDLE", default = 60 * 10),
+    "MAX_LIFETIME": env.float("DB_POOL_MAX_LIFETIME", default = 60 * 60),
+    # Valida las conexiones antes de entregarlas
+    "HEALTH_CHECKS": env.bool("DB_HEALTH_CHECKS", default = True),
+    # Sin el pool (SQLite, DB_POOL_ENABLED=False): conexiones persistentes
+    "CONN_MAX_AGE": env.int("CONN_MAX_AGE", default = 0),
+}
+
 DATABASES = {
-    'default': env.db()
+    'default': configure_database(env.db(), DATABASE_POOL)
+}
+
+# Réplicas de lectura para las peticiones públicas (school/routers.py)
+# Ej. DATABASE_REPLICA_URLS=postgres://...@replica-1/school,postgres://...@replica-2/school
+# En desarrollo puede apuntar a la misma base de datos que 'DATABASE_URL'
+for index, url in enumerate(env.list("DATABASE_REPLICA_URLS", default = []), start = 1):
+    DATABASES[f"replica_{index}"] = {
+        **configure_database(env.db_url_config(url), DATABASE_POOL),
+        # En las pruebas las réplicas usan la base de datos de 'default'
+        "TEST": {"MIRROR": "default"},
+    }
+
+DATABASE_REPLICAS = {
+    "ALIASES": [alias for alias in DATABASES if alias.startswith("replica_")],
+    # Segundos que un cliente lee de 'default' después de escribir
+    "PIN_SECONDS": env.int("DB_REPLICA_PIN_SECONDS", default = 5),
+    # Segundos sin usar una réplica que no respondió
+    "RETRY_SECONDS": env.int("DB_REPLICA_RETRY_SECONDS", default = 30),
+    # Caché en la que se fija al cliente después de escribir, debe ser
+    # compartida por los procesos o las réplicas no se usan (school.W002)
+    "CACHE_ALIAS": env.str("DB_REPLICA_CACHE_ALIAS", default = "default"),
+}
+
+DATABASE_ROUTERS = ["school.routers.ReplicaRouter"]
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/ref/settings/#caches
+
+# En producción debe ser una caché compartida por todos los procesos
+# (CACHE_URL=redis://... o pymemcache://...), con 'locmemcache://' cada
+# 'worker' tiene su propia copia y las invalidaciones de un proceso no
+# llegan al resto ('manage.py check --deploy' lo advierte: school.W001)
+CACHES = {
+    'default': env.cache("CACHE_URL", default = "locmemcache://")
+}
+
+# Caché de los recursos públicos de una escuela (apps.school.services.cache)
+SCHOOL_CACHE = {
+    "ALIAS": "default",
+    "TIMEOUT": env.int("SCHOOL_CACHE_TIMEOUT", default = 60 * 15),
+    "ENABLED": env.bool("SCHOOL_CACHE_ENABLED", default = True),
+}
+
+# Caché en memoria 'subdominio -> id' (apps.school.services.subdomains)
+SCHOOL_SUBDOMAIN_CACHE = {
+    "MAXSIZE": env.int("SCHOOL_SUBDOMAIN_CACHE_MAXSIZE", default = 1024),
+    "TTL": env.int("SCHOOL_SUBDOMAIN_CACHE_TTL", default = 60 * 5),
+    # Subdominios que no existen
+    "MISSING_TTL": env.int("SCHOOL_SUBDOMAIN_CACHE_MISSING_TTL", default = 10),
+}
+
+# Importación de archivos CSV / XLSX (apps.management.services.imports)
+SCHOOL_IMPORT = {
+    "BATCH_SIZE": env.int("SCHOOL_IMPORT_BATCH_SIZE", default = 1000),
+    # Cantidad máxima de errores que se informan por archivo
+    "MAX_ERRORS": env.int("SCHOOL_IMPORT_MAX_ERRORS", default = 100),
+}
+
+# Exportación de archivos CSV / NDJSON (apps.management.services.exports)
+SCHOOL_EXPORT = {
+    # Filas que se leen de la base de datos por cada consulta del cursor
+    "CHUNK_SIZE": env.int("SCHOOL_EXPORT_CHUNK_SIZE", default = 2000),
+}
+
+
+# Endpoints '/health' y '/metrics' (apps.monitoring)
+MONITORING = {
+    # Se exige 'Authorization: Bearer <token>', sin el token '/health' y
+    # '/metrics' solo responden con DEBUG
+    "TOKEN": env.str("MONITORING_TOKEN", default = ""),
+}
+
+# Métricas por petición: consultas, tiempo en la base de datos y en los
+# serializers, tamaño de la respuesta (apps.monitoring.middleware)
+REQUEST_METRICS = {
+    "ENABLED": env.bool("REQUEST_METRICS_ENABLED", default = False),
+    # Agrega el encabezado 'Server-Timing' a las respuestas
+    "SERVER_TIMING": env.bool("REQUEST_METRICS_SERVER_TIMING", default = False),
+    # Endpoints distintos, el resto se agrupa en 'other'
+    "MAX_ENDPOINTS": env.int("REQUEST_METRICS_MAX_ENDPOINTS", default = 500),
 }
 
 
@@ -141,6 +246,14 @@ STATICFILES_DIRS = (
 )
 STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
 
+# Archivos subidos por los administradores ('LocalStorage'), con DEBUG
+# los sirve 'school/urls.py', en producción el servidor web o un CDN
+MEDIA_URL = env.str("MEDIA_URL", default = "http://localhost:8000/media/")
+MEDIA_ROOT = env.str("MEDIA_ROOT", default = os.path.join(BASE_DIR, "media"))
+
+# Las pruebas guardan los archivos en un 'MEDIA_ROOT' temporal
+TEST_RUNNER = "tests.runner.SchoolTestRunner"
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -166,6 +279,11 @@ SIMPLE_JWT = {
     "REFRESH_TOKEN_LIFETIME":timedelta(hours=3),
 }
 
+# Los permisos de administración confían en las escuelas del token
+# mientras su versión de pertenencia sea la actual
+# (apps.management.services.membership)
+ADMIN_TOKEN_CLAIMS = env.bool("ADMIN_TOKEN_CLAIMS", default = True)
+
 
 
 ## API Documentation
@@ -190,6 +308,48 @@ if not DEBUG:
         }
     } 
 
+# Almacenamiento de imágenes y archivos (apps.management.services.storage)
+# Ej. S3: SCHOOL_STORAGE_BACKEND=apps.management.services.storage.S3Storage
+#         SCHOOL_STORAGE_OPTIONS="bucket=school,endpoint_url=http://localhost:9000"
+SCHOOL_STORAGE = {
+    "BACKEND": env.str(
+        "SCHOOL_STORAGE_BACKEND", 
+        default = "apps.management.services.storage.LocalStorage"
+    ),
+    "OPTIONS": env.dict("SCHOOL_STORAGE_OPTIONS", default = {}),
+    # Hilos para subir en paralelo los archivos de una petición
+    "MAX_WORKERS": env.int("SCHOOL_STORAGE_MAX_WORKERS", default = 4),
+}
+
+# Cola de tareas en segundo plano (apps.jobs), se ejecutan con:
+# python manage.py run_jobs
+SCHOOL_JOBS = {
+    # Ejecuta las tareas al encolarlas, sin 'worker' (pruebas y desarrollo)
+    "ALWAYS_EAGER": env.bool("JOBS_ALWAYS_EAGER", default = DEBUG),
+    "MAX_ATTEMPTS": env.int("JOBS_MAX_ATTEMPTS", default = 5),
+    # Espera (segundos) antes de reintentar: BACKOFF * 2 ^ (intento - 1)
+    "BACKOFF": env.int("JOBS_BACKOFF", default = 30),
+    "MAX_BACKOFF": 60 * 60,
+    "BATCH_SIZE": env.int("JOBS_BATCH_SIZE", default = 10),
+    "POLL_INTERVAL": env.float("JOBS_POLL_INTERVAL", default = 2),
+    # Las tareas 'ejecutando' por más tiempo se vuelven a tomar
+    "TIMEOUT": 60 * 10,
+    "DELETE_COMPLETED": True,
+}
+
+# Versiones de las imágenes subidas (apps.management.services.images)
+SCHOOL_IMAGES = {
+    # WEBP o JPEG
+    "FORMAT": env.str("SCHOOL_IMAGES_FORMAT", default = "WEBP"),
+    "QUALITY": env.int("SCHOOL_IMAGES_QUALITY", default = 80),
+    # Nombre de la versión: lado mayor en píxeles
+    "RENDITIONS": {
+        "thumbnail": 320,
+        "medium": 960,
+        "full": 1920,
+    },
+}
+
 
 
 # Email Settings
@@ -205,6 +365,19 @@ EMAIL_HOST_USER = email.get("user")
 EMAIL_HOST_PASSWORD = email.get("password")
 EMAIL_PORT = email.get("port")
 
+# Conexión SMTP reutilizada entre envíos (apps.emails.services.dispatcher)
+EMAIL_DISPATCHER = {
+    # Correos por cada 'send_messages' en la misma conexión
+    "BATCH_SIZE": env.int("EMAIL_BATCH_SIZE", default = 50),
+    # Segundos sin uso antes de cerrar la conexión
+    "MAX_IDLE": env.int("EMAIL_MAX_IDLE", default = 60),
+    # Correos por segundo de cada proveedor ('EMAIL_HOST'), '0' sin límite
+    "RATE_LIMITS": {
+        "smtp.gmail.com": 5,
+    },
+    "DEFAULT_RATE": env.float("EMAIL_DEFAULT_RATE", default = 0),
+}
+
 
 # STRAWBERRY Settings
 STRAWBERRY_DJANGO = {
@@ -212,6 +385,34 @@ STRAWBERRY_DJANGO = {
     "TYPE_DESCRIPTION_FROM_MODEL_DOCSTRING": True,
 }
 
+# Límites de las queries de '/graphql' (apps.graphql.extensions)
+GRAPHQL_QUERY_COST = {
+    "MAX_COST": env.int("GRAPHQL_MAX_COST", default = 2000),
+    "MAX_DEPTH": env.int("GRAPHQL_MAX_DEPTH", default = 10),
+    "DEFAULT_LIST_SIZE": 10,
+    "DEFAULT_CONNECTION_SIZE": 100,
+    "FIELD_WEIGHTS": {},
+}
+
+# Queries persistidas de '/graphql' (apps.graphql.persisted)
+GRAPHQL_PERSISTED_QUERIES = {
+    "ENABLED": env.bool("GRAPHQL_PERSISTED_QUERIES_ENABLED", default = True),
+    "MAXSIZE": env.int("GRAPHQL_PERSISTED_QUERIES_MAXSIZE", default = 1000),
+    # JSON '{sha256: query}' con las queries que se cargan al iniciar
+    "ALLOWLIST": env.str("GRAPHQL_PERSISTED_QUERIES_ALLOWLIST", default = None),
+}
+
+# Caché en memoria 'token -> usuario' de '/graphql' (apps.graphql.tokens)
+GRAPHQL_TOKEN_CACHE = {
+    "MAXSIZE": env.int("GRAPHQL_TOKEN_CACHE_MAXSIZE", default = 1024),
+    "TTL": env.int("GRAPHQL_TOKEN_CACHE_TTL", default = 60),
+}
+
+# Caché de las queries públicas de '/graphql' (apps.graphql.cache)
+GRAPHQL_RESPONSE_CACHE = {
+    "ENABLED": env.bool("GRAPHQL_RESPONSE_CACHE_ENABLED", default = True),
+}
+
 
 STRAWBERRY_DJANGO_AUTH_TOKEN = {
     "ALGORITHM": "HS256",
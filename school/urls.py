@@ -14,9 +14,15 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+import re
+from urllib.parse import urlsplit
+
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path
 from django.urls import include
+from django.urls import re_path
+from django.views.static import serve
 
 from drf_spectacular.views import SpectacularAPIView
 from drf_spectacular.views import SpectacularRedocView
@@ -32,6 +38,8 @@ urlpatterns = [
     path('graphql', include("apps.graphql.urls")),
     path('email/', include("apps.emails.urls")),
 
+    path('', include("apps.monitoring.urls")),
+
     path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
     # Optional UI:
     path('swagger/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
@@ -39,3 +47,13 @@ urlpatterns = [
 
 
 ]
+
+# Archivos de 'LocalStorage' en desarrollo ('MEDIA_URL' puede incluir el dominio)
+if settings.DEBUG:
+    urlpatterns += [
+        re_path(
+            r'^%s(?P<path>.*)$' % re.escape(urlsplit(settings.MEDIA_URL).path.lstrip('/')),
+            serve,
+            {'document_root': settings.MEDIA_ROOT}
+        ),
+    ]
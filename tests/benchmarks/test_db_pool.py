@@ -0,0 +1,141 @@
+"""
+	Prueba de carga: latencia de 200 clientes concurrentes con y sin el
+	pool de conexiones de psycopg ('school/database.py').
+
+	"Sin pool" abre y cierra una conexión por petición (como Django con
+	'CONN_MAX_AGE = 0'), "Con pool" toma prestada una conexión del pool con
+	la configuración de 'DATABASE_POOL'. Cada petición ejecuta 'QUERIES'
+	consultas.
+
+	Solo se ejecuta con PostgreSQL:
+
+	DATABASE_URL=postgres://<user>:<password>@localhost:5432/school \
+	python manage.py test tests.benchmarks.test_db_pool --tag benchmark -v 2
+"""
+import time, statistics, threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connection
+from django.test import TransactionTestCase, tag
+
+import psycopg
+from psycopg_pool import ConnectionPool
+
+from school.database import get_pool_options
+
+CLIENTS = 200
+REQUESTS = 10
+QUERIES = 3
+
+
+@tag("benchmark")
+class DatabasePoolBenchmark(TransactionTestCase):
+	def setUp(self):
+		if connection.vendor != "postgresql":
+			self.skipTest("La prueba de carga necesita PostgreSQL")
+
+		self.params = {
+			key: value
+			for key, value in connection.get_connection_params().items()
+			if key not in ("pool", "cursor_factory", "context")
+		}
+
+	def query(self, conn) -> None:
+		with conn.cursor() as cursor:
+			for _ in range(QUERIES):
+				cursor.execute("SELECT 1")
+				cursor.fetchone()
+
+	def request_without_pool(self) -> None:
+		with psycopg.connect(autocommit = True, **self.params) as conn:
+			self.query(conn)
+
+	def request_with_pool(self, pool: ConnectionPool) -> None:
+		with pool.connection() as conn:
+			self.query(conn)
+
+	def load(self, request) -> dict:
+		latencies = []
+		errors = 0
+		lock = threading.Lock()
+		start_event = threading.Event()
+
+		def client():
+			nonlocal errors
+			start_event.wait()
+
+			for _ in range(REQUESTS):
+				start = time.perf_counter()
+
+				try:
+					request()
+				except psycopg.Error:
+					with lock:
+						errors += 1
+					continue
+
+				with lock:
+					latencies.append((time.perf_counter() - start) * 1000)
+
+		with ThreadPoolExecutor(max_workers = CLIENTS) as executor:
+			futures = [executor.submit(client) for _ in range(CLIENTS)]
+
+			start = time.perf_counter()
+			start_event.set()
+
+			for future in futures:
+				future.result()
+
+			elapsed = time.perf_counter() - start
+
+		latencies.sort()
+
+		return {
+			"rps": len(latencies) / elapsed,
+			"p50": statistics.median(latencies) if latencies else 0,
+			"p95": latencies[int(len(latencies) * 0.95) - 1] if latencies else 0,
+			"p99": latencies[int(len(latencies) * 0.99) - 1] if latencies else 0,
+			"errors": errors,
+		}
+
+	def report(self, name: str, result: dict) -> None:
+		print(
+			f"\n{name} ({CLIENTS} clientes): "
+			f"{result['rps']:.0f} peticiones/s, "
+			f"p50 {result['p50']:.1f} ms, p95 {result['p95']:.1f} ms, "
+			f"p99 {result['p99']:.1f} ms, errores {result['errors']}"
+		)
+
+	def test_concurrent_clients(self):
+		"""
+			Prueba de carga con y sin el pool de conexiones
+		"""
+		before = self.load(self.request_without_pool)
+
+		pool = ConnectionPool(
+			kwargs = {"autocommit": True, **self.params},
+			open = False,
+			check = ConnectionPool.check_connection,
+			**get_pool_options(settings.DATABASE_POOL)
+		)
+		pool.open(wait = True)
+
+		try:
+			after = self.load(lambda: self.request_with_pool(pool))
+			stats = pool.get_stats()
+		finally:
+			pool.close()
+
+		self.report("Sin pool", before)
+		self.report("Con pool", after)
+		print(
+			f"Pool: {stats.get('connections_num', 0)} conexiones creadas, "
+			f"{stats.get('requests_queued', 0)} peticiones en espera, "
+			f"{stats.get('requests_wait_ms', 0) / 1000:.2f} s de espera total"
+		)
+
+		# La latencia solo se informa, se valida que el pool no supere
+		# su límite de conexiones y que ninguna petición falle
+		self.assertEqual(after["errors"], 0)
+		self.assertLessEqual(stats.get("connections_num", 0), pool.max_size)
@@ -0,0 +1,75 @@
+"""
+	Benchmark: renderizado de 10.000 correos de restablecimiento de contraseña.
+
+	"Antes" reproduce 'EmailResetPassword' y 'ContentHTMLMessage.set_message'
+	(el template se buscaba tres veces por correo con 'get_template' y
+	'render_to_string' y solo se generaba el HTML), "Después" usa
+	'apps.emails.services.render' (HTML y texto plano).
+
+	python manage.py test tests.benchmarks.test_email_render --tag benchmark -v 2
+"""
+import time
+
+from django.test import SimpleTestCase, tag
+from django.template.loader import render_to_string, get_template
+from django.utils.html import escape
+
+from apps.emails.services import render
+
+from tests import faker
+
+EMAILS = 10_000
+TEMPLATE_NAME = "reset_user_password.html"
+
+
+def legacy_render(context: dict) -> str:
+	# Validación de 'EmailResetPassword'
+	get_template(f"emails/{TEMPLATE_NAME}")
+	# Validación de 'ContentHTMLMessage.set_message'
+	get_template(f"emails/{TEMPLATE_NAME}")
+
+	return render_to_string(f"emails/{TEMPLATE_NAME}", context = context)
+
+
+@tag("benchmark")
+class EmailRenderBenchmark(SimpleTestCase):
+	def setUp(self):
+		render.get_email_template.cache_clear()
+
+		self.contexts = [
+			{"name": faker.name(), "password": faker.password()}
+			for _ in range(EMAILS)
+		]
+
+	def measure(self, task) -> tuple[float, list]:
+		start = time.perf_counter()
+		result = task()
+
+		return time.perf_counter() - start, result
+
+	def test_render_reset_password(self):
+		"""
+			Benchmark de renderizado de los correos de restablecimiento de contraseña
+		"""
+		before, before_result = self.measure(
+			lambda: [legacy_render(context) for context in self.contexts]
+		)
+		after_one, _ = self.measure(
+			lambda: [render.render_email(TEMPLATE_NAME, context) for context in self.contexts]
+		)
+		after, after_result = self.measure(
+			lambda: render.render_many(TEMPLATE_NAME, self.contexts)
+		)
+
+		print(
+			f"\n{EMAILS} correos: "
+			f"antes {before:.2f} s (solo HTML), "
+			f"después {after_one:.2f} s uno a uno y {after:.2f} s por lote (HTML y texto plano)"
+		)
+
+		# El tiempo solo se informa, se valida que el resultado sea el mismo
+		self.assertEqual(len(after_result), EMAILS)
+		for context, rendered, legacy in zip(self.contexts, after_result, before_result):
+			self.assertEqual(rendered.html, legacy)
+			self.assertIn(context["password"], rendered.text)
+			self.assertIn(escape(context["password"]), rendered.html)
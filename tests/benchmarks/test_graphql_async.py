@@ -0,0 +1,163 @@
+"""
+	Benchmark: peticiones concurrentes a '/graphql' ('school' y 'administrator').
+
+	"Antes" reproduce los resolvers síncronos (cada uno se ejecuta en un
+	hilo con 'sync_to_async' y la autenticación consulta al usuario en cada
+	petición), "Después" usa el esquema actual con resolvers asíncronos.
+
+	Con SQLite el ORM asíncrono también usa un hilo, la diferencia es
+	mayor con PostgreSQL bajo ASGI ('school/asgi.py').
+
+	python manage.py test tests.benchmarks.test_graphql_async --tag benchmark -v 2
+"""
+import json, time, asyncio
+
+from django.db import connection
+from django.db.models import Prefetch
+from django.test import TestCase, AsyncRequestFactory, tag
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+
+from asgiref.sync import async_to_sync
+
+import strawberry, strawberry_django
+from strawberry_django.optimizer import DjangoOptimizerExtension
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.school import models as school_models
+from apps.management import models
+from apps.graphql.schema import schema
+from apps.graphql.views import GraphQLView
+from apps.graphql.tokens import tokens
+from apps.graphql.utils import decode_token, get_http_authorization, get_user_by_payload
+from apps.graphql.school.types import School
+from apps.graphql.management.types import Response, AdminResponse
+from apps.school.services.subdomains import get_school_id
+
+from tests.school.utils import create_school
+from tests.user.utils import create_user
+
+CONCURRENCY = 25
+ROUNDS = 4
+
+QUERY = """
+query MyQuery($subdomain: String!, $pk: ID!) {
+	school(subdomain: $subdomain) {
+		id
+		name
+	}
+	administrator(pk: $pk) {
+		... on Administrator {
+			id
+		}
+		... on AdminResponse {
+			__typename
+		}
+	}
+}
+"""
+
+
+@strawberry.type
+class LegacyQuery:
+
+	@strawberry_django.field
+	def school(self, subdomain: str) -> School | None:
+		return school_models.School.objects.filter(pk = get_school_id(subdomain)).first()
+
+	@strawberry_django.field
+	def administrator(self, pk: strawberry.ID, info: strawberry.Info) -> Response:
+		user = get_user_by_payload(
+			decode_token(get_http_authorization(info.context.request))
+		)
+
+		if not models.Administrator.objects.filter(pk = pk, users__id = user.id).exists():
+			return AdminResponse(messages = [])
+
+		return models.Administrator.objects.select_related(
+			"school"
+		).prefetch_related(
+			Prefetch("users", queryset = get_user_model().objects.all())
+		).filter(pk = pk, users__id = user.id).first()
+
+
+legacy_schema = strawberry.Schema(
+	query = LegacyQuery,
+	extensions = [DjangoOptimizerExtension]
+)
+
+
+@tag("benchmark")
+class GraphQLAsyncBenchmark(TestCase):
+	def setUp(self):
+		tokens.clear()
+
+		self.school = create_school()
+		self.user = create_user()
+
+		self.administrator = models.Administrator.objects.get(school = self.school)
+		self.administrator.users.add(self.user)
+
+		self.factory = AsyncRequestFactory()
+		self.body = json.dumps({
+			"query": QUERY,
+			"variables": {
+				"subdomain": self.school.subdomain,
+				"pk": self.administrator.id
+			}
+		})
+		self.headers = {"Authorization": f"Bearer {AccessToken.for_user(self.user)}"}
+
+	async def request(self, view) -> dict:
+		request = self.factory.post(
+			"/graphql",
+			data = self.body,
+			content_type = "application/json",
+			headers = self.headers
+		)
+		response = await view(request)
+
+		return json.loads(response.content)
+
+	async def measure(self, view) -> tuple[float, list[dict]]:
+		start = time.perf_counter()
+
+		for _ in range(ROUNDS):
+			results = await asyncio.gather(
+				*(self.request(view) for _ in range(CONCURRENCY))
+			)
+
+		elapsed = time.perf_counter() - start
+
+		return CONCURRENCY * ROUNDS / elapsed, results
+
+	def test_concurrent_requests(self):
+		"""
+			Benchmark de peticiones concurrentes a '/graphql'
+		"""
+		legacy_view = GraphQLView.as_view(schema = legacy_schema)
+		view = GraphQLView.as_view(schema = schema)
+
+		with CaptureQueriesContext(connection) as before_queries:
+			before, before_results = async_to_sync(self.measure)(legacy_view)
+
+		with CaptureQueriesContext(connection) as after_queries:
+			after, after_results = async_to_sync(self.measure)(view)
+
+		requests = CONCURRENCY * ROUNDS
+
+		print(
+			f"\n/graphql ({CONCURRENCY} concurrentes): "
+			f"antes {before:.1f} peticiones/s ({len(before_queries) / requests:.2f} consultas/petición), "
+			f"después {after:.1f} peticiones/s ({len(after_queries) / requests:.2f} consultas/petición)"
+		)
+
+		self.assertEqual(
+			[result["data"] for result in before_results],
+			[result["data"] for result in after_results]
+		)
+		self.assertEqual(
+			after_results[0]["data"]["administrator"]["id"],
+			str(self.administrator.id)
+		)
+		self.assertLess(len(after_queries), len(before_queries))
@@ -0,0 +1,110 @@
+"""
+	Benchmark: consultas por petición de los permisos de administración
+	('BelongToOurAdministrator' y 'BasePermissionDetailObject').
+
+	"Antes" reproduce las consultas 'EXISTS' que se hacían en cada petición,
+	"Después" usa 'apps.management.services.membership'.
+
+	python manage.py test tests.benchmarks.test_membership --tag benchmark -v 2
+"""
+import time
+
+from django.db import connection
+from django.db.models import Subquery
+from django.test import tag
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework.test import APITestCase
+
+from apps.school import models as school_models
+from apps.management import models
+from apps.management.services import membership
+
+from tests.school.utils import create_school, create_news
+from tests.user.utils import create_user
+
+REQUESTS = 200
+
+
+def legacy_is_member(user_id, school_id) -> bool:
+	return models.Administrator.objects.filter(
+		school_id = school_id,
+		users__id = user_id
+	).exists()
+
+
+def legacy_has_perm_detail(model, data_id, user_id) -> bool:
+	return models.Administrator.objects.filter(
+		school_id__in = Subquery(
+			model.objects.filter(pk = data_id).values("school_id")
+		),
+		users__id = user_id
+	).exists()
+
+
+def current_has_perm_detail(model, data_id, user_id) -> bool:
+	school_id = membership.get_object_school(model = model, pk = data_id)
+	return membership.is_member(user_id = user_id, school_id = school_id)
+
+
+@tag("benchmark")
+class MembershipBenchmark(APITestCase):
+	def setUp(self):
+		membership.get_cache().clear()
+
+		self.school = create_school()
+		self.user = create_user(role = 0)
+		self.news = create_news(school = self.school)
+
+		models.Administrator.objects.get(school = self.school).users.add(self.user)
+
+	def measure(self, check) -> tuple[float, float]:
+		with CaptureQueriesContext(connection) as queries:
+			start = time.perf_counter()
+
+			for _ in range(REQUESTS):
+				self.assertTrue(check())
+
+			elapsed = time.perf_counter() - start
+
+		return len(queries) / REQUESTS, elapsed / REQUESTS * 1000
+
+	def report(self, name, before, after):
+		print(
+			f"\n{name}: "
+			f"antes {before[0]:.2f} consultas/petición ({before[1]:.3f} ms), "
+			f"después {after[0]:.2f} consultas/petición ({after[1]:.3f} ms)"
+		)
+
+	def test_list_permission(self):
+		"""
+			Benchmark 'BelongToOurAdministrator'
+		"""
+		before = self.measure(
+			lambda: legacy_is_member(self.user.id, self.school.id)
+		)
+		after = self.measure(
+			lambda: membership.is_member(self.user.id, self.school.id)
+		)
+
+		self.report("BelongToOurAdministrator", before, after)
+
+		self.assertEqual(before[0], 1)
+		# Solo la primera petición consulta la base de datos
+		self.assertLessEqual(after[0], 1 / REQUESTS)
+
+	def test_detail_permission(self):
+		"""
+			Benchmark 'BasePermissionDetailObject'
+		"""
+		before = self.measure(
+			lambda: legacy_has_perm_detail(school_models.News, self.news.id, self.user.id)
+		)
+		after = self.measure(
+			lambda: current_has_perm_detail(school_models.News, self.news.id, self.user.id)
+		)
+
+		self.report("BasePermissionDetailObject", before, after)
+
+		self.assertEqual(before[0], 1)
+		self.assertLessEqual(after[0], 2 / REQUESTS)
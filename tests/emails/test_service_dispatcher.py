@@ -0,0 +1,124 @@
+import time
+
+from django.test import SimpleTestCase, override_settings
+from django.core.mail import EmailMultiAlternatives
+
+from apps.emails.services import dispatcher
+from apps.emails.services.send_email import SendEmail
+
+from tests import faker
+
+from .utils.smtp import LocalSMTPServer
+
+
+def create_emails(size: int = 1) -> list[EmailMultiAlternatives]:
+	return [
+		EmailMultiAlternatives(
+			faker.text(max_nb_chars = 20),
+			faker.text(max_nb_chars = 50),
+			faker.email(),
+			[faker.email()]
+		)
+		for _ in range(size)
+	]
+
+
+class MailDispatcherTest(SimpleTestCase):
+	def setUp(self):
+		self.server = LocalSMTPServer().__enter__()
+		self.addCleanup(self.server.__exit__)
+
+		self.settings_smtp = self.settings(
+			EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend",
+			EMAIL_HOST = "127.0.0.1",
+			EMAIL_PORT = self.server.port,
+			EMAIL_USE_TLS = False,
+			EMAIL_HOST_USER = "",
+			EMAIL_HOST_PASSWORD = "",
+			EMAIL_DISPATCHER = {"BATCH_SIZE": 50, "MAX_IDLE": 60}
+		)
+		self.settings_smtp.enable()
+		self.addCleanup(self.settings_smtp.disable)
+
+	def test_send_reuses_connection(self):
+		"""
+			Validar que varios envíos usen la misma conexión SMTP
+		"""
+		for email in create_emails(size = 3):
+			self.assertEqual(SendEmail.send(email = email), 1)
+
+		self.assertEqual(self.server.connections, 1)
+		self.assertEqual(len(self.server.messages), 3)
+
+	def test_send_many(self):
+		"""
+			Validar enviar un lote de correos en una conexión
+		"""
+		sent = SendEmail.send_many(emails = create_emails(size = 120))
+
+		self.assertEqual(sent, 120)
+		self.assertEqual(self.server.connections, 1)
+		self.assertEqual(len(self.server.messages), 120)
+
+	def test_send_many_with_wrong_emails(self):
+		"""
+			Generar un error por enviar correos que no son 'EmailMultiAlternatives'
+		"""
+		with self.assertRaises(ValueError):
+			SendEmail.send_many(emails = ["correo"])
+
+	def test_reconnect_after_idle(self):
+		"""
+			Validar abrir una nueva conexión después de 'MAX_IDLE' segundos sin uso
+		"""
+		with self.settings(EMAIL_DISPATCHER = {"MAX_IDLE": 0}):
+			SendEmail.send(email = create_emails()[0])
+			time.sleep(0.01)
+			SendEmail.send(email = create_emails()[0])
+
+		self.assertEqual(self.server.connections, 2)
+		self.assertEqual(len(self.server.messages), 2)
+
+	def test_reconnect_when_server_disconnected(self):
+		"""
+			Validar volver a conectar si el servidor cerró la conexión
+		"""
+		SendEmail.send(email = create_emails()[0])
+
+		# Se cierra el socket, como si el servidor hubiera cerrado la conexión
+		dispatcher.get_dispatcher().connection.connection.close()
+
+		SendEmail.send(email = create_emails()[0])
+
+		self.assertEqual(self.server.connections, 2)
+		self.assertEqual(len(self.server.messages), 2)
+
+	def test_reconnect_in_the_middle_of_a_batch(self):
+		"""
+			Validar que al cerrarse la conexión a mitad de un lote solo se reenvíen los correos que faltan
+		"""
+		self.server.disconnect_after = 3
+
+		emails = create_emails(size = 5)
+		sent = SendEmail.send_many(emails = emails)
+
+		self.assertEqual(sent, 5)
+		self.assertEqual(self.server.connections, 2)
+		self.assertEqual(len(self.server.messages), 5)
+		self.assertEqual(
+			[message.split(b"Subject: ", 1)[1].split(b"\r\n", 1)[0].decode() for message in self.server.messages],
+			[email.subject for email in emails]
+		)
+
+	def test_rate_limit_by_provider(self):
+		"""
+			Validar el límite de correos por segundo del proveedor
+		"""
+		with self.settings(EMAIL_DISPATCHER = {"BATCH_SIZE": 1, "RATE_LIMITS": {"127.0.0.1": 20}}):
+			start = time.monotonic()
+			SendEmail.send_many(emails = create_emails(size = 5))
+			elapsed = time.monotonic() - start
+
+		# 4 esperas de 1 / 20 segundos
+		self.assertGreaterEqual(elapsed, 0.19)
+		self.assertEqual(len(self.server.messages), 5)
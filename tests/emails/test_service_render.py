@@ -0,0 +1,94 @@
+from unittest.mock import patch
+
+from django.template.loader import render_to_string
+
+from apps.emails.services import render
+from apps.emails.services.reset_password import EmailResetPassword
+
+from tests import faker
+
+from .utils import testcases
+
+
+class EmailRenderServiceTest(testcases.RenderingEmailTemplateResetPasswordTestCase):
+	def setUp(self):
+		super().setUp()
+
+		render.get_email_template.cache_clear()
+
+		self.context = {
+			"name": self.context_user["name_user"],
+			"password": self.context_user["password"]
+		}
+
+	def test_template_is_loaded_once(self):
+		"""
+			Validar que el template se cargue una sola vez por proceso
+		"""
+		with patch.object(render, "get_template", wraps = render.get_template) as mock_get_template:
+			EmailResetPassword(data_message = self.context_user, emails_to = self.emails_to)
+			EmailResetPassword(data_message = self.context_user, emails_to = self.emails_to)
+
+		mock_get_template.assert_called_once_with(f"emails/{self.template_name}")
+
+	def test_render_email(self):
+		"""
+			Validar que se genere el HTML y el texto plano del mensaje
+		"""
+		rendered = render.render_email(self.template_name, context = self.context)
+
+		self.assertHTMLEqual(
+			rendered.html,
+			render_to_string(f"emails/{self.template_name}", self.context)
+		)
+		self.assertIn(self.context["password"], rendered.text)
+		self.assertIn("Contraseña restablecida", rendered.text)
+		self.assertNotIn("<", rendered.text)
+		self.assertNotIn("text-align", rendered.text)
+
+	def test_render_many(self):
+		"""
+			Validar que se rendericen varios contextos con el mismo template
+		"""
+		contexts = [
+			{"name": faker.name(), "password": faker.password()}
+			for _ in range(5)
+		]
+
+		result = render.render_many(self.template_name, contexts)
+
+		self.assertEqual(len(result), len(contexts))
+
+		for rendered, context in zip(result, contexts):
+			self.assertInHTML(context["name"], rendered.html)
+			self.assertIn(context["password"], rendered.text)
+
+	def test_render_email_with_no_existent_template(self):
+		"""
+			Generar un error por pasar un template que no existe
+		"""
+		with self.assertRaisesMessage(ValueError, "No existe este template: emails/does_not_exist.html"):
+			render.render_email("does_not_exist.html")
+
+	def test_email_reset_password_with_text_alternative(self):
+		"""
+			Validar que el correo tenga el texto plano y el HTML como alternativa
+		"""
+		email_reset_password = EmailResetPassword(
+			data_message = self.context_user,
+			emails_to = self.emails_to
+		)
+
+		email = email_reset_password.email
+
+		self.assertEqual(email.body, email_reset_password.content_text)
+		self.assertEqual(email.alternatives[0].content, email_reset_password.content_message)
+		self.assertEqual(email.alternatives[0].mimetype, "text/html")
+
+		message = email.message()
+
+		self.assertEqual(message.get_content_type(), "multipart/alternative")
+		self.assertEqual(
+			[part.get_content_type() for part in message.get_payload()],
+			["text/plain", "text/html"]
+		)
@@ -0,0 +1,81 @@
+"""
+	Servidor SMTP local para las pruebas: acepta los correos y los guarda
+	en memoria, contando las conexiones que recibe.
+
+	Con 'disconnect_after' cierra la conexión después de aceptar esa
+	cantidad de correos, como un servidor que corta la conexión a mitad
+	de un lote (solo una vez).
+"""
+import socketserver, threading
+
+
+class SMTPHandler(socketserver.StreamRequestHandler):
+
+	def reply(self, message: str) -> None:
+		self.wfile.write(f"{message}\r\n".encode())
+
+	def handle(self):
+		server = self.server
+		server.connections += 1
+
+		self.reply("220 localhost SMTP de pruebas")
+
+		while line := self.rfile.readline():
+			command = line.decode().strip()
+			verb = command.split(" ", 1)[0].upper()
+
+			if verb == "EHLO":
+				self.reply("250-localhost")
+				self.reply("250 8BITMIME")
+			elif verb == "HELO":
+				self.reply("250 localhost")
+			elif verb in ("MAIL", "RCPT", "RSET", "NOOP"):
+				self.reply("250 OK")
+			elif verb == "DATA":
+				self.reply("354 Fin del mensaje con <CR><LF>.<CR><LF>")
+
+				data = []
+
+				while (line := self.rfile.readline()) not in (b".\r\n", b""):
+					data.append(line)
+
+				with server.lock:
+					server.messages.append(b"".join(data))
+					disconnect = len(server.messages) == server.disconnect_after
+
+				self.reply("250 OK")
+
+				if disconnect:
+					server.disconnect_after = None
+					break
+			elif verb == "QUIT":
+				self.reply("221 Adios")
+				break
+			else:
+				self.reply("502 Comando no implementado")
+
+
+class LocalSMTPServer(socketserver.ThreadingTCPServer):
+	daemon_threads = True
+	allow_reuse_address = True
+
+	def __init__(self, disconnect_after: int | None = None):
+		super().__init__(("127.0.0.1", 0), SMTPHandler)
+
+		self.connections = 0
+		self.messages = []
+		self.disconnect_after = disconnect_after
+		self.lock = threading.Lock()
+
+	@property
+	def port(self) -> int:
+		return self.server_address[1]
+
+	def __enter__(self):
+		threading.Thread(target = self.serve_forever, daemon = True).start()
+
+		return self
+
+	def __exit__(self, *args):
+		self.shutdown()
+		self.server_close()
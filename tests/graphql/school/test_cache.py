@@ -0,0 +1,109 @@
+"""
+	Estos tests validan la caché de las respuestas de las queries
+	públicas ('@cacheControl').
+"""
+from graphql import parse
+
+from apps.graphql.cache import CACHE_HEADER, CachePolicy
+from apps.graphql.schema import schema
+
+from tests.school.utils import utils
+from tests.graphql.management.utils.schemas import QUERY_ADMINISTRATOR_DETAIL
+
+from .utils import testcases
+
+
+class SchoolQueryResponseCacheTest(testcases.SchoolQueryResponseCacheTestCase):
+
+	def test_query_cache(self):
+		"""
+			Validar que la segunda query se responda desde la caché
+		"""
+		response = self.request(self.query, self.variables)
+
+		self.assertEqual(response[CACHE_HEADER], "MISS")
+
+		with self.assertNumQueries(0):
+			cached_response = self.request(self.query, self.variables)
+
+		self.assertEqual(cached_response[CACHE_HEADER], "HIT")
+		self.assertEqual(cached_response.json(), response.json())
+
+	def test_query_cache_invalidate(self):
+		"""
+			Validar que una escritura en la escuela invalide la respuesta
+		"""
+		self.request(self.query, self.variables)
+
+		news = utils.create_news(school = self.school, status = "publicado")
+
+		response = self.request(self.query, self.variables)
+
+		self.assertEqual(response[CACHE_HEADER], "MISS")
+
+		nodes = [
+			edge["node"]["id"]
+			for edge in response.json()["data"]["recent"]["edges"]
+		]
+
+		self.assertIn(str(news.id), nodes)
+
+	def test_query_cache_other_school(self):
+		"""
+			Validar que una escritura en otra escuela no invalide la respuesta
+		"""
+		self.request(self.query, self.variables)
+
+		utils.create_news(status = "publicado")
+
+		response = self.request(self.query, self.variables)
+
+		self.assertEqual(response[CACHE_HEADER], "HIT")
+
+	def test_query_cache_by_variables(self):
+		"""
+			Validar que la caché dependa de las variables de la query
+		"""
+		self.request(self.query, self.variables)
+
+		self.variables.update({"first": 1})
+
+		response = self.request(self.query, self.variables)
+
+		self.assertEqual(response[CACHE_HEADER], "MISS")
+
+	def test_query_cache_authenticated(self):
+		"""
+			Validar que no se guarden las queries con 'Authorization'
+		"""
+		headers = {"Authorization": "Bearer token"}
+
+		self.request(self.query, self.variables, headers = headers)
+		response = self.request(self.query, self.variables, headers = headers)
+
+		self.assertNotIn(CACHE_HEADER, response)
+
+	def test_query_cache_without_subdomain(self):
+		"""
+			Validar que no se guarden las queries que no filtran por escuela
+		"""
+		query = """
+			query MyQuery {
+			  news(first: 5) {
+			    edges { node { id } }
+			  }
+			}
+		"""
+
+		response = self.request(query)
+
+		self.assertNotIn(CACHE_HEADER, response)
+
+	def test_query_cache_private_types(self):
+		"""
+			Validar que no se guarden las queries de administración
+		"""
+		policy = CachePolicy(schema._schema, parse(QUERY_ADMINISTRATOR_DETAIL), {"pk": 1})
+		document = parse(QUERY_ADMINISTRATOR_DETAIL)
+
+		self.assertFalse(policy.add_operation(document.definitions[0]))
@@ -0,0 +1,141 @@
+"""
+	Estos tests validan el límite de costo y profundidad de las queries.
+"""
+from django.test import override_settings
+
+from .utils import testcases
+from .utils.schemas import QUERY_SCHOOL_EXPENSIVE
+
+
+class SchoolQueryCostTest(testcases.SchoolQueryLoadersTestCase):
+
+	def test_query_cost_in_extensions(self):
+		"""
+			Validar que el costo de la query se informe en 'extensions'
+		"""
+		result = self.client.query(self.query, variables = self.variables)
+
+		self.assertIsNone(result.errors)
+
+		cost = result.extensions["cost"]
+
+		self.assertGreater(cost["requested"], 0)
+		self.assertLessEqual(cost["requested"], cost["maximum"])
+
+	def test_query_cost_exceeded(self):
+		"""
+			Validar que no se ejecute una query que supera el costo máximo
+		"""
+		result = self.client.query(
+			QUERY_SCHOOL_EXPENSIVE,
+			variables = self.variables,
+			assert_no_errors = False
+		)
+
+		self.assertIsNone(result.data)
+		self.assertEqual(len(result.errors), 1)
+		self.assertEqual(result.errors[0]["extensions"]["code"], "QUERY_TOO_COMPLEX")
+		self.assertGreater(
+			result.extensions["cost"]["requested"],
+			result.extensions["cost"]["maximum"]
+		)
+
+	def test_query_cost_by_arguments(self):
+		"""
+			Validar que el costo dependa de la cantidad de elementos solicitados
+		"""
+		query = """
+			query MyQuery($first: Int!) {
+			  news(first: $first) {
+			    edges {
+			      node {
+			        id
+			      }
+			    }
+			  }
+			}
+		"""
+
+		small = self.client.query(query, variables = {"first": 1})
+		large = self.client.query(query, variables = {"first": 10})
+
+		self.assertGreater(
+			large.extensions["cost"]["requested"],
+			small.extensions["cost"]["requested"]
+		)
+
+	@override_settings(GRAPHQL_QUERY_COST = {"MAX_COST": 1})
+	def test_query_cost_with_settings(self):
+		"""
+			Validar que el costo máximo se defina en 'GRAPHQL_QUERY_COST'
+		"""
+		result = self.client.query(
+			self.query,
+			variables = self.variables,
+			assert_no_errors = False
+		)
+
+		self.assertIsNone(result.data)
+		self.assertEqual(result.extensions["cost"]["maximum"], 1)
+
+	def test_query_cost_with_fragments(self):
+		"""
+			Validar que los fragmentos sumen el mismo costo que los campos
+		"""
+		query = """
+			query MyQuery {
+			  news(first: 5) {
+			    edges { node { id media { photo } } }
+			  }
+			}
+		"""
+		query_fragments = """
+			query MyQuery {
+			  news(first: 5) {
+			    edges { node { ...NewsFields } }
+			  }
+			}
+			fragment NewsFields on News { id media { ...MediaFields } }
+			fragment MediaFields on NewsMedia { photo }
+		"""
+
+		result = self.client.query(query)
+		result_fragments = self.client.query(query_fragments)
+
+		self.assertEqual(
+			result.extensions["cost"]["requested"],
+			result_fragments.extensions["cost"]["requested"]
+		)
+
+	def test_query_cost_with_negative_size(self):
+		"""
+			Validar que un 'first' negativo no reduzca el costo de los otros campos
+		"""
+		query = """
+			query MyQuery {
+			  a: news(first: -100000) { edges { node { id } } }
+			  b: news(first: 1000) { edges { node { id } } }
+			}
+		"""
+
+		result = self.client.query(query, assert_no_errors = False)
+
+		self.assertIsNone(result.data)
+		self.assertEqual(len(result.errors), 1)
+		self.assertEqual(result.errors[0]["extensions"]["code"], "BAD_USER_INPUT")
+
+	def test_query_cost_with_negative_limit(self):
+		"""
+			Validar que 'pagination: {limit: -1}' (sin límite) no evite el límite de costo
+		"""
+		query = """
+			query MyQuery {
+			  calendar(subdomain: "school", pagination: {limit: -1}) { results { id } }
+			}
+		"""
+
+		result = self.client.query(query, assert_no_errors = False)
+
+		self.assertIsNone(result.data)
+		self.assertEqual(len(result.errors), 1)
+		self.assertEqual(result.errors[0]["extensions"]["code"], "BAD_USER_INPUT")
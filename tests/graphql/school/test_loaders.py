@@ -0,0 +1,56 @@
+"""
+	Estos tests validan que las relaciones del esquema (media, colors)
+	se resuelvan en una sola consulta por relación, sin importar la
+	cantidad de elementos que devuelva la query.
+"""
+from tests.school.utils import utils
+
+from .utils import testcases
+
+
+class SchoolQueryLoadersTest(testcases.SchoolQueryLoadersTestCase):
+
+	def grow(self, size: int):
+		utils.bulk_create_news(size = size, school = self.school, status = "publicado")
+		utils.bulk_create_repository(size = size, school = self.school)
+		utils.bulk_create_infraestructure(size = size, school = self.school)
+
+	def test_query_count_is_constant(self):
+		"""
+			Validar que la cantidad de consultas no cambie al aumentar los elementos
+		"""
+		self.school.setting.colors.set(
+			utils.bulk_create_color_hex_format(size = 2)
+		)
+		self.grow(size = 2)
+
+		def grow():
+			self.grow(size = 10)
+			self.school.setting.colors.add(
+				*utils.bulk_create_color_hex_format(size = 5)
+			)
+
+		self.assertConstantQueries(self.query, self.variables, grow = grow)
+
+	def test_query_media(self):
+		"""
+			Validar que cada elemento reciba sus propios archivos
+		"""
+		news = utils.create_news(school = self.school, status = "publicado")
+		other_news = utils.create_news(school = self.school, status = "publicado")
+		other_news.media.clear()
+
+		result = self.client.query(self.query, variables = self.variables)
+
+		self.assertIsNone(result.errors)
+
+		nodes = {
+			edge["node"]["id"]: edge["node"]["media"]
+			for edge in result.data["recent"]["edges"]
+		}
+
+		self.assertEqual(
+			sorted(media["photo"] for media in nodes[str(news.id)]),
+			sorted(media.photo for media in news.media.all())
+		)
+		self.assertEqual(nodes[str(other_news.id)], [])
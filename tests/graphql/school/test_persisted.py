@@ -0,0 +1,147 @@
+"""
+	Estos tests validan las queries persistidas ('persistedQuery') y la
+	caché de los documentos ya analizados y validados.
+"""
+import json, tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.test import TestCase
+
+from graphql import parse
+
+from apps.graphql.persisted import (
+	PERSISTED_QUERY_NOT_FOUND,
+	PersistedQueryStore,
+	get_hash,
+	load_allowlist,
+	persisted_queries
+)
+
+from .utils import testcases
+
+
+class SchoolQueryPersistedTest(testcases.SchoolQueryPersistedTestCase):
+
+	def test_persisted_query_not_found(self):
+		"""
+			Validar "PersistedQueryNotFound" para un hash desconocido
+		"""
+		result = self.persisted_query(get_hash(self.query))
+
+		self.assertIsNone(result.data)
+		self.assertEqual(result.errors[0]["message"], PERSISTED_QUERY_NOT_FOUND)
+		self.assertEqual(
+			result.errors[0]["extensions"]["code"], 
+			"PERSISTED_QUERY_NOT_FOUND"
+		)
+
+	def test_persisted_query(self):
+		"""
+			Validar que una query registrada se ejecute solo con su hash
+		"""
+		query_hash = get_hash(self.query)
+
+		register = self.persisted_query(query_hash, query = self.query)
+
+		self.assertIsNone(register.errors)
+
+		result = self.persisted_query(query_hash)
+
+		self.assertIsNone(result.errors)
+		self.assertEqual(result.data, register.data)
+		self.assertIn("calendar", result.data)
+
+	def test_persisted_query_hash_mismatch(self):
+		"""
+			Validar que no se registre una query con un hash que no le corresponde
+		"""
+		query_hash = get_hash("query { __typename }")
+
+		result = self.persisted_query(query_hash, query = self.query)
+
+		self.assertIsNone(result.data)
+		self.assertEqual(
+			result.errors[0]["extensions"]["code"], 
+			"PERSISTED_QUERY_HASH_MISMATCH"
+		)
+		self.assertIsNone(persisted_queries.get(query_hash))
+
+	def test_persisted_query_skip_parse(self):
+		"""
+			Validar que una query conocida no se vuelva a analizar ni validar
+		"""
+		with (
+			mock.patch("strawberry.schema.schema.parse", wraps = parse) as mock_parse,
+			mock.patch("strawberry.schema.schema.validate_document") as mock_validate
+		):
+			mock_validate.return_value = []
+
+			self.client.query(self.query, variables = self.variables)
+			self.client.query(self.query, variables = self.variables)
+			self.persisted_query(get_hash(self.query))
+
+		self.assertEqual(mock_parse.call_count, 1)
+		self.assertEqual(mock_validate.call_count, 1)
+
+	def test_persisted_query_invalid(self):
+		"""
+			Validar que no se guarden las queries con errores de validación
+		"""
+		query = "query { calendar { id } }"
+
+		result = self.client.query(query, assert_no_errors = False)
+
+		self.assertTrue(result.errors)
+		self.assertIsNone(persisted_queries.get(get_hash(query)))
+
+
+class PersistedQueryStoreTest(TestCase):
+
+	def test_store_maxsize(self):
+		"""
+			Validar que se eliminen las queries menos usadas al superar 'maxsize'
+		"""
+		store = PersistedQueryStore(maxsize = 2)
+		queries = ["query { a }", "query { b }", "query { c }"]
+
+		for query in queries[:2]:
+			store.set(get_hash(query), query, parse(query))
+
+		store.get(get_hash(queries[0]))
+		store.set(get_hash(queries[2]), queries[2], parse(queries[2]))
+
+		self.assertEqual(len(store), 2)
+		self.assertIsNotNone(store.get(get_hash(queries[0])))
+		self.assertIsNone(store.get(get_hash(queries[1])))
+
+	def test_store_allowlist(self):
+		"""
+			Validar que las queries permitidas no se eliminen
+		"""
+		query = "query { a }"
+
+		with tempfile.TemporaryDirectory() as directory:
+			path = Path(directory) / "queries.json"
+			path.write_text(json.dumps({get_hash(query): query}))
+
+			store = PersistedQueryStore(maxsize = 1, allowlist = load_allowlist(path))
+
+		self.assertEqual(store.get_query(get_hash(query)), query)
+
+		store.set(get_hash(query), query, parse(query))
+		store.set(get_hash("query { b }"), "query { b }", parse("query { b }"))
+		store.set(get_hash("query { c }"), "query { c }", parse("query { c }"))
+
+		self.assertIsNotNone(store.get(get_hash(query)))
+
+	def test_load_allowlist_hash_mismatch(self):
+		"""
+			Validar un error en la lista de queries permitidas con un hash incorrecto
+		"""
+		with tempfile.TemporaryDirectory() as directory:
+			path = Path(directory) / "queries.json"
+			path.write_text(json.dumps({get_hash("query { b }"): "query { a }"}))
+
+			with self.assertRaises(ValueError):
+				load_allowlist(path)
@@ -131,7 +131,100 @@ query MyQuery($subdomain: String!, $month: MonthsEnum) {
 }
 """
 
+QUERY_SCHOOL_MEDIA = """
+query MyQuery($subdomain: String!, $first: Int!) {
+  recent: news(
+    first: $first,
+    filters: {school: {subdomain: $subdomain}},
+    ordering: {created: DESC}
+  ) {
+    edges {
+      node {
+        id
+        media {
+          photo
+        }
+      }
+    }
+  }
+  oldest: news(
+    first: $first,
+    filters: {school: {subdomain: $subdomain}},
+    ordering: {created: ASC}
+  ) {
+    edges {
+      node {
+        id
+        media {
+          photo
+        }
+      }
+    }
+  }
+  settings(filters: {school: {subdomain: $subdomain}}) {
+    colors {
+      color
+    }
+  }
+  repository(first: $first, filters: {school: {subdomain: $subdomain}}) {
+    edges {
+      node {
+        id
+        media {
+          file
+          title
+        }
+      }
+    }
+  }
+  infraestructure(first: $first, filters: {school: {subdomain: $subdomain}}) {
+    edges {
+      node {
+        id
+        media {
+          photo
+        }
+      }
+    }
+  }
+}
+"""
+
+QUERY_SCHOOL_EXPENSIVE = """
+query MyQuery($subdomain: String!) {
+  news(first: 100, filters: {school: {subdomain: $subdomain}}) {
+    edges {
+      node {
+        media {
+          photo
+        }
+      }
+    }
+  }
+  repository(first: 100, filters: {school: {subdomain: $subdomain}}) {
+    edges {
+      node {
+        media {
+          file
+        }
+      }
+    }
+  }
+  infraestructure(first: 100, filters: {school: {subdomain: $subdomain}}) {
+    edges {
+      node {
+        media {
+          photo
+        }
+      }
+    }
+  }
+}
+"""
+
 __all__ = [
 	"QUERY_SCHOOL",
-	"QUERY_SCHOOL_CALENDAR"
+	"QUERY_SCHOOL_CALENDAR",
+	"QUERY_SCHOOL_MEDIA",
+	"QUERY_SCHOOL_EXPENSIVE"
 ]
\ No newline at end of file
@@ -1,15 +1,24 @@
+from typing import Callable
+
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
+from strawberry.test.client import Response
 from strawberry_django.test.client import TestClient
 
+from apps.graphql.persisted import persisted_queries
+from apps.school.services.cache import school_cache
+
 from apps.graphql.school.types import MonthsEnum
 
 from tests.school.utils import utils
 
 from .schemas import (
 	QUERY_SCHOOL, 
-	QUERY_SCHOOL_CALENDAR
+	QUERY_SCHOOL_CALENDAR,
+	QUERY_SCHOOL_MEDIA
 )
 
 URL = "/graphql"
@@ -78,3 +87,88 @@ class SchoolQueryCalendarTestCase(SchoolQueryTestCase):
 			"subdomain": self.school.subdomain,
 			"month": MonthsEnum(self.current_date.month).name,
 		}
+
+
+class SchoolQueryLoadersTestCase(SchoolQueryTestCase):
+	"""
+		Valida que la cantidad de consultas de una query no dependa
+		de la cantidad de elementos de sus listas.
+	"""
+	def setUp(self):
+		super().setUp()
+
+		self.query = QUERY_SCHOOL_MEDIA
+		self.variables = {
+			"subdomain": self.school.subdomain,
+			"first": 20
+		}
+
+	def count_queries(self, query: str, variables: dict) -> int:
+		with CaptureQueriesContext(connection) as context:
+			result = self.client.query(query, variables = variables)
+
+		self.assertIsNone(result.errors)
+
+		return len(context.captured_queries)
+
+	def assertConstantQueries(self, query: str, variables: dict, grow: Callable[[], None]):
+		before = self.count_queries(query, variables)
+
+		grow()
+
+		after = self.count_queries(query, variables)
+
+		self.assertEqual(before, after)
+
+
+class SchoolQueryPersistedTestCase(SchoolQueryCalendarTestCase):
+	def setUp(self):
+		super().setUp()
+
+		persisted_queries.clear()
+		self.addCleanup(persisted_queries.clear)
+
+	def persisted_query(self, query_hash: str, query: str | None = None, variables: dict | None = None) -> Response:
+		body = {
+			"variables": variables or self.variables,
+			"extensions": {
+				"persistedQuery": {"version": 1, "sha256Hash": query_hash}
+			}
+		}
+
+		if query is not None:
+			body["query"] = query
+
+		data = self.client.request(body).json()
+
+		return Response(
+			errors = data.get("errors"),
+			data = data.get("data"),
+			extensions = data.get("extensions")
+		)
+
+
+class SchoolQueryResponseCacheTestCase(SchoolQueryTestCase):
+	def setUp(self):
+		super().setUp()
+		school_cache.cache.clear()
+
+		utils.bulk_create_news(
+			size = 3,
+			school = self.school,
+			status = "publicado"
+		)
+
+		self.query = QUERY_SCHOOL_MEDIA
+		self.variables = {
+			"subdomain": self.school.subdomain,
+			"first": 10
+		}
+
+	def request(self, query: str, variables: dict | None = None, headers: dict | None = None):
+		body = {"query": query}
+
+		if variables:
+			body["variables"] = variables
+
+		return self.client.request(body, headers)
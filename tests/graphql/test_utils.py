@@ -4,7 +4,9 @@ from django.utils import timezone
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
 
+from asgiref.sync import async_to_sync
 from freezegun import freeze_time
+from rest_framework_simplejwt.tokens import AccessToken
 
 from tests import faker
 
@@ -13,8 +15,10 @@ from apps.graphql.utils import (
 	get_user_by_payload,
 	get_user_from_token,
 	get_http_authorization,
+	aget_user_from_token,
 )
 from apps.graphql import exceptions
+from apps.graphql.tokens import TokenCache
 
 from .utils import testcases, encode_token, PAYLOAD_SET_EXP, create_token
 
@@ -203,3 +207,94 @@ class GetUserFromToken(testcases.GetHTTPAuthorizationTestCase):
 
 		is_user = get_user_from_token(request = request)
 		self.assertIsInstance(is_user, AnonymousUser)
+
+
+class GetUserFromTokenCache(testcases.TokenCacheTestCase):
+
+	def test_cached_user(self):
+		"""
+			Validar que el usuario de un token se obtenga desde la caché
+		"""
+		request = self.get_request(create_token(user_id = self.user.id))
+
+		user = get_user_from_token(request = request)
+
+		with self.assertNumQueries(0):
+			cached_user = get_user_from_token(request = request)
+
+		self.assertEqual(cached_user.id, user.id)
+		self.assertIsNot(cached_user, user)
+
+	def test_cached_user_async(self):
+		"""
+			Validar que la versión asíncrona use la misma caché
+		"""
+		request = self.get_request(create_token(user_id = self.user.id))
+
+		user = async_to_sync(aget_user_from_token)(request = request)
+
+		self.assertEqual(user.id, self.user.id)
+
+		with self.assertNumQueries(0):
+			cached_user = get_user_from_token(request = request)
+
+		self.assertEqual(cached_user.id, self.user.id)
+
+	def test_cached_user_updated(self):
+		"""
+			Validar que un cambio en el usuario invalide la caché
+		"""
+		request = self.get_request(create_token(user_id = self.user.id))
+
+		get_user_from_token(request = request)
+
+		self.user.is_active = False
+		self.user.save()
+
+		user = get_user_from_token(request = request)
+
+		self.assertIsInstance(user, AnonymousUser)
+
+	def test_get_user_with_one_query(self):
+		"""
+			Validar que sin caché solo se consulte el usuario (los tokens de
+			acceso no están en la lista negra de 'simplejwt')
+		"""
+		request = self.get_request(str(AccessToken.for_user(self.user)))
+
+		with self.assertNumQueries(1):
+			user = get_user_from_token(request = request)
+
+		self.assertEqual(user.id, self.user.id)
+
+	def test_cache_token_expiration(self):
+		"""
+			Validar que una entrada no dure más que el token
+		"""
+		now = timezone.now().timestamp()
+		cache = TokenCache(ttl = 60, timer = lambda: now)
+
+		cache.set("token", {"exp": now + 10}, self.user)
+		cache.set("expired", {"exp": now}, self.user)
+
+		self.assertIsNotNone(cache.get("token"))
+		self.assertIsNone(cache.get("expired"))
+
+		cache.timer = lambda: now + 10
+
+		self.assertIsNone(cache.get("token"))
+
+	def test_cache_token_maxsize(self):
+		"""
+			Validar que se eliminen los tokens menos usados al superar 'maxsize'
+		"""
+		cache = TokenCache(maxsize = 2)
+
+		cache.set("a", {}, self.user)
+		cache.set("b", {}, self.user)
+		cache.get("a")
+		cache.set("c", {}, self.user)
+
+		self.assertEqual(len(cache), 2)
+		self.assertIsNotNone(cache.get("a"))
+		self.assertIsNone(cache.get("b"))
@@ -2,6 +2,8 @@
 from django.conf import settings
 from django.test import TestCase, RequestFactory
 
+from apps.graphql.tokens import tokens
+
 from tests import faker
 from tests.user.utils import create_user
 
@@ -25,3 +27,15 @@ class GetHTTPAuthorizationTestCase(TestCase):
 		self.user = create_user()
 		self.request_factory = RequestFactory()
 		self.HEADER_PREFIX = settings.STRAWBERRY_DJANGO_AUTH_TOKEN['JWT_AUTH_HEADER_PREFIX']
+
+
+class TokenCacheTestCase(GetHTTPAuthorizationTestCase):
+	def setUp(self):
+		super().setUp()
+		tokens.clear()
+		self.addCleanup(tokens.clear)
+
+	def get_request(self, token: str):
+		headers = f"{self.HEADER_PREFIX} {token}"
+
+		return self.request_factory.get("/", HTTP_AUTHORIZATION = headers)
@@ -0,0 +1,181 @@
+import datetime
+
+from django.core import mail
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.jobs.models import Job
+from apps.jobs.services import queue
+from apps.user.jobs import JOB_RESET_PASSWORD
+
+from tests import faker
+from tests.user.utils import create_user
+
+JOB_ECHO = "tests.echo"
+JOB_FAIL = "tests.fail"
+
+calls = []
+
+
+@queue.job(JOB_ECHO)
+def echo(value: int) -> int:
+	calls.append(value)
+
+	return value
+
+
+@queue.job(JOB_FAIL, max_attempts = 2)
+def fail(value: int = 0) -> None:
+	raise RuntimeError("Error en la tarea")
+
+
+@override_settings(SCHOOL_JOBS = {
+	"ALWAYS_EAGER": False,
+	"BACKOFF": 10,
+	"MAX_BACKOFF": 60,
+	"BATCH_SIZE": 10,
+	"TIMEOUT": 60,
+	"DELETE_COMPLETED": True,
+})
+class JobQueueTest(TestCase):
+	def setUp(self):
+		calls.clear()
+
+	def test_enqueue(self):
+		"""
+			Validar guardar una tarea en la cola y ejecutarla
+		"""
+		job = queue.enqueue(JOB_ECHO, value = 1)
+
+		self.assertEqual(job.status, Job.TypeStatus.pending)
+		self.assertEqual(job.payload, {"value": 1})
+		self.assertEqual(calls, [])
+
+		executed = queue.run_pending()
+
+		self.assertEqual(executed, 1)
+		self.assertEqual(calls, [1])
+		self.assertFalse(Job.objects.exists())
+
+	def test_enqueue_eager(self):
+		"""
+			Validar ejecutar la tarea al encolarla ('ALWAYS_EAGER')
+		"""
+		with self.settings(SCHOOL_JOBS = {"ALWAYS_EAGER": True}):
+			job = queue.enqueue(JOB_ECHO, value = 2)
+
+		self.assertIsNone(job)
+		self.assertEqual(calls, [2])
+		self.assertFalse(Job.objects.exists())
+
+	def test_enqueue_unknown_job(self):
+		"""
+			Generar un error al encolar una tarea que no está registrada
+		"""
+		with self.assertRaises(LookupError):
+			queue.enqueue("tests.unknown")
+
+	def test_run_in_order_and_scheduled(self):
+		"""
+			Validar ejecutar las tareas en orden, sin las programadas a futuro
+		"""
+		for value in range(3):
+			queue.enqueue(JOB_ECHO, value = value)
+
+		queue.enqueue(JOB_ECHO, value = 99, run_at = timezone.now() + datetime.timedelta(hours = 1))
+
+		queue.run_pending()
+
+		self.assertEqual(calls, [0, 1, 2])
+		self.assertEqual(Job.objects.get().payload, {"value": 99})
+
+	def test_retry_with_backoff(self):
+		"""
+			Validar reintentar una tarea fallida con espera exponencial
+		"""
+		job = queue.enqueue(JOB_FAIL, value = 1)
+
+		with self.assertLogs(queue.logger, level = "ERROR"):
+			queue.run_pending()
+
+		job.refresh_from_db()
+
+		self.assertEqual(job.status, Job.TypeStatus.pending)
+		self.assertEqual(job.attempts, 1)
+		self.assertEqual(job.payload, {"value": 1})
+		self.assertIn("Error en la tarea", job.last_error)
+		self.assertGreater(job.run_at, timezone.now() + datetime.timedelta(seconds = 5))
+
+		# Todavía no se cumple la espera
+		self.assertEqual(queue.run_pending(), 0)
+
+		Job.objects.filter(id = job.id).update(run_at = timezone.now())
+
+		with self.assertLogs(queue.logger, level = "ERROR"):
+			queue.run_pending()
+
+		job.refresh_from_db()
+
+		self.assertEqual(job.status, Job.TypeStatus.failed)
+		self.assertEqual(job.attempts, 2)
+		# Una tarea fallida no conserva su 'payload'
+		self.assertEqual(job.payload, {})
+
+	def test_get_backoff(self):
+		"""
+			Validar la espera entre intentos
+		"""
+		self.assertEqual(queue.get_backoff(1), datetime.timedelta(seconds = 10))
+		self.assertEqual(queue.get_backoff(2), datetime.timedelta(seconds = 20))
+		self.assertEqual(queue.get_backoff(10), datetime.timedelta(seconds = 60))
+
+	def test_claim_expired_running_job(self):
+		"""
+			Validar volver a tomar una tarea que quedó 'ejecutando' (el 'worker' se detuvo)
+		"""
+		job = queue.enqueue(JOB_ECHO, value = 3)
+
+		Job.objects.filter(id = job.id).update(
+			status = Job.TypeStatus.running,
+			locked_at = timezone.now() - datetime.timedelta(minutes = 5),
+			attempts = 1
+		)
+
+		queue.run_pending()
+
+		self.assertEqual(calls, [3])
+
+	def test_run_jobs_command(self):
+		"""
+			Validar el comando 'run_jobs'
+		"""
+		for value in range(15):
+			queue.enqueue(JOB_ECHO, value = value)
+
+		call_command("run_jobs", "--once", "--batch-size", "4", stdout = open("/dev/null", "w"))
+
+		self.assertEqual(calls, list(range(15)))
+		self.assertFalse(Job.objects.exists())
+
+	def test_reset_password_email_in_background(self):
+		"""
+			Validar que el correo de 'reset_password' se envíe desde la cola
+		"""
+		password = faker.password()
+		user = create_user(password = password)
+
+		job = queue.enqueue(JOB_RESET_PASSWORD, user_id = user.id)
+
+		# La contraseña se genera al ejecutar la tarea, no se guarda en la cola
+		self.assertEqual(job.payload, {"user_id": user.id})
+		self.assertEqual(len(mail.outbox), 0)
+
+		queue.run_pending()
+
+		user.refresh_from_db()
+
+		self.assertEqual(len(mail.outbox), 1)
+		self.assertEqual(mail.outbox[0].to, [user.email])
+		self.assertFalse(user.check_password(password))
+		self.assertFalse(Job.objects.exists())
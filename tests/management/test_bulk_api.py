@@ -0,0 +1,612 @@
+from django.db import connection
+from django.urls import reverse
+from django.test.utils import CaptureQueriesContext
+
+from apps.school import models
+from apps.management.apiv1.school import serializers
+
+from tests import faker
+from tests.school.utils import (
+	create_school,
+	create_calendar,
+	bulk_create_calendar,
+	create_coordinate,
+	bulk_create_grade,
+	bulk_create_school_staff
+)
+
+from .utils import testcases
+
+
+def get_bulk_url(resource, school_id):
+	return reverse(
+		f"management:{resource}-bulk",
+		kwargs = {"pk": school_id}
+	)
+
+
+def get_calendars(size: int = 1) -> list[dict]:
+	return [
+		{
+			"title": f"{faker.text(max_nb_chars = 20)} {index}",
+			"description": faker.paragraph(),
+			"date": faker.date_this_year()
+		}
+		for index in range(size)
+	]
+
+
+class BulkAPITest(testcases.BulkTestCase):
+
+	def count_queries(self, method, url, data) -> tuple[int, object]:
+		with CaptureQueriesContext(connection) as queries:
+			response = getattr(self.client, method)(url, data, format = "json")
+
+		return len(queries), response
+
+
+class CalendarBulkAPITest(BulkAPITest):
+	def setUp(self):
+		super().setUp()
+
+		self.URL_CALENDAR_BULK = get_bulk_url("calendar", self.school.id)
+
+	def test_bulk_create_calendar(self):
+		"""
+			Validar "POST /calendar/bulk"
+		"""
+		self.client.force_authenticate(user = self.user_with_all_perm)
+
+		calendars = get_calendars(size = 5)
+
+		response = self.client.post(
+			self.URL_CALENDAR_BULK,
+			calendars,
+			format = "json"
+		)
+
+		responseStatus = response.status_code
+		responseJson = response.data
+
+		self.assertEqual(responseStatus, 201)
+		self.assertEqual(len(responseJson), len(calendars))
+		self.assertEqual(
+			[calendar["title"] for calendar in responseJson],
+			[calendar["title"] for calendar in calendars]
+		)
+		self.assertTrue(all(calendar["id"] for calendar in responseJson))
+		self.assertEqual(
+			models.Calendar.objects.filter(school_id = self.school.id).count(),
+			len(calendars)
+		)
+
+	def test_bulk_create_calendar_constant_queries(self):
+		"""
+			Validar "POST /calendar/bulk" con la misma cantidad de consultas sin importar el tamaño del lote
+		"""
+		self.client.force_authenticate(user = self.user_with_all_perm)
+
+		# La primera petición guarda en caché la pertenencia del usuario
+		self.client.post(self.URL_CALENDAR_BULK, get_calendars(size = 1), format = "json")
+
+		few_queries, few_response = self.count_queries(
+			"post",
+			self.URL_CALENDAR_BULK,
+			get_calendars(size = 3)
+		)
+		many_queries, many_response = self.count_queries(
+			"post",
+			self.URL_CALENDAR_BULK,
+			get_calendars(size = 60)
+		)
+
+		self.assertEqual(few_response.status_code, 201)
+		self.assertEqual(many_response.status_code, 201)
+		self.assertEqual(few_queries, many_queries)
+
+	def test_bulk_create_calendar_with_duplicates(self):
+		"""
+			Validar "POST /calendar/bulk" con registros duplicados
+		"""
+		self.client.force_authenticate(user = self.user_with_all_perm)
+
+		calendar = create_calendar(school = self.school)
+		calendars = get_calendars(size = 2)
+
+		calendars.append({"title": calendar.title, "date": calendar.date})
+		calendars.append(calendars[0])
+
+		response = self.client.post(
+			self.URL_CALENDAR_BULK,
+			calendars,
+			format = "json"
+		)
+
+		responseStatus = response.status_code
+		responseJson = response.data
+
+		self.assertEqual(responseStatus, 400)
+		self.assertEqual(len(responseJson), len(calendars))
+		self.assertEqual(responseJson[0], {})
+		self.assertEqual(responseJson[1], {})
+		self.assertEqual(
+			responseJson[2]["non_field_errors"][0],
+			serializers.CALENDAR_ALREADY_EXISTS
+		)
+		self.assertEqual(
+			responseJson[3]["non_field_errors"][0],
+			serializers.BULK_DUPLICATED_ITEM
+		)
+		self.assertEqual(
+			models.Calendar.objects.filter(school_id = self.school.id).count(),
+			1
+		)
+
+	def test_bulk_create_calendar_with_invalid_item(self):
+		"""
+			Validar "POST /calendar/bulk" con un registro invalido
+		"""
+		self.client.force_authenticate(user = self.user_with_all_perm)
+
+		calendars = get_calendars(size = 3)
+		calendars[1]["title"] = "a"
+
+		response = self.client.post(
+			self.URL_CALENDAR_BULK,
+			calendars,
+			format = "json"
+		)
+
+		responseStatus = response.status_code
+		responseJson = response.data
+
+		self.assertEqual(responseStatus, 400)
+		self.assertEqual(responseJson[0], {})
+		self.assertIn("title", responseJson[1])
+		self.assertEqual(responseJson[2], {})
+		self.assertFalse(
+			models.Calendar.objects.filter(school_id = self.school.id).exists()
+		)
+
+	def test_bulk_create_calendar_empty(self):
+		"""
+			Validar "POST /calendar/bulk" sin registros
+		"""
+		self.client.force_authenticate(user = self.user_with_all_perm)
+
+		response = self.client.post(
+			self.URL_CALENDAR_BULK,
+			[],
+			format = "json"
+		)
+
+		self.assertEqual(response.status_code, 400)
+
+	def test_bulk_calendar_without_perm(self):
+		"""
+			Validar "POST /calendar/bulk" sin permisos
+		"""
+		self.client.force_authenticate(user = self.user_without_perm)
+
+		response = self.client.post(
+			self.URL_CALENDAR_BULK,
+			get_calendars(size = 2),
+			format = "json"
+		)
+
+		self.assertEqual(response.status_code, 403)
+
+	def test_bulk_calendar_other_school(self):
+		"""
+			Validar "POST /calendar/bulk" en una escuela a la que no pertenece
+		"""
+		self.client.force_authenticate(user = self.user_with_all_perm)
+
+		response = self.client.post(
+			get_bulk_url("calendar", create_school().id),
+			get_calendars(size = 2),
+			format = "json"
+		)
+
+		self.assertEqual(response.status_code, 403)
+
+	def test_bulk_update_calendar(self):
+		"""
+			Validar "PATCH /calendar/bulk"
+		"""
+		self.client.force_authenticate(user = self.user_with_all_perm)
+
+		calendars = bulk_create_calendar(size = 3, school = self.school)
+
+		update_calendars = [
+			{"id": calendar.id, "title": f"{faker.text(max_nb_chars = 20)} {index}"}
+			for index, calendar in enumerate(calendars)
+		]
+
+		response = self.client.patch(
+			self.URL_CALENDAR_BULK,
+			update_calendars,
+			format = "json"
+		)
+
+		responseStatus = response.status_code
+		responseJson = response.data
+
+		self.assertEqual(responseStatus, 200)
+		self.assertEqual(
+			[calendar["title"] for calendar in responseJson],
+			[calendar["title"] for calendar in update_calendars]
+		)
+
+		for calendar in update_calendars:
+			self.assertEqual(
+				models.Calendar.objects.get(id = calendar["id"]).title,
+				calendar["title"]
+			)
+
+	def test_bulk_update_calendar_with_duplicates(self):
+		"""
+			Validar "PATCH /calendar/bulk" cambiando un registro por uno ya existente
+		"""
+		self.client.force_authenticate(user = self.user_with_all_perm)
+
+		calendar, other_calendar = bulk_create_calendar(size = 2, school = self.school)
+
+		response = self.client.patch(
+			self.URL_CALENDAR_BULK,
+			[{"id": calendar.id, "title": other_calendar.title, "date": other_calendar.date}],
+			format = "json"
+		)
+
+		responseStatus = response.status_code
+		responseJson = response.data
+
+		self.assertEqual(responseStatus, 400)
+		self.assertEqual(
+			responseJson[0]["non_field_errors"][0],
+			serializers.CALENDAR_ALREADY_EXISTS
+		)
+
+	def test_bulk_update_calendar_other_school(self):
+		"""
+			Validar "PATCH /calendar/bulk" con registros de otra escuela
+		"""
+		self.client.force_authenticate(user = self.user_with_all_perm)
+
+		calendar = create_calendar(school = self.school)
+		other_calendar = create_calendar(school = create_school())
+
+		response = self.client.patch(
+			self.URL_CALENDAR_BULK,
+			[
+				{"id": calendar.id, "title": faker.text(max_nb_chars = 20)},
+				{"id": other_calendar.id, "title": faker.text(max_nb_chars = 20)},
+			],
+			format = "json"
+		)
+
+		responseStatus = response.status_code
+		responseJson = response.data
+
+		self.assertEqual(responseStatus, 400)
+		self.assertEqual(responseJson[0], {})
+		self.assertEqual(responseJson[1]["id"][0], serializers.BULK_ITEM_DOES_NOT_EXIST)
+
+	def test_bulk_delete_calendar(self):
+		"""
+			Validar "DELETE /calendar/bulk"
+		"""
+		self.client.force_authenticate(user = self.user_with_all_perm)
+
+		calendars = bulk_create_calendar(size = 4, school = self.school)
+		ids = [calendar.id for calendar in calendars[:3]]
+
+		response = self.client.delete(
+			self.URL_CALENDAR_BULK,
+			{"ids": ids},
+			format = "json"
+		)
+
+		responseStatus = response.status_code
+		responseJson = response.data
+
+		self.assertEqual(responseStatus, 200)
+		self.assertEqual(responseJson["ids"], ids)
+		self.assertFalse(models.Calendar.objects.filter(id__in = ids).exists())
+		self.assertTrue(models.Calendar.objects.filter(id = calendars[3].id).exists())
+
+	def test_bulk_delete_calendar_other_school(self):
+		"""
+			Validar "DELETE /calendar/bulk" con registros de otra escuela
+		"""
+		self.client.force_authenticate(user = self.user_with_all_perm)
+
+		calendar = create_calendar(school = self.school)
+		other_calendar = create_calendar(school = create_school())
+
+		response = self.client.delete(
+			self.URL_CALENDAR_BULK,
+			{"ids": [calendar.id, other_calendar.id]},
+			format = "json"
+		)
+
+		responseStatus = response.status_code
+		responseJson = response.data
+
+		self.assertEqual(responseStatus, 400)
+		self.assertEqual(responseJson["ids"][1][0], serializers.BULK_ITEM_DOES_NOT_EXIST)
+		self.assertTrue(models.Calendar.objects.filter(id = calendar.id).exists())
+
+
+class CoordinateBulkAPITest(BulkAPITest):
+	def setUp(self):
+		super().setUp()
+
+		self.URL_COORDINATE_BULK = get_bulk_url("coordinate", self.school.id)
+
+	def get_coordinates(self, size: int = 1) -> list[dict]:
+		coordinates = []
+
+		for index in range(size):
+			latitude, longitude, *_ = faker.local_latlng(country_code = "VE")
+
+			coordinates.append({
+				"title": f"{faker.text(max_nb_chars = 20)} {index}",
+				"latitude": latitude,
+				"longitude": longitude
+			})
+
+		return coordinates
+
+	def test_bulk_create_coordinate(self):
+		"""
+			Validar "POST /coordinate/bulk"
+		"""
+		self.client.force_authenticate(user = self.user_with_all_perm)
+
+		coordinates = self.get_coordinates(size = 4)
+
+		response = self.client.post(
+			self.URL_COORDINATE_BULK,
+			coordinates,
+			format = "json"
+		)
+
+		responseStatus = response.status_code
+		responseJson = response.data
+
+		self.assertEqual(responseStatus, 201)
+		self.assertEqual(len(responseJson), len(coordinates))
+		self.assertEqual(
+			models.Coordinate.objects.filter(school_id = self.school.id).count(),
+			len(coordinates)
+		)
+
+	def test_bulk_create_coordinate_with_duplicates(self):
+		"""
+			Validar "POST /coordinate/bulk" con una coordenada ya registrada
+		"""
+		self.client.force_authenticate(user = self.user_with_all_perm)
+
+		coordinate = create_coordinate(school = self.school)
+		coordinates = self.get_coordinates(size = 1)
+
+		coordinates.append({
+			"title": coordinate.title,
+			"latitude": str(coordinate.latitude),
+			"longitude": str(coordinate.longitude)
+		})
+
+		response = self.client.post(
+			self.URL_COORDINATE_BULK,
+			coordinates,
+			format = "json"
+		)
+
+		responseStatus = response.status_code
+		responseJson = response.data
+
+		self.assertEqual(responseStatus, 400)
+		self.assertEqual(responseJson[0], {})
+		self.assertEqual(
+			responseJson[1]["non_field_errors"][0],
+			serializers.COORDIANTE_ALREADY_EXISTS
+		)
+
+
+class StaffBulkAPITest(BulkAPITest):
+	def setUp(self):
+		super().setUp()
+
+		self.URL_STAFF_BULK = get_bulk_url("staff", self.school.id)
+
+	def test_bulk_create_staff(self):
+		"""
+			Validar "POST /staff/bulk"
+		"""
+		self.client.force_authenticate(user = self.user_with_all_perm)
+
+		staff = [
+			{"name": faker.name(), "occupation": models.OccupationStaff.teacher},
+			{"name": faker.name()},
+		]
+
+		response = self.client.post(
+			self.URL_STAFF_BULK,
+			staff,
+			format = "json"
+		)
+
+		responseStatus = response.status_code
+		responseJson = response.data
+
+		self.assertEqual(responseStatus, 201)
+		self.assertEqual(responseJson[0]["occupation"], models.OccupationStaff.teacher)
+		self.assertEqual(responseJson[1]["occupation"], models.OccupationStaff.administrative)
+
+
+class GradeBulkAPITest(BulkAPITest):
+	def setUp(self):
+		super().setUp()
+
+		self.URL_GRADE_BULK = get_bulk_url("grade", self.school.id)
+
+		self.teachers = bulk_create_school_staff(
+			size = 3,
+			school = self.school,
+			occupation = models.OccupationStaff.teacher
+		)
+
+	def get_grades(self, size: int = 1) -> list[dict]:
+		return [
+			{
+				"name": faker.text(max_nb_chars = models.MAX_LENGTH_GRADE_NAME),
+				"level": (index % models.MAX_LENGTH_GRADE_LEVEL) + 1,
+				"section": chr(ord("a") + index // models.MAX_LENGTH_GRADE_LEVEL),
+				"stage": self.stages[0].id,
+				"teacher": [teacher.id for teacher in self.teachers]
+			}
+			for index in range(size)
+		]
+
+	def test_bulk_create_grade(self):
+		"""
+			Validar "POST /grade/bulk" (con profesores)
+		"""
+		self.client.force_authenticate(user = self.user_with_all_perm)
+
+		grades = self.get_grades(size = 4)
+
+		response = self.client.post(
+			self.URL_GRADE_BULK,
+			grades,
+			format = "json"
+		)
+
+		responseStatus = response.status_code
+		responseJson = response.data
+
+		self.assertEqual(responseStatus, 201)
+		self.assertEqual(len(responseJson), len(grades))
+
+		for grade in responseJson:
+			self.assertEqual(grade["stage"], self.stages[0].type)
+			self.assertEqual(len(grade["teacher"]), len(self.teachers))
+
+	def test_bulk_create_grade_constant_queries(self):
+		"""
+			Validar "POST /grade/bulk" con la misma cantidad de consultas sin importar el tamaño del lote
+		"""
+		self.client.force_authenticate(user = self.user_with_all_perm)
+
+		grades = self.get_grades(size = 41)
+
+		# La primera petición guarda en caché la pertenencia del usuario
+		self.client.post(self.URL_GRADE_BULK, grades[:1], format = "json")
+
+		few_queries, few_response = self.count_queries(
+			"post",
+			self.URL_GRADE_BULK,
+			grades[1:4]
+		)
+		many_queries, many_response = self.count_queries(
+			"post",
+			self.URL_GRADE_BULK,
+			grades[4:]
+		)
+
+		self.assertEqual(few_response.status_code, 201)
+		self.assertEqual(many_response.status_code, 201)
+		self.assertEqual(few_queries, many_queries)
+
+	def test_bulk_create_grade_with_invalid_relations(self):
+		"""
+			Validar "POST /grade/bulk" con personal administrativo y una etapa que no existe
+		"""
+		self.client.force_authenticate(user = self.user_with_all_perm)
+
+		admin, = bulk_create_school_staff(
+			size = 1,
+			school = self.school,
+			occupation = models.OccupationStaff.administrative
+		)
+
+		grades = self.get_grades(size = 3)
+		grades[1]["teacher"] = [admin.id]
+		grades[2]["stage"] = max(stage.id for stage in self.stages) + 1
+
+		response = self.client.post(
+			self.URL_GRADE_BULK,
+			grades,
+			format = "json"
+		)
+
+		responseStatus = response.status_code
+		responseJson = response.data
+
+		self.assertEqual(responseStatus, 400)
+		self.assertEqual(responseJson[0], {})
+		self.assertEqual(responseJson[1]["teacher"][0], serializers.ONLY_TEACHING_STAFF)
+		self.assertEqual(responseJson[2]["stage"][0], serializers.STAGE_DOES_NOT_EXIST)
+		self.assertFalse(models.Grade.objects.filter(school_id = self.school.id).exists())
+
+	def test_bulk_create_grade_with_invalid_teacher(self):
+		"""
+			Validar "POST /grade/bulk" con personal que no existe o es de otra escuela
+		"""
+		self.client.force_authenticate(user = self.user_with_all_perm)
+
+		other_teacher, = bulk_create_school_staff(
+			size = 1,
+			occupation = models.OccupationStaff.teacher
+		)
+
+		grades = self.get_grades(size = 3)
+		grades[1]["teacher"] = [self.teachers[0].id, other_teacher.id]
+		grades[2]["teacher"] = [max(teacher.id for teacher in self.teachers) + 100]
+
+		response = self.client.post(
+			self.URL_GRADE_BULK,
+			grades,
+			format = "json"
+		)
+
+		responseStatus = response.status_code
+		responseJson = response.data
+
+		self.assertEqual(responseStatus, 400)
+		self.assertEqual(responseJson[0], {})
+		self.assertEqual(responseJson[1]["teacher"], [serializers.STAFF_DOES_NOT_EXIST])
+		self.assertEqual(responseJson[2]["teacher"], [serializers.STAFF_DOES_NOT_EXIST])
+		self.assertFalse(models.Grade.objects.filter(school_id = self.school.id).exists())
+
+	def test_bulk_update_grade(self):
+		"""
+			Validar "PATCH /grade/bulk" cambiando los profesores
+		"""
+		self.client.force_authenticate(user = self.user_with_all_perm)
+
+		grades = bulk_create_grade(size = 2, school = self.school, stage = self.stages[1])
+
+		response = self.client.patch(
+			self.URL_GRADE_BULK,
+			[
+				{"id": grades[0].id, "teacher": [self.teachers[0].id]},
+				{"id": grades[1].id, "stage": self.stages[2].id},
+			],
+			format = "json"
+		)
+
+		responseStatus = response.status_code
+		responseJson = response.data
+
+		self.assertEqual(responseStatus, 200)
+		self.assertEqual(
+			list(models.Grade.objects.get(id = grades[0].id).teacher.values_list("id", flat = True)),
+			[self.teachers[0].id]
+		)
+		self.assertEqual(responseJson[1]["stage"], self.stages[2].type)
+		self.assertEqual(
+			models.Grade.objects.get(id = grades[1].id).stage_id,
+			self.stages[2].id
+		)
@@ -227,6 +227,82 @@ class CalendarListAPITest(testcases.CalendarTestCase):
 		self.assertEqual(responseStatus, 200)
 		self.assertEqual(responseJson["count"], total_calendar)
 
+	def test_get_calendar_by_cursor(self):
+		"""
+			Validar "GET /calendar?pagination=cursor"
+		"""
+		self.client.force_authenticate(user = self.user_with_all_perm)
+
+		calendar_ids = list(
+			models.Calendar.objects.filter(
+				school_id = self.school.id
+			).order_by("date", "id").values_list("id", flat = True)
+		)
+
+		ids = []
+		url = get_create_list_calendar_url(
+			school_id = self.school.id,
+			query = {"pagination": "cursor", "size": 10}
+		)
+
+		while url:
+			response = self.client.get(url)
+			
+			responseJson = response.data
+
+			self.assertEqual(response.status_code, 200)
+			self.assertNotIn("count", responseJson)
+
+			ids.extend(calendar["id"] for calendar in responseJson["results"])
+			url = responseJson["next"]
+
+		self.assertEqual(ids, calendar_ids)
+
+	def test_get_calendar_by_cursor_same_date(self):
+		"""
+			Validar "GET /calendar?pagination=cursor" con varios eventos en la misma fecha
+		"""
+		self.client.force_authenticate(user = self.user_with_all_perm)
+
+		bulk_create_calendar(
+			size = 7,
+			school = self.school,
+			date = self.create_date()
+		)
+
+		calendar_ids = list(
+			models.Calendar.objects.filter(
+				school_id = self.school.id
+			).order_by("date", "id").values_list("id", flat = True)
+		)
+
+		pages = []
+		url = get_create_list_calendar_url(
+			school_id = self.school.id,
+			query = {"pagination": "cursor", "size": 3}
+		)
+
+		while url:
+			response = self.client.get(url)
+
+			responseJson = response.data
+
+			self.assertEqual(response.status_code, 200)
+
+			pages.append([calendar["id"] for calendar in responseJson["results"]])
+			previous = responseJson["previous"]
+			url = responseJson["next"]
+
+		self.assertEqual(sum(pages, []), calendar_ids)
+
+		response = self.client.get(previous)
+
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual(
+			[calendar["id"] for calendar in response.data["results"]],
+			pages[-2]
+		)
+
 	def test_get_calendar_filter_by_month(self):
 		"""
 			Validar "GET /calendar?month=<...>&year=<...>"
@@ -0,0 +1,235 @@
+import csv, io, json
+
+from django.db import connection
+from django.urls import reverse
+from django.test.utils import CaptureQueriesContext
+
+from apps.school import models
+from apps.management.services import exports
+
+from tests.school.utils import (
+	bulk_create_calendar,
+	bulk_create_school_staff,
+	bulk_create_news,
+	create_calendar,
+	create_grade,
+	bulk_create_payment_report
+)
+from tests.user.utils import create_user
+
+from .utils import testcases
+
+
+def get_export_url(school_id, resource, **params):
+	url = reverse(
+		"management:export",
+		kwargs = {"pk": school_id, "resource": resource}
+	)
+
+	if params:
+		url += "?" + "&".join(f"{key}={value}" for key, value in params.items())
+
+	return url
+
+
+def read_csv(response) -> list[dict]:
+	content = b"".join(response.streaming_content).decode("utf-8")
+
+	return list(csv.DictReader(io.StringIO(content)))
+
+
+def read_ndjson(response) -> list[dict]:
+	content = b"".join(response.streaming_content).decode("utf-8")
+
+	return [json.loads(line) for line in content.splitlines()]
+
+
+class ExportAPITest(testcases.BulkTestCase):
+	def setUp(self):
+		super().setUp()
+
+		self.client.force_authenticate(user = self.user_with_all_perm)
+
+	def test_export_calendar_csv(self):
+		"""
+			Validar "GET /export/calendar" en formato CSV
+		"""
+		calendars = bulk_create_calendar(size = 15, school = self.school)
+		bulk_create_calendar(size = 5)
+
+		response = self.client.get(get_export_url(self.school.id, "calendar"))
+
+		responseStatus = response.status_code
+		rows = read_csv(response)
+
+		self.assertEqual(responseStatus, 200)
+		self.assertTrue(response.streaming)
+		self.assertEqual(response["Content-Type"], exports.CONTENT_TYPES[exports.FORMAT_CSV])
+		self.assertIn('filename="calendar.csv"', response["Content-Disposition"])
+		self.assertEqual(len(rows), len(calendars))
+		self.assertEqual(list(rows[0].keys()), list(exports.RESOURCES["calendar"].fields))
+		self.assertEqual(
+			{int(row["id"]) for row in rows},
+			{calendar.id for calendar in calendars}
+		)
+
+	def test_export_staff_ndjson(self):
+		"""
+			Validar "GET /export/staff" en formato NDJSON
+		"""
+		staff = bulk_create_school_staff(size = 10, school = self.school)
+
+		response = self.client.get(
+			get_export_url(self.school.id, "staff", output = "ndjson")
+		)
+
+		responseStatus = response.status_code
+		rows = read_ndjson(response)
+
+		self.assertEqual(responseStatus, 200)
+		self.assertEqual(response["Content-Type"], exports.CONTENT_TYPES[exports.FORMAT_NDJSON])
+		self.assertEqual(len(rows), len(staff))
+		self.assertEqual(
+			rows[0],
+			{"id": staff[0].id, "name": staff[0].name, "occupation": staff[0].occupation}
+		)
+
+	def test_export_csv_escape_formula(self):
+		"""
+			Validar que "GET /export/calendar" (CSV) escape los textos que inician una fórmula
+		"""
+		calendar = create_calendar(
+			school = self.school,
+			title = '=HYPERLINK("http://example.com")',
+			description = "@SUM(A1:A2)"
+		)
+
+		rows = read_csv(self.client.get(get_export_url(self.school.id, "calendar")))
+
+		self.assertEqual(rows[0]["title"], f"'{calendar.title}")
+		self.assertEqual(rows[0]["description"], f"'{calendar.description}")
+
+		for value in ("+1", "-1", "\t=1", "texto"):
+			with self.subTest(value = value):
+				expected = value if value == "texto" else f"'{value}"
+
+				self.assertEqual(exports.escape_formula(value), expected)
+
+		self.assertEqual(exports.escape_formula(-1), -1)
+
+		rows = read_ndjson(
+			self.client.get(get_export_url(self.school.id, "calendar", output = "ndjson"))
+		)
+
+		self.assertEqual(rows[0]["title"], calendar.title)
+
+	def test_export_news_with_filter(self):
+		"""
+			Validar "GET /export/news" usando los filtros de la lista
+		"""
+		bulk_create_news(size = 5, school = self.school, status = models.News.TypeStatus.published)
+		pending = bulk_create_news(size = 3, school = self.school, status = models.News.TypeStatus.pending)
+
+		response = self.client.get(
+			get_export_url(self.school.id, "news", status = models.News.TypeStatus.pending)
+		)
+
+		rows = read_csv(response)
+
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual(
+			{int(row["id"]) for row in rows},
+			{news.id for news in pending}
+		)
+
+	def test_export_payment_report(self):
+		"""
+			Validar "GET /export/payment" filtrando por grado
+		"""
+		grade = create_grade(school = self.school, stage = self.stages[0])
+		other_grade = create_grade(school = self.school, stage = self.stages[1])
+
+		payments = bulk_create_payment_report(size = 4, school = self.school, grade = grade)
+		bulk_create_payment_report(size = 2, school = self.school, grade = other_grade)
+
+		response = self.client.get(
+			get_export_url(self.school.id, "payment", grade = grade.id, output = "ndjson")
+		)
+
+		rows = read_ndjson(response)
+
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual(
+			{row["id"] for row in rows},
+			{payment.id for payment in payments}
+		)
+		self.assertTrue(all(row["grade_id"] == grade.id for row in rows))
+
+	def test_export_with_invalid_filter(self):
+		"""
+			Validar "GET /export/calendar" con un filtro invalido
+		"""
+		response = self.client.get(
+			get_export_url(self.school.id, "calendar", year = "fecha")
+		)
+
+		self.assertEqual(response.status_code, 400)
+		self.assertIn("year", response.data)
+
+	def test_export_unsupported_format(self):
+		"""
+			Validar "GET /export/calendar" con un formato no soportado
+		"""
+		response = self.client.get(
+			get_export_url(self.school.id, "calendar", output = "xml")
+		)
+
+		self.assertEqual(response.status_code, 400)
+		self.assertEqual(response.data["errors"][0]["message"], exports.UNSUPPORTED_FORMAT)
+
+	def test_export_unknown_resource(self):
+		"""
+			Validar "GET /export/<recurso>" con un recurso que no existe
+		"""
+		response = self.client.get(get_export_url(self.school.id, "grade"))
+
+		self.assertEqual(response.status_code, 404)
+
+	def test_export_from_other_school(self):
+		"""
+			Validar "GET /export/calendar" de una escuela a la que no pertenecemos
+		"""
+		self.client.force_authenticate(user = create_user(role = 0))
+
+		response = self.client.get(get_export_url(self.school.id, "calendar"))
+
+		self.assertEqual(response.status_code, 403)
+
+
+class ExportQuerysetTest(testcases.BulkTestCase):
+
+	def test_export_by_chunks(self):
+		"""
+			Validar que la exportación lea los registros en bloques y no instancie modelos
+		"""
+		for index in range(30):
+			create_calendar(school = self.school)
+
+		queryset = models.Calendar.objects.filter(school_id = self.school.id)
+
+		stream = exports.export_queryset(
+			resource_name = "calendar",
+			queryset = queryset,
+			file_format = exports.FORMAT_CSV,
+			chunk_size = 10
+		)
+
+		with CaptureQueriesContext(connection) as queries:
+			header = next(stream)
+
+			self.assertEqual(header.strip(), ",".join(exports.RESOURCES["calendar"].fields))
+
+			lines = [header, *stream]
+
+		self.assertEqual(len(lines), 31)
+		self.assertLessEqual(len(queries), 1)
@@ -0,0 +1,156 @@
+import io
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from PIL import Image
+
+from apps.school import models
+from apps.management.commands import commands
+from apps.management.services import images, storage
+
+from .utils import list_upload_files
+
+# 'Orientation' = 6: la cámara estaba girada 90°
+EXIF_ORIENTATION = 0x0112
+EXIF_MAKE = 0x010F
+
+
+def create_image(width: int, height: int, image_format: str = "JPEG", name: str = "foto.jpg") -> SimpleUploadedFile:
+	image = Image.new("RGB", (width, height), color = (120, 30, 200))
+
+	exif = Image.Exif()
+	exif[EXIF_ORIENTATION] = 6
+	exif[EXIF_MAKE] = "Camara"
+
+	buffer = io.BytesIO()
+	image.save(buffer, format = image_format, exif = exif)
+
+	return SimpleUploadedFile(
+		name, 
+		buffer.getvalue(), 
+		content_type = f"image/{image_format.lower()}"
+	)
+
+
+def open_content(content) -> Image.Image:
+	return Image.open(io.BytesIO(content.read() if hasattr(content, "read") else content))
+
+
+@override_settings(SCHOOL_IMAGES = {
+	"FORMAT": "WEBP",
+	"QUALITY": 80,
+	"RENDITIONS": {"thumbnail": 100, "medium": 400, "full": 1000},
+})
+class ImageRenditionsTest(SimpleTestCase):
+
+	def test_create_renditions(self):
+		"""
+			Validar crear las versiones de una imagen sin EXIF y con la orientación aplicada
+		"""
+		file = create_image(width = 800, height = 600)
+
+		renditions = images.create_renditions(file, "news/foto.jpg")
+
+		self.assertEqual(
+			[(rendition, name) for rendition, name, _ in renditions],
+			[
+				("full", "news/foto_full.webp"),
+				("medium", "news/foto_medium.webp"),
+				("thumbnail", "news/foto_thumbnail.webp"),
+			]
+		)
+
+		sizes = {}
+
+		for rendition, _, content in renditions:
+			image = open_content(content)
+
+			self.assertEqual(image.format, "WEBP")
+			self.assertFalse(image.getexif())
+			self.assertEqual(content.content_type, "image/webp")
+
+			sizes[rendition] = image.size
+
+		# La imagen original es 800x600 girada 90°, la versión 'full' no se agranda
+		self.assertEqual(sizes["full"], (600, 800))
+		self.assertEqual(sizes["medium"], (300, 400))
+		self.assertEqual(sizes["thumbnail"], (75, 100))
+
+	def test_create_renditions_jpeg(self):
+		"""
+			Validar crear las versiones en formato JPEG
+		"""
+		file = create_image(width = 500, height = 500, image_format = "PNG", name = "logo.png")
+
+		with override_settings(SCHOOL_IMAGES = {"FORMAT": "JPEG", "RENDITIONS": {"thumbnail": 50}}):
+			renditions = images.create_renditions(file, "logo/logo.png")
+
+		self.assertEqual(len(renditions), 1)
+
+		_, name, content = renditions[0]
+
+		self.assertEqual(name, "logo/logo_thumbnail.jpg")
+		self.assertEqual(open_content(content).format, "JPEG")
+
+	def test_create_renditions_without_image(self):
+		"""
+			Validar que los archivos que no son imágenes (o son GIF) no tengan versiones
+		"""
+		gif = list_upload_files(size = 1, type_file = "image")[0]
+		gif.content_type = "image/gif"
+
+		file = SimpleUploadedFile("foto.jpg", b"no es una imagen", content_type = "image/jpeg")
+
+		self.assertEqual(images.create_renditions(gif, "news/foto.gif"), [])
+		self.assertEqual(images.create_renditions(file, "news/foto.jpg"), [])
+
+	def test_upload_renditions(self):
+		"""
+			Validar crear las versiones de imágenes ya guardadas
+		"""
+		files = [create_image(width = 640, height = 480) for _ in range(3)]
+		backend = storage.MemoryStorage()
+
+		uploads = storage.upload_files(files = files, folder = storage.FOLDER_NEWS, storage = backend)
+		urls = [url for _, url in uploads] + ["https://otro.servidor.com/foto.jpg"]
+
+		renditions = storage.upload_renditions(urls = urls, storage = backend)
+
+		self.assertEqual(len(renditions), len(urls))
+		self.assertEqual(renditions[-1], {})
+		self.assertEqual(len(backend.files), len(files) * 4)
+
+		for (title, _), rendition in zip(uploads, renditions):
+			stem = title.rsplit(".", 1)[0]
+
+			self.assertEqual(set(rendition), {"thumbnail", "medium", "full"})
+			self.assertEqual(
+				rendition["thumbnail"], 
+				backend.url(f"{storage.FOLDER_NEWS}/{stem}_thumbnail.webp")
+			)
+
+
+@override_settings(
+	SCHOOL_STORAGE = {"BACKEND": "apps.management.services.storage.MemoryStorage"},
+	SCHOOL_JOBS = {"ALWAYS_EAGER": True}
+)
+class ImageRenditionsJobTest(TestCase):
+
+	def test_add_newsmedia_with_renditions(self):
+		"""
+			Validar crear las versiones de las imágenes de 'newsmedia' con la cola de tareas
+		"""
+		files = [create_image(width = 640, height = 480) for _ in range(2)]
+
+		command = commands.add_newsmedia(media = files)
+
+		media = models.NewsMedia.objects.filter(
+			id__in = [image.id for image in command.query]
+		)
+
+		self.assertEqual(len(media), len(files))
+
+		for image in media:
+			self.assertEqual(set(image.renditions), {"thumbnail", "medium", "full"})
+			self.assertTrue(image.renditions["thumbnail"].endswith("_thumbnail.webp"))
@@ -0,0 +1,364 @@
+import csv, io
+
+from django.db import connection
+from django.urls import reverse
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test.utils import CaptureQueriesContext
+
+from openpyxl import Workbook
+
+from apps.school import models
+from apps.management.apiv1.school import serializers
+from apps.management.services import imports
+
+from tests import faker
+from tests.school.utils import create_calendar, create_grade
+
+from .utils import testcases
+
+
+def get_import_url(school_id, resource):
+	return reverse(
+		"management:import",
+		kwargs = {"pk": school_id, "resource": resource}
+	)
+
+
+def create_csv(rows: list[dict], name: str = "data.csv") -> SimpleUploadedFile:
+	stream = io.StringIO()
+
+	writer = csv.DictWriter(stream, fieldnames = list(rows[0].keys()))
+	writer.writeheader()
+	writer.writerows(rows)
+
+	return SimpleUploadedFile(name, stream.getvalue().encode("utf-8"), content_type = "text/csv")
+
+
+def get_calendars(size: int = 1) -> list[dict]:
+	return [
+		{
+			"title": f"{faker.text(max_nb_chars = 20)} {index}",
+			"description": faker.paragraph(),
+			"date": faker.date_this_year().isoformat()
+		}
+		for index in range(size)
+	]
+
+
+class ImportAPITest(testcases.ImportTestCase):
+	def setUp(self):
+		super().setUp()
+
+		self.client.force_authenticate(user = self.user_with_all_perm)
+
+	def upload(self, resource: str, file: SimpleUploadedFile):
+		return self.client.post(
+			get_import_url(self.school.id, resource),
+			{"file": file},
+			format = "multipart"
+		)
+
+	def test_import_calendar(self):
+		"""
+			Validar "POST /import/calendar"
+		"""
+		calendars = get_calendars(size = 25)
+
+		response = self.upload("calendar", create_csv(calendars))
+
+		responseStatus = response.status_code
+		responseJson = response.data
+
+		self.assertEqual(responseStatus, 200)
+		self.assertEqual(responseJson["created"], len(calendars))
+		self.assertEqual(responseJson["failed"], 0)
+		self.assertEqual(
+			models.Calendar.objects.filter(school_id = self.school.id).count(),
+			len(calendars)
+		)
+
+	def test_import_calendar_with_row_errors(self):
+		"""
+			Validar "POST /import/calendar" con filas invalidas y duplicadas
+		"""
+		calendar = create_calendar(school = self.school)
+		calendars = get_calendars(size = 3)
+
+		calendars[1]["title"] = "a"
+		calendars[2]["date"] = "fecha"
+		calendars.append({"title": calendar.title, "description": "", "date": calendar.date.isoformat()})
+		calendars.append(calendars[0])
+
+		response = self.upload("calendar", create_csv(calendars))
+
+		responseStatus = response.status_code
+		responseJson = response.data
+
+		self.assertEqual(responseStatus, 200)
+		self.assertEqual(responseJson["created"], 1)
+		self.assertEqual(responseJson["failed"], 4)
+		self.assertEqual(
+			[(error["row"], error["field"]) for error in responseJson["errors"]],
+			[(3, "title"), (4, "date"), (5, None), (6, None)]
+		)
+		self.assertEqual(responseJson["errors"][2]["message"], imports.ROW_ALREADY_EXISTS)
+		self.assertEqual(responseJson["errors"][3]["message"], imports.ROW_DUPLICATED)
+
+	def test_import_staff(self):
+		"""
+			Validar "POST /import/staff"
+		"""
+		staff = [
+			{"name": faker.name(), "occupation": models.OccupationStaff.teacher},
+			{"name": faker.name(), "occupation": ""},
+			{"name": faker.name(), "occupation": "director"},
+		]
+
+		response = self.upload("staff", create_csv(staff))
+
+		responseStatus = response.status_code
+		responseJson = response.data
+
+		self.assertEqual(responseStatus, 200)
+		self.assertEqual(responseJson["created"], 2)
+		self.assertEqual(responseJson["errors"][0]["row"], 4)
+		self.assertEqual(responseJson["errors"][0]["field"], "occupation")
+		self.assertEqual(
+			models.SchoolStaff.objects.filter(
+				school_id = self.school.id,
+				occupation = models.OccupationStaff.administrative
+			).count(),
+			1
+		)
+
+	def test_import_grade(self):
+		"""
+			Validar "POST /import/grade" con una etapa que no existe
+		"""
+		grades = [
+			{
+				"name": faker.text(max_nb_chars = models.MAX_LENGTH_GRADE_NAME),
+				"level": level,
+				"section": "a",
+				"stage_id": self.stages[0].id
+			}
+			for level in range(1, 4)
+		]
+		grades[2]["stage_id"] = max(stage.id for stage in self.stages) + 1
+
+		response = self.upload("grade", create_csv(grades))
+
+		responseStatus = response.status_code
+		responseJson = response.data
+
+		self.assertEqual(responseStatus, 200)
+		self.assertEqual(responseJson["created"], 2)
+		self.assertEqual(responseJson["errors"][0]["row"], 4)
+		self.assertEqual(responseJson["errors"][0]["message"], imports.STAGE_DOES_NOT_EXIST)
+
+	def test_import_payment_report(self):
+		"""
+			Validar "POST /import/payment" con un grado de otra escuela
+		"""
+		grade = create_grade(school = self.school, stage = self.stages[0])
+		other_grade = create_grade(stage = self.stages[0])
+
+		payments = [
+			{"fullname_student": faker.name(), "payment_detail": faker.url(), "grade_id": grade.id},
+			{"fullname_student": faker.name(), "payment_detail": faker.url(), "grade_id": ""},
+			{"fullname_student": faker.name(), "payment_detail": faker.url(), "grade_id": other_grade.id},
+		]
+
+		response = self.upload("payment", create_csv(payments))
+
+		responseStatus = response.status_code
+		responseJson = response.data
+
+		self.assertEqual(responseStatus, 200)
+		self.assertEqual(responseJson["created"], 2)
+		self.assertEqual(responseJson["errors"][0]["message"], imports.GRADE_DOES_NOT_EXIST)
+		self.assertEqual(
+			models.PaymentReport.objects.filter(school_id = self.school.id, grade = grade).count(),
+			1
+		)
+
+	def test_import_payment_info(self):
+		"""
+			Validar "POST /import/payment-info"
+		"""
+		payments = [
+			{"title": faker.text(max_nb_chars = 20), "photo": faker.image_url(), "description": faker.paragraph()},
+			{"title": "", "photo": faker.image_url(), "description": ""},
+			{"title": faker.text(max_nb_chars = 20), "photo": "imagen", "description": ""},
+		]
+
+		response = self.upload("payment-info", create_csv(payments))
+
+		responseStatus = response.status_code
+		responseJson = response.data
+
+		self.assertEqual(responseStatus, 200)
+		self.assertEqual(responseJson["created"], 2)
+		self.assertEqual(responseJson["errors"][0]["row"], 4)
+		self.assertEqual(responseJson["errors"][0]["field"], "photo")
+		self.assertEqual(models.PaymentInfo.objects.filter(school_id = self.school.id).count(), 2)
+
+	def test_import_unsupported_format(self):
+		"""
+			Validar "POST /import/calendar" con un archivo que no es CSV o XLSX
+		"""
+		response = self.upload(
+			"calendar",
+			SimpleUploadedFile("data.txt", b"title,date", content_type = "text/plain")
+		)
+
+		responseStatus = response.status_code
+		responseJson = response.data
+
+		self.assertEqual(responseStatus, 400)
+		self.assertEqual(responseJson["errors"][0]["message"], imports.UNSUPPORTED_FORMAT)
+
+	def test_import_unknown_resource(self):
+		"""
+			Validar "POST /import/<recurso>" con un recurso que no existe
+		"""
+		response = self.upload("news", create_csv(get_calendars(size = 1)))
+
+		self.assertEqual(response.status_code, 404)
+
+	def test_import_without_perm(self):
+		"""
+			Validar "POST /import/calendar" sin permisos
+		"""
+		self.client.force_authenticate(user = self.user_without_perm)
+
+		response = self.upload("calendar", create_csv(get_calendars(size = 1)))
+
+		self.assertEqual(response.status_code, 403)
+
+	def test_import_calendar_xlsx(self):
+		"""
+			Validar "POST /import/calendar" con un archivo XLSX
+		"""
+		calendars = get_calendars(size = 5)
+
+		workbook = Workbook()
+		sheet = workbook.active
+		sheet.append(list(calendars[0].keys()))
+
+		for calendar in calendars:
+			sheet.append(list(calendar.values()))
+
+		stream = io.BytesIO()
+		workbook.save(stream)
+
+		response = self.upload(
+			"calendar",
+			SimpleUploadedFile("data.xlsx", stream.getvalue())
+		)
+
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual(response.data["created"], len(calendars))
+
+
+class ImportFileTest(testcases.ImportTestCase):
+
+	def test_import_by_batches(self):
+		"""
+			Validar la importación por lotes, con una cantidad de consultas por lote
+		"""
+		calendars = get_calendars(size = 50)
+
+		with CaptureQueriesContext(connection) as few_queries:
+			few = imports.import_file(
+				resource_name = "calendar",
+				school_id = self.school.id,
+				file = create_csv(calendars[:10]),
+				name = "data.csv",
+				batch_size = 10
+			)
+
+		with CaptureQueriesContext(connection) as many_queries:
+			many = imports.import_file(
+				resource_name = "calendar",
+				school_id = self.school.id,
+				file = create_csv(calendars[10:]),
+				name = "data.csv",
+				batch_size = 10
+			)
+
+		self.assertEqual(few.created, 10)
+		self.assertEqual(many.created, 40)
+		self.assertEqual(len(many_queries), 4 * len(few_queries))
+
+	def test_import_max_errors(self):
+		"""
+			Validar que solo se guarden los primeros errores del archivo
+		"""
+		calendars = get_calendars(size = 20)
+
+		for calendar in calendars:
+			calendar["title"] = "a"
+
+		with self.settings(SCHOOL_IMPORT = {"MAX_ERRORS": 5}):
+			result = imports.import_file(
+				resource_name = "calendar",
+				school_id = self.school.id,
+				file = create_csv(calendars),
+				name = "data.csv"
+			)
+
+		self.assertEqual(result.created, 0)
+		self.assertEqual(result.failed, len(calendars))
+		self.assertEqual(len(result.errors), 5)
+
+	def test_import_duplicated_between_batches(self):
+		"""
+			Validar que las filas repetidas en otro lote se informen como existentes
+		"""
+		calendars = get_calendars(size = 4)
+		calendars.append(calendars[0])
+
+		result = imports.import_file(
+			resource_name = "calendar",
+			school_id = self.school.id,
+			file = create_csv(calendars),
+			name = "data.csv",
+			batch_size = 2
+		)
+
+		self.assertEqual(result.created, 4)
+		self.assertEqual(result.errors, [{"row": 6, "field": None, "message": imports.ROW_ALREADY_EXISTS}])
+
+	def test_import_invalid_encoding_after_first_batch(self):
+		"""
+			Validar que un error de codificación después de guardar un lote
+			informe los registros ya creados
+		"""
+		calendars = get_calendars(size = 200)
+		file = create_csv(calendars)
+
+		# 'TextIOWrapper' decodifica por bloques, el byte inválido queda
+		# fuera del primer bloque
+		content = file.read() + b"\xff\xfe,a,b\r\n"
+		self.assertGreater(len(content), 8192 * 2)
+
+		result = imports.import_file(
+			resource_name = "calendar",
+			school_id = self.school.id,
+			file = SimpleUploadedFile("data.csv", content, content_type = "text/csv"),
+			name = "data.csv",
+			batch_size = 10
+		)
+
+		total_calendar = models.Calendar.objects.filter(school_id = self.school.id).count()
+
+		self.assertGreater(result.created, 0)
+		self.assertEqual(result.created, total_calendar)
+		self.assertEqual(
+			result.errors[-1],
+			{"row": None, "field": None, "message": imports.INVALID_FILE}
+		)
+		self.assertIsNone(
+			serializers.MSchoolImportResponse(result.data).data["errors"][-1]["row"]
+		)
@@ -2,6 +2,10 @@ import pprint
 
 from django.urls import reverse
 
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from apps.management.services import membership
+
 from tests import faker
 from tests.user.utils import create_user
 
@@ -47,6 +51,26 @@ class AdminLoginAPITest(testcases.AdminTokenTestCase):
 		self.assertEqual(school["subdomain"], self.school.subdomain)
 		self.assertEqual(school["name"], self.school.name)
 
+	def test_validate_login_token_claims(self):
+		"""
+			Validar que los tokens de "POST /login" llevan la escuela del usuario
+		"""
+		response = self.client.post(
+			self.URL_LOGIN,
+			self.credentials,
+			HTTP_X_SCHOOL_SUBDOMAIN = self.school.subdomain
+		)
+
+		auth = response.data["auth"]
+
+		for token in (AccessToken(auth["access"]), RefreshToken(auth["refresh"])):
+			self.assertEqual(token["school_id"], str(self.school.id))
+			self.assertIn(self.school.id, token[membership.CLAIM_SCHOOLS])
+			self.assertEqual(
+				token[membership.CLAIM_VERSION], 
+				membership.get_version(self.user.id)
+			)
+
 
 	def test_validate_login_with_wrong_credentials(self):
 		"""
@@ -0,0 +1,230 @@
+from django.urls import reverse
+
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.school import models as school_models
+from apps.management.services import membership
+
+from tests.school.utils import create_school, create_news
+
+from .utils import testcases
+from .utils.utils import get_administrator
+
+
+class MembershipTest(testcases.NewsTestCase):
+	def setUp(self):
+		super().setUp()
+		membership.get_cache().clear()
+
+		self.user = self.user_with_all_perm
+		self.news = create_news(school = self.school)
+
+	def test_is_member_from_cache(self):
+		"""
+			Validar que la pertenencia del usuario a la escuela se consulta
+			una sola vez
+		"""
+		with self.assertNumQueries(1):
+			self.assertTrue(membership.is_member(self.user.id, self.school.id))
+
+		with self.assertNumQueries(0):
+			self.assertTrue(membership.is_member(self.user.id, self.school.id))
+			self.assertTrue(membership.is_member(self.user.id, str(self.school.id)))
+			self.assertFalse(membership.is_member(self.user.id, self.school.id + 1))
+			self.assertFalse(membership.is_member(None, self.school.id))
+			self.assertFalse(membership.is_member(self.user.id, None))
+
+	def test_object_school_from_cache(self):
+		"""
+			Validar que la escuela de un registro se consulta una sola vez
+		"""
+		with self.assertNumQueries(1):
+			school_id = membership.get_object_school(school_models.News, self.news.id)
+
+		with self.assertNumQueries(0):
+			school_id_cache = membership.get_object_school(school_models.News, self.news.id)
+
+		self.assertEqual(school_id, self.school.id)
+		self.assertEqual(school_id_cache, self.school.id)
+
+	def test_remove_user_invalidate_cache(self):
+		"""
+			Validar que al quitar o agregar un usuario a la administración
+			de la escuela se actualiza su pertenencia
+		"""
+		admin = get_administrator(school_id = self.school.id)
+
+		self.assertTrue(membership.is_member(self.user.id, self.school.id))
+
+		admin.users.remove(self.user)
+
+		self.assertFalse(membership.is_member(self.user.id, self.school.id))
+
+		self.user.administrator_set.add(admin)
+
+		self.assertTrue(membership.is_member(self.user.id, self.school.id))
+
+		admin.users.clear()
+
+		self.assertFalse(membership.is_member(self.user.id, self.school.id))
+
+	def test_delete_school_invalidate_cache(self):
+		"""
+			Validar que al eliminar la escuela el usuario deja de pertenecer a ella
+		"""
+		school_id = self.school.id
+
+		self.assertTrue(membership.is_member(self.user.id, school_id))
+
+		self.school.delete()
+
+		self.assertFalse(membership.is_member(self.user.id, school_id))
+
+	def test_delete_object_invalidate_cache(self):
+		"""
+			Validar que al eliminar un registro se elimina su escuela del caché
+		"""
+		news_id = self.news.id
+		membership.get_object_school(school_models.News, news_id)
+
+		self.news.delete()
+
+		self.assertIsNone(membership.get_object_school(school_models.News, news_id))
+
+	def test_get_news_detail_without_membership_queries(self):
+		"""
+			Validar que "GET /management/school/news/:id" no consulta la
+			pertenencia del usuario después de la primera petición
+		"""
+		url = reverse("management:news-detail", kwargs = {"pk": self.news.id})
+
+		self.client.force_authenticate(user = self.user)
+
+		response = self.client.get(url)
+
+		self.assertEqual(response.status_code, 200)
+
+		self.assertIsNotNone(membership.get_cache().get(membership.user_key(self.user.id)))
+		self.assertIsNotNone(
+			membership.get_cache().get(
+				membership.object_key(school_models.News, self.news.id)
+			)
+		)
+
+	def test_get_news_detail_other_school(self):
+		"""
+			Generar [Error 403] "GET /management/school/news/:id" con
+			un registro de otra escuela
+		"""
+		other_news = create_news(school = create_school())
+		url = reverse("management:news-detail", kwargs = {"pk": other_news.id})
+
+		self.client.force_authenticate(user = self.user)
+
+		response = self.client.get(url)
+
+		self.assertEqual(response.status_code, 403)
+
+
+class MembershipClaimsTest(testcases.NewsTestCase):
+	def setUp(self):
+		super().setUp()
+		membership.get_cache().clear()
+
+		self.user = self.user_with_all_perm
+		self.token = AccessToken.for_user(self.user)
+		membership.add_claims(self.token, user_id = self.user.id)
+
+		# Solo se debe usar la información del token
+		membership.get_cache().delete(membership.user_key(self.user.id))
+
+	def test_is_member_from_claims(self):
+		"""
+			Validar que la pertenencia se obtiene del token sin consultar
+			la base de datos
+		"""
+		with self.assertNumQueries(0):
+			self.assertTrue(
+				membership.is_member(self.user.id, self.school.id, token = self.token)
+			)
+			self.assertFalse(
+				membership.is_member(self.user.id, self.school.id + 1, token = self.token)
+			)
+
+	def test_is_member_with_stale_claims(self):
+		"""
+			Validar que con un token desactualizado se consulta
+			la base de datos
+		"""
+		admin = get_administrator(school_id = self.school.id)
+		admin.users.remove(self.user)
+
+		with self.assertNumQueries(1):
+			self.assertFalse(
+				membership.is_member(self.user.id, self.school.id, token = self.token)
+			)
+
+	def test_is_member_with_evicted_version(self):
+		"""
+			Validar que si la versión ya no está en caché el token
+			se considera desactualizado
+		"""
+		membership.get_cache().delete(membership.version_key(self.user.id))
+
+		with self.assertNumQueries(1):
+			self.assertTrue(
+				membership.is_member(self.user.id, self.school.id, token = self.token)
+			)
+
+	def test_is_member_with_claims_disabled(self):
+		"""
+			Validar que con 'ADMIN_TOKEN_CLAIMS = False' no se usa el token
+		"""
+		with self.settings(ADMIN_TOKEN_CLAIMS = False):
+			with self.assertNumQueries(1):
+				self.assertTrue(
+					membership.is_member(self.user.id, self.school.id, token = self.token)
+				)
+
+	def test_get_news_with_token(self):
+		"""
+			Validar "GET /management/school/:id/news" autenticado con el token
+		"""
+		self.client.credentials(HTTP_AUTHORIZATION = f"Bearer {self.token}")
+
+		response = self.client.get(
+			reverse("management:news-list-create", kwargs = {"pk": self.school.id})
+		)
+
+		self.assertEqual(response.status_code, 200)
+		# El permiso no necesitó consultar la pertenencia del usuario
+		self.assertIsNone(membership.get_cache().get(membership.user_key(self.user.id)))
+
+	def test_is_member_verify_with_stale_cache(self):
+		"""
+			Validar que las escrituras ('verify') consultan la base de datos
+			aunque el caché (de otro proceso) y el token sigan vigentes
+		"""
+		cache = membership.get_cache()
+		version = cache.get(membership.version_key(self.user.id))
+
+		get_administrator(school_id = self.school.id).users.remove(self.user)
+
+		# Caché de otro proceso que no recibió la invalidación
+		cache.set(membership.version_key(self.user.id), version, timeout = None)
+		cache.set(membership.user_key(self.user.id), frozenset([self.school.id]))
+
+		self.assertTrue(membership.is_member(self.user.id, self.school.id, token = self.token))
+		self.assertFalse(
+			membership.is_member(self.user.id, self.school.id, token = self.token, verify = True)
+		)
+
+		self.client.credentials(HTTP_AUTHORIZATION = f"Bearer {self.token}")
+
+		response = self.client.post(
+			reverse("management:news-list-create", kwargs = {"pk": self.school.id}),
+			{"title": "Noticia", "description": "Descripción de la noticia"},
+			format = "json"
+		)
+
+		self.assertEqual(response.status_code, 403)
@@ -0,0 +1,298 @@
+import csv, io
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+
+from apps.school import models
+from apps.management.apiv1.school.urls import urlpatterns
+
+from tests import faker
+from tests.queries import load_budgets, query_budget
+
+from .utils import testcases
+
+# Registros por cada petición 'bulk' o 'import'
+SIZE_BATCH = 20
+
+
+def create_csv(rows: list[dict], name: str = "data.csv") -> SimpleUploadedFile:
+	stream = io.StringIO()
+
+	writer = csv.DictWriter(stream, fieldnames = list(rows[0].keys()))
+	writer.writeheader()
+	writer.writerows(rows)
+
+	return SimpleUploadedFile(name, stream.getvalue().encode("utf-8"), content_type = "text/csv")
+
+
+def get_calendars(size: int = 1) -> list[dict]:
+	return [
+		{
+			"title": f"{faker.text(max_nb_chars = 20)} {index}",
+			"description": faker.paragraph(),
+			"date": faker.date_this_year().isoformat()
+		}
+		for index in range(size)
+	]
+
+
+def get_coordinates(size: int = 1) -> list[dict]:
+	coordinates = []
+
+	for index in range(size):
+		latitude, longitude, *_ = faker.local_latlng(country_code = "VE")
+
+		coordinates.append({
+			"title": f"{faker.text(max_nb_chars = 20)} {index}",
+			"latitude": latitude,
+			"longitude": longitude
+		})
+
+	return coordinates
+
+
+class ManagementQueryBudgetTest(testcases.QueryBudgetTestCase):
+
+	def get(self, url_name: str, **kwargs):
+		response = self.client.get(reverse(url_name, **kwargs))
+
+		self.assertEqual(response.status_code, 200)
+
+		return response
+
+	def post_bulk(self, resource: str, data: list[dict]):
+		response = self.client.post(
+			reverse(f"management:{resource}-bulk", kwargs = {"pk": self.school.id}),
+			data,
+			format = "json"
+		)
+
+		self.assertEqual(response.status_code, 201)
+		self.assertEqual(len(response.data), len(data))
+
+		return response
+
+	def test_all_urls_have_budget(self):
+		"""
+			Validar que cada URL de 'management' (escuela) tenga un presupuesto de consultas
+		"""
+		budgets = load_budgets()
+
+		for pattern in urlpatterns:
+			with self.subTest(url_name = pattern.name):
+				self.assertIn(f"management:{pattern.name}", budgets)
+
+	@query_budget("management:news-list-create")
+	def test_news(self):
+		"""
+			Validar "GET /school/:id/news/" dentro de su presupuesto de consultas
+		"""
+		self.get("management:news-list-create", kwargs = {"pk": self.school.id})
+
+	@query_budget("management:news-images-detail")
+	def test_news_images_detail(self):
+		"""
+			Validar "GET /school/news/images/:id" dentro de su presupuesto de consultas
+		"""
+		self.get("management:news-images-detail", kwargs = {"pk": self.news_media.id})
+
+	@query_budget("management:officehour-list-create")
+	def test_officehour(self):
+		"""
+			Validar "GET /school/:id/officehour/" dentro de su presupuesto de consultas
+		"""
+		self.get("management:officehour-list-create", kwargs = {"pk": self.school.id})
+
+	@query_budget("management:officehour-detail")
+	def test_officehour_detail(self):
+		"""
+			Validar "GET /school/officehour/:id/" dentro de su presupuesto de consultas
+		"""
+		self.get("management:officehour-detail", kwargs = {"pk": self.office_hours[0].id})
+
+	@query_budget("management:timegroup-list")
+	def test_timegroup(self):
+		"""
+			Validar "GET /school/:id/officehour/time" dentro de su presupuesto de consultas
+		"""
+		self.get("management:timegroup-list", kwargs = {"pk": self.school.id})
+
+	@query_budget("management:timegroup-detail")
+	def test_timegroup_detail(self):
+		"""
+			Validar "GET /school/officehour/time/:id" dentro de su presupuesto de consultas
+		"""
+		self.get("management:timegroup-detail", kwargs = {"pk": self.office_hours[0].time_group_id})
+
+	@query_budget("management:calendar-list-create")
+	def test_calendar(self):
+		"""
+			Validar "GET /school/:id/calendar" dentro de su presupuesto de consultas
+		"""
+		self.get("management:calendar-list-create", kwargs = {"pk": self.school.id})
+
+	@query_budget("management:calendar-detail")
+	def test_calendar_detail(self):
+		"""
+			Validar "GET /school/calendar/:id" dentro de su presupuesto de consultas
+		"""
+		self.get("management:calendar-detail", kwargs = {"pk": self.calendars[0].id})
+
+	@query_budget("management:calendar-bulk", method = "POST")
+	def test_calendar_bulk(self):
+		"""
+			Validar "POST /school/:id/calendar/bulk" dentro de su presupuesto de consultas
+		"""
+		self.post_bulk("calendar", get_calendars(size = SIZE_BATCH))
+
+	@query_budget("management:socialmedia-list-create")
+	def test_socialmedia(self):
+		"""
+			Validar "GET /school/:id/socialmedia" dentro de su presupuesto de consultas
+		"""
+		self.get("management:socialmedia-list-create", kwargs = {"pk": self.school.id})
+
+	@query_budget("management:socialmedia-detail")
+	def test_socialmedia_detail(self):
+		"""
+			Validar "GET /school/socialmedia/:id" dentro de su presupuesto de consultas
+		"""
+		self.get("management:socialmedia-detail", kwargs = {"pk": self.social_media[0].id})
+
+	@query_budget("management:coordinate-list-create")
+	def test_coordinate(self):
+		"""
+			Validar "GET /school/:id/coordinate" dentro de su presupuesto de consultas
+		"""
+		self.get("management:coordinate-list-create", kwargs = {"pk": self.school.id})
+
+	@query_budget("management:coordinate-detail")
+	def test_coordinate_detail(self):
+		"""
+			Validar "GET /school/coordinate/:id" dentro de su presupuesto de consultas
+		"""
+		self.get("management:coordinate-detail", kwargs = {"pk": self.coordinates[0].id})
+
+	@query_budget("management:coordinate-bulk", method = "POST")
+	def test_coordinate_bulk(self):
+		"""
+			Validar "POST /school/:id/coordinate/bulk" dentro de su presupuesto de consultas
+		"""
+		self.post_bulk("coordinate", get_coordinates(size = SIZE_BATCH))
+
+	@query_budget("management:staff-list-create")
+	def test_staff(self):
+		"""
+			Validar "GET /school/:id/staff" dentro de su presupuesto de consultas
+		"""
+		self.get("management:staff-list-create", kwargs = {"pk": self.school.id})
+
+	@query_budget("management:staff-detail")
+	def test_staff_detail(self):
+		"""
+			Validar "GET /school/staff/:id" dentro de su presupuesto de consultas
+		"""
+		self.get("management:staff-detail", kwargs = {"pk": self.staff[0].id})
+
+	@query_budget("management:staff-bulk", method = "POST")
+	def test_staff_bulk(self):
+		"""
+			Validar "POST /school/:id/staff/bulk" dentro de su presupuesto de consultas
+		"""
+		self.post_bulk("staff", [
+			{"name": faker.name(), "occupation": models.OccupationStaff.teacher}
+			for _ in range(SIZE_BATCH)
+		])
+
+	@query_budget("management:grade-list-create")
+	def test_grade(self):
+		"""
+			Validar "GET /school/:id/grade" dentro de su presupuesto de consultas
+		"""
+		self.get("management:grade-list-create", kwargs = {"pk": self.school.id})
+
+	@query_budget("management:grade-detail")
+	def test_grade_detail(self):
+		"""
+			Validar "GET /school/grade/:id" dentro de su presupuesto de consultas
+		"""
+		self.get("management:grade-detail", kwargs = {"pk": self.grades[0].id})
+
+	@query_budget("management:grade-bulk", method = "POST")
+	def test_grade_bulk(self):
+		"""
+			Validar "POST /school/:id/grade/bulk" (con profesores) dentro de su presupuesto de consultas
+		"""
+		self.post_bulk("grade", [
+			{
+				"name": faker.text(max_nb_chars = models.MAX_LENGTH_GRADE_NAME),
+				"level": (index % models.MAX_LENGTH_GRADE_LEVEL) + 1,
+				# Secciones distintas a las de 'setUpTestData'
+				"section": f"z{index}",
+				"stage": self.grades[0].stage_id,
+				"teacher": [teacher.id for teacher in self.teachers]
+			}
+			for index in range(SIZE_BATCH)
+		])
+
+	@query_budget("management:repository-list-create")
+	def test_repository(self):
+		"""
+			Validar "GET /school/:id/repository" dentro de su presupuesto de consultas
+		"""
+		self.get("management:repository-list-create", kwargs = {"pk": self.school.id})
+
+	@query_budget("management:repository-file-detail")
+	def test_repository_file_detail(self):
+		"""
+			Validar "GET /school/repository/file/:id" dentro de su presupuesto de consultas
+		"""
+		self.get("management:repository-file-detail", kwargs = {"pk": self.repository_file.id})
+
+	@query_budget("management:infraestructure-image-detail")
+	def test_infraestructure_image_detail(self):
+		"""
+			Validar "GET /school/infraestructure/image/:id" dentro de su presupuesto de consultas
+		"""
+		self.get(
+			"management:infraestructure-image-detail",
+			kwargs = {"pk": self.infraestructure_image.id}
+		)
+
+	@query_budget("management:infraestructure-list-create")
+	def test_infraestructure(self):
+		"""
+			Validar "GET /school/:id/infraestructure" dentro de su presupuesto de consultas
+		"""
+		self.get("management:infraestructure-list-create", kwargs = {"pk": self.school.id})
+
+	@query_budget("management:import", method = "POST")
+	def test_import(self):
+		"""
+			Validar "POST /school/:id/import/calendar" dentro de su presupuesto de consultas
+		"""
+		calendars = get_calendars(size = SIZE_BATCH)
+
+		response = self.client.post(
+			reverse("management:import", kwargs = {"pk": self.school.id, "resource": "calendar"}),
+			{"file": create_csv(calendars)},
+			format = "multipart"
+		)
+
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual(response.data["created"], len(calendars))
+
+	@query_budget("management:export")
+	def test_export(self):
+		"""
+			Validar "GET /school/:id/export/news" dentro de su presupuesto de consultas
+		"""
+		response = self.get(
+			"management:export",
+			kwargs = {"pk": self.school.id, "resource": "news"}
+		)
+
+		# Las consultas se realizan al leer la respuesta
+		content = b"".join(response.streaming_content).decode("utf-8")
+
+		self.assertEqual(len(content.splitlines()), len(self.news) + 1)
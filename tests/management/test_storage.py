@@ -0,0 +1,187 @@
+import time, tempfile, shutil, importlib
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.test import SimpleTestCase, override_settings
+from django.urls import clear_url_caches
+
+from botocore.exceptions import ClientError
+
+from school import urls
+
+from apps.management.services import storage
+
+from .utils import list_upload_files
+
+
+class SlowStorage(storage.MemoryStorage):
+	DELAY = 0.2
+
+	def save(self, file, name: str) -> str:
+		time.sleep(self.DELAY)
+
+		return super().save(file, name)
+
+
+class FakeS3Client:
+	def __init__(self):
+		self.uploads = []
+
+	def upload_fileobj(self, file, bucket, key, ExtraArgs = None):
+		self.uploads.append((bucket, key, file.read(), ExtraArgs))
+
+	def download_fileobj(self, bucket, key, file):
+		for upload_bucket, upload_key, content, _ in self.uploads:
+			if (upload_bucket, upload_key) == (bucket, key):
+				file.write(content)
+				return
+
+		# Lo que devuelve 'boto3' cuando el objeto no existe
+		raise ClientError(
+			{"Error": {"Code": "404", "Message": "Not Found"}},
+			"HeadObject"
+		)
+
+
+class StorageTest(SimpleTestCase):
+
+	def test_upload_files_in_parallel(self):
+		"""
+			Validar que los archivos se suban en paralelo y en el mismo orden
+		"""
+		files = list_upload_files(size = 4, type_file = "image")
+		backend = SlowStorage()
+
+		with override_settings(SCHOOL_STORAGE = {"MAX_WORKERS": 4}):
+			start = time.perf_counter()
+			uploads = storage.upload_files(files = files, folder = storage.FOLDER_NEWS, storage = backend)
+			elapsed = time.perf_counter() - start
+
+		self.assertEqual(len(uploads), len(files))
+		self.assertLess(elapsed, SlowStorage.DELAY * len(files))
+		self.assertEqual(
+			[url for _, url in uploads],
+			[backend.url(f"{storage.FOLDER_NEWS}/{title}") for title, _ in uploads]
+		)
+		self.assertEqual(len(backend.files), len(files))
+
+	def test_local_storage(self):
+		"""
+			Validar guardar los archivos en 'MEDIA_ROOT'
+		"""
+		location = tempfile.mkdtemp()
+		self.addCleanup(shutil.rmtree, location)
+
+		file = list_upload_files(size = 1, type_file = "image")[0]
+
+		with override_settings(
+			SCHOOL_STORAGE = {"BACKEND": "apps.management.services.storage.LocalStorage"},
+			MEDIA_ROOT = location,
+			MEDIA_URL = "https://cdn.school.com/media/"
+		):
+			url = storage.upload_file(file = file, folder = storage.FOLDER_LOGO)
+
+		name = url.removeprefix("https://cdn.school.com/media/")
+
+		self.assertTrue(name.startswith(f"{storage.FOLDER_LOGO}/"))
+		self.assertEqual(
+			(Path(location) / name).read_bytes(),
+			b"".join(file.chunks())
+		)
+
+	def test_s3_storage(self):
+		"""
+			Validar subir los archivos a un servicio compatible con S3
+		"""
+		client = FakeS3Client()
+		backend = storage.S3Storage(
+			bucket = "school",
+			endpoint_url = "http://localhost:9000",
+			client = client
+		)
+
+		files = list_upload_files(size = 3, type_file = "image")
+
+		uploads = storage.upload_files(files = files, folder = storage.FOLDER_INFRAESTRUCTURE, storage = backend)
+
+		self.assertEqual(len(client.uploads), len(files))
+		self.assertTrue(
+			all(url.startswith("http://localhost:9000/school/infraestructure/") for _, url in uploads)
+		)
+		self.assertEqual(
+			{extra["ContentType"] for *_, extra in client.uploads},
+			{file.content_type for file in files}
+		)
+
+	def test_s3_storage_open_deleted_file(self):
+		"""
+			Validar que abrir un archivo eliminado del bucket genere 'FileNotFoundError'
+		"""
+		backend = storage.S3Storage(
+			bucket = "school",
+			endpoint_url = "http://localhost:9000",
+			client = FakeS3Client()
+		)
+
+		file, = list_upload_files(size = 1, type_file = "image")
+		url = backend.save(file, "news/image.png")
+
+		with backend.open("news/image.png") as saved_file:
+			self.assertTrue(saved_file.read())
+
+		with self.assertRaises(FileNotFoundError):
+			backend.open("news/deleted.png")
+
+		self.assertEqual(
+			storage.upload_renditions(
+				urls = [backend.url("news/deleted.png")],
+				storage = backend
+			),
+			[{}]
+		)
+		self.assertTrue(url.endswith("news/image.png"))
+
+	def test_get_storage_from_settings(self):
+		"""
+			Validar crear el backend definido en 'SCHOOL_STORAGE'
+		"""
+		with override_settings(SCHOOL_STORAGE = {
+			"BACKEND": "apps.management.services.storage.MemoryStorage",
+			"OPTIONS": {"base_url": "http://testserver/media/"}
+		}):
+			backend = storage.get_storage()
+
+			self.assertIsInstance(backend, storage.MemoryStorage)
+			self.assertIs(backend, storage.get_storage())
+			self.assertEqual(backend.base_url, "http://testserver/media/")
+
+		self.assertNotIsInstance(storage.get_storage(), storage.MemoryStorage)
+
+	def test_media_root_for_tests(self):
+		"""
+			Validar que las pruebas no guarden los archivos en el 'media/' del repositorio
+		"""
+		self.assertNotEqual(
+			Path(settings.MEDIA_ROOT).resolve(),
+			(Path(settings.BASE_DIR) / "media").resolve()
+		)
+		self.assertTrue(Path(settings.MEDIA_ROOT).is_relative_to(tempfile.gettempdir()))
+
+	@override_settings(DEBUG = True, MEDIA_URL = "http://localhost:8000/media/")
+	def test_serve_local_storage(self):
+		"""
+			Validar que con DEBUG se sirvan los archivos de 'LocalStorage' en 'MEDIA_URL'
+		"""
+		importlib.reload(urls)
+		clear_url_caches()
+		self.addCleanup(clear_url_caches)
+		self.addCleanup(importlib.reload, urls)
+
+		file = list_upload_files(size = 1, type_file = "image")[0]
+
+		url = storage.upload_file(file = file, folder = storage.FOLDER_LOGO)
+		response = self.client.get(urlsplit(url).path)
+
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual(b"".join(response.streaming_content), b"".join(file.chunks()))
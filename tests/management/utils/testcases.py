@@ -1,3 +1,4 @@
+from django.contrib.auth.models import Permission
 from django.test import TransactionTestCase
 
 from rest_framework.test import APIClient, APITestCase
@@ -17,6 +18,7 @@ from tests.school.utils import (
 	create_time_group,
 	create_educational_stage
 )
+from tests.school.utils.testcases import QueryBudgetTestCase as SchoolQueryBudgetTestCase
 
 from .utils import get_long_string, get_administrator
 
@@ -792,3 +794,69 @@ class InfraestructureDetailDeleteUpdateTestCase(InfraestructureTestCase):
 			self.user_with_delete_perm,
 			self.user_with_change_perm
 		))
+
+
+class BulkTestCase(APITestCase):
+	def setUp(self):
+		self.client = APIClient()
+
+		self.school = create_school()
+
+		self.stages = [
+			create_educational_stage(type_number = 1),
+			create_educational_stage(type_number = 2),
+			create_educational_stage(type_number = 3),
+		]
+
+		self.user_with_all_perm = create_user(role = 0)
+		self.user_without_perm = create_user(role = 0)
+
+		permissions = get_permissions(codenames = [
+			f"{action}_{model}"
+			for action in ("add", "change", "delete")
+			for model in ("calendar", "coordinate", "schoolstaff", "grade")
+		])
+
+		self.user_with_all_perm.user_permissions.set(permissions)
+
+		self.admin = get_administrator(school_id = self.school.id)
+		self.admin.users.add(*(
+			self.user_with_all_perm,
+			self.user_without_perm
+		))
+
+
+class ImportTestCase(BulkTestCase):
+	def setUp(self):
+		super().setUp()
+
+		self.user_with_all_perm.user_permissions.add(
+			*get_permissions(codenames = ["add_paymentreport", "add_paymentinfo"])
+		)
+
+
+class QueryBudgetTestCase(SchoolQueryBudgetTestCase):
+	@classmethod
+	def setUpTestData(cls):
+		super().setUpTestData()
+
+		cls.user_with_all_perm = create_user(role = 0)
+		cls.user_with_all_perm.user_permissions.set(
+			Permission.objects.filter(content_type__app_label = "school")
+		)
+
+		admin = get_administrator(school_id = cls.school.id)
+		admin.users.add(cls.user_with_all_perm)
+
+		cls.news_media = cls.news[0].media.first()
+		cls.repository_file = cls.repositories[0].media.first()
+		cls.infraestructure_image = cls.infraestructures[0].media.first()
+		cls.teachers = list(school_models.SchoolStaff.objects.filter(
+			school = cls.school,
+			occupation = school_models.OccupationStaff.teacher
+		)[:3])
+
+	def setUp(self):
+		super().setUp()
+
+		self.client.force_authenticate(user = self.user_with_all_perm)
@@ -0,0 +1,181 @@
+from unittest.mock import patch
+
+from django.urls import reverse
+from django.test import TestCase, SimpleTestCase, override_settings
+
+from psycopg_pool import ConnectionPool
+
+from apps.monitoring.services import pool, prometheus
+from school.database import configure_database
+
+POSTGRESQL = {
+	"ENGINE": "django.db.backends.postgresql",
+	"NAME": "school",
+	"HOST": "localhost",
+}
+
+SQLITE = {
+	"ENGINE": "django.db.backends.sqlite3",
+	"NAME": "db.sqlite3",
+}
+
+STATS = {
+	"pool_min": 2,
+	"pool_max": 20,
+	"pool_size": 8,
+	"pool_available": 3,
+	"requests_waiting": 4,
+	"requests_num": 120,
+	"requests_wait_ms": 2500,
+}
+
+
+class DatabaseConfigTest(SimpleTestCase):
+
+	def test_configure_database_with_pool(self):
+		"""
+			Validar que con PostgreSQL se configure el pool de conexiones
+		"""
+		database = configure_database(POSTGRESQL, {
+			"MIN_SIZE": 4,
+			"MAX_SIZE": 40,
+			"TIMEOUT": 5,
+			"CONN_MAX_AGE": 60,
+		})
+
+		self.assertEqual(database["CONN_MAX_AGE"], 0)
+		self.assertTrue(database["CONN_HEALTH_CHECKS"])
+		self.assertEqual(database["OPTIONS"]["pool"]["min_size"], 4)
+		self.assertEqual(database["OPTIONS"]["pool"]["max_size"], 40)
+		self.assertEqual(database["OPTIONS"]["pool"]["timeout"], 5)
+		self.assertNotIn("OPTIONS", POSTGRESQL)
+
+	def test_configure_database_without_pool(self):
+		"""
+			Validar que sin el pool se usen conexiones persistentes
+		"""
+		disabled = configure_database(POSTGRESQL, {"ENABLED": False, "CONN_MAX_AGE": 60})
+		sqlite = configure_database(SQLITE, {"CONN_MAX_AGE": 60, "HEALTH_CHECKS": False})
+
+		self.assertNotIn("pool", disabled["OPTIONS"])
+		self.assertEqual(disabled["CONN_MAX_AGE"], 60)
+
+		self.assertNotIn("pool", sqlite["OPTIONS"])
+		self.assertEqual(sqlite["CONN_MAX_AGE"], 60)
+		self.assertFalse(sqlite["CONN_HEALTH_CHECKS"])
+
+
+class PoolMetricsTest(SimpleTestCase):
+
+	def test_collect_pool_metrics(self):
+		"""
+			Validar las métricas del pool en el formato de Prometheus
+		"""
+		with patch.object(pool, "get_pool_stats", return_value = {"default": STATS}):
+			content = prometheus.render(pool.collect_pool_metrics())
+
+		self.assertIn("# TYPE school_db_pool_in_use gauge", content)
+		self.assertIn('school_db_pool_in_use{database="default"} 5', content)
+		self.assertIn('school_db_pool_waiting{database="default"} 4', content)
+		self.assertIn('school_db_pool_requests_total{database="default"} 120', content)
+		self.assertIn('school_db_pool_wait_seconds_total{database="default"} 2.5', content)
+
+	def test_collect_pool_metrics_without_pool(self):
+		"""
+			Validar que sin el pool (SQLite) no haya métricas
+		"""
+		self.assertEqual(pool.get_pool_stats(), {})
+		self.assertEqual(pool.collect_pool_metrics(), [])
+
+	def test_get_pool_stats(self):
+		"""
+			Validar las estadísticas de un pool de psycopg
+		"""
+		connection_pool = ConnectionPool(min_size = 2, max_size = 10, open = False)
+
+		with patch.object(pool, "get_pool", return_value = connection_pool):
+			stats = pool.get_pool_stats()
+
+		self.assertEqual(stats["default"]["pool_min"], 2)
+		self.assertEqual(stats["default"]["pool_max"], 10)
+
+
+@override_settings(MONITORING = {"TOKEN": "secret"})
+class MonitoringViewsTest(TestCase):
+	def setUp(self):
+		self.headers = {"Authorization": "Bearer secret"}
+
+	def test_health(self):
+		"""
+			Validar el estado de las bases de datos
+		"""
+		response = self.client.get(reverse("health"), headers = self.headers)
+
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual(response.json()["status"], "ok")
+		self.assertEqual(response.json()["databases"]["default"]["status"], "ok")
+
+	def test_health_with_database_error(self):
+		"""
+			Validar la respuesta cuando una base de datos no responde
+		"""
+		error = {"status": pool.STATUS_ERROR, "error": "OperationalError"}
+
+		with patch.object(pool, "check_database", return_value = error):
+			response = self.client.get(reverse("health"), headers = self.headers)
+
+		self.assertEqual(response.status_code, 503)
+		self.assertEqual(response.json()["databases"]["default"], error)
+
+	@override_settings(DATABASE_REPLICAS = {"ALIASES": ["replica_1"]})
+	def test_health_status_with_replica_error(self):
+		"""
+			Validar que si solo falla una réplica el estado sea 'degraded'
+		"""
+		ok = {"status": pool.STATUS_OK}
+		error = {"status": pool.STATUS_ERROR}
+
+		self.assertEqual(pool.get_status({"default": ok, "replica_1": error}), pool.STATUS_DEGRADED)
+		self.assertEqual(pool.get_status({"default": error, "replica_1": ok}), pool.STATUS_ERROR)
+		self.assertEqual(pool.get_status({"default": ok, "replica_1": ok}), pool.STATUS_OK)
+
+	def test_metrics(self):
+		"""
+			Validar el endpoint de las métricas
+		"""
+		with patch.object(pool, "get_pool_stats", return_value = {"default": STATS}):
+			response = self.client.get(reverse("metrics"), headers = self.headers)
+
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual(response["Content-Type"], prometheus.CONTENT_TYPE)
+		self.assertIn(b'school_db_pool_size{database="default"} 8', response.content)
+
+	def test_metrics_with_token(self):
+		"""
+			Validar que con 'MONITORING["TOKEN"]' se exija el token
+		"""
+		response = self.client.get(reverse("metrics"))
+		response_token = self.client.get(reverse("metrics"), headers = self.headers)
+
+		self.assertEqual(response.status_code, 401)
+		self.assertEqual(response_token.status_code, 200)
+
+	@override_settings(MONITORING = {"TOKEN": ""})
+	def test_without_token(self):
+		"""
+			Validar que sin 'MONITORING["TOKEN"]' no se permita el acceso (sin DEBUG)
+		"""
+		response_health = self.client.get(reverse("health"))
+		response_metrics = self.client.get(reverse("metrics"))
+
+		self.assertEqual(response_health.status_code, 401)
+		self.assertEqual(response_metrics.status_code, 401)
+
+	@override_settings(MONITORING = {"TOKEN": ""}, DEBUG = True)
+	def test_without_token_with_debug(self):
+		"""
+			Validar que sin 'MONITORING["TOKEN"]' se permita el acceso con DEBUG
+		"""
+		response = self.client.get(reverse("health"))
+
+		self.assertEqual(response.status_code, 200)
@@ -0,0 +1,121 @@
+from django.urls import reverse
+from django.core.exceptions import MiddlewareNotUsed
+from django.test import override_settings
+
+from rest_framework.test import APITestCase
+
+from apps.monitoring.middleware import RequestMetricsMiddleware
+from apps.monitoring.services import prometheus, requests
+
+from tests.school.utils import utils
+
+QUERY = """
+query SchoolName($subdomain: String!) {
+	school(subdomain: $subdomain) {
+		id
+		name
+	}
+}
+"""
+
+
+@override_settings(
+	REQUEST_METRICS = {"ENABLED": True, "SERVER_TIMING": True, "MAX_ENDPOINTS": 10},
+	SCHOOL_CACHE = {"ALIAS": "default", "TIMEOUT": 60, "ENABLED": False},
+	GRAPHQL_RESPONSE_CACHE = {"ENABLED": False},
+	MONITORING = {"TOKEN": "secret"}
+)
+class RequestMetricsTest(APITestCase):
+	def setUp(self):
+		requests.registry.clear()
+
+		self.school = utils.create_school()
+		utils.bulk_create_calendar(size = 5, school = self.school)
+
+		self.URL_CALENDAR = reverse("school:calendar", kwargs = {"pk": self.school.id})
+
+	def test_middleware_disabled(self):
+		"""
+			Validar que sin 'REQUEST_METRICS["ENABLED"]' no se use el middleware
+		"""
+		with override_settings(REQUEST_METRICS = {"ENABLED": False}):
+			with self.assertRaises(MiddlewareNotUsed):
+				RequestMetricsMiddleware(lambda request: request)
+
+	def test_request_metrics(self):
+		"""
+			Validar las métricas de una petición por el nombre de su URL
+		"""
+		response = self.client.get(self.URL_CALENDAR)
+
+		self.assertEqual(response.status_code, 200)
+
+		stats = requests.registry.endpoints["school:calendar"]
+
+		self.assertGreater(stats.queries, 0)
+		self.assertGreater(stats.db_time, 0)
+		self.assertGreater(stats.serializer_time, 0)
+		self.assertEqual(stats.response_bytes, len(response.content))
+		self.assertEqual(requests.registry.requests[("school:calendar", "GET", "200")], 1)
+
+	def test_server_timing(self):
+		"""
+			Validar el encabezado 'Server-Timing'
+		"""
+		response = self.client.get(self.URL_CALENDAR)
+
+		server_timing = response["Server-Timing"]
+		queries = requests.registry.endpoints["school:calendar"].queries
+
+		self.assertIn("db;dur=", server_timing)
+		self.assertIn(f'desc="{queries} queries"', server_timing)
+		self.assertIn("serializer;dur=", server_timing)
+		self.assertIn("total;dur=", server_timing)
+
+	def test_graphql_operation_metrics(self):
+		"""
+			Validar las métricas de '/graphql' por el nombre de la operación
+		"""
+		response = self.client.post(
+			reverse("graphql"),
+			data = {
+				"query": QUERY,
+				"operationName": "SchoolName",
+				"variables": {"subdomain": self.school.subdomain}
+			},
+			format = "json"
+		)
+
+		self.assertEqual(response.status_code, 200)
+		self.assertGreater(requests.registry.endpoints["graphql:SchoolName"].queries, 0)
+
+	def test_max_endpoints(self):
+		"""
+			Validar que los endpoints que superan 'MAX_ENDPOINTS' se agrupen en 'other'
+		"""
+		metrics = requests.RequestMetrics()
+
+		for index in range(12):
+			requests.registry.observe(f"endpoint-{index}", "GET", 200, metrics, 0.01, 10)
+
+		self.assertEqual(len(requests.registry.endpoints), 11)
+		self.assertEqual(requests.registry.requests[(requests.OTHER_ENDPOINT, "GET", "200")], 2)
+
+	def test_prometheus_metrics(self):
+		"""
+			Validar las métricas de las peticiones en '/metrics'
+		"""
+		self.client.get(self.URL_CALENDAR)
+
+		response = self.client.get(reverse("metrics"), headers = {"Authorization": "Bearer secret"})
+		content = response.content.decode()
+
+		self.assertEqual(response["Content-Type"], prometheus.CONTENT_TYPE)
+		self.assertIn(
+			'school_http_requests_total{endpoint="school:calendar",method="GET",status="200"} 1',
+			content
+		)
+		self.assertIn('school_http_request_duration_seconds_count{endpoint="school:calendar"} 1', content)
+		self.assertIn('school_http_request_queries_bucket{endpoint="school:calendar",le="+Inf"} 1', content)
+		self.assertIn('school_db_queries_total{endpoint="school:calendar"}', content)
+		self.assertIn('school_serializer_seconds_total{endpoint="school:calendar"}', content)
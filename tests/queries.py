@@ -0,0 +1,103 @@
+"""
+	Presupuesto de consultas a la base de datos por endpoint.
+
+	'query_budgets.yaml' define la cantidad máxima de consultas de cada
+	URL (por su nombre: 'school:news', 'management:grade-list-create'), una
+	prueba falla si la petición realiza más consultas que su presupuesto:
+
+		class NewsQueryBudgetTest(QueryBudgetMixin, APITestCase):
+
+			@query_budget("school:news")
+			def test_news(self):
+				self.client.get(reverse("school:news", kwargs = {"pk": 1}))
+
+	El presupuesto puede ser un número (cualquier método) o uno por
+	método ('GET', 'POST', ...).
+"""
+import functools, pathlib
+
+import yaml
+
+from django.db import connections, DEFAULT_DB_ALIAS
+from django.test.utils import CaptureQueriesContext
+
+QUERY_BUDGETS_PATH = pathlib.Path(__file__).parent / "query_budgets.yaml"
+
+WITHOUT_BUDGET = "'{url_name}' ({method}) no tiene un presupuesto de consultas en 'query_budgets.yaml'"
+OVER_BUDGET = "'{url_name}' ({method}) realizó {executed} consultas, su presupuesto es de {budget}:\n{queries}"
+
+
+@functools.cache
+def load_budgets() -> dict[str, int | dict[str, int]]:
+	"""
+		Presupuestos por el nombre completo de la URL:
+		{"school": {"news": 4}} -> {"school:news": 4}
+	"""
+	with open(QUERY_BUDGETS_PATH, encoding = "utf-8") as file:
+		data = yaml.safe_load(file) or {}
+
+	return {
+		f"{namespace}:{name}": budget
+		for namespace, budgets in data.items()
+		for name, budget in budgets.items()
+	}
+
+
+def get_budget(url_name: str, method: str = "GET") -> int:
+	budget = load_budgets().get(url_name)
+
+	if isinstance(budget, dict):
+		budget = budget.get(method)
+
+	if budget is None:
+		raise KeyError(WITHOUT_BUDGET.format(url_name = url_name, method = method))
+
+	return budget
+
+
+class QueryBudgetContext(CaptureQueriesContext):
+	def __init__(self, test_case, url_name: str, method: str = "GET", using: str = DEFAULT_DB_ALIAS):
+		self.test_case = test_case
+		self.url_name = url_name
+		self.method = method
+		self.budget = get_budget(url_name = url_name, method = method)
+
+		super().__init__(connections[using])
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		super().__exit__(exc_type, exc_value, traceback)
+
+		if exc_type is not None or len(self) <= self.budget:
+			return
+
+		self.test_case.fail(OVER_BUDGET.format(
+			url_name = self.url_name,
+			method = self.method,
+			executed = len(self),
+			budget = self.budget,
+			queries = "\n".join(
+				f"{index}. {query['sql']}"
+				for index, query in enumerate(self.captured_queries, start = 1)
+			)
+		))
+
+
+class QueryBudgetMixin:
+	def assertQueryBudget(self, url_name: str, method: str = "GET", using: str = DEFAULT_DB_ALIAS):
+		return QueryBudgetContext(self, url_name = url_name, method = method, using = using)
+
+
+def query_budget(url_name: str, method: str = "GET"):
+	"""
+		Cuenta las consultas de la prueba (sin 'setUp') y la hace fallar
+		si superan el presupuesto de 'url_name'.
+	"""
+	def decorator(test):
+		@functools.wraps(test)
+		def wrapper(self, *args, **kwargs):
+			with QueryBudgetContext(self, url_name = url_name, method = method):
+				return test(self, *args, **kwargs)
+
+		return wrapper
+
+	return decorator
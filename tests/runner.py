@@ -0,0 +1,41 @@
+"""
+	Ejecutor de las pruebas ('TEST_RUNNER' en settings.py).
+
+	Los archivos que suben las pruebas ('LocalStorage') se guardan en un
+	'MEDIA_ROOT' temporal que se elimina al terminar, así no se escriben
+	en el 'media/' del repositorio.
+
+	Las pruebas con '@tag("benchmark")' (tests/benchmarks) solo se
+	ejecutan al pedirlas:
+
+	python manage.py test tests.benchmarks --tag benchmark -v 2
+"""
+import shutil, tempfile
+
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+BENCHMARK_TAG = "benchmark"
+
+
+class SchoolTestRunner(DiscoverRunner):
+	def __init__(self, *args, tags = None, exclude_tags = None, **kwargs):
+		exclude_tags = set(exclude_tags or ())
+
+		if BENCHMARK_TAG not in (tags or ()):
+			exclude_tags.add(BENCHMARK_TAG)
+
+		super().__init__(*args, tags = tags, exclude_tags = exclude_tags, **kwargs)
+
+	def setup_test_environment(self, **kwargs):
+		super().setup_test_environment(**kwargs)
+
+		self.media_root = tempfile.mkdtemp(prefix = "school-media-")
+		self.media_settings = override_settings(MEDIA_ROOT = self.media_root)
+		self.media_settings.enable()
+
+	def teardown_test_environment(self, **kwargs):
+		self.media_settings.disable()
+		shutil.rmtree(self.media_root, ignore_errors = True)
+
+		super().teardown_test_environment(**kwargs)
@@ -1,6 +1,8 @@
 import unittest, datetime
 
+from django.db import connection
 from django.urls import reverse
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 
@@ -84,6 +86,67 @@ class SchoolAPITest(testcases.SchoolTestCase):
 		self.assertEqual(responseStatus, 404)
 
 
+class SchoolBootstrapAPITest(testcases.SchoolBootstrapTestCase):
+	# Escuela (con su configuración), colores, redes sociales, contactos,
+	# coordenadas, horarios de oficina (con su grupo horario) y días de la semana
+	MAX_QUERIES = 7
+
+	def setUp(self):
+		super().setUp()
+		self.URL_SCHOOL_BOOTSTRAP = self.get_school_bootstrap_url(
+			subdomain = self.school.subdomain
+		)
+
+	def get_school_bootstrap_url(self, subdomain):
+		return reverse("school:bootstrap", kwargs = {"subdomain": subdomain})
+
+	def test_get_school_bootstrap(self):
+		"""
+			Validar "GET /school/:subdomain/bootstrap"
+		"""
+		colors = [color.color for color in self.school.setting.colors.all()]
+
+		response = self.client.get(self.URL_SCHOOL_BOOTSTRAP)
+
+		responseJson = response.data
+		responseStatus = response.status_code
+
+		self.assertEqual(responseStatus, 200)
+		self.assertEqual(responseJson["id"], self.school.id)
+		self.assertEqual(responseJson["subdomain"], self.school.subdomain)
+		self.assertCountEqual(responseJson["settings"]["colors"], colors)
+		self.assertEqual(len(responseJson["social_media"]), 3)
+		self.assertEqual(len(responseJson["contacts"]), 2)
+		self.assertEqual(len(responseJson["coordinates"]), 4)
+		self.assertEqual(len(responseJson["office_hours"]), 3)
+		self.assertIn("daysweek", responseJson["office_hours"][0]["time_group"])
+
+	def test_get_school_bootstrap_fixed_queries(self):
+		"""
+			Validar que "GET /school/:subdomain/bootstrap" no aumente
+			la cantidad de consultas al aumentar los datos de la escuela
+		"""
+		with self.assertNumQueries(self.MAX_QUERIES):
+			self.client.get(self.URL_SCHOOL_BOOTSTRAP)
+
+		utils.bulk_create_social_media(size = 5, school = self.school)
+		utils.bulk_create_coordinate(size = 5, school = self.school)
+		utils.bulk_create_officehour(size = 5, school = self.school)
+
+		with self.assertNumQueries(self.MAX_QUERIES):
+			self.client.get(self.URL_SCHOOL_BOOTSTRAP)
+
+	def test_get_school_bootstrap_does_not_exist(self):
+		"""
+			Generar [Error 404] "GET /school/:subdomain/bootstrap" por información que no existe
+		"""
+		response = self.client.get(
+			self.get_school_bootstrap_url(subdomain = faker.slug())
+		)
+
+		self.assertEqual(response.status_code, 404)
+
+
 class SettingsFormatAPITest(testcases.SettingsFormatTestCase):
 
 	def setUp(self):
@@ -652,6 +715,41 @@ class NewsAPITest(testcases.NewsTestCase):
 		self.assertEqual(responseJson["count"], total_news)
 
 
+	def test_get_news_by_cursor(self):
+		"""
+			Validar "GET /school/:id/news?pagination=cursor"
+		"""
+		news_ids = list(
+			models.News.objects.filter(
+				school_id = self.school.id
+			).order_by("-created", "-id").values_list("id", flat = True)
+		)
+
+		ids = []
+		url = reverse(
+			"school:news", 
+			kwargs={"pk": self.school.id}, 
+			query={"pagination": "cursor"}
+		)
+
+		while url:
+			with CaptureQueriesContext(connection) as queries:
+				response = self.client.get(url)
+
+			responseJson = response.data
+
+			self.assertEqual(response.status_code, 200)
+			self.assertNotIn("count", responseJson)
+			self.assertFalse(
+				any("COUNT(" in query["sql"] for query in queries.captured_queries)
+			)
+
+			ids.extend(news["id"] for news in responseJson["results"])
+			url = responseJson["next"]
+
+		self.assertEqual(ids, news_ids)
+
+
 	def test_get_news_detail(self):
 		"""
 			Validar "GET /news/:id"
@@ -0,0 +1,349 @@
+from django.test import override_settings
+from django.urls import reverse
+
+from asgiref.sync import async_to_sync
+
+from apps.school import checks, models
+from apps.school.services.cache import school_cache
+from apps.management.commands import commands
+
+from tests import faker
+
+from .utils import utils, testcases
+
+
+class SchoolCacheAPITest(testcases.NewsTestCase):
+	def setUp(self):
+		super().setUp()
+		school_cache.cache.clear()
+		school_cache.reset_stats()
+
+		self.URL_NEWS = reverse("school:news", kwargs={"pk": self.school.id})
+		self.URL_NEWS_DETAIL = reverse("school:news-detail", kwargs={"pk": self.news.id})
+		self.URL_BOOTSTRAP = reverse(
+			"school:bootstrap",
+			kwargs={"subdomain": self.school.subdomain}
+		)
+
+	def test_get_news_from_cache(self):
+		"""
+			Validar que "GET /school/:id/news" se responde desde el caché
+			la segunda vez, sin consultar la base de datos
+		"""
+		response = self.client.get(self.URL_NEWS)
+
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual(response["X-Cache"], "MISS")
+
+		with self.assertNumQueries(0):
+			response_cache = self.client.get(self.URL_NEWS)
+
+		self.assertEqual(response_cache.status_code, 200)
+		self.assertEqual(response_cache["X-Cache"], "HIT")
+		self.assertEqual(response_cache.data, response.data)
+
+		stats = school_cache.stats()
+
+		self.assertEqual(stats["hits"], 1)
+		self.assertEqual(stats["misses"], 1)
+		self.assertEqual(stats["news:hits"], 1)
+
+
+	def test_get_news_with_different_query(self):
+		"""
+			Validar que cada pagina de "GET /school/:id/news" tiene su propia
+			entrada en el caché
+		"""
+		self.client.get(self.URL_NEWS)
+		response = self.client.get(self.URL_NEWS, {"page": 2})
+
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual(response["X-Cache"], "MISS")
+
+
+	def test_update_news_invalidate_cache(self):
+		"""
+			Validar que actualizar una noticia invalida su lista y su detalle
+		"""
+		self.client.get(self.URL_NEWS)
+		self.client.get(self.URL_NEWS_DETAIL)
+
+		new_title = faker.text(max_nb_chars = 20)
+		self.news.title = new_title
+		self.news.save()
+
+		response = self.client.get(self.URL_NEWS_DETAIL)
+
+		self.assertEqual(response["X-Cache"], "MISS")
+		self.assertEqual(response.data["title"], new_title)
+		self.assertEqual(self.client.get(self.URL_NEWS)["X-Cache"], "MISS")
+
+
+	def test_delete_news_invalidate_cache(self):
+		"""
+			Validar que eliminar una noticia invalida la lista de noticias
+		"""
+		response = self.client.get(self.URL_NEWS)
+		total_news = response.data["count"]
+
+		self.news.delete()
+
+		response = self.client.get(self.URL_NEWS)
+
+		self.assertEqual(response["X-Cache"], "MISS")
+		self.assertEqual(response.data["count"], total_news - 1)
+
+
+	def test_update_news_media_invalidate_cache(self):
+		"""
+			Validar que agregar, modificar o eliminar imagenes de una noticia
+			invalida su detalle
+		"""
+		response = self.client.get(self.URL_NEWS_DETAIL)
+		total_media = len(response.data["media"])
+
+		self.news.media.add(utils.create_news_media())
+
+		response = self.client.get(self.URL_NEWS_DETAIL)
+
+		self.assertEqual(response["X-Cache"], "MISS")
+		self.assertEqual(len(response.data["media"]), total_media + 1)
+
+		media = self.news.media.first()
+		media.photo = faker.image_url()
+		media.save()
+
+		response = self.client.get(self.URL_NEWS_DETAIL)
+
+		self.assertEqual(response["X-Cache"], "MISS")
+
+		self.news.media.all().delete()
+
+		response = self.client.get(self.URL_NEWS_DETAIL)
+
+		self.assertEqual(response["X-Cache"], "MISS")
+		self.assertEqual(len(response.data["media"]), 0)
+
+
+	def test_update_school_invalidate_cache(self):
+		"""
+			Validar que actualizar la escuela invalida el detalle de sus noticias
+		"""
+		self.client.get(self.URL_NEWS_DETAIL)
+
+		self.school.name = faker.text(max_nb_chars = 20)
+		self.school.save()
+
+		response = self.client.get(self.URL_NEWS_DETAIL)
+
+		self.assertEqual(response["X-Cache"], "MISS")
+		self.assertEqual(response.data["school"]["name"], self.school.name)
+
+
+	def test_cache_is_by_school(self):
+		"""
+			Validar que los cambios de una escuela no invalidan
+			el caché de otra escuela
+		"""
+		other_school = utils.create_school()
+		utils.create_news(school = other_school)
+
+		self.client.get(self.URL_NEWS)
+
+		response = self.client.get(
+			reverse("school:news", kwargs={"pk": other_school.id})
+		)
+		self.assertEqual(response["X-Cache"], "MISS")
+
+		utils.create_news(school = other_school)
+
+		self.assertEqual(self.client.get(self.URL_NEWS)["X-Cache"], "HIT")
+
+
+	def test_not_found_is_not_cached(self):
+		"""
+			Validar que las respuestas [Error 404] no se guardan en el caché
+		"""
+		wrong_pk = models.News.objects.order_by("id").last().id + 1
+		url = reverse("school:news-detail", kwargs={"pk": wrong_pk})
+
+		self.client.get(url)
+		response = self.client.get(url)
+
+		self.assertEqual(response.status_code, 404)
+		self.assertEqual(response["X-Cache"], "MISS")
+
+
+	def test_bulk_add_social_media_invalidate_bootstrap(self):
+		"""
+			Validar que agregar varias redes sociales invalida
+			"GET /school/:subdomain/bootstrap"
+		"""
+		self.client.get(self.URL_BOOTSTRAP)
+
+		commands.bulk_add_social_media(
+			school_id = self.school.id,
+			profiles = [faker.url(), faker.url()]
+		)
+
+		response = self.client.get(self.URL_BOOTSTRAP)
+
+		self.assertEqual(response["X-Cache"], "MISS")
+		self.assertEqual(len(response.data["social_media"]), 2)
+
+
+	def test_update_time_group_invalidate_bootstrap(self):
+		"""
+			Validar que modificar los días de un horario invalida
+			"GET /school/:subdomain/bootstrap"
+		"""
+		office_hour = utils.create_officehour(school = self.school)
+
+		self.client.get(self.URL_BOOTSTRAP)
+
+		office_hour.time_group.daysweek.clear()
+
+		response = self.client.get(self.URL_BOOTSTRAP)
+
+		self.assertEqual(response["X-Cache"], "MISS")
+		self.assertEqual(
+			response.data["office_hours"][0]["time_group"]["daysweek"],
+			[]
+		)
+
+
+class SchoolConditionalAPITest(testcases.NewsTestCase):
+	def setUp(self):
+		super().setUp()
+		self.URL_NEWS = reverse("school:news", kwargs={"pk": self.school.id})
+		self.URL_CALENDAR = reverse("school:calendar", kwargs={"pk": self.school.id})
+		self.URL_REPOSITORY = reverse("school:repository", kwargs={"pk": self.school.id})
+
+	def test_get_news_not_modified(self):
+		"""
+			Validar [304] "GET /school/:id/news" con 'If-None-Match'
+			sin consultar la base de datos
+		"""
+		response = self.client.get(self.URL_NEWS)
+
+		self.assertEqual(response.status_code, 200)
+		self.assertIn("ETag", response)
+		self.assertIn("Last-Modified", response)
+
+		with self.assertNumQueries(0):
+			response_not_modified = self.client.get(
+				self.URL_NEWS,
+				headers = {"If-None-Match": response["ETag"]}
+			)
+
+		self.assertEqual(response_not_modified.status_code, 304)
+		self.assertEqual(response_not_modified["ETag"], response["ETag"])
+		self.assertFalse(response_not_modified.content)
+
+
+	def test_get_news_if_modified_since(self):
+		"""
+			Validar [304] "GET /school/:id/news" con 'If-Modified-Since'
+		"""
+		response = self.client.get(self.URL_NEWS)
+
+		response_not_modified = self.client.get(
+			self.URL_NEWS,
+			headers = {"If-Modified-Since": response["Last-Modified"]}
+		)
+
+		self.assertEqual(response_not_modified.status_code, 304)
+
+
+	def test_get_news_modified(self):
+		"""
+			Validar que "GET /school/:id/news" responde [200] con un nuevo 'ETag'
+			cuando las noticias de la escuela cambian
+		"""
+		response = self.client.get(self.URL_NEWS)
+
+		utils.create_news(school = self.school)
+
+		response_modified = self.client.get(
+			self.URL_NEWS,
+			headers = {"If-None-Match": response["ETag"]}
+		)
+
+		self.assertEqual(response_modified.status_code, 200)
+		self.assertNotEqual(response_modified["ETag"], response["ETag"])
+		self.assertEqual(response_modified.data["count"], response.data["count"] + 1)
+
+
+	def test_etag_by_query(self):
+		"""
+			Validar que cada pagina de "GET /school/:id/news" tiene su propio 'ETag'
+		"""
+		response = self.client.get(self.URL_NEWS)
+
+		response_page = self.client.get(
+			self.URL_NEWS,
+			{"page": 2},
+			headers = {"If-None-Match": response["ETag"]}
+		)
+
+		self.assertEqual(response_page.status_code, 200)
+		self.assertNotEqual(response_page["ETag"], response["ETag"])
+
+
+	def test_get_calendar_and_repository_not_modified(self):
+		"""
+			Validar [304] "GET /school/:id/calendar" y "GET /school/:id/repository"
+		"""
+		utils.bulk_create_calendar(size = 2, school = self.school)
+		utils.bulk_create_repository(size = 2, school = self.school)
+
+		for url in (self.URL_CALENDAR, self.URL_REPOSITORY):
+			response = self.client.get(url)
+
+			response_not_modified = self.client.get(
+				url,
+				headers = {"If-None-Match": response["ETag"]}
+			)
+
+			self.assertEqual(response_not_modified.status_code, 304)
+
+
+	def test_aget_versions(self):
+		"""
+			Validar que 'aget_versions' devuelva las mismas versiones que 'get_versions'
+		"""
+		scopes = [f"school:{self.school.id}", "schools"]
+
+		versions = async_to_sync(school_cache.aget_versions)("news", scopes)
+
+		self.assertEqual(len(versions), 2)
+		self.assertEqual(school_cache.get_versions("news", scopes), versions)
+		self.assertEqual(async_to_sync(school_cache.aget_versions)("news", scopes), versions)
+
+
+class SchoolCacheCheckTest(testcases.SchoolTestCase):
+
+	def test_check_local_cache(self):
+		"""
+			Validar que 'check --deploy' advierta una caché local a cada proceso
+		"""
+		with override_settings(CACHES = {
+			"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+		}):
+			warnings = checks.check_school_cache(app_configs = None)
+
+		self.assertEqual([warning.id for warning in warnings], ["school.W001"])
+
+	def test_check_shared_cache(self):
+		"""
+			Validar que 'check --deploy' no advierta una caché compartida
+		"""
+		with override_settings(CACHES = {
+			"default": {
+				"BACKEND": "django.core.cache.backends.redis.RedisCache",
+				"LOCATION": "redis://127.0.0.1:6379"
+			}
+		}):
+			warnings = checks.check_school_cache(app_configs = None)
+
+		self.assertEqual(warnings, [])
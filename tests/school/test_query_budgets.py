@@ -0,0 +1,258 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.school import models
+from apps.school.apiv1.urls import urlpatterns
+
+from tests.queries import get_budget, load_budgets, query_budget
+
+from .utils import testcases
+
+
+class SchoolQueryBudgetTest(testcases.QueryBudgetTestCase):
+
+	def get(self, url_name: str, **kwargs):
+		response = self.client.get(reverse(url_name, **kwargs))
+
+		self.assertEqual(response.status_code, 200)
+
+		return response
+
+	def test_all_urls_have_budget(self):
+		"""
+			Validar que cada URL de 'school' tenga un presupuesto de consultas
+		"""
+		budgets = load_budgets()
+
+		for pattern in urlpatterns:
+			with self.subTest(url_name = pattern.name):
+				self.assertIn(f"school:{pattern.name}", budgets)
+
+	def test_over_budget(self):
+		"""
+			Validar que falle al superar el presupuesto de consultas
+		"""
+		budget = get_budget("school:detail")
+
+		with self.assertRaisesMessage(AssertionError, f"su presupuesto es de {budget}"):
+			with self.assertQueryBudget("school:detail"):
+				for _ in range(budget + 1):
+					models.School.objects.filter(pk = self.school.id).exists()
+
+	def test_without_budget(self):
+		"""
+			Validar que falle si la URL no tiene un presupuesto de consultas
+		"""
+		with self.assertRaises(KeyError):
+			get_budget("management:calendar-bulk", method = "GET")
+
+		with self.assertRaises(KeyError):
+			get_budget("school:unknown")
+
+	@query_budget("school:school")
+	def test_school(self):
+		"""
+			Validar "GET /school" dentro de su presupuesto de consultas
+		"""
+		self.get("school:school", query = {"subdomain": self.school.subdomain})
+
+	@query_budget("school:detail")
+	def test_school_detail(self):
+		"""
+			Validar "GET /school/:id" dentro de su presupuesto de consultas
+		"""
+		self.get("school:detail", kwargs = {"pk": self.school.id})
+
+	@query_budget("school:bootstrap")
+	def test_bootstrap(self):
+		"""
+			Validar "GET /school/:subdomain/bootstrap" dentro de su presupuesto de consultas
+		"""
+		self.get("school:bootstrap", kwargs = {"subdomain": self.school.subdomain})
+
+	@query_budget("school:settings")
+	def test_settings(self):
+		"""
+			Validar "GET /school/settings/:id" dentro de su presupuesto de consultas
+		"""
+		self.get("school:settings", kwargs = {"pk": self.school.id})
+
+	@query_budget("school:office-hour")
+	def test_office_hour(self):
+		"""
+			Validar "GET /school/:id/office" dentro de su presupuesto de consultas
+		"""
+		self.get("school:office-hour", kwargs = {"pk": self.school.id})
+
+	@query_budget("school:office-hour-detail")
+	def test_office_hour_detail(self):
+		"""
+			Validar "GET /school/office/:id" dentro de su presupuesto de consultas
+		"""
+		self.get("school:office-hour-detail", kwargs = {"pk": self.office_hours[0].id})
+
+	@query_budget("school:calendar")
+	def test_calendar(self):
+		"""
+			Validar "GET /school/:id/calendar" dentro de su presupuesto de consultas
+		"""
+		self.get("school:calendar", kwargs = {"pk": self.school.id})
+
+	@query_budget("school:calendar-detail")
+	def test_calendar_detail(self):
+		"""
+			Validar "GET /school/calendar/:id" dentro de su presupuesto de consultas
+		"""
+		self.get("school:calendar-detail", kwargs = {"pk": self.calendars[0].id})
+
+	@query_budget("school:social-media")
+	def test_social_media(self):
+		"""
+			Validar "GET /school/:id/social/media" dentro de su presupuesto de consultas
+		"""
+		self.get("school:social-media", kwargs = {"pk": self.school.id})
+
+	@query_budget("school:coordinate")
+	def test_coordinate(self):
+		"""
+			Validar "GET /school/:id/coordinate" dentro de su presupuesto de consultas
+		"""
+		self.get("school:coordinate", kwargs = {"pk": self.school.id})
+
+	@query_budget("school:grade")
+	def test_grade(self):
+		"""
+			Validar "GET /school/:id/grade" dentro de su presupuesto de consultas
+		"""
+		self.get("school:grade", kwargs = {"pk": self.school.id})
+
+	@query_budget("school:grade-detail")
+	def test_grade_detail(self):
+		"""
+			Validar "GET /school/grade/:id" dentro de su presupuesto de consultas
+		"""
+		self.get("school:grade-detail", kwargs = {"pk": self.grades[0].id})
+
+	@query_budget("school:repository")
+	def test_repository(self):
+		"""
+			Validar "GET /school/:id/repository" dentro de su presupuesto de consultas
+		"""
+		self.get("school:repository", kwargs = {"pk": self.school.id})
+
+	@query_budget("school:repository-detail")
+	def test_repository_detail(self):
+		"""
+			Validar "GET /school/repository/:id" dentro de su presupuesto de consultas
+		"""
+		self.get("school:repository-detail", kwargs = {"pk": self.repositories[0].id})
+
+	@query_budget("school:infraestructure")
+	def test_infraestructure(self):
+		"""
+			Validar "GET /school/:id/infraestructure" dentro de su presupuesto de consultas
+		"""
+		self.get("school:infraestructure", kwargs = {"pk": self.school.id})
+
+	@query_budget("school:infraestructure-detail")
+	def test_infraestructure_detail(self):
+		"""
+			Validar "GET /school/infraestructure/:id" dentro de su presupuesto de consultas
+		"""
+		self.get("school:infraestructure-detail", kwargs = {"pk": self.infraestructures[0].id})
+
+	@query_budget("school:downloads")
+	def test_downloads(self):
+		"""
+			Validar "GET /school/:id/download" dentro de su presupuesto de consultas
+		"""
+		self.get("school:downloads", kwargs = {"pk": self.school.id})
+
+	@query_budget("school:downloads-detail")
+	def test_downloads_detail(self):
+		"""
+			Validar "GET /school/download/:id" dentro de su presupuesto de consultas
+		"""
+		self.get("school:downloads-detail", kwargs = {"pk": self.downloads[0].id})
+
+	@query_budget("school:news")
+	def test_news(self):
+		"""
+			Validar "GET /school/:id/news" dentro de su presupuesto de consultas
+		"""
+		self.get("school:news", kwargs = {"pk": self.school.id})
+
+	@query_budget("school:news-detail")
+	def test_news_detail(self):
+		"""
+			Validar "GET /school/news/:id" dentro de su presupuesto de consultas
+		"""
+		self.get("school:news-detail", kwargs = {"pk": self.news[0].id})
+
+	@query_budget("school:cultural-events")
+	def test_cultural_events(self):
+		"""
+			Validar "GET /school/:id/event" dentro de su presupuesto de consultas
+		"""
+		self.get("school:cultural-events", kwargs = {"pk": self.school.id})
+
+	@query_budget("school:cultural-events-detail")
+	def test_cultural_events_detail(self):
+		"""
+			Validar "GET /school/event/:id" dentro de su presupuesto de consultas
+		"""
+		self.get("school:cultural-events-detail", kwargs = {"pk": self.cultural_events[0].id})
+
+	@query_budget("school:payment-info")
+	def test_payment_info(self):
+		"""
+			Validar "GET /school/:id/payment" dentro de su presupuesto de consultas
+		"""
+		self.get("school:payment-info", kwargs = {"pk": self.school.id})
+
+	@query_budget("school:payment-info-detail")
+	def test_payment_info_detail(self):
+		"""
+			Validar "GET /school/payment/:id" dentro de su presupuesto de consultas
+		"""
+		self.get("school:payment-info-detail", kwargs = {"pk": self.payment_info[0].id})
+
+	@query_budget("school:contact-info")
+	def test_contact_info(self):
+		"""
+			Validar "GET /school/:id/contact" dentro de su presupuesto de consultas
+		"""
+		self.get("school:contact-info", kwargs = {"pk": self.school.id})
+
+	@query_budget("school:extra-activity")
+	def test_extra_activity(self):
+		"""
+			Validar "GET /school/:id/activity" dentro de su presupuesto de consultas
+		"""
+		self.get("school:extra-activity", kwargs = {"pk": self.school.id})
+
+	@query_budget("school:extra-activity-detail")
+	def test_extra_activity_detail(self):
+		"""
+			Validar "GET /school/activity/:id" dentro de su presupuesto de consultas
+		"""
+		self.get("school:extra-activity-detail", kwargs = {"pk": self.extra_activities[0].id})
+
+	def test_extra_activity_without_n_plus_one(self):
+		"""
+			Validar que las consultas de "GET /school/:id/activity" no dependan del tamaño de la página
+		"""
+		url = reverse("school:extra-activity", kwargs = {"pk": self.school.id})
+		queries = []
+
+		for size in (1, 10):
+			self.setUp()
+
+			with CaptureQueriesContext(connection) as context:
+				response = self.client.get(url, {"size": size})
+
+			self.assertEqual(len(response.data["results"]), size)
+			queries.append(len(context))
+
+		self.assertEqual(queries[0], queries[1])
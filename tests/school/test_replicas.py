@@ -0,0 +1,217 @@
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS
+from django.urls import reverse
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+
+from apps.school import checks, models
+from apps.school.middleware import SchoolReplicaMiddleware, PRIMARY_COOKIE
+from apps.school.services.cache import school_cache
+from school import routers
+
+from .utils import testcases, utils
+from .utils.testcases import REPLICA, REPLICA_CACHE
+
+QUERY = """
+query MyQuery($subdomain: String!) {
+	school(subdomain: $subdomain) {
+		id
+		name
+	}
+}
+"""
+
+
+@override_settings(
+	SCHOOL_CACHE = {"ALIAS": "default", "TIMEOUT": 60, "ENABLED": False},
+	GRAPHQL_RESPONSE_CACHE = {"ENABLED": False}
+)
+class ReplicaRouterTest(testcases.ReplicaTestCase):
+	def setUp(self):
+		super().setUp()
+
+		self.router = routers.ReplicaRouter()
+		self.request_factory = RequestFactory()
+
+	def test_read_from_primary_by_default(self):
+		"""
+			Validar que fuera de las peticiones públicas se lea de 'default'
+		"""
+		self.assertEqual(self.router.db_for_read(models.School), DEFAULT_DB_ALIAS)
+		self.assertEqual(self.router.db_for_write(models.School), DEFAULT_DB_ALIAS)
+
+	def test_read_from_replica(self):
+		"""
+			Validar que las lecturas públicas vayan a la réplica
+		"""
+		with routers.replica_reads():
+			self.assertEqual(self.router.db_for_read(models.School), REPLICA)
+
+		self.assertEqual(self.router.db_for_read(models.School), DEFAULT_DB_ALIAS)
+
+	def test_read_from_primary_after_write(self):
+		"""
+			Validar que después de escribir se lea de 'default'
+		"""
+		routers.start_request()
+
+		with routers.replica_reads():
+			self.router.db_for_write(models.School)
+
+			self.assertEqual(self.router.db_for_read(models.School), DEFAULT_DB_ALIAS)
+
+		self.assertTrue(routers.has_written())
+
+	def test_unhealthy_replica(self):
+		"""
+			Validar que se lea de 'default' si la réplica no responde
+		"""
+		with patch.object(routers, "connect", return_value = False):
+			with routers.replica_reads():
+				self.assertEqual(self.router.db_for_read(models.School), DEFAULT_DB_ALIAS)
+
+		routers.mark_unhealthy(REPLICA)
+
+		with routers.replica_reads():
+			self.assertFalse(routers.is_healthy(REPLICA))
+			self.assertEqual(self.router.db_for_read(models.School), DEFAULT_DB_ALIAS)
+
+	@override_settings(DATABASE_REPLICAS = {"ALIASES": [REPLICA], "RETRY_SECONDS": 0})
+	def test_unhealthy_replica_retry(self):
+		"""
+			Validar que la réplica se vuelva a usar después de 'RETRY_SECONDS'
+		"""
+		routers.mark_unhealthy(REPLICA)
+
+		with routers.replica_reads():
+			self.assertTrue(routers.is_healthy(REPLICA))
+			self.assertEqual(self.router.db_for_read(models.School), REPLICA)
+
+	def test_public_api_reads_from_replica(self):
+		"""
+			Validar que las vistas públicas lean de la réplica
+		"""
+		utils.bulk_create_calendar(size = 3, school = self.school)
+
+		with patch.object(routers, "get_replica", wraps = routers.get_replica) as mock_get_replica:
+			response = self.client.get(
+				reverse("school:calendar", kwargs = {"pk": self.school.id})
+			)
+
+		self.assertEqual(response.status_code, 200)
+		self.assertTrue(mock_get_replica.called)
+		self.assertNotIn(PRIMARY_COOKIE, response.cookies)
+
+	def test_graphql_anonymous_query_reads_from_replica(self):
+		"""
+			Validar que las queries anónimas de '/graphql' lean de la réplica
+		"""
+		data = {"query": QUERY, "variables": {"subdomain": self.school.subdomain}}
+
+		with patch.object(routers, "get_replica", wraps = routers.get_replica) as mock_get_replica:
+			response = self.client.post("/graphql", data = data, format = "json")
+
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual(response.json()["data"]["school"]["id"], str(self.school.id))
+		self.assertTrue(mock_get_replica.called)
+
+	def test_write_pins_client_to_primary(self):
+		"""
+			Validar que después de escribir el cliente quede fijado a 'default'
+		"""
+		def write_view(request):
+			utils.create_calendar(school = self.school)
+			return HttpResponse()
+
+		def read_view(request):
+			routers.enable_replica_reads()
+			return HttpResponse(self.router.db_for_read(models.Calendar))
+
+		headers = {"Authorization": "Bearer token"}
+
+		response = SchoolReplicaMiddleware(write_view)(
+			self.request_factory.post("/", headers = headers)
+		)
+
+		self.assertIn(PRIMARY_COOKIE, response.cookies)
+
+		# Sin la cookie, por el encabezado 'Authorization'
+		pinned = SchoolReplicaMiddleware(read_view)(
+			self.request_factory.get("/", headers = headers)
+		)
+		# Otro cliente
+		not_pinned = SchoolReplicaMiddleware(read_view)(self.request_factory.get("/"))
+
+		self.assertEqual(pinned.content.decode(), DEFAULT_DB_ALIAS)
+		self.assertEqual(not_pinned.content.decode(), REPLICA)
+
+	def test_replicas_disabled_with_local_cache(self):
+		"""
+			Validar que no se usen las réplicas si los clientes se fijan en una caché local
+		"""
+		replicas = {"ALIASES": [REPLICA], "CACHE_ALIAS": "default"}
+
+		with override_settings(DATABASE_REPLICAS = replicas):
+			with patch.object(routers, "get_replica", wraps = routers.get_replica) as mock_get_replica:
+				response = self.client.get(
+					reverse("school:calendar", kwargs = {"pk": self.school.id})
+				)
+
+			errors = checks.check_replica_cache(None)
+
+		self.assertEqual(response.status_code, 200)
+		self.assertFalse(mock_get_replica.called)
+		self.assertEqual([error.id for error in errors], ["school.W002"])
+		self.assertEqual(checks.check_replica_cache(None), [])
+
+	def test_write_pins_client_in_shared_cache(self):
+		"""
+			Validar que el cliente se fije en la caché 'CACHE_ALIAS'
+		"""
+		def write_view(request):
+			utils.create_calendar(school = self.school)
+			return HttpResponse()
+
+		headers = {"Authorization": "Bearer token"}
+		request = self.request_factory.post("/", headers = headers)
+
+		SchoolReplicaMiddleware(write_view)(request)
+
+		key = SchoolReplicaMiddleware(write_view).get_pin_key(request)
+
+		self.assertTrue(routers.get_pin_cache().get(key))
+		self.assertIs(routers.get_pin_cache(), caches[REPLICA_CACHE])
+
+	@override_settings(
+		SCHOOL_CACHE = {"ALIAS": "default", "TIMEOUT": 60, "ENABLED": True},
+		GRAPHQL_RESPONSE_CACHE = {"ENABLED": True}
+	)
+	def test_recent_change_not_cached_from_replica(self):
+		"""
+			Validar que no se guarde lo leído de la réplica si el recurso cambió hace menos de 'PIN_SECONDS'
+		"""
+		school_cache.cache.clear()
+		utils.bulk_create_calendar(size = 3, school = self.school)
+
+		url = reverse("school:calendar", kwargs = {"pk": self.school.id})
+		data = {"query": QUERY, "variables": {"subdomain": self.school.subdomain}}
+
+		responses = [self.client.get(url) for _ in range(2)]
+		graphql = [self.client.post("/graphql", data = data, format = "json") for _ in range(2)]
+
+		self.assertEqual([response["X-Cache"] for response in responses], ["MISS", "MISS"])
+		self.assertNotIn("ETag", responses[1])
+		self.assertEqual([response["X-Cache"] for response in graphql], ["MISS", "MISS"])
+
+		# La réplica ya tiene el cambio
+		replicas = {"ALIASES": [REPLICA], "PIN_SECONDS": 0, "CACHE_ALIAS": REPLICA_CACHE}
+
+		with override_settings(DATABASE_REPLICAS = replicas):
+			responses = [self.client.get(url) for _ in range(2)]
+			graphql = [self.client.post("/graphql", data = data, format = "json") for _ in range(2)]
+
+		self.assertEqual([response["X-Cache"] for response in responses], ["MISS", "HIT"])
+		self.assertIn("ETag", responses[0])
+		self.assertEqual([response["X-Cache"] for response in graphql], ["MISS", "HIT"])
@@ -0,0 +1,256 @@
+from django.test import RequestFactory, AsyncRequestFactory, override_settings
+
+from asgiref.sync import async_to_sync
+
+from rest_framework.test import APITestCase
+
+from apps.school.middleware import SchoolSubdomainMiddleware, SCHOOL_HEADER
+from apps.school.services import subdomains
+from apps.school.services.subdomains import (
+	SubdomainCache, 
+	get_school_id, 
+	aget_school_id,
+	get_request_school_id
+)
+
+from tests import faker
+
+from .utils import utils
+
+
+class FakeTimer:
+	def __init__(self):
+		self.now = 0
+
+	def __call__(self):
+		return self.now
+
+
+class SubdomainCacheTest(APITestCase):
+	def setUp(self):
+		self.timer = FakeTimer()
+		self.cache = SubdomainCache(maxsize = 2, ttl = 10, timer = self.timer)
+
+	def test_lru(self):
+		"""
+			Validar que se elimina el subdominio usado hace más tiempo
+		"""
+		self.cache.set("a", 1)
+		self.cache.set("b", 2)
+		self.cache.get("a")
+		self.cache.set("c", 3)
+
+		self.assertEqual(len(self.cache), 2)
+		self.assertEqual(self.cache.get("a"), 1)
+		self.assertIsNone(self.cache.get("b"))
+		self.assertEqual(self.cache.get("c"), 3)
+
+	def test_ttl(self):
+		"""
+			Validar que un subdominio expira después de 'ttl' segundos
+		"""
+		self.cache.set("a", 1)
+
+		self.timer.now = 9
+		self.assertEqual(self.cache.get("a"), 1)
+
+		self.timer.now = 10
+		self.assertIsNone(self.cache.get("a"))
+		self.assertEqual(len(self.cache), 0)
+
+	def test_ttl_by_subdomain(self):
+		"""
+			Validar que un subdominio puede tener su propio tiempo de expiración
+		"""
+		self.cache.set("a", None, ttl = 2)
+
+		self.assertIsNone(self.cache.get("a", "missing"))
+
+		self.timer.now = 2
+		self.assertEqual(self.cache.get("a", "missing"), "missing")
+
+	def test_delete_school(self):
+		"""
+			Validar que se eliminan todos los subdominios de una escuela
+		"""
+		self.cache.set("a", 1)
+		self.cache.set("b", 2)
+
+		self.cache.delete_school(1)
+
+		self.assertIsNone(self.cache.get("a"))
+		self.assertEqual(self.cache.get("b"), 2)
+
+
+class SchoolSubdomainTest(APITestCase):
+	def setUp(self):
+		subdomains.subdomains.clear()
+		self.school = utils.create_school()
+
+	def test_get_school_id(self):
+		"""
+			Validar que el 'id' de la escuela se obtiene sin consultar
+			la base de datos
+		"""
+		with self.assertNumQueries(0):
+			school_id = get_school_id(self.school.subdomain)
+
+		self.assertEqual(school_id, self.school.id)
+
+	def test_get_school_id_after_expire(self):
+		"""
+			Validar que se consulta la base de datos cuando el subdominio
+			no está en caché
+		"""
+		subdomains.subdomains.clear()
+
+		with self.assertNumQueries(1):
+			get_school_id(self.school.subdomain)
+
+		with self.assertNumQueries(0):
+			school_id = get_school_id(self.school.subdomain)
+
+		self.assertEqual(school_id, self.school.id)
+
+	def test_get_school_id_does_not_exist(self):
+		"""
+			Validar que un subdominio que no existe devuelve 'None'
+			y se guarda en caché por 'MISSING_TTL' segundos
+		"""
+		subdomain = faker.slug()
+
+		self.assertIsNone(get_school_id(subdomain))
+		self.assertIsNone(get_school_id(None))
+
+		with self.assertNumQueries(0):
+			self.assertIsNone(get_school_id(subdomain))
+			self.assertIsNone(async_to_sync(aget_school_id)(subdomain))
+
+		subdomains.subdomains.clear()
+
+		with self.assertNumQueries(1):
+			self.assertIsNone(async_to_sync(aget_school_id)(subdomain))
+
+	def test_create_school_after_does_not_exist(self):
+		"""
+			Validar que una escuela creada con un subdominio que no existía
+			se puede usar al instante
+		"""
+		subdomain = faker.slug()
+
+		self.assertIsNone(get_school_id(subdomain))
+
+		school = utils.create_school(subdomain = subdomain)
+
+		with self.assertNumQueries(0):
+			self.assertEqual(get_school_id(subdomain), school.id)
+
+	@override_settings(SCHOOL_SUBDOMAIN_CACHE = {"MISSING_TTL": 0})
+	def test_get_school_id_does_not_exist_without_ttl(self):
+		"""
+			Validar que con 'MISSING_TTL = 0' no se guardan los subdominios
+			que no existen
+		"""
+		subdomain = faker.slug()
+
+		self.assertIsNone(get_school_id(subdomain))
+
+		with self.assertNumQueries(1):
+			self.assertIsNone(get_school_id(subdomain))
+
+	def test_update_subdomain(self):
+		"""
+			Validar que al cambiar el subdominio de una escuela
+			el anterior deja de ser válido
+		"""
+		old_subdomain = self.school.subdomain
+		self.school.subdomain = faker.slug()
+		self.school.save()
+
+		self.assertIsNone(get_school_id(old_subdomain))
+		self.assertEqual(get_school_id(self.school.subdomain), self.school.id)
+
+	def test_delete_school(self):
+		"""
+			Validar que al eliminar una escuela su subdominio deja de ser válido
+		"""
+		subdomain = self.school.subdomain
+		self.school.delete()
+
+		self.assertIsNone(get_school_id(subdomain))
+
+	def test_middleware(self):
+		"""
+			Validar que 'SchoolSubdomainMiddleware' agrega la escuela a la petición
+		"""
+		request_factory = RequestFactory()
+		middleware = SchoolSubdomainMiddleware(lambda get_request: get_request)
+
+		request_header = request_factory.get(
+			"/", 
+			headers = {SCHOOL_HEADER: self.school.subdomain}
+		)
+		request_query = request_factory.get(
+			"/", 
+			{"subdomain": self.school.subdomain}
+		)
+		request_without_subdomain = request_factory.get("/")
+
+		for request in (request_header, request_query):
+			middleware(request)
+
+			self.assertEqual(request.school_subdomain, self.school.subdomain)
+			self.assertEqual(request.school_id, self.school.id)
+
+		middleware(request_without_subdomain)
+
+		self.assertIsNone(request_without_subdomain.school_subdomain)
+		self.assertIsNone(request_without_subdomain.school_id)
+
+	def test_get_request_school_id(self):
+		"""
+			Validar que se usa 'request.school_id' si la petición va dirigida
+			al mismo subdominio
+		"""
+		request = RequestFactory().get(
+			"/", 
+			headers = {SCHOOL_HEADER: self.school.subdomain}
+		)
+		SchoolSubdomainMiddleware(lambda get_request: get_request)(request)
+
+		other_school = utils.create_school()
+		subdomains.subdomains.clear()
+
+		with self.assertNumQueries(0):
+			school_id = get_request_school_id(request, self.school.subdomain)
+
+		with self.assertNumQueries(1):
+			other_school_id = get_request_school_id(request, other_school.subdomain)
+
+		self.assertEqual(school_id, self.school.id)
+		self.assertEqual(other_school_id, other_school.id)
+
+	def test_middleware_async(self):
+		"""
+			Validar 'SchoolSubdomainMiddleware' en modo asíncrono (ASGI)
+		"""
+		async def get_response(request):
+			return request
+
+		subdomains.subdomains.clear()
+
+		middleware = SchoolSubdomainMiddleware(get_response)
+		request = AsyncRequestFactory().get(
+			"/", 
+			headers = {SCHOOL_HEADER: self.school.subdomain}
+		)
+
+		async_to_sync(middleware)(request)
+
+		self.assertEqual(request.school_subdomain, self.school.subdomain)
+		self.assertEqual(request.school_id, self.school.id)
+
+		with self.assertNumQueries(0):
+			school_id = async_to_sync(aget_school_id)(self.school.subdomain)
+
+		self.assertEqual(school_id, self.school.id)
@@ -1,7 +1,24 @@
+import shutil, tempfile
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections
+from django.test import override_settings
+
 from rest_framework.test import APIClient, APITestCase
 
+from apps.school.services import subdomains
+from school import routers
+
+from tests import faker
+from tests.queries import QueryBudgetMixin
+
 from . import utils
 
+REPLICA = "replica_1"
+# Caché compartida por los procesos en la que se fija a los clientes
+REPLICA_CACHE = "replicas"
+
 
 class SchoolTestCase(APITestCase):
 	def setUp(self):
@@ -16,6 +33,18 @@ class SettingsFormatTestCase(SchoolTestCase):
 		self.settings_format = self.school.setting
 
 
+class SchoolBootstrapTestCase(SchoolTestCase):
+	def setUp(self):
+		super().setUp()
+		self.school.setting.colors.set(
+			utils.bulk_create_color_hex_format(size = 3)
+		)
+		utils.bulk_create_social_media(size = 3, school = self.school)
+		utils.bulk_create_contac_info(size = 2, school = self.school)
+		utils.bulk_create_coordinate(size = 4, school = self.school)
+		utils.bulk_create_officehour(size = 3, school = self.school)
+
+
 class OfficeHourTestCase(SchoolTestCase):
 	def setUp(self):
 		super().setUp()
@@ -138,4 +167,99 @@ class ExtraActivityTestCase(SchoolTestCase):
 			size = 6,
 			school = self.school
 		)
-		self.extra_activity = extra_activities[0]
\ No newline at end of file
+		self.extra_activity = extra_activities[0]
+
+class ReplicaTestCase(SchoolTestCase):
+	def setUp(self):
+		super().setUp()
+
+		routers.reset_health()
+
+		# Réplica de reemplazo: usa la misma conexión de 'default'
+		connections[REPLICA] = connections["default"]
+		self.addCleanup(connections.__delitem__, REPLICA)
+
+		location = tempfile.mkdtemp()
+		self.addCleanup(shutil.rmtree, location, ignore_errors = True)
+
+		replicas = override_settings(
+			DATABASE_REPLICAS = {
+				"ALIASES": [REPLICA],
+				"PIN_SECONDS": 5,
+				"RETRY_SECONDS": 30,
+				"CACHE_ALIAS": REPLICA_CACHE,
+			},
+			CACHES = {
+				**settings.CACHES,
+				REPLICA_CACHE: {
+					"BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+					"LOCATION": location,
+				}
+			}
+		)
+		replicas.enable()
+		self.addCleanup(replicas.disable)
+		# Los datos creados en 'setUp' no fijan las lecturas a 'default'
+		routers.start_request()
+		self.addCleanup(routers.end_request)
+
+
+class QueryBudgetTestCase(QueryBudgetMixin, APITestCase):
+	"""
+		Una escuela con datos de tamaño real (50 noticias con 5 imágenes
+		cada una, ...) para medir las consultas de cada endpoint.
+	"""
+	@classmethod
+	def setUpTestData(cls):
+		cls.school = utils.create_school()
+		cls.school.setting.colors.set(
+			utils.bulk_create_color_hex_format(size = 3)
+		)
+
+		cls.news = utils.bulk_create_news(size = 50, school = cls.school)
+
+		for news in cls.news:
+			news.media.set(utils.bulk_create_news_media(size = 5))
+
+		cls.office_hours = utils.bulk_create_officehour(size = 10, school = cls.school)
+		cls.calendars = utils.bulk_create_calendar(size = 50, school = cls.school)
+		cls.social_media = utils.bulk_create_social_media(size = 5, school = cls.school)
+		# Los títulos de las coordenadas, descargas y eventos son únicos
+		# en cada escuela
+		cls.coordinates = [
+			utils.create_coordinate(
+				title = f"{faker.text(max_nb_chars = 20)} {index}",
+				school = cls.school
+			)
+			for index in range(5)
+		]
+		cls.staff = utils.bulk_create_school_staff(size = 20, school = cls.school)
+		cls.grades = utils.bulk_create_grade(size = 15, school = cls.school)
+		cls.repositories = utils.bulk_create_repository(size = 20, school = cls.school)
+		cls.infraestructures = utils.bulk_create_infraestructure(size = 10, school = cls.school)
+		cls.downloads = [
+			utils.create_download(
+				title = f"{faker.text(max_nb_chars = 20)} {index}",
+				school = cls.school
+			)
+			for index in range(20)
+		]
+		cls.cultural_events = [
+			utils.create_cultura_event(
+				title = f"{faker.text(max_nb_chars = 20)} {index}",
+				school = cls.school
+			)
+			for index in range(20)
+		]
+		cls.payment_info = utils.bulk_create_payment_info(size = 5, school = cls.school)
+		cls.contact_info = utils.bulk_create_contac_info(size = 3, school = cls.school)
+		cls.extra_activities = utils.bulk_create_extra_activity(size = 10, school = cls.school)
+
+	def setUp(self):
+		self.client = APIClient()
+
+		# Se mide la petición con las cachés vacías (el peor caso)
+		for cache in caches.all():
+			cache.clear()
+
+		subdomains.subdomains.clear()
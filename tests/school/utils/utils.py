@@ -484,8 +484,8 @@ class PaymentReportFactory(factory.django.DjangoModelFactory):
 def create_payment_report(**kwargs) -> models.PaymentReport:
 	return PaymentReportFactory.create(**kwargs)
 
-def bulk_create_payment_report(size:int = 1, **kwargs) -> models.PaymentReport:
-	return PaymentReportFactory.create(size = size, **kwargs)
+def bulk_create_payment_report(size:int = 1, **kwargs) -> list[models.PaymentReport]:
+	return PaymentReportFactory.create_batch(size = size, **kwargs)
 
 
 class ConactInfoFactory(factory.django.DjangoModelFactory):